@@ -0,0 +1,28 @@
+"""add_completed_trades_keyset_index
+
+Revision ID: n2o3p4q5r6s7
+Revises: m1n2o3p4q5r6
+Create Date: 2026-10-19
+
+Index for cursor pagination of the trades page
+(user_id, exit_time DESC, id DESC).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = 'n2o3p4q5r6s7'
+down_revision: Union[str, None] = 'm1n2o3p4q5r6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_completed_trades_user_exit_time', 'completed_trades', ['user_id', 'exit_time', 'id'],
+        unique=False, postgresql_ops={'exit_time': 'DESC', 'id': 'DESC'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_completed_trades_user_exit_time', table_name='completed_trades')
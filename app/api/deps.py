@@ -280,6 +280,8 @@ def get_strategy_runner(
                 skip_strategy_load=skip_load,  # Skip if already loaded or currently loading
                 position_broadcast_service=getattr(base_runner, "position_broadcast_service", None),
                 mark_price_stream_manager=getattr(base_runner, "mark_price_stream_manager", None),
+                lease_manager=getattr(base_runner, "lease_manager", None),
+                idempotency_index=getattr(base_runner, "idempotency_index", None),
             )
             
             # Mark strategies as loaded for this user (app-level cache)
@@ -413,8 +415,10 @@ async def get_account_service_async(
     from app.core.config import get_settings
     
     settings = get_settings()
-    redis_storage = None
-    if settings.redis_enabled:
+    # Share the runner's Redis storage so its async connection pool is reused across requests
+    runner = getattr(request.app.state, 'strategy_runner', None)
+    redis_storage = getattr(runner, 'redis', None)
+    if redis_storage is None and settings.redis_enabled:
         redis_storage = RedisStorage(
             redis_url=settings.redis_url,
             enabled=settings.redis_enabled
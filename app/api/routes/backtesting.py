@@ -5,11 +5,11 @@ from __future__ import annotations
 
 import asyncio
 import json
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta, timezone
-from statistics import fmean
 from typing import Optional, Literal, TYPE_CHECKING, Annotated
 from fastapi import APIRouter, Depends, HTTPException, Query, Body, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
@@ -23,13 +23,15 @@ from app.strategies.base import StrategyContext, StrategySignal
 from app.strategies.scalping import EmaScalpingStrategy
 from app.strategies.range_mean_reversion import RangeMeanReversionStrategy
 from app.strategies.reverse_scalping import ReverseScalpingStrategy
-from app.strategies.indicators import calculate_ema, calculate_rsi
+from app.strategies.indicator_cache import IndicatorSeriesCache
 from app.risk.manager import RiskManager, PositionSizingResult
+from app.services.backtest_result_cache import backtest_cache_key, get_backtest_result_cache
 from app.utils.backtest_params import (
     extract_range_mean_reversion_params,
     extract_scalping_params,
     calculate_range_tp_sl_levels
 )
+from app.utils.kline_series import KlineSeries
 from loguru import logger
 
 
@@ -714,29 +716,34 @@ def _slice_klines_by_time_range(
     - Include candles with close_time <= end_time (inclusive end)
     This ensures we don't cut the last candle unexpectedly.
     
+    Klines are sorted by open time (as returned by the fetch helpers), so the
+    range is contiguous and located by binary search. A ``KlineSeries`` is
+    sliced through its timestamp index and returns a view instead of a copy.
+    
     Args:
-        klines: List of klines in Binance format
+        klines: List of klines in Binance format (or a KlineSeries)
         start_time: Start time (timezone-aware datetime) - inclusive
         end_time: End time (timezone-aware datetime) - inclusive
     
     Returns:
-        Filtered list of klines within the time range
+        Klines within the time range
     """
+    if isinstance(klines, KlineSeries):
+        return klines.slice(start_time, end_time)
+    
     start_timestamp = int(start_time.timestamp() * 1000)
     end_timestamp = int(end_time.timestamp() * 1000)
     
-    filtered = [
-        k for k in klines
-        if int(k[0]) >= start_timestamp and int(k[6]) <= end_timestamp
-    ]
-    
-    return filtered
+    lo = bisect_left(klines, start_timestamp, key=lambda k: int(k[0]))
+    hi = bisect_right(klines, end_timestamp, key=lambda k: int(k[6]))
+    return klines[lo:max(lo, hi)]
 
 
 async def run_backtest(
     request: BacktestRequest,
     client: BinanceClient,
-    pre_fetched_klines: Optional[list[list]] = None
+    pre_fetched_klines: Optional[list[list]] = None,
+    indicator_cache: Optional[IndicatorSeriesCache] = None
 ) -> BacktestResult:
     """Run backtesting on historical data.
     
@@ -744,6 +751,8 @@ async def run_backtest(
         request: Backtest request with parameters
         client: BinanceClient instance (used if pre_fetched_klines is None)
         pre_fetched_klines: Optional pre-fetched klines to use instead of fetching
+        indicator_cache: Optional indicator cache over ``pre_fetched_klines``, shared by
+            the runs of a parameter sweep (ignored if built over other klines)
     
     Returns:
         BacktestResult with statistics and trades
@@ -797,7 +806,18 @@ async def run_backtest(
             end_time=request.end_time,
         )
         logger.debug(f"Fetched {len(filtered_klines)} klines from Binance mainnet")
-    
+
+    # Identical request + identical klines => identical result: serve repeats from the cache.
+    # Hashing the klines and the Redis/disk tiers block, so they run in a worker thread.
+    result_cache = get_backtest_result_cache()
+    cache_key = None
+    if result_cache is not None and filtered_klines:
+        cache_key = await asyncio.to_thread(backtest_cache_key, request, interval, filtered_klines)
+        cached_result = await asyncio.to_thread(result_cache.get, cache_key, BacktestResult)
+        if cached_result is not None:
+            logger.debug(f"Backtest cache hit for {request.symbol} {request.strategy_type} ({len(filtered_klines)} candles)")
+            return cached_result
+
     # Calculate interval_seconds for strategy context (using the correct interval)
     # NOTE: Seconds intervals (1s, 3s, etc.) are NOT supported by standard Binance klines endpoint
     interval_seconds_map = {
@@ -836,6 +856,11 @@ async def run_backtest(
     else:
         raise HTTPException(status_code=400, detail=f"Unknown strategy type: {request.strategy_type}")
     
+    # Indicator values per candle, computed once per (indicator, period) over these klines
+    if indicator_cache is None or indicator_cache.klines is not filtered_klines:
+        indicator_cache = IndicatorSeriesCache(filtered_klines)
+    strategy.set_indicator_cache(indicator_cache)
+    
     # Initialize risk manager
     risk_manager = RiskManager(mock_client)
     
@@ -857,9 +882,6 @@ async def run_backtest(
     
     # Process each candle
     # Calculate minimum required candles based on strategy type
-    # PERFORMANCE FIX: Pre-calculate closing prices once (O(N)) instead of recalculating in loop (O(N²))
-    closing_prices_all = [float(k[4]) for k in filtered_klines]
-    
     # CODE QUALITY FIX: Extract parameters using utility functions to reduce duplication
     if request.strategy_type == "range_mean_reversion":
         rmr_params = extract_range_mean_reversion_params(request.params)
@@ -1003,22 +1025,19 @@ async def run_backtest(
                         snapshot["sl"] = tp_sl_levels["sl"]
             
             # Calculate RSI and EMA if we have enough data
-            # PERFORMANCE FIX: Use pre-calculated closing_prices_all with O(1) slice instead of O(i) list comprehension
             # CRITICAL FIX: Use only closed candles (up to i-1) for indicators
             # Decision was made on candle i-1, so indicators should not include candle i's close (future data)
             if i >= min_required_candles:
-                # Use pre-calculated prices with O(1) slice operation (much faster than list comprehension)
-                closing_prices = closing_prices_all[:i]  # Only closed candles, up to i-1
-                
+                # Indicators over closed candles 0..i-1, served from the per-run cache
                 # Calculate RSI
-                if len(closing_prices) >= rsi_period + 1:
-                    snapshot["rsi"] = calculate_rsi(closing_prices, rsi_period)
+                if i >= rsi_period + 1:
+                    snapshot["rsi"] = indicator_cache.rsi(rsi_period, i)
                 
-                # Calculate EMA fast and slow (reuse same closing_prices variable - no redundant calculation)
-                if len(closing_prices) >= ema_fast_period:
-                    snapshot["ema_fast"] = calculate_ema(closing_prices, ema_fast_period)
-                if len(closing_prices) >= ema_slow_period:
-                    snapshot["ema_slow"] = calculate_ema(closing_prices, ema_slow_period)
+                # Calculate EMA fast and slow
+                if i >= ema_fast_period:
+                    snapshot["ema_fast"] = indicator_cache.ema(ema_fast_period, i)
+                if i >= ema_slow_period:
+                    snapshot["ema_slow"] = indicator_cache.ema(ema_slow_period, i)
                 
                 # Calculate EMA spread percentage
                 if snapshot["ema_fast"] is not None and snapshot["ema_slow"] is not None:
@@ -1615,46 +1634,12 @@ async def run_backtest(
             "sell_zone_pct": rmr_params["sell_zone_pct"]
         }
     elif request.strategy_type in ("scalping", "reverse_scalping"):
-        # PERFORMANCE FIX: Use pre-calculated closing_prices_all (already calculated above)
-        closing_prices = closing_prices_all
-        
-        # Calculate EMA fast and slow using incremental calculation (O(N) instead of O(N²))
-        ema_fast_values = []
-        ema_slow_values = []
-        
         fast_period = int(request.params.get("ema_fast", 8))
         slow_period = int(request.params.get("ema_slow", 21))
         
-        # Incremental EMA calculation (O(N) total instead of O(N²))
-        ema_fast_prev = None
-        ema_slow_prev = None
-        alpha_fast = 2.0 / (fast_period + 1)
-        alpha_slow = 2.0 / (slow_period + 1)
-        
-        for i, price in enumerate(closing_prices):
-            # EMA fast incremental calculation
-            if i < fast_period - 1:
-                ema_fast_values.append(None)
-            else:
-                if i == fast_period - 1:
-                    # Initialize with SMA
-                    ema_fast_prev = fmean(closing_prices[:fast_period])
-                else:
-                    # Update EMA incrementally (O(1) per iteration)
-                    ema_fast_prev = (price - ema_fast_prev) * alpha_fast + ema_fast_prev
-                ema_fast_values.append(ema_fast_prev)
-            
-            # EMA slow incremental calculation
-            if i < slow_period - 1:
-                ema_slow_values.append(None)
-            else:
-                if i == slow_period - 1:
-                    # Initialize with SMA (fmean imported at top of file)
-                    ema_slow_prev = fmean(closing_prices[:slow_period])
-                else:
-                    # Update EMA incrementally (O(1) per iteration)
-                    ema_slow_prev = (price - ema_slow_prev) * alpha_slow + ema_slow_prev
-                ema_slow_values.append(ema_slow_prev)
+        # EMA over each prefix of closes, shared with the strategy's indicator cache (O(N) per period)
+        ema_fast_values = [indicator_cache.ema(fast_period, i + 1) for i in range(len(filtered_klines))]
+        ema_slow_values = [indicator_cache.ema(slow_period, i + 1) for i in range(len(filtered_klines))]
         
         # Create indicators data with timestamps matching klines
         indicators_data = {
@@ -1674,7 +1659,7 @@ async def run_backtest(
     
     # PERFORMANCE FIX: Conditionally include klines to reduce response payload size
     # For large backtests (30+ days), excluding klines can reduce payload by 90%+
-    return BacktestResult(
+    result = BacktestResult(
         symbol=request.symbol,
         strategy_type=request.strategy_type,
         start_time=request.start_time,
@@ -1699,12 +1684,26 @@ async def run_backtest(
         klines=klines_data if request.include_klines else None,
         indicators=indicators_data
     )
+    if cache_key is not None:
+        await asyncio.to_thread(result_cache.put, cache_key, result)
+    return result
 
 
 @router.post("/run", response_model=BacktestResult)
 async def run_backtest_endpoint(
     request: BacktestRequest,
-    client: BinanceClient = Depends(get_binance_client)
+    client: BinanceClient = Depends(get_binance_client),
+    response_format: Literal["json", "columnar"] = Query(
+        "json",
+        alias="format",
+        description="'columnar' returns klines and indicator series as parallel arrays instead of one object per point"
+    ),
+    max_points: Optional[int] = Query(
+        None,
+        ge=100,
+        le=100000,
+        description="Downsample klines (OHLCV buckets) and indicator series (LTTB) to about this many points; trades are kept"
+    )
 ) -> BacktestResult:
     """
     Run backtesting on historical data.
@@ -1716,6 +1715,7 @@ async def run_backtest_endpoint(
     For very large backtests, consider using walk-forward analysis with async task management.
     """
     from app.services.backtest_service import BacktestService
+    from app.services.backtest_payload import columnar_backtest_payload, downsample_backtest_result
     
     # PERFORMANCE FIX: Add timeout to prevent hanging requests
     # 10 minutes should be sufficient for most backtests
@@ -1728,6 +1728,10 @@ async def run_backtest_endpoint(
             service.run_backtest(request),
             timeout=timeout_seconds
         )
+        if max_points is not None:
+            result = downsample_backtest_result(result, max_points)
+        if response_format == "columnar":
+            return JSONResponse(columnar_backtest_payload(result))
         return result
     except asyncio.TimeoutError:
         logger.error(
@@ -1803,7 +1807,9 @@ async def start_walk_forward_analysis(
     Raises:
         HTTPException 429: If concurrency limits are exceeded
     """
-    from app.services.walk_forward import WalkForwardRequest, run_walk_forward_analysis
+    from app.core.job_queue import get_job_queue
+    from app.services.analysis_jobs import enqueue_analysis, execute_walk_forward, run_in_process
+    from app.services.walk_forward import WalkForwardRequest
     from app.services.walk_forward_task_manager import get_task_manager
     from app.services.walk_forward import generate_walk_forward_windows
     from fastapi import status
@@ -1849,6 +1855,25 @@ async def start_walk_forward_analysis(
     
     # Get task manager
     task_manager = get_task_manager()
+    job_queue = get_job_queue()
+    
+    if job_queue is not None:
+        # Queued for the job workers: capacity limits are applied when a worker claims the job
+        pending = job_queue.active_count(user_id)
+        if pending >= settings.job_max_pending_per_user:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Too many queued analyses: {pending}/{settings.job_max_pending_per_user} analyses already queued or running. Please wait for one to complete."
+            )
+        task_id = await task_manager.create_task(total_windows=len(windows), user_id=user_id)
+        enqueue_analysis("walk_forward", task_id, current_user.id, walk_forward_request)
+        await task_manager.update_progress(task_id, current_phase="queued", message="Waiting for a job worker...")
+        logger.info(f"Queued walk-forward analysis {task_id} for user {user_id} ({len(windows)} windows)")
+        return {
+            "task_id": task_id,
+            "message": "Walk-forward analysis queued",
+            "total_windows": len(windows)
+        }
     
     # Check global concurrency limit
     running_tasks = await task_manager.count_running_tasks()
@@ -1869,80 +1894,10 @@ async def start_walk_forward_analysis(
     # Create task with user_id
     task_id = await task_manager.create_task(total_windows=len(windows), user_id=user_id)
     
-    # Start analysis in background
-    async def run_analysis():
-        import time
-        start_time = time.time()
-        candles_processed = 0  # Will be calculated from result if available
-        
-        try:
-            result = await run_walk_forward_analysis(walk_forward_request, client, task_id=task_id)
-            execution_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Store result in task manager - ensure it's serializable
-            try:
-                if hasattr(result, 'model_dump'):
-                    result_dict = result.model_dump()
-                elif hasattr(result, 'dict'):
-                    result_dict = result.dict()
-                else:
-                    result_dict = result
-                
-                # Verify equity_curve is included
-                if isinstance(result_dict, dict) and 'equity_curve' in result_dict:
-                    logger.info(f"Storing result with equity_curve containing {len(result_dict.get('equity_curve', []))} points")
-                
-                await task_manager.complete_task(task_id, result=result_dict)
-                
-                # Auto-save to database after successful completion
-                try:
-                    from app.services.database_service import DatabaseService
-                    from app.core.database import get_async_session_factory
-                    
-                    # Create a new database session for the background task
-                    # We can't use the dependency injection here, so we create the session manually
-                    async_session_factory = await get_async_session_factory()
-                    
-                    async with async_session_factory() as db:
-                        db_service = DatabaseService(db)
-                        
-                        # Calculate candles processed (estimate from windows and periods)
-                        if hasattr(result, 'windows') and result.windows:
-                            # Rough estimate: each window processes training + test period candles
-                            candles_processed = len(result.windows) * (
-                                walk_forward_request.training_period_days * 24 * 60 +  # Training period (assuming 1m candles)
-                                walk_forward_request.test_period_days * 24 * 60  # Test period
-                            )
-                        else:
-                            candles_processed = 0
-                        
-                        analysis_id = await db_service.save_walk_forward_analysis(
-                            user_id=current_user.id,
-                            result=result,
-                            request=walk_forward_request,
-                            execution_time_ms=execution_time_ms,
-                            candles_processed=candles_processed,
-                            name=walk_forward_request.name,  # Optional name from parsed request
-                            keep_details=True
-                        )
-                        logger.info(f"✅ Saved walk-forward analysis {analysis_id} to database for user {user_id}")
-                except Exception as save_error:
-                    logger.error(f"❌ Failed to save walk-forward analysis to database: {save_error}", exc_info=True)
-                    # Don't fail the analysis - just log the error
-            except Exception as serialize_error:
-                logger.error(f"Error serializing result: {serialize_error}", exc_info=True)
-                await task_manager.fail_task(task_id, f"Failed to serialize result: {str(serialize_error)}")
-        except HTTPException as e:
-            if e.status_code == 499:  # Cancelled
-                await task_manager.cancel_task(task_id)
-            else:
-                await task_manager.fail_task(task_id, str(e.detail))
-        except Exception as e:
-            logger.error(f"Error in walk-forward analysis: {e}", exc_info=True)
-            await task_manager.fail_task(task_id, str(e))
-    
     # Run in background
-    asyncio.create_task(run_analysis())
+    asyncio.create_task(run_in_process(
+        task_id, execute_walk_forward(task_id, current_user.id, walk_forward_request, client)
+    ))
     
     logger.info(f"Started walk-forward analysis {task_id} for user {user_id} ({len(windows)} windows)")
     return {
@@ -2042,6 +1997,8 @@ async def get_walk_forward_progress(
                 # Check for disconnect (this is handled by FastAPI/Starlette automatically)
                 # but we can add explicit checks if needed
                 
+                # Read the version first so a change made while we send is not missed
+                version = task_manager.progress_version(task_id)
                 progress = await task_manager.get_progress(task_id)
                 
                 if not progress:
@@ -2082,7 +2039,10 @@ async def get_walk_forward_progress(
                     yield ": keep-alive ping\n\n"  # SSE comment line (keeps connection alive)
                     last_ping_time = current_time
                 
-                await asyncio.sleep(0.5)  # Poll every 500ms
+                # Sleep until the task publishes a change (or the next keep-alive is due)
+                await task_manager.wait_for_update(
+                    task_id, version, timeout=max(0.0, last_ping_time + ping_interval - current_time)
+                )
         except asyncio.CancelledError:
             # Client disconnected - stop streaming
             logger.debug(f"SSE stream cancelled for task {task_id}")
@@ -3257,12 +3217,11 @@ async def start_sensitivity_analysis(
     Raises:
         HTTPException 429: If concurrency limits are exceeded
     """
-    from app.services.sensitivity_analysis import SensitivityAnalysisRequest, run_sensitivity_analysis
+    from app.core.job_queue import get_job_queue
+    from app.services.analysis_jobs import enqueue_analysis, execute_sensitivity, run_in_process
+    from app.services.sensitivity_analysis import SensitivityAnalysisRequest
     from app.services.walk_forward_task_manager import get_task_manager
-    from app.services.database_service import DatabaseService
-    from app.api.deps import get_async_db
     from fastapi import status
-    import time
     
     # Get user ID
     user_id = str(current_user.id)
@@ -3285,6 +3244,25 @@ async def start_sensitivity_analysis(
     
     # Get task manager
     task_manager = get_task_manager()
+    job_queue = get_job_queue()
+    
+    if job_queue is not None:
+        # Queued for the job workers: capacity limits are applied when a worker claims the job
+        pending = job_queue.active_count(user_id)
+        if pending >= settings.job_max_pending_per_user:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Too many queued analyses: {pending}/{settings.job_max_pending_per_user} analyses already queued or running. Please wait for one to complete."
+            )
+        task_id = await task_manager.create_task(total_tests, user_id)
+        enqueue_analysis("sensitivity", task_id, current_user.id, sensitivity_request)
+        await task_manager.update_progress(task_id, current_phase="queued", message="Waiting for a job worker...")
+        logger.info(f"Queued sensitivity analysis {task_id} for user {user_id} ({total_tests} tests)")
+        return {
+            "task_id": task_id,
+            "message": "Sensitivity analysis queued",
+            "total_tests": total_tests
+        }
     
     # Check concurrency limits
     user_running = await task_manager.count_user_running_tasks(user_id)
@@ -3298,78 +3276,10 @@ async def start_sensitivity_analysis(
     # Create task
     task_id = await task_manager.create_task(total_tests, user_id)
     
-    # Background task to run analysis
-    async def run_analysis():
-        start_time = time.time()
-        try:
-            # Update progress: starting
-            await task_manager.update_progress(
-                task_id,
-                current_phase="initializing",
-                message="Starting sensitivity analysis..."
-            )
-            
-            # Run analysis with progress callback
-            async def update_progress_callback(current_window, total_windows, current_phase, message, phase_progress):
-                # Note: total_windows is set at task creation, not in update_progress
-                await task_manager.update_progress(
-                    task_id,
-                    current_window=current_window,
-                    current_phase=current_phase,
-                    message=message,
-                    phase_progress=phase_progress
-                )
-            
-            result = await run_sensitivity_analysis(
-                sensitivity_request, 
-                client,
-                task_id=task_id,
-                progress_callback=update_progress_callback
-            )
-            execution_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Store result in task manager
-            try:
-                if hasattr(result, 'model_dump'):
-                    result_dict = result.model_dump()
-                elif hasattr(result, 'dict'):
-                    result_dict = result.dict()
-                else:
-                    result_dict = result
-                
-                await task_manager.complete_task(task_id, result_dict)
-                logger.info(f"✅ Sensitivity analysis {task_id} completed in {execution_time_ms}ms")
-                
-                # Save to database
-                try:
-                    async_db_gen = get_async_db()
-                    db = await async_db_gen.__anext__()
-                    db_service = DatabaseService(db)
-                    
-                    analysis_id = await db_service.save_sensitivity_analysis(
-                        user_id=current_user.id,
-                        result=result,
-                        request=sensitivity_request,
-                        name=sensitivity_request.name
-                    )
-                    logger.info(f"✅ Saved sensitivity analysis {analysis_id} to database for user {user_id}")
-                except Exception as save_error:
-                    logger.error(f"❌ Failed to save sensitivity analysis to database: {save_error}", exc_info=True)
-                    # Don't fail the analysis - just log the error
-            except Exception as serialize_error:
-                logger.error(f"Error serializing result: {serialize_error}", exc_info=True)
-                await task_manager.fail_task(task_id, f"Failed to serialize result: {str(serialize_error)}")
-        except HTTPException as e:
-            if e.status_code == 499:  # Cancelled
-                await task_manager.cancel_task(task_id)
-            else:
-                await task_manager.fail_task(task_id, str(e.detail))
-        except Exception as e:
-            logger.error(f"Error in sensitivity analysis: {e}", exc_info=True)
-            await task_manager.fail_task(task_id, str(e))
-    
     # Run in background
-    asyncio.create_task(run_analysis())
+    asyncio.create_task(run_in_process(
+        task_id, execute_sensitivity(task_id, current_user.id, sensitivity_request, client)
+    ))
     
     logger.info(f"Started sensitivity analysis {task_id} for user {user_id} ({total_tests} tests)")
     return {
@@ -3413,6 +3323,7 @@ async def get_sensitivity_progress(
     async def event_generator():
         last_progress = None
         while True:
+            version = task_manager.progress_version(task_id)
             current_progress = await task_manager.get_progress(task_id)
             
             if not current_progress:
@@ -3439,7 +3350,8 @@ async def get_sensitivity_progress(
             if current_progress.status in ("completed", "cancelled", "error"):
                 break
             
-            await asyncio.sleep(1)  # Update every second
+            # Sleep until the task publishes a change (re-check periodically as a safety net)
+            await task_manager.wait_for_update(task_id, version, timeout=15.0)
     
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
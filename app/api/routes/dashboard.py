@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict
 from dateutil import parser as date_parser
@@ -12,9 +13,11 @@ from loguru import logger
 from app.api.deps import (
     get_strategy_runner,
     get_current_user,
+    get_current_user_async,
     get_binance_client,
     get_client_manager,
     get_database_service,
+    get_database_service_async,
 )
 from app.models.dashboard import (
     DashboardOverview,
@@ -24,9 +27,11 @@ from app.models.dashboard import (
     DateRange,
 )
 from app.models.strategy_performance import StrategyPerformanceList
+from app.models.report import TradeReport
 from app.models.trade import SymbolPnL
 from app.services.strategy_runner import StrategyRunner
 from app.services.database_service import DatabaseService
+from app.services.report_cache import cached_report
 from app.core.my_binance_client import BinanceClient
 from app.core.binance_client_manager import BinanceClientManager
 from app.models.db_models import User, SystemEvent
@@ -135,16 +140,44 @@ def _calculate_total_running_time(
         return None
 
 
+def _exited_between(
+    trades: List[TradeReport],
+    start_datetime: Optional[datetime] = None,
+    end_datetime: Optional[datetime] = None,
+) -> List[TradeReport]:
+    """Completed trades whose exit_time lies within the optional date range.
+    
+    Same filter as the exit_time range of ``_get_completed_trades_from_database``,
+    applied in memory so one set of completed trades can serve several ranges.
+    """
+    if not start_datetime and not end_datetime:
+        return list(trades)
+    selected = []
+    for trade in trades:
+        exit_time = trade.exit_time
+        if exit_time is None:
+            continue
+        if exit_time.tzinfo is None:
+            exit_time = exit_time.replace(tzinfo=timezone.utc)
+        if start_datetime and exit_time < start_datetime:
+            continue
+        if end_datetime and exit_time > end_datetime:
+            continue
+        selected.append(trade)
+    return selected
+
+
 @router.get("/overview", response_model=DashboardOverview)
-def get_dashboard_overview(
+@cached_report("dashboard_overview", ("start_date", "end_date", "account_id"))
+async def get_dashboard_overview(
     start_date: Optional[str] = Query(default=None, description="Filter from date (ISO format)"),
     end_date: Optional[str] = Query(default=None, description="Filter to date (ISO format)"),
     account_id: Optional[str] = Query(default=None, description="Filter by Binance account ID"),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_async),
     runner: StrategyRunner = Depends(get_strategy_runner),
     client: BinanceClient = Depends(get_binance_client),
     client_manager: BinanceClientManager = Depends(get_client_manager),
-    db_service: DatabaseService = Depends(get_database_service),
+    db_service: DatabaseService = Depends(get_database_service_async),
 ) -> DashboardOverview:
     """Get aggregated dashboard overview data from multiple endpoints.
     
@@ -198,59 +231,49 @@ def get_dashboard_overview(
         total_trade_fees = 0.0
         total_funding_fees = 0.0
         
+        # The runner may read strategies and trades through its sync session: keep it off the event loop
+        all_strategies = await asyncio.to_thread(runner.list_strategies)
+        account_strategies = [s for s in all_strategies if not (account_id and s.account_id != account_id)]
+        
+        # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
+        # One query for all strategies and all history; the summary, fees, PnL changes and
+        # timeline below select their date ranges from it instead of querying per strategy
+        completed_trades_by_strategy: Dict[str, List[TradeReport]] = {}
+        try:
+            from app.api.routes.reports import _async_get_completed_trades_by_strategy
+            completed_trades_by_strategy = await _async_get_completed_trades_by_strategy(
+                db_service=db_service,
+                user_id=current_user.id,
+                strategy_ids=[s.id for s in account_strategies],
+            )
+        except Exception as e:
+            logger.debug(f"Could not get completed trades from database: {e}")
+        all_completed_trades = [t for trades in completed_trades_by_strategy.values() for t in trades]
+        
         # Get strategy performance data
         # We'll calculate strategy performance directly using runner to avoid circular imports
         # This duplicates some logic from strategy_performance endpoint but keeps things simple
         try:
             from app.models.strategy_performance import StrategyPerformance, StrategyPerformanceList
+            from app.models.strategy import StrategyStats
             
-            strategies = runner.list_strategies()
             performance_list = []
             
-            for strategy in strategies:
-                # Apply account filter
-                if account_id and strategy.account_id != account_id:
-                    continue
-                
+            for strategy in account_strategies:
                 try:
-                    # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
-                    # This is much faster than on-demand matching
-                    from app.api.routes.reports import _get_completed_trades_from_database, _match_trades_to_completed_positions
-                    from app.models.strategy import StrategyStats
-                    from uuid import UUID
-                    
-                    completed_trades_list = []
-                    
-                    # Get strategy UUID from database
-                    db_strategy = None
-                    if runner.strategy_service and runner.user_id:
-                        try:
-                            db_strategy = runner.strategy_service.db_service.get_strategy(current_user.id, strategy.id)
-                        except Exception as e:
-                            logger.debug(f"Could not get strategy from database: {e}")
-                    
-                    if db_strategy:
-                        try:
-                            # Query from CompletedTrade table
-                            completed_trades_list = _get_completed_trades_from_database(
-                                db_service=db_service,
-                                user_id=current_user.id,
-                                strategy_uuid=db_strategy.id,
-                                strategy_id=strategy.id,
-                                start_datetime=start_datetime,
-                                end_datetime=end_datetime
-                            )
-                        except Exception as e:
-                            logger.debug(f"Could not get completed trades from database for strategy {strategy.id}: {e}")
+                    completed_trades_list = _exited_between(
+                        completed_trades_by_strategy.get(strategy.id, []), start_datetime, end_datetime
+                    )
                     
                     # ✅ FALLBACK: If no completed trades from database, use on-demand matching
                     if not completed_trades_list:
                         logger.debug(f"No completed trades from database for strategy {strategy.id}, falling back to trades table")
                         # Use existing calculate_strategy_stats which uses trades table
-                        stats = runner.calculate_strategy_stats(
+                        stats = await asyncio.to_thread(
+                            runner.calculate_strategy_stats,
                             strategy.id,
                             start_date=start_datetime,
-                            end_date=end_datetime
+                            end_date=end_datetime,
                         )
                     else:
                         # Calculate stats from completed trades (TradeReport objects)
@@ -271,7 +294,7 @@ def get_dashboard_overview(
                                 last_trade_at = max(exit_times)
                         
                         # Get total trades count from runner (includes open positions)
-                        all_trades = runner.get_trades(strategy.id)
+                        all_trades = await asyncio.to_thread(runner.get_trades, strategy.id)
                         total_trades_count = len(all_trades) if all_trades else completed_count
                         
                         stats = StrategyStats(
@@ -375,53 +398,25 @@ def get_dashboard_overview(
             logger.error(f"Failed to get strategy performance: {exc}")
             strategy_response = None
         
-        # Collect all completed trades to calculate total fees
-        # Do this after strategy performance to ensure we have all trades
-        try:
-            all_completed_trades_for_fees = []
-            strategies_for_fees = runner.list_strategies()
-            for strategy in strategies_for_fees:
-                if account_id and strategy.account_id != account_id:
-                    continue
-                
-                try:
-                    db_strategy = runner.strategy_service.db_service.get_strategy(current_user.id, strategy.id) if runner.strategy_service else None
-                    if db_strategy:
-                        try:
-                            completed_trades_for_fees = _get_completed_trades_from_database(
-                                db_service=db_service,
-                                user_id=current_user.id,
-                                strategy_uuid=db_strategy.id,
-                                strategy_id=strategy.id,
-                                start_datetime=start_datetime,
-                                end_datetime=end_datetime
-                            )
-                            all_completed_trades_for_fees.extend(completed_trades_for_fees)
-                        except Exception as e:
-                            logger.debug(f"Could not get completed trades for fee calculation for strategy {strategy.id}: {e}")
-                except Exception:
-                    pass
-            
-            # Calculate total fees from completed trades
-            if all_completed_trades_for_fees:
-                total_trade_fees = sum(trade.fee_paid for trade in all_completed_trades_for_fees)
-                total_funding_fees = sum(trade.funding_fee for trade in all_completed_trades_for_fees)
-        except Exception as exc:
-            logger.debug(f"Failed to calculate total fees: {exc}")
-            # Keep default values (0.0)
+        # Calculate total fees from the completed trades of the date range
+        completed_trades_for_fees = _exited_between(all_completed_trades, start_datetime, end_datetime)
+        if completed_trades_for_fees:
+            total_trade_fees = sum(trade.fee_paid for trade in completed_trades_for_fees)
+            total_funding_fees = sum(trade.funding_fee for trade in completed_trades_for_fees)
         
         # Get symbol PnL data
         # We'll use the trades endpoint logic directly
         try:
             from app.api.routes.trades import get_pnl_overview
-            symbol_pnl_list = get_pnl_overview(
+            symbol_pnl_list = await get_pnl_overview(
                 account_id=account_id,
                 start_date=start_date,
                 end_date=end_date,
                 current_user=current_user,
                 runner=runner,
                 client=client,
-                client_manager=client_manager
+                client_manager=client_manager,
+                db_service=db_service,
             )
         except Exception as exc:
             logger.error(f"Failed to get symbol PnL: {exc}")
@@ -444,7 +439,7 @@ def get_dashboard_overview(
             worst_strategy = strategies[-1] if strategies else None
         else:
             # Fallback if strategy performance endpoint fails
-            strategies = runner.list_strategies()
+            strategies = all_strategies
             total_strategies = len(strategies)
             active_strategies = len([s for s in strategies if s.status.value == "running"])
             
@@ -460,7 +455,7 @@ def get_dashboard_overview(
                 if account_id and strategy.account_id != account_id:
                     continue
                 try:
-                    stats = runner.calculate_strategy_stats(strategy.id)
+                    stats = await asyncio.to_thread(runner.calculate_strategy_stats, strategy.id)
                     realized_pnl += stats.total_pnl
                     unrealized_pnl += (strategy.unrealized_pnl or 0.0)
                     total_trades += stats.total_trades
@@ -486,7 +481,7 @@ def get_dashboard_overview(
                 account_client = client_manager.get_client(account_id) or client
             
             rest = account_client._ensure()
-            account_info = rest.futures_account()
+            account_info = await asyncio.to_thread(rest.futures_account)
             
             # Get USDT balance (or main quote currency)
             assets = account_info.get("assets", [])
@@ -504,9 +499,6 @@ def get_dashboard_overview(
         pnl_change_30d = None
         
         try:
-            from app.api.routes.reports import _get_completed_trades_from_database
-            from app.models.db_models import Strategy as DBStrategy
-            
             now = datetime.now(timezone.utc)
             periods = {
                 '24h': now - timedelta(hours=24),
@@ -514,33 +506,9 @@ def get_dashboard_overview(
                 '30d': now - timedelta(days=30),
             }
             
-            # Get fresh list of strategies for period calculation
-            # Note: 'strategies' variable may have been overwritten with StrategyPerformance objects
-            period_strategies = runner.list_strategies()
-            
-            # Calculate PnL for each period
+            # Calculate PnL for each period from the completed trades within it
             for period_name, period_start in periods.items():
-                period_pnl = 0.0
-                
-                # Collect completed trades within this period
-                for strategy in period_strategies:
-                    if account_id and strategy.account_id != account_id:
-                        continue
-                    
-                    try:
-                        db_strategy = db_service.get_strategy(current_user.id, strategy.id)
-                        if db_strategy:
-                            period_trades = _get_completed_trades_from_database(
-                                db_service=db_service,
-                                user_id=current_user.id,
-                                strategy_uuid=db_strategy.id,
-                                strategy_id=strategy.id,
-                                start_datetime=period_start,
-                                end_datetime=now
-                            )
-                            period_pnl += sum(trade.pnl_usd for trade in period_trades)
-                    except Exception as e:
-                        logger.debug(f"Could not get period trades for {period_name} for strategy {strategy.id}: {e}")
+                period_pnl = sum(trade.pnl_usd for trade in _exited_between(all_completed_trades, period_start, now))
                 
                 # Set the appropriate variable
                 if period_name == '24h':
@@ -559,36 +527,9 @@ def get_dashboard_overview(
         # (date filters are for summary metrics, but timeline shows full history for context)
         pnl_timeline = []
         try:
-            from app.api.routes.reports import _get_completed_trades_from_database
-            from app.models.db_models import Strategy as DBStrategy
-            
-            # Get fresh list of strategies (StrategySummary objects) for timeline calculation
-            # Note: 'strategies' variable may have been overwritten with StrategyPerformance objects
-            timeline_strategies = runner.list_strategies()
-            
-            # Collect all completed trades from all strategies (no date filter for timeline)
+            # All completed trades of all strategies (no date filter for timeline)
             # This allows the timeline to show full historical progression
-            all_completed_trades_timeline = []
-            for strategy in timeline_strategies:
-                if account_id and strategy.account_id != account_id:
-                    continue
-                
-                try:
-                    db_strategy = db_service.get_strategy(current_user.id, strategy.id)
-                    if db_strategy:
-                        # Get all completed trades for timeline (ignore date filters)
-                        completed_trades_timeline = _get_completed_trades_from_database(
-                            db_service=db_service,
-                            user_id=current_user.id,
-                            strategy_uuid=db_strategy.id,
-                            strategy_id=strategy.id,
-                            start_datetime=None,  # No date filter - show all history
-                            end_datetime=None     # No date filter - show all history
-                        )
-                        all_completed_trades_timeline.extend(completed_trades_timeline)
-                        logger.debug(f"Timeline: Found {len(completed_trades_timeline)} completed trades for strategy {strategy.id}")
-                except Exception as e:
-                    logger.warning(f"Could not get completed trades for timeline for strategy {strategy.id}: {e}")
+            all_completed_trades_timeline = list(all_completed_trades)
             
             logger.info(f"Timeline: Total completed trades collected: {len(all_completed_trades_timeline)}")
             
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Tuple
 from uuid import UUID
@@ -11,7 +12,7 @@ from dateutil import parser as date_parser
 from fastapi import APIRouter, Depends, Query
 from loguru import logger
 
-from app.api.deps import get_strategy_runner, get_binance_client, get_current_user, get_database_service
+from app.api.deps import get_strategy_runner, get_binance_client, get_current_user_async, get_database_service_async
 from app.models.report import StrategyReport, TradeReport, TradingReport, TrailingStopUpdateItem
 from app.models.order import OrderResponse
 from app.models.strategy import StrategySummary
@@ -19,9 +20,8 @@ from app.models.db_models import User
 from app.services.strategy_runner import StrategyRunner
 from app.services.trade_service import TradeService
 from app.services.database_service import DatabaseService
+from app.services.report_cache import cached_report
 from app.core.my_binance_client import BinanceClient
-from app.core.redis_storage import RedisStorage
-from app.core.config import get_settings
 
 
 router = APIRouter(prefix="/api/reports", tags=["reports"])
@@ -116,6 +116,197 @@ def _fetch_klines_for_strategy(
         return (strategy.id, None)
 
 
+def _fetch_klines_parallel(
+    client: BinanceClient,
+    klines_tasks: List[Tuple[StrategySummary, datetime, datetime]],
+) -> Dict[str, Optional[List]]:
+    """Fetch klines of several strategies in parallel (blocking).
+    
+    Args:
+        client: Binance client
+        klines_tasks: (strategy, chart_start, chart_end) per strategy
+    
+    Returns:
+        Dictionary mapping strategy_id to klines data (None on error)
+    """
+    klines_by_strategy: Dict[str, Optional[List]] = {}
+    with ThreadPoolExecutor(max_workers=min(len(klines_tasks), 5)) as executor:
+        future_to_strategy = {
+            executor.submit(_fetch_klines_for_strategy, client, strategy, chart_start, chart_end): strategy
+            for strategy, chart_start, chart_end in klines_tasks
+        }
+        
+        for future in as_completed(future_to_strategy):
+            try:
+                strategy_id, klines_data = future.result()
+                klines_by_strategy[strategy_id] = klines_data
+            except Exception as e:
+                strategy = future_to_strategy[future]
+                logger.warning(f"Error fetching klines for strategy {strategy.id}: {e}")
+                klines_by_strategy[strategy.id] = None
+    return klines_by_strategy
+
+
+def _group_trailing_stop_updates(updates) -> Dict[UUID, List[TrailingStopUpdateItem]]:
+    """Group TrailingStopUpdate rows (ordered by update_sequence) by position_instance_id."""
+    histories: Dict[UUID, List[TrailingStopUpdateItem]] = {}
+    for u in updates:
+        histories.setdefault(u.position_instance_id, []).append(
+            TrailingStopUpdateItem(
+                update_sequence=u.update_sequence,
+                best_price=float(u.best_price),
+                tp_price=float(u.tp_price),
+                sl_price=float(u.sl_price),
+                created_at=u.created_at,
+            )
+        )
+    return histories
+
+
+def _completed_trade_to_report(
+    ct,
+    strategy_id: str,
+    trailing_stop_history: List[TrailingStopUpdateItem],
+) -> TradeReport:
+    """Convert a CompletedTrade row to TradeReport."""
+    return TradeReport(
+        trade_id=str(ct.entry_order_id),  # Use entry_order_id as trade_id
+        strategy_id=strategy_id,
+        symbol=ct.symbol,
+        side=ct.side,  # "LONG" or "SHORT"
+        entry_time=ct.entry_time,
+        entry_price=float(ct.entry_price),
+        exit_time=ct.exit_time,
+        exit_price=float(ct.exit_price),
+        quantity=float(ct.quantity),
+        leverage=ct.leverage or 1,
+        fee_paid=float(ct.fee_paid),
+        funding_fee=float(ct.funding_fee),
+        pnl_usd=float(ct.pnl_usd),
+        pnl_pct=float(ct.pnl_pct),
+        exit_reason=ct.exit_reason,
+        initial_margin=float(ct.initial_margin) if ct.initial_margin else None,
+        margin_type=ct.margin_type,
+        notional_value=float(ct.notional_value) if ct.notional_value else None,
+        entry_order_id=ct.entry_order_id,
+        exit_order_id=ct.exit_order_id,
+        trailing_stop_history=trailing_stop_history,
+    )
+
+
+async def _async_get_completed_trades_for_strategies(
+    db_service: DatabaseService,
+    user_id: UUID,
+    strategies: list,
+    start_datetime: Optional[datetime] = None,
+    end_datetime: Optional[datetime] = None,
+) -> List[TradeReport]:
+    """Get completed trades of several strategies from CompletedTrade table (async).
+
+    Async, batched counterpart of ``_get_completed_trades_from_database``: one
+    query for the completed trades of all strategies and one for their
+    trailing stop history, instead of several queries per strategy.
+
+    Args:
+        db_service: Database service (async)
+        user_id: User UUID
+        strategies: Strategy models with the ``account`` relationship loaded
+            (as returned by ``async_get_user_strategies``)
+        start_datetime: Optional start date filter (exit_time)
+        end_datetime: Optional end date filter (exit_time)
+
+    Returns:
+        List of TradeReport objects, most recent exit first
+    """
+    if not strategies:
+        return []
+    try:
+        from sqlalchemy import and_, or_, select
+        from app.models.db_models import CompletedTrade, TrailingStopUpdate
+
+        # Paper trading strategies only report paper trades, live strategies only live trades
+        paper_ids = [s.id for s in strategies if s.account is not None and s.account.paper_trading]
+        live_ids = [s.id for s in strategies if not (s.account is not None and s.account.paper_trading)]
+        conditions = []
+        if paper_ids:
+            conditions.append(and_(CompletedTrade.strategy_id.in_(paper_ids), CompletedTrade.paper_trading == True))
+        if live_ids:
+            conditions.append(and_(CompletedTrade.strategy_id.in_(live_ids), CompletedTrade.paper_trading == False))
+
+        stmt = select(CompletedTrade).filter(CompletedTrade.user_id == user_id, or_(*conditions))
+        if start_datetime:
+            stmt = stmt.filter(CompletedTrade.exit_time >= start_datetime)
+        if end_datetime:
+            stmt = stmt.filter(CompletedTrade.exit_time <= end_datetime)
+        stmt = stmt.order_by(CompletedTrade.exit_time.desc())
+
+        result = await db_service.db.execute(stmt)
+        completed_trades = result.scalars().all()
+
+        position_instance_ids = {ct.position_instance_id for ct in completed_trades if ct.position_instance_id is not None}
+        updates = []
+        if position_instance_ids:
+            result = await db_service.db.execute(
+                select(TrailingStopUpdate)
+                .filter(TrailingStopUpdate.position_instance_id.in_(position_instance_ids))
+                .order_by(TrailingStopUpdate.update_sequence.asc())
+            )
+            updates = result.scalars().all()
+        trailing_stop_histories = _group_trailing_stop_updates(updates)
+
+        strategy_ids = {s.id: s.strategy_id or str(s.id) for s in strategies}
+        trade_reports = [
+            _completed_trade_to_report(
+                ct, strategy_ids[ct.strategy_id], trailing_stop_histories.get(ct.position_instance_id, [])
+            )
+            for ct in completed_trades
+        ]
+        logger.info(
+            f"_async_get_completed_trades_for_strategies: Found {len(trade_reports)} completed trades "
+            f"for {len(strategies)} strategies"
+        )
+        return trade_reports
+    except Exception as e:
+        logger.warning(f"Failed to get completed trades from database for {len(strategies)} strategies: {e}", exc_info=True)
+        return []
+
+
+async def _async_get_completed_trades_by_strategy(
+    db_service: DatabaseService,
+    user_id: UUID,
+    strategy_ids: List[str],
+    start_datetime: Optional[datetime] = None,
+    end_datetime: Optional[datetime] = None,
+) -> Dict[str, List[TradeReport]]:
+    """Get completed trades of the user's strategies, grouped by strategy ID (async).
+    
+    Loads the strategies (account eager-loaded) and then their completed trades
+    with ``_async_get_completed_trades_for_strategies``.
+    
+    Args:
+        db_service: Database service (async)
+        user_id: User UUID
+        strategy_ids: Strategy ID strings (as used by the strategy runner)
+        start_datetime: Optional start date filter (exit_time)
+        end_datetime: Optional end date filter (exit_time)
+    
+    Returns:
+        Dictionary mapping strategy ID to its TradeReport objects, most recent exit first.
+        Strategies without completed trades are missing.
+    """
+    wanted = set(strategy_ids)
+    if not wanted:
+        return {}
+    strategies = [s for s in await db_service.async_get_user_strategies(user_id) if s.strategy_id in wanted]
+    trade_reports = await _async_get_completed_trades_for_strategies(
+        db_service, user_id, strategies, start_datetime, end_datetime
+    )
+    by_strategy: Dict[str, List[TradeReport]] = {}
+    for trade_report in trade_reports:
+        by_strategy.setdefault(trade_report.strategy_id, []).append(trade_report)
+    return by_strategy
+
+
 def _get_completed_trades_from_database(
     db_service: DatabaseService,
     user_id: UUID,
@@ -180,52 +371,23 @@ def _get_completed_trades_from_database(
         completed_trades = query.all()
         from app.models.db_models import TrailingStopUpdate
 
-        # Convert to TradeReport
-        trade_reports = []
-        for ct in completed_trades:
-            # Fetch trailing stop history for this trade when position_instance_id is set
-            trailing_stop_history: List[TrailingStopUpdateItem] = []
-            if ct.position_instance_id is not None:
-                updates = (
-                    db_service.db.query(TrailingStopUpdate)
-                    .filter(TrailingStopUpdate.position_instance_id == ct.position_instance_id)
-                    .order_by(TrailingStopUpdate.update_sequence.asc())
-                    .all()
-                )
-                for u in updates:
-                    trailing_stop_history.append(
-                        TrailingStopUpdateItem(
-                            update_sequence=u.update_sequence,
-                            best_price=float(u.best_price),
-                            tp_price=float(u.tp_price),
-                            sl_price=float(u.sl_price),
-                            created_at=u.created_at,
-                        )
-                    )
-            trade_report = TradeReport(
-                trade_id=str(ct.entry_order_id),  # Use entry_order_id as trade_id
-                strategy_id=strategy_id,
-                symbol=ct.symbol,
-                side=ct.side,  # "LONG" or "SHORT"
-                entry_time=ct.entry_time,
-                entry_price=float(ct.entry_price),
-                exit_time=ct.exit_time,
-                exit_price=float(ct.exit_price),
-                quantity=float(ct.quantity),
-                leverage=ct.leverage or 1,
-                fee_paid=float(ct.fee_paid),
-                funding_fee=float(ct.funding_fee),
-                pnl_usd=float(ct.pnl_usd),
-                pnl_pct=float(ct.pnl_pct),
-                exit_reason=ct.exit_reason,
-                initial_margin=float(ct.initial_margin) if ct.initial_margin else None,
-                margin_type=ct.margin_type,
-                notional_value=float(ct.notional_value) if ct.notional_value else None,
-                entry_order_id=ct.entry_order_id,
-                exit_order_id=ct.exit_order_id,
-                trailing_stop_history=trailing_stop_history,
+        # Trailing stop history of all trades in one query
+        position_instance_ids = {ct.position_instance_id for ct in completed_trades if ct.position_instance_id is not None}
+        updates = []
+        if position_instance_ids:
+            updates = (
+                db_service.db.query(TrailingStopUpdate)
+                .filter(TrailingStopUpdate.position_instance_id.in_(position_instance_ids))
+                .order_by(TrailingStopUpdate.update_sequence.asc())
+                .all()
             )
-            trade_reports.append(trade_report)
+        trailing_stop_histories = _group_trailing_stop_updates(updates)
+
+        # Convert to TradeReport
+        trade_reports = [
+            _completed_trade_to_report(ct, strategy_id, trailing_stop_histories.get(ct.position_instance_id, []))
+            for ct in completed_trades
+        ]
         
         logger.info(
             f"_get_completed_trades_from_database: Found {len(trade_reports)} completed trades "
@@ -528,18 +690,238 @@ def _match_trades_to_completed_positions(
     return completed_trades
 
 
+def _calculate_indicators(strategy: StrategySummary, klines_data: List) -> Optional[Dict]:
+    """Calculate chart indicators of a strategy from its klines (CPU-bound, run off the event loop).
+    
+    Returns:
+        Indicator series for the strategy type, or None if not available
+    """
+    indicators_data = None
+    try:
+        from app.strategies.indicators import calculate_ema, calculate_rsi
+
+        # Extract closing prices
+        closing_prices = [float(k[4]) for k in klines_data]
+
+        # Get strategy type (handle both enum and string)
+        strategy_type_str = None
+        if hasattr(strategy, 'strategy_type'):
+            if hasattr(strategy.strategy_type, 'value'):
+                strategy_type_str = strategy.strategy_type.value
+            else:
+                strategy_type_str = str(strategy.strategy_type)
+
+        if strategy_type_str == "scalping":
+            # Scalping strategy: Calculate EMA fast and slow
+            fast_period = 8  # default
+            slow_period = 21  # default
+            if hasattr(strategy, 'params') and strategy.params:
+                if isinstance(strategy.params, dict):
+                    fast_period = int(strategy.params.get('ema_fast', 8))
+                    slow_period = int(strategy.params.get('ema_slow', 21))
+                elif hasattr(strategy.params, 'ema_fast'):
+                    fast_period = int(getattr(strategy.params, 'ema_fast', 8))
+                    slow_period = int(getattr(strategy.params, 'ema_slow', 21))
+
+            # Calculate EMA fast and slow
+            ema_fast_values = []
+            ema_slow_values = []
+
+            for i in range(len(closing_prices)):
+                # EMA fast
+                prices_up_to_i = closing_prices[:i+1]
+                ema_fast = calculate_ema(prices_up_to_i, fast_period) if len(prices_up_to_i) >= fast_period else None
+                ema_fast_values.append(ema_fast)
+
+                # EMA slow
+                ema_slow = calculate_ema(prices_up_to_i, slow_period) if len(prices_up_to_i) >= slow_period else None
+                ema_slow_values.append(ema_slow)
+
+            # Create indicators data with timestamps matching klines
+            indicators_data = {
+                "ema_fast": [
+                    {"time": int(k[0]) // 1000, "value": ema_fast_values[i]} 
+                    for i, k in enumerate(klines_data) 
+                    if ema_fast_values[i] is not None
+                ],
+                "ema_slow": [
+                    {"time": int(k[0]) // 1000, "value": ema_slow_values[i]} 
+                    for i, k in enumerate(klines_data) 
+                    if ema_slow_values[i] is not None
+                ],
+                "ema_fast_period": fast_period,
+                "ema_slow_period": slow_period
+            }
+        elif strategy_type_str == "range_mean_reversion":
+            # Range mean reversion strategy: Calculate EMA, RSI, and basic range detection
+            # Get parameters from strategy
+            lookback_period = 150
+            ema_fast_period = 20
+            ema_slow_period = 50
+            rsi_period = 14
+            rsi_oversold = 40
+            rsi_overbought = 60
+            buy_zone_pct = 0.2
+            sell_zone_pct = 0.2
+
+            if hasattr(strategy, 'params') and strategy.params:
+                if isinstance(strategy.params, dict):
+                    lookback_period = int(strategy.params.get('lookback_period', 150))
+                    ema_fast_period = int(strategy.params.get('ema_fast_period', 20))
+                    ema_slow_period = int(strategy.params.get('ema_slow_period', 50))
+                    rsi_period = int(strategy.params.get('rsi_period', 14))
+                    rsi_oversold = float(strategy.params.get('rsi_oversold', 40))
+                    rsi_overbought = float(strategy.params.get('rsi_overbought', 60))
+                    buy_zone_pct = float(strategy.params.get('buy_zone_pct', 0.2))
+                    sell_zone_pct = float(strategy.params.get('sell_zone_pct', 0.2))
+                elif hasattr(strategy.params, 'lookback_period'):
+                    lookback_period = int(getattr(strategy.params, 'lookback_period', 150))
+                    ema_fast_period = int(getattr(strategy.params, 'ema_fast_period', 20))
+                    ema_slow_period = int(getattr(strategy.params, 'ema_slow_period', 50))
+                    rsi_period = int(getattr(strategy.params, 'rsi_period', 14))
+                    rsi_oversold = float(getattr(strategy.params, 'rsi_oversold', 40))
+                    rsi_overbought = float(getattr(strategy.params, 'rsi_overbought', 60))
+                    buy_zone_pct = float(getattr(strategy.params, 'buy_zone_pct', 0.2))
+                    sell_zone_pct = float(getattr(strategy.params, 'sell_zone_pct', 0.2))
+
+            # Calculate EMA fast and slow
+            ema_fast_values = []
+            ema_slow_values = []
+            for i in range(len(closing_prices)):
+                prices_up_to_i = closing_prices[:i+1]
+                ema_fast = calculate_ema(prices_up_to_i, ema_fast_period) if len(prices_up_to_i) >= ema_fast_period else None
+                ema_slow = calculate_ema(prices_up_to_i, ema_slow_period) if len(prices_up_to_i) >= ema_slow_period else None
+                ema_fast_values.append(ema_fast)
+                ema_slow_values.append(ema_slow)
+
+            # Calculate RSI
+            rsi_values = []
+            for i in range(len(closing_prices)):
+                prices_up_to_i = closing_prices[:i+1]
+                rsi = calculate_rsi(prices_up_to_i, rsi_period) if len(prices_up_to_i) >= rsi_period + 1 else None
+                rsi_values.append(rsi)
+
+            # Simple range detection: calculate range for each lookback window
+            range_high_values = []
+            range_low_values = []
+            range_mid_values = []
+            buy_zone_upper_values = []
+            sell_zone_lower_values = []
+
+            for i in range(len(klines_data)):
+                if i < lookback_period:
+                    range_high_values.append(None)
+                    range_low_values.append(None)
+                    range_mid_values.append(None)
+                    buy_zone_upper_values.append(None)
+                    sell_zone_lower_values.append(None)
+                else:
+                    # Get lookback window
+                    lookback_klines = klines_data[i - lookback_period:i]
+                    highs = [float(k[2]) for k in lookback_klines]
+                    lows = [float(k[3]) for k in lookback_klines]
+
+                    range_high = max(highs)
+                    range_low = min(lows)
+                    range_mid = (range_high + range_low) / 2
+                    range_size = range_high - range_low
+
+                    range_high_values.append(range_high)
+                    range_low_values.append(range_low)
+                    range_mid_values.append(range_mid)
+                    buy_zone_upper_values.append(range_low + (range_size * buy_zone_pct))
+                    sell_zone_lower_values.append(range_high - (range_size * sell_zone_pct))
+
+            # Calculate EMA spread percentage
+            ema_spread_pct_values = []
+            for i in range(len(klines_data)):
+                if ema_fast_values[i] is not None and ema_slow_values[i] is not None:
+                    ema_mid = (ema_fast_values[i] + ema_slow_values[i]) / 2
+                    if ema_mid > 0:
+                        spread = abs(ema_fast_values[i] - ema_slow_values[i]) / ema_mid
+                        ema_spread_pct_values.append(spread)
+                    else:
+                        ema_spread_pct_values.append(None)
+                else:
+                    ema_spread_pct_values.append(None)
+
+            # Create indicators data with timestamps matching klines
+            indicators_data = {
+                "range_high": [
+                    {"time": int(k[0]) // 1000, "value": range_high_values[i]} 
+                    for i, k in enumerate(klines_data) 
+                    if range_high_values[i] is not None
+                ],
+                "range_low": [
+                    {"time": int(k[0]) // 1000, "value": range_low_values[i]} 
+                    for i, k in enumerate(klines_data) 
+                    if range_low_values[i] is not None
+                ],
+                "range_mid": [
+                    {"time": int(k[0]) // 1000, "value": range_mid_values[i]} 
+                    for i, k in enumerate(klines_data) 
+                    if range_mid_values[i] is not None
+                ],
+                "buy_zone_upper": [
+                    {"time": int(k[0]) // 1000, "value": buy_zone_upper_values[i]} 
+                    for i, k in enumerate(klines_data) 
+                    if buy_zone_upper_values[i] is not None
+                ],
+                "sell_zone_lower": [
+                    {"time": int(k[0]) // 1000, "value": sell_zone_lower_values[i]} 
+                    for i, k in enumerate(klines_data) 
+                    if sell_zone_lower_values[i] is not None
+                ],
+                "rsi": [
+                    {"time": int(k[0]) // 1000, "value": rsi_values[i]} 
+                    for i, k in enumerate(klines_data) 
+                    if rsi_values[i] is not None
+                ],
+                "ema_fast": [
+                    {"time": int(k[0]) // 1000, "value": ema_fast_values[i]} 
+                    for i, k in enumerate(klines_data) 
+                    if ema_fast_values[i] is not None
+                ],
+                "ema_slow": [
+                    {"time": int(k[0]) // 1000, "value": ema_slow_values[i]} 
+                    for i, k in enumerate(klines_data) 
+                    if ema_slow_values[i] is not None
+                ],
+                "ema_spread_pct": [
+                    {"time": int(k[0]) // 1000, "value": ema_spread_pct_values[i]} 
+                    for i, k in enumerate(klines_data) 
+                    if ema_spread_pct_values[i] is not None
+                ],
+                "rsi_period": rsi_period,
+                "rsi_oversold": rsi_oversold,
+                "rsi_overbought": rsi_overbought,
+                "ema_fast_period": ema_fast_period,
+                "ema_slow_period": ema_slow_period,
+                "buy_zone_pct": buy_zone_pct,
+                "sell_zone_pct": sell_zone_pct,
+            }
+    except Exception as indicators_error:
+        logger.warning(f"Failed to calculate indicators for strategy {strategy.id}: {indicators_error}")
+        indicators_data = None
+    return indicators_data
+
+
 @router.get("/", response_model=TradingReport)
-def get_trading_report(
+@cached_report(
+    "trading_report",
+    ("strategy_id", "strategy_name", "symbol", "start_date", "end_date", "account_id"),
+)
+async def get_trading_report(
     strategy_id: Optional[str] = Query(default=None, description="Filter by strategy ID"),
     strategy_name: Optional[str] = Query(default=None, description="Filter by strategy name (partial match)"),
     symbol: Optional[str] = Query(default=None, description="Filter by symbol"),
     start_date: Optional[str] = Query(default=None, description="Filter from date/time (ISO format)"),
     end_date: Optional[str] = Query(default=None, description="Filter to date/time (ISO format)"),
     account_id: Optional[str] = Query(default=None, description="Filter by Binance account ID"),
-    current_user: Optional[User] = Depends(get_current_user),
+    current_user: Optional[User] = Depends(get_current_user_async),
     runner: Optional[StrategyRunner] = Depends(get_strategy_runner),
     client: Optional[BinanceClient] = Depends(get_binance_client),
-    db_service: Optional[DatabaseService] = Depends(get_database_service),
+    db_service: Optional[DatabaseService] = Depends(get_database_service_async),
 ) -> TradingReport:
     """Generate comprehensive trading report with strategy summaries and trade details.
     
@@ -582,8 +964,8 @@ def get_trading_report(
             else:
                 account_id = None  # Not a string and not a Query - treat as None
         
-        # Get all strategies
-        all_strategies = runner.list_strategies()
+        # Get all strategies (the runner may read them through its sync session: keep it off the event loop)
+        all_strategies = await asyncio.to_thread(runner.list_strategies)
         logger.debug(f"Reports endpoint: Found {len(all_strategies)} total strategies in memory")
         
         # Apply filters
@@ -612,68 +994,61 @@ def get_trading_report(
         total_profit = 0.0
         total_loss = 0.0
         
-        # Batch load trades for all strategies (optimizes N+1 query problem)
+        # Batch load completed trades and raw trades for all strategies (optimizes N+1 query problem)
         strategy_ids = [s.id for s in filtered_strategies]
         
+        # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
         # Try to fetch from database first (more reliable for historical data)
+        completed_trades_by_strategy: Dict[str, List[TradeReport]] = {}
         trades_by_strategy: Dict[str, List[OrderResponse]] = {}
         try:
-            if current_user and db_service:
-                # Create TradeService for database access
-                settings = get_settings()
-                redis_storage = None
-                if settings.redis_enabled:
-                    redis_storage = RedisStorage(
-                        redis_url=settings.redis_url,
-                        enabled=settings.redis_enabled
-                    )
-                # Get the underlying SQLAlchemy session from DatabaseService
-                from sqlalchemy.orm import Session
-                db_session: Session = db_service.db
-                trade_service = TradeService(db_session, redis_storage)
-                
-                # Get strategy UUIDs from database
-                from app.services.strategy_service import StrategyService
-                strategy_service = StrategyService(db_session, redis_storage)
-                strategy_uuid_map: Dict[str, str] = {}  # Map strategy_id (string) to UUID
-                
-                for strategy_id in strategy_ids:
-                    db_strategy = strategy_service.db_service.get_strategy(current_user.id, strategy_id)
-                    if db_strategy:
-                        strategy_uuid_map[strategy_id] = str(db_strategy.id)
-                
-                if strategy_uuid_map:
-                    # Batch fetch trades from database
-                    uuid_list = [UUID(uuid_str) for uuid_str in strategy_uuid_map.values()]
-                    logger.info(f"Reports: Fetching trades from database for {len(uuid_list)} strategies (UUIDs: {[str(u) for u in uuid_list[:3]]}...)")
-                    trades_by_uuid = trade_service.get_trades_batch(
+            if current_user and db_service and strategy_ids:
+                # Strategies (account eager-loaded) and their completed trades in a few queries
+                wanted = set(strategy_ids)
+                db_strategies = [
+                    s for s in await db_service.async_get_user_strategies(current_user.id)
+                    if s.strategy_id in wanted
+                ]
+                if db_strategies:
+                    for trade_report in await _async_get_completed_trades_for_strategies(
+                        db_service=db_service,
                         user_id=current_user.id,
-                        strategy_ids=uuid_list,
-                        limit_per_strategy=10000
-                    )
+                        strategies=db_strategies,
+                        start_datetime=start_datetime,
+                        end_datetime=end_datetime,
+                    ):
+                        completed_trades_by_strategy.setdefault(trade_report.strategy_id, []).append(trade_report)
                     
-                    # Convert UUID keys back to string strategy_id keys
-                    for strategy_id, uuid_str in strategy_uuid_map.items():
-                        strategy_uuid = UUID(uuid_str)
-                        if strategy_uuid in trades_by_uuid:
-                            trades_by_strategy[strategy_id] = trades_by_uuid[strategy_uuid]
-                            logger.debug(f"Reports: Strategy {strategy_id} (UUID {uuid_str}) has {len(trades_by_uuid[strategy_uuid])} trades from database")
-                        else:
-                            trades_by_strategy[strategy_id] = []
-                            logger.warning(f"Reports: Strategy {strategy_id} (UUID {uuid_str}) has no trades in database result")
+                    # Raw trades are only needed for on-demand matching of strategies without completed trades
+                    fallback_strategies = [s for s in db_strategies if s.strategy_id not in completed_trades_by_strategy]
+                    if fallback_strategies:
+                        trade_service = TradeService(db_service.db)
+                        logger.info(f"Reports: Fetching trades from database for {len(fallback_strategies)} strategies without completed trades")
+                        trades_by_uuid = await trade_service.async_get_trades_batch(
+                            user_id=current_user.id,
+                            strategy_ids=[s.id for s in fallback_strategies],
+                            limit_per_strategy=10000
+                        )
+                        for s in fallback_strategies:
+                            trades_by_strategy[s.strategy_id] = trades_by_uuid.get(s.id, [])
                     
-                    logger.info(f"Reports: Fetched {sum(len(t) for t in trades_by_strategy.values())} trades from database for {len(trades_by_strategy)} strategies")
+                    logger.info(
+                        f"Reports: Fetched {sum(len(t) for t in completed_trades_by_strategy.values())} completed trades "
+                        f"and {sum(len(t) for t in trades_by_strategy.values())} raw trades from database "
+                        f"for {len(db_strategies)} strategies"
+                    )
                 else:
                     logger.warning("Reports: No strategies found in database, falling back to StrategyRunner")
-                    trades_by_strategy = runner.get_trades_batch(strategy_ids)
+                    trades_by_strategy = await asyncio.to_thread(runner.get_trades_batch, strategy_ids)
             else:
                 # No user authenticated or db_service not available - use StrategyRunner
                 logger.debug("Reports: No user authenticated or db_service unavailable, using StrategyRunner")
-                trades_by_strategy = runner.get_trades_batch(strategy_ids)
+                trades_by_strategy = await asyncio.to_thread(runner.get_trades_batch, strategy_ids)
         except Exception as db_exc:
             logger.warning(f"Reports: Failed to fetch trades from database: {db_exc}, falling back to StrategyRunner")
             # Fallback to StrategyRunner method (Redis/in-memory)
-            trades_by_strategy = runner.get_trades_batch(strategy_ids)
+            completed_trades_by_strategy = {}
+            trades_by_strategy = await asyncio.to_thread(runner.get_trades_batch, strategy_ids)
         
         # Parallel fetch klines for all strategies (optimizes sequential API calls)
         klines_by_strategy: Dict[str, Optional[List]] = {}
@@ -693,62 +1068,19 @@ def get_trading_report(
                 if chart_start and chart_end and chart_start < chart_end:
                     klines_tasks.append((strategy, chart_start, chart_end))
             
-            # Fetch klines in parallel using ThreadPoolExecutor
+            # Fetch klines in parallel, off the event loop
             if klines_tasks:
-                with ThreadPoolExecutor(max_workers=min(len(klines_tasks), 5)) as executor:
-                    future_to_strategy = {
-                        executor.submit(_fetch_klines_for_strategy, client, strategy, chart_start, chart_end): strategy
-                        for strategy, chart_start, chart_end in klines_tasks
-                    }
-                    
-                    for future in as_completed(future_to_strategy):
-                        try:
-                            strategy_id, klines_data = future.result()
-                            klines_by_strategy[strategy_id] = klines_data
-                        except Exception as e:
-                            strategy = future_to_strategy[future]
-                            logger.warning(f"Error fetching klines for strategy {strategy.id}: {e}")
-                            klines_by_strategy[strategy.id] = None
+                klines_by_strategy = await asyncio.to_thread(_fetch_klines_parallel, client, klines_tasks)
         
         for strategy in filtered_strategies:
             try:
-                # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
-                # This is much faster than on-demand matching
-                completed_trades_list: List[TradeReport] = []
-                
-                if current_user and db_service:
-                    try:
-                        # Get strategy UUID from database
-                        from app.services.strategy_service import StrategyService
-                        settings = get_settings()
-                        redis_storage = None
-                        if settings.redis_enabled:
-                            redis_storage = RedisStorage(
-                                redis_url=settings.redis_url,
-                                enabled=settings.redis_enabled
-                            )
-                        strategy_service = StrategyService(db_service.db, redis_storage)
-                        db_strategy = strategy_service.db_service.get_strategy(current_user.id, strategy.id)
-                        
-                        if db_strategy:
-                            # Query from CompletedTrade table (pre-computed)
-                            completed_trades_list = _get_completed_trades_from_database(
-                                db_service=db_service,
-                                user_id=current_user.id,
-                                strategy_uuid=db_strategy.id,
-                                strategy_id=strategy.id,
-                                start_datetime=start_datetime,
-                                end_datetime=end_datetime,
-                            )
-                            logger.info(
-                                f"Reports: Strategy {strategy.id} has {len(completed_trades_list)} "
-                                f"completed trades from CompletedTrade table (pre-computed)"
-                            )
-                    except Exception as db_exc:
-                        logger.warning(
-                            f"Reports: Failed to get completed trades from database for strategy {strategy.id}: {db_exc}. "
-                            f"Falling back to on-demand matching."
-                        )
+                # Completed trades from CompletedTrade table (batch-loaded above)
+                completed_trades_list: List[TradeReport] = completed_trades_by_strategy.get(strategy.id, [])
+                if completed_trades_list:
+                    logger.info(
+                        f"Reports: Strategy {strategy.id} has {len(completed_trades_list)} "
+                        f"completed trades from CompletedTrade table (pre-computed)"
+                    )
                 
                 # ✅ FALLBACK: If no completed trades from database, use on-demand matching
                 # This handles cases where:
@@ -822,7 +1154,8 @@ def get_trading_report(
                             end_time_ms = int(latest_exit.timestamp() * 1000)
                             
                             # Fetch funding fees from Binance
-                            funding_fees = client.get_funding_fees(
+                            funding_fees = await asyncio.to_thread(
+                                client.get_funding_fees,
                                 symbol=strategy.symbol,
                                 start_time=start_time_ms,
                                 end_time=end_time_ms,
@@ -898,212 +1231,7 @@ def get_trading_report(
                 # Calculate indicators for charting if klines are available
                 indicators_data = None
                 if klines_data:
-                    try:
-                        from app.strategies.indicators import calculate_ema, calculate_rsi
-                        
-                        # Extract closing prices
-                        closing_prices = [float(k[4]) for k in klines_data]
-                        
-                        # Get strategy type (handle both enum and string)
-                        strategy_type_str = None
-                        if hasattr(strategy, 'strategy_type'):
-                            if hasattr(strategy.strategy_type, 'value'):
-                                strategy_type_str = strategy.strategy_type.value
-                            else:
-                                strategy_type_str = str(strategy.strategy_type)
-                        
-                        if strategy_type_str == "scalping":
-                            # Scalping strategy: Calculate EMA fast and slow
-                            fast_period = 8  # default
-                            slow_period = 21  # default
-                            if hasattr(strategy, 'params') and strategy.params:
-                                if isinstance(strategy.params, dict):
-                                    fast_period = int(strategy.params.get('ema_fast', 8))
-                                    slow_period = int(strategy.params.get('ema_slow', 21))
-                                elif hasattr(strategy.params, 'ema_fast'):
-                                    fast_period = int(getattr(strategy.params, 'ema_fast', 8))
-                                    slow_period = int(getattr(strategy.params, 'ema_slow', 21))
-                            
-                            # Calculate EMA fast and slow
-                            ema_fast_values = []
-                            ema_slow_values = []
-                            
-                            for i in range(len(closing_prices)):
-                                # EMA fast
-                                prices_up_to_i = closing_prices[:i+1]
-                                ema_fast = calculate_ema(prices_up_to_i, fast_period) if len(prices_up_to_i) >= fast_period else None
-                                ema_fast_values.append(ema_fast)
-                                
-                                # EMA slow
-                                ema_slow = calculate_ema(prices_up_to_i, slow_period) if len(prices_up_to_i) >= slow_period else None
-                                ema_slow_values.append(ema_slow)
-                            
-                            # Create indicators data with timestamps matching klines
-                            indicators_data = {
-                                "ema_fast": [
-                                    {"time": int(k[0]) // 1000, "value": ema_fast_values[i]} 
-                                    for i, k in enumerate(klines_data) 
-                                    if ema_fast_values[i] is not None
-                                ],
-                                "ema_slow": [
-                                    {"time": int(k[0]) // 1000, "value": ema_slow_values[i]} 
-                                    for i, k in enumerate(klines_data) 
-                                    if ema_slow_values[i] is not None
-                                ],
-                                "ema_fast_period": fast_period,
-                                "ema_slow_period": slow_period
-                            }
-                        elif strategy_type_str == "range_mean_reversion":
-                            # Range mean reversion strategy: Calculate EMA, RSI, and basic range detection
-                            # Get parameters from strategy
-                            lookback_period = 150
-                            ema_fast_period = 20
-                            ema_slow_period = 50
-                            rsi_period = 14
-                            rsi_oversold = 40
-                            rsi_overbought = 60
-                            buy_zone_pct = 0.2
-                            sell_zone_pct = 0.2
-                            
-                            if hasattr(strategy, 'params') and strategy.params:
-                                if isinstance(strategy.params, dict):
-                                    lookback_period = int(strategy.params.get('lookback_period', 150))
-                                    ema_fast_period = int(strategy.params.get('ema_fast_period', 20))
-                                    ema_slow_period = int(strategy.params.get('ema_slow_period', 50))
-                                    rsi_period = int(strategy.params.get('rsi_period', 14))
-                                    rsi_oversold = float(strategy.params.get('rsi_oversold', 40))
-                                    rsi_overbought = float(strategy.params.get('rsi_overbought', 60))
-                                    buy_zone_pct = float(strategy.params.get('buy_zone_pct', 0.2))
-                                    sell_zone_pct = float(strategy.params.get('sell_zone_pct', 0.2))
-                                elif hasattr(strategy.params, 'lookback_period'):
-                                    lookback_period = int(getattr(strategy.params, 'lookback_period', 150))
-                                    ema_fast_period = int(getattr(strategy.params, 'ema_fast_period', 20))
-                                    ema_slow_period = int(getattr(strategy.params, 'ema_slow_period', 50))
-                                    rsi_period = int(getattr(strategy.params, 'rsi_period', 14))
-                                    rsi_oversold = float(getattr(strategy.params, 'rsi_oversold', 40))
-                                    rsi_overbought = float(getattr(strategy.params, 'rsi_overbought', 60))
-                                    buy_zone_pct = float(getattr(strategy.params, 'buy_zone_pct', 0.2))
-                                    sell_zone_pct = float(getattr(strategy.params, 'sell_zone_pct', 0.2))
-                            
-                            # Calculate EMA fast and slow
-                            ema_fast_values = []
-                            ema_slow_values = []
-                            for i in range(len(closing_prices)):
-                                prices_up_to_i = closing_prices[:i+1]
-                                ema_fast = calculate_ema(prices_up_to_i, ema_fast_period) if len(prices_up_to_i) >= ema_fast_period else None
-                                ema_slow = calculate_ema(prices_up_to_i, ema_slow_period) if len(prices_up_to_i) >= ema_slow_period else None
-                                ema_fast_values.append(ema_fast)
-                                ema_slow_values.append(ema_slow)
-                            
-                            # Calculate RSI
-                            rsi_values = []
-                            for i in range(len(closing_prices)):
-                                prices_up_to_i = closing_prices[:i+1]
-                                rsi = calculate_rsi(prices_up_to_i, rsi_period) if len(prices_up_to_i) >= rsi_period + 1 else None
-                                rsi_values.append(rsi)
-                            
-                            # Simple range detection: calculate range for each lookback window
-                            range_high_values = []
-                            range_low_values = []
-                            range_mid_values = []
-                            buy_zone_upper_values = []
-                            sell_zone_lower_values = []
-                            
-                            for i in range(len(klines_data)):
-                                if i < lookback_period:
-                                    range_high_values.append(None)
-                                    range_low_values.append(None)
-                                    range_mid_values.append(None)
-                                    buy_zone_upper_values.append(None)
-                                    sell_zone_lower_values.append(None)
-                                else:
-                                    # Get lookback window
-                                    lookback_klines = klines_data[i - lookback_period:i]
-                                    highs = [float(k[2]) for k in lookback_klines]
-                                    lows = [float(k[3]) for k in lookback_klines]
-                                    
-                                    range_high = max(highs)
-                                    range_low = min(lows)
-                                    range_mid = (range_high + range_low) / 2
-                                    range_size = range_high - range_low
-                                    
-                                    range_high_values.append(range_high)
-                                    range_low_values.append(range_low)
-                                    range_mid_values.append(range_mid)
-                                    buy_zone_upper_values.append(range_low + (range_size * buy_zone_pct))
-                                    sell_zone_lower_values.append(range_high - (range_size * sell_zone_pct))
-                            
-                            # Calculate EMA spread percentage
-                            ema_spread_pct_values = []
-                            for i in range(len(klines_data)):
-                                if ema_fast_values[i] is not None and ema_slow_values[i] is not None:
-                                    ema_mid = (ema_fast_values[i] + ema_slow_values[i]) / 2
-                                    if ema_mid > 0:
-                                        spread = abs(ema_fast_values[i] - ema_slow_values[i]) / ema_mid
-                                        ema_spread_pct_values.append(spread)
-                                    else:
-                                        ema_spread_pct_values.append(None)
-                                else:
-                                    ema_spread_pct_values.append(None)
-                            
-                            # Create indicators data with timestamps matching klines
-                            indicators_data = {
-                                "range_high": [
-                                    {"time": int(k[0]) // 1000, "value": range_high_values[i]} 
-                                    for i, k in enumerate(klines_data) 
-                                    if range_high_values[i] is not None
-                                ],
-                                "range_low": [
-                                    {"time": int(k[0]) // 1000, "value": range_low_values[i]} 
-                                    for i, k in enumerate(klines_data) 
-                                    if range_low_values[i] is not None
-                                ],
-                                "range_mid": [
-                                    {"time": int(k[0]) // 1000, "value": range_mid_values[i]} 
-                                    for i, k in enumerate(klines_data) 
-                                    if range_mid_values[i] is not None
-                                ],
-                                "buy_zone_upper": [
-                                    {"time": int(k[0]) // 1000, "value": buy_zone_upper_values[i]} 
-                                    for i, k in enumerate(klines_data) 
-                                    if buy_zone_upper_values[i] is not None
-                                ],
-                                "sell_zone_lower": [
-                                    {"time": int(k[0]) // 1000, "value": sell_zone_lower_values[i]} 
-                                    for i, k in enumerate(klines_data) 
-                                    if sell_zone_lower_values[i] is not None
-                                ],
-                                "rsi": [
-                                    {"time": int(k[0]) // 1000, "value": rsi_values[i]} 
-                                    for i, k in enumerate(klines_data) 
-                                    if rsi_values[i] is not None
-                                ],
-                                "ema_fast": [
-                                    {"time": int(k[0]) // 1000, "value": ema_fast_values[i]} 
-                                    for i, k in enumerate(klines_data) 
-                                    if ema_fast_values[i] is not None
-                                ],
-                                "ema_slow": [
-                                    {"time": int(k[0]) // 1000, "value": ema_slow_values[i]} 
-                                    for i, k in enumerate(klines_data) 
-                                    if ema_slow_values[i] is not None
-                                ],
-                                "ema_spread_pct": [
-                                    {"time": int(k[0]) // 1000, "value": ema_spread_pct_values[i]} 
-                                    for i, k in enumerate(klines_data) 
-                                    if ema_spread_pct_values[i] is not None
-                                ],
-                                "rsi_period": rsi_period,
-                                "rsi_oversold": rsi_oversold,
-                                "rsi_overbought": rsi_overbought,
-                                "ema_fast_period": ema_fast_period,
-                                "ema_slow_period": ema_slow_period,
-                                "buy_zone_pct": buy_zone_pct,
-                                "sell_zone_pct": sell_zone_pct,
-                            }
-                    except Exception as indicators_error:
-                        logger.warning(f"Failed to calculate indicators for strategy {strategy.id}: {indicators_error}")
-                        indicators_data = None
+                    indicators_data = await asyncio.to_thread(_calculate_indicators, strategy, klines_data)
                 
                 # Get strategy type (handle both enum and string)
                 strategy_type_value = None
@@ -11,7 +11,7 @@ Phase 4 Week 8: Dashboard & Reporting
 from __future__ import annotations
 
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
@@ -40,6 +40,7 @@ def _safe_create_notification_task(coro):
 
 from app.risk.metrics_calculator import RiskMetricsCalculator, RiskMetrics
 from app.risk.portfolio_risk_manager import PortfolioRiskManager
+from app.risk.risk_config_cache import get_risk_config_cache
 from app.risk.circuit_breaker import CircuitBreaker
 from app.risk.margin_manager import MarginManager
 from app.services.risk_management_service import RiskManagementService
@@ -62,11 +63,17 @@ from app.models.risk_management import (
     StrategyRiskConfigResponse
 )
 from app.models.order import OrderResponse
-from sqlalchemy.orm import Session
-from app.models.db_models import User, Account
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.db_models import User, Strategy
 
 # Import dependencies from the correct location
-from app.api.deps import get_current_user, get_db_session_dependency, get_client_manager, get_account_service, get_strategy_runner
+from app.api.deps import (
+    get_current_user_async,
+    get_async_db,
+    get_client_manager, get_account_service_async,
+    get_strategy_runner,
+)
 from app.services.strategy_runner import StrategyRunner
 
 
@@ -108,13 +115,121 @@ _get_pnl_from_completed_trade = get_pnl_from_completed_trade
 _get_timestamp_from_completed_trade = get_timestamp_from_completed_trade
 
 
+async def _async_get_cached_account_risk_config(
+    risk_service: RiskManagementService,
+    user_id,
+    account_id: str,
+) -> Optional[RiskManagementConfigResponse]:
+    """Get account risk config through the process-wide risk config cache (async).
+    
+    The cache is invalidated by the create/update/delete config endpoints below.
+    Exceptions (e.g. missing tables) propagate and are not cached.
+    """
+    risk_config_cache = get_risk_config_cache()
+    hit, config = risk_config_cache.get_account_config(user_id, account_id)
+    if hit:
+        return config
+    generation = risk_config_cache.generation(user_id)
+    config = await risk_service.async_get_risk_config(user_id, account_id)
+    risk_config_cache.set_account_config(user_id, account_id, config, generation=generation)
+    return config
+
+
+async def _async_resolve_account_circuit_breakers(
+    db: AsyncSession,
+    user_id,
+    account_id: str,
+) -> Optional[Tuple[int, int]]:
+    """Resolve active circuit breaker events of an account and reset its stopped_by_risk strategies.
+    
+    Changes are not committed.
+    
+    Returns:
+        (resolved events, reset strategies), or None if the account is not found
+    """
+    from app.models.db_models import Account
+    
+    result = await db.execute(
+        select(Account).filter(
+            Account.user_id == user_id,
+            Account.account_id.ilike(account_id)
+        )
+    )
+    account = result.scalars().first()
+    if not account:
+        return None
+    
+    resolved = await db.execute(
+        update(DBCircuitBreakerEvent)
+        .where(
+            DBCircuitBreakerEvent.user_id == user_id,
+            DBCircuitBreakerEvent.account_id == account.id,
+            DBCircuitBreakerEvent.status == "active"
+        )
+        .values(status="resolved", resolved_at=datetime.now(timezone.utc))
+    )
+    # Reset strategies with stopped_by_risk status to stopped (so they can be manually restarted)
+    reset = await db.execute(
+        update(Strategy)
+        .where(
+            Strategy.user_id == user_id,
+            Strategy.account_id == account.id,
+            Strategy.status == "stopped_by_risk"
+        )
+        .values(status="stopped")
+    )
+    return resolved.rowcount, reset.rowcount
+
+
+async def _async_get_report_strategies(
+    db_service: DatabaseService,
+    user_id,
+    account_id: Optional[str],
+) -> List[Strategy]:
+    """Get strategies of an active account, or all of the user's strategies when account_id is None (async).
+    
+    Strategies come with their account relationship loaded.
+    """
+    strategies = await db_service.async_get_user_strategies(user_id)
+    if account_id is None:
+        return strategies
+    account = await db_service.async_get_account_by_id(user_id, account_id)
+    if not account:
+        logger.warning(f"Account not found: '{account_id}', returning empty list")
+        return []
+    return [s for s in strategies if s.account_id == account.id]
+
+
+async def _async_get_account_client(
+    request: Request,
+    account_service: AccountService,
+    user_id,
+    account_id: str,
+):
+    """Get the Binance client of an account, adding it to the client manager if needed.
+    
+    Returns:
+        Client, or None if the account is not found
+    """
+    account_config = await account_service.async_get_account(user_id, account_id)
+    if not account_config:
+        logger.warning(f"Account config not found for '{account_id}'")
+        return None
+    client_manager = get_client_manager(request)
+    client = client_manager.get_client(account_id)
+    if not client:
+        client_manager.add_client(account_id, account_config)
+        client = client_manager.get_client(account_id)
+    return client
+
+
 @router.get("/metrics/strategy/{strategy_id}")
 async def get_strategy_risk_metrics(
     request: Request,
     strategy_id: str,
     lookback_days: int = Query(90, ge=1, le=365),
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict:
     """Get risk metrics for a specific strategy.
     
@@ -131,9 +246,9 @@ async def get_strategy_risk_metrics(
         # Get trades for strategy
         user_id = current_user.id if hasattr(current_user, 'id') else current_user
         
-        # First, get the database strategy UUID from the strategy_id string
+        # First, get the database strategy UUID from the strategy_id string (account eager-loaded)
         db_service = DatabaseService(db=db)
-        db_strategy = db_service.get_strategy(user_id, strategy_id)
+        db_strategy = await db_service.async_get_strategy(user_id, strategy_id)
         
         if not db_strategy:
             return {
@@ -146,7 +261,7 @@ async def get_strategy_risk_metrics(
         strategy_uuid = db_strategy.id  # This is the database UUID
         
         trade_service = TradeService(db=db)
-        trades = trade_service.get_strategy_trades(user_id, strategy_uuid, limit=10000)
+        trades = await db_service.async_get_user_trades(user_id, strategy_uuid, limit=10000)
         
         if not trades:
             return {
@@ -156,7 +271,6 @@ async def get_strategy_risk_metrics(
             }
         
         # Convert database trades to OrderResponse format using helper (eliminates repetitive code)
-        from app.models.order import OrderResponse
         order_responses = _convert_db_trades_to_order_responses(trades, trade_service)
         
         # Match trades to completed positions (same logic as reports page)
@@ -190,12 +304,7 @@ async def get_strategy_risk_metrics(
             })
         
         # Get account_id from strategy to fetch real balance
-        account_id_str = None
-        if db_strategy.account_id:
-            # Get account string ID from account UUID
-            account = db.query(Account).filter(Account.id == db_strategy.account_id).first()
-            if account:
-                account_id_str = account.account_id
+        account_id_str = db_strategy.account.account_id if db_strategy.account else None
         
         # Get actual account balance if available
         initial_balance = 10000.0  # Default fallback
@@ -203,24 +312,18 @@ async def get_strategy_risk_metrics(
         
         if account_id_str:
             try:
-                account_service = get_account_service(request, db)
-                client_manager = get_client_manager(request)
-                account_config = account_service.get_account(user_id, account_id_str)
-                if account_config:
-                    client = client_manager.get_client(account_id_str)
-                    if not client:
-                        client_manager.add_client(account_id_str, account_config)
-                        client = client_manager.get_client(account_id_str)
-                    if client:
-                        balance = await asyncio.to_thread(client.futures_account_balance)
-                        current_balance = float(balance)
-                        if trade_data:
-                            total_pnl = sum(t["pnl"] for t in trade_data)
-                            initial_balance = current_balance - total_pnl
-                            if initial_balance <= 0:
-                                initial_balance = current_balance * 0.5
-                        else:
-                            initial_balance = current_balance
+                account_service = await get_account_service_async(request, db)
+                client = await _async_get_account_client(request, account_service, user_id, account_id_str)
+                if client:
+                    balance = await asyncio.to_thread(client.futures_account_balance)
+                    current_balance = float(balance)
+                    if trade_data:
+                        total_pnl = sum(t["pnl"] for t in trade_data)
+                        initial_balance = current_balance - total_pnl
+                        if initial_balance <= 0:
+                            initial_balance = current_balance * 0.5
+                    else:
+                        initial_balance = current_balance
             except Exception as e:
                 logger.warning(f"Error getting balance for strategy '{strategy_id}': {e}, using defaults")
         
@@ -266,8 +369,8 @@ async def get_portfolio_risk_metrics(
     request: Request,
     account_id: Optional[str] = Query(None),
     lookback_days: int = Query(90, ge=1, le=365),
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict:
     """Get portfolio-level risk metrics.
     
@@ -286,140 +389,63 @@ async def get_portfolio_risk_metrics(
         db_service = DatabaseService(db=db)  # Initialize db_service
         trade_service = TradeService(db=db)
         
-        # CRITICAL: Query DBTrade objects directly from database (not OrderResponse)
-        # We need DBTrade objects to access strategy_id (UUID)
-        from app.models.db_models import Trade as DBTrade, Account
-        
         # Normalize account_id: empty string or None means all accounts
         account_id_normalized = account_id.strip() if account_id and account_id.strip() else None
         
         if account_id_normalized:
             logger.info(f"Getting portfolio metrics for account: '{account_id_normalized}', user: {user_id}")
-            # Get account UUID from account_id string
-            account_id_lower = account_id_normalized.lower().strip()
-            account = db.query(Account).filter(
-                Account.user_id == user_id,
-                Account.account_id == account_id_lower,
-                Account.is_active == True
-            ).first()
-            
-            if account:
-                # Get all strategies for this account
-                from app.models.db_models import Strategy
-                strategies = db.query(Strategy).filter(
-                    Strategy.user_id == user_id,
-                    Strategy.account_id == account.id
-                ).all()
-                strategy_ids = [s.id for s in strategies]
-                
-                # Query DBTrade objects directly
-                trades_db = db.query(DBTrade).filter(
-                    DBTrade.user_id == user_id,
-                    DBTrade.strategy_id.in_(strategy_ids)
-                ).all()
-                logger.info(f"Found {len(trades_db)} DBTrade objects for account '{account_id_normalized}'")
-            else:
-                logger.warning(f"Account not found: '{account_id_normalized}', returning empty list")
-                trades_db = []
         else:
             logger.info(f"Getting portfolio metrics for ALL accounts, user: {user_id}")
-            # Query all DBTrade objects for user (needed for fallback)
-            trades_db = db.query(DBTrade).filter(DBTrade.user_id == user_id).all()
-            logger.info(f"Found {len(trades_db)} DBTrade objects across all accounts")
         
-        # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
-        # This is much faster than on-demand matching
-        from app.models.db_models import CompletedTrade
-        from app.api.routes.reports import _get_completed_trades_from_database, _match_trades_to_completed_positions
-        from app.models.order import OrderResponse
-        
-        all_completed_trades = []
+        # Strategies of the account (or of all accounts), with their account loaded
+        strategies = await _async_get_report_strategies(db_service, user_id, account_id_normalized)
+        strategies_by_uuid = {s.id: s for s in strategies}
         
-        # Get strategy UUIDs for the account
-        strategy_uuids = []
-        if account_id_normalized:
-            if account:
-                from app.models.db_models import Strategy
-                strategies = db.query(Strategy).filter(
-                    Strategy.user_id == user_id,
-                    Strategy.account_id == account.id
-                ).all()
-                strategy_uuids = [s.id for s in strategies]
-        else:
-            # All strategies for user
-            from app.models.db_models import Strategy
-            strategies = db.query(Strategy).filter(Strategy.user_id == user_id).all()
-            strategy_uuids = [s.id for s in strategies]
+        # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
+        # This is much faster than on-demand matching; one query for all strategies
+        from app.api.routes.reports import _async_get_completed_trades_for_strategies, _match_trades_to_completed_positions
         
-        # Try to get completed trades from database (pre-computed)
-        for strategy_uuid in strategy_uuids:
-            try:
-                # Get strategy_id string for the helper function
-                db_strategy = db_service.get_strategy_by_uuid(strategy_uuid)
-                if not db_strategy:
-                    continue
-                
-                strategy_id_str = db_strategy.strategy_id or str(strategy_uuid)
-                
-                # Query from CompletedTrade table
-                completed_trades = _get_completed_trades_from_database(
-                    db_service=db_service,
-                    user_id=user_id,
-                    strategy_uuid=strategy_uuid,
-                    strategy_id=strategy_id_str,
-                    start_datetime=None,  # Get all completed trades
-                    end_datetime=None
-                )
-                all_completed_trades.extend(completed_trades)
-            except Exception as e:
-                logger.debug(f"Could not get completed trades from database for strategy {strategy_uuid}: {e}")
+        all_completed_trades = await _async_get_completed_trades_for_strategies(
+            db_service=db_service,
+            user_id=user_id,
+            strategies=strategies,
+            start_datetime=None,  # Get all completed trades
+            end_datetime=None
+        )
         
         # ✅ FALLBACK: If no completed trades from database, use on-demand matching
-        if not all_completed_trades:
+        if not all_completed_trades and strategies_by_uuid:
             logger.debug("No completed trades from database, falling back to on-demand matching")
             
+            # CRITICAL: Query DBTrade objects directly from database (not OrderResponse)
+            # We need DBTrade objects to access strategy_id (UUID)
+            result = await db.execute(
+                select(DBTrade).filter(
+                    DBTrade.user_id == user_id,
+                    DBTrade.strategy_id.in_(list(strategies_by_uuid))
+                )
+            )
+            trades_db = result.scalars().all()
+            logger.info(f"Found {len(trades_db)} DBTrade objects for account '{account_id_normalized or 'all'}'")
+            
             # Group trades by strategy UUID BEFORE converting (db_trade.strategy_id is a UUID)
             trades_by_strategy_uuid = {}
             for db_trade in trades_db:
-                strategy_uuid = db_trade.strategy_id if db_trade.strategy_id else None
-                if not strategy_uuid:
-                    continue
-                
-                strategy_uuid_str = str(strategy_uuid)
-                if strategy_uuid_str not in trades_by_strategy_uuid:
-                    trades_by_strategy_uuid[strategy_uuid_str] = []
-                trades_by_strategy_uuid[strategy_uuid_str].append(db_trade)
-            
-            # Convert and group OrderResponse objects by strategy
-            trades_by_strategy = {}
-            for strategy_uuid_str, db_trades in trades_by_strategy_uuid.items():
-                # Convert database trades to OrderResponse format using helper
-                order_responses = _convert_db_trades_to_order_responses(db_trades, trade_service)
-                trades_by_strategy[strategy_uuid_str] = order_responses
+                trades_by_strategy_uuid.setdefault(db_trade.strategy_id, []).append(db_trade)
             
             # Match trades for each strategy and calculate PnL
-            for strategy_uuid_str, strategy_trades in trades_by_strategy.items():
+            for strategy_uuid, db_trades in trades_by_strategy_uuid.items():
+                # Convert database trades to OrderResponse format using helper
+                strategy_trades = _convert_db_trades_to_order_responses(db_trades, trade_service)
                 if not strategy_trades:
                     continue
                 
                 # Get strategy info for matching
-                strategy_name = "Unknown"
-                symbol = strategy_trades[0].symbol if strategy_trades else ""
-                leverage = strategy_trades[0].leverage if strategy_trades and strategy_trades[0].leverage else 1
-                strategy_id_str = "unknown"  # Default strategy_id string
-                
-                # Try to get strategy info from database using UUID
-                try:
-                    from uuid import UUID
-                    strategy_uuid_obj = UUID(strategy_uuid_str)
-                    db_strategy = db_service.get_strategy_by_uuid(strategy_uuid_obj)
-                    if db_strategy:
-                        strategy_name = db_strategy.name or "Unknown"
-                        symbol = db_strategy.symbol or symbol
-                        leverage = db_strategy.leverage or leverage
-                        strategy_id_str = db_strategy.strategy_id or "unknown"
-                except Exception as e:
-                    logger.debug(f"Could not get strategy info for UUID {strategy_uuid_str}: {e}")
+                db_strategy = strategies_by_uuid[strategy_uuid]
+                strategy_name = db_strategy.name or "Unknown"
+                symbol = db_strategy.symbol or strategy_trades[0].symbol
+                leverage = db_strategy.leverage or strategy_trades[0].leverage or 1
+                strategy_id_str = db_strategy.strategy_id or "unknown"
                 
                 # Match trades to completed positions
                 try:
@@ -451,76 +477,54 @@ async def get_portfolio_risk_metrics(
         
         if account_id_normalized:
             try:
-                # Get account service and client manager
-                account_service = get_account_service(request, db)
-                client_manager = get_client_manager(request)
+                # Get account service and the account's client (added to the client manager if needed)
+                account_service = await get_account_service_async(request, db)
+                client = await _async_get_account_client(request, account_service, user_id, account_id_normalized)
                 
-                # Get account config
-                account_config = account_service.get_account(user_id, account_id_normalized)
-                if account_config:
-                    # Ensure client exists in manager
-                    client = client_manager.get_client(account_id_normalized)
-                    if not client:
-                        # Add client if not exists
-                        client_manager.add_client(account_id_normalized, account_config)
-                        client = client_manager.get_client(account_id_normalized)
-                    
-                    if client:
-                        # Get current balance from Binance (sync call wrapped in async)
-                        try:
-                            balance = await asyncio.to_thread(client.futures_account_balance)
-                            current_balance = float(balance)
-                            logger.info(f"Retrieved balance for account '{account_id_normalized}': {current_balance:.2f} USDT")
-                            
-                            # Calculate initial balance: current_balance - total_pnl
-                            if trade_data:
-                                total_pnl = sum(t["pnl"] for t in trade_data)
-                                initial_balance = current_balance - total_pnl
-                                # Ensure initial balance is positive
-                                if initial_balance <= 0:
-                                    initial_balance = current_balance * 0.5  # Fallback: assume 50% drawdown max
-                                logger.info(f"Calculated initial balance for account '{account_id_normalized}': {initial_balance:.2f} USDT (current: {current_balance:.2f}, total_pnl: {total_pnl:.2f})")
-                            else:
-                                initial_balance = current_balance
-                        except Exception as e:
-                            logger.warning(f"Failed to get balance for account '{account_id_normalized}': {e}, using defaults")
-                    else:
-                        logger.warning(f"Could not get client for account '{account_id_normalized}', using default balance")
+                if client:
+                    # Get current balance from Binance (sync call wrapped in async)
+                    try:
+                        balance = await asyncio.to_thread(client.futures_account_balance)
+                        current_balance = float(balance)
+                        logger.info(f"Retrieved balance for account '{account_id_normalized}': {current_balance:.2f} USDT")
+                        
+                        # Calculate initial balance: current_balance - total_pnl
+                        if trade_data:
+                            total_pnl = sum(t["pnl"] for t in trade_data)
+                            initial_balance = current_balance - total_pnl
+                            # Ensure initial balance is positive
+                            if initial_balance <= 0:
+                                initial_balance = current_balance * 0.5  # Fallback: assume 50% drawdown max
+                            logger.info(f"Calculated initial balance for account '{account_id_normalized}': {initial_balance:.2f} USDT (current: {current_balance:.2f}, total_pnl: {total_pnl:.2f})")
+                        else:
+                            initial_balance = current_balance
+                    except Exception as e:
+                        logger.warning(f"Failed to get balance for account '{account_id_normalized}': {e}, using defaults")
                 else:
-                    logger.warning(f"Account config not found for '{account_id_normalized}', using default balance")
+                    logger.warning(f"Could not get client for account '{account_id_normalized}', using default balance")
             except Exception as e:
                 logger.warning(f"Error getting balance for account '{account_id_normalized}': {e}, using defaults")
         else:
             # For "all accounts", we need to sum balances from all accounts
             # Try to get balances from all active accounts
             try:
-                account_service = get_account_service(request, db)
-                client_manager = get_client_manager(request)
+                account_service = await get_account_service_async(request, db)
                 
-                # Get all accounts for user
-                from app.models.db_models import Account
-                accounts = db.query(Account).filter(
-                    Account.user_id == user_id,
-                    Account.is_active == True
-                ).all()
+                # Get all active accounts for user
+                accounts = await db_service.async_get_user_accounts(user_id)
                 
                 total_current_balance = 0.0
                 account_balances = {}
                 
                 for account in accounts:
                     try:
-                        account_config = account_service.get_account(user_id, account.account_id)
-                        if account_config:
-                            client = client_manager.get_client(account.account_id)
-                            if not client:
-                                client_manager.add_client(account.account_id, account_config)
-                                client = client_manager.get_client(account.account_id)
-                            if client:
-                                balance = await asyncio.to_thread(client.futures_account_balance)
-                                balance_float = float(balance)
-                                total_current_balance += balance_float
-                                account_balances[account.account_id] = balance_float
-                                logger.debug(f"Account '{account.account_id}' balance: {balance_float:.2f} USDT")
+                        client = await _async_get_account_client(request, account_service, user_id, account.account_id)
+                        if client:
+                            balance = await asyncio.to_thread(client.futures_account_balance)
+                            balance_float = float(balance)
+                            total_current_balance += balance_float
+                            account_balances[account.account_id] = balance_float
+                            logger.debug(f"Account '{account.account_id}' balance: {balance_float:.2f} USDT")
                     except Exception as e:
                         logger.warning(f"Failed to get balance for account '{account.account_id}': {e}")
                 
@@ -644,8 +648,8 @@ async def get_portfolio_risk_metrics(
 async def get_portfolio_risk_status(
     request: Request,
     account_id: Optional[str] = Query(None),
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict:
     """Get real-time portfolio risk status.
     
@@ -667,7 +671,7 @@ async def get_portfolio_risk_status(
         logger.info(f"Getting portfolio status for account: '{normalized_account_id}' (original: '{account_id}'), user: {user_id}")
         
         risk_service = RiskManagementService(db=db)
-        risk_config = risk_service.get_risk_config(user_id, normalized_account_id)
+        risk_config = await risk_service.async_get_risk_config(user_id, normalized_account_id)
         
         # Calculate basic portfolio metrics (simplified for now)
         # TODO: Implement full portfolio metrics calculation
@@ -738,8 +742,8 @@ async def get_daily_risk_report(
     request: Request,
     date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format"),
     account_id: Optional[str] = Query(None),
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict:
     """Get daily risk report.
     
@@ -767,65 +771,26 @@ async def get_daily_risk_report(
         
         # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
         # This is much faster and more consistent with risk limit checks
-        from app.models.db_models import CompletedTrade, Account, Strategy
-        from app.api.routes.reports import _get_completed_trades_from_database
+        from app.api.routes.reports import _async_get_completed_trades_for_strategies
         
         # Normalize account_id
         account_id_normalized = account_id.strip() if account_id and account_id.strip() else None
         
-        # Get strategy UUIDs for the account
-        strategy_uuids = []
         if account_id_normalized:
             logger.info(f"Getting daily report for account: '{account_id_normalized}', date: {report_date}")
-            # Get account UUID from account_id string
-            account_id_lower = account_id_normalized.lower().strip()
-            account = db.query(Account).filter(
-                Account.user_id == user_id,
-                Account.account_id == account_id_lower,
-                Account.is_active == True
-            ).first()
-            
-            if account:
-                # Get all strategies for this account
-                strategies = db.query(Strategy).filter(
-                    Strategy.user_id == user_id,
-                    Strategy.account_id == account.id
-                ).all()
-                strategy_uuids = [s.id for s in strategies]
-            else:
-                logger.warning(f"Account not found: '{account_id_normalized}', returning empty list")
         else:
             logger.info(f"Getting daily report for ALL accounts, date: {report_date}")
-            # Get all strategies for user
-            strategies = db.query(Strategy).filter(Strategy.user_id == user_id).all()
-            strategy_uuids = [s.id for s in strategies]
-        
-        # Query completed trades from CompletedTrade table (pre-computed)
-        all_completed_trades = []
-        logger.info(f"Daily report: Querying completed trades from {start_time} to {end_time} for {len(strategy_uuids)} strategies")
-        for strategy_uuid in strategy_uuids:
-            try:
-                # Get strategy_id string for the helper function
-                db_strategy = db_service.get_strategy_by_uuid(strategy_uuid)
-                if not db_strategy:
-                    continue
-                
-                strategy_id_str = db_strategy.strategy_id or str(strategy_uuid)
-                
-                # Query from CompletedTrade table with date filters
-                completed_trades = _get_completed_trades_from_database(
-                    db_service=db_service,
-                    user_id=user_id,
-                    strategy_uuid=strategy_uuid,
-                    strategy_id=strategy_id_str,
-                    start_datetime=start_time,  # Filter by exit_time >= start_time
-                    end_datetime=end_time        # Filter by exit_time <= end_time
-                )
-                if completed_trades:
-                    logger.debug(f"Daily report: Found {len(completed_trades)} completed trades for strategy {strategy_id_str}")
-                all_completed_trades.extend(completed_trades)
-            except Exception as e:
-                logger.warning(f"Error getting completed trades from database for strategy {strategy_uuid}: {e}")
+        strategies = await _async_get_report_strategies(db_service, user_id, account_id_normalized)
+        
+        # Query completed trades of all strategies from CompletedTrade table (pre-computed)
+        logger.info(f"Daily report: Querying completed trades from {start_time} to {end_time} for {len(strategies)} strategies")
+        all_completed_trades = await _async_get_completed_trades_for_strategies(
+            db_service=db_service,
+            user_id=user_id,
+            strategies=strategies,
+            start_datetime=start_time,  # Filter by exit_time >= start_time
+            end_datetime=end_time        # Filter by exit_time <= end_time
+        )
         
         logger.info(f"Daily report: Total completed trades found: {len(all_completed_trades)}")
         # Calculate daily metrics from completed trades using helper functions
@@ -842,24 +807,18 @@ async def get_daily_risk_report(
         
         if account_id_normalized:
             try:
-                account_service = get_account_service(request, db)
-                client_manager = get_client_manager(request)
-                account_config = account_service.get_account(user_id, account_id_normalized)
-                if account_config:
-                    client = client_manager.get_client(account_id_normalized)
-                    if not client:
-                        client_manager.add_client(account_id_normalized, account_config)
-                        client = client_manager.get_client(account_id_normalized)
-                    if client:
-                        balance = await asyncio.to_thread(client.futures_account_balance)
-                        current_balance = float(balance)
-                        if all_completed_trades:
-                            daily_pnl = sum(_get_pnl_from_completed_trade(t) for t in all_completed_trades)
-                            initial_balance = current_balance - daily_pnl
-                            if initial_balance <= 0:
-                                initial_balance = current_balance * 0.5
-                        else:
-                            initial_balance = current_balance
+                account_service = await get_account_service_async(request, db)
+                client = await _async_get_account_client(request, account_service, user_id, account_id_normalized)
+                if client:
+                    balance = await asyncio.to_thread(client.futures_account_balance)
+                    current_balance = float(balance)
+                    if all_completed_trades:
+                        daily_pnl = sum(_get_pnl_from_completed_trade(t) for t in all_completed_trades)
+                        initial_balance = current_balance - daily_pnl
+                        if initial_balance <= 0:
+                            initial_balance = current_balance * 0.5
+                    else:
+                        initial_balance = current_balance
             except Exception as e:
                 logger.warning(f"Error getting balance for daily report: {e}, using defaults")
         
@@ -895,8 +854,8 @@ async def get_weekly_risk_report(
     request: Request,
     week_start: Optional[str] = Query(None, description="Week start date in YYYY-MM-DD format"),
     account_id: Optional[str] = Query(None),
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict:
     """Get weekly risk report.
     
@@ -937,65 +896,26 @@ async def get_weekly_risk_report(
         
         # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
         # This is much faster and more consistent with risk limit checks
-        from app.models.db_models import CompletedTrade, Account, Strategy
-        from app.api.routes.reports import _get_completed_trades_from_database
+        from app.api.routes.reports import _async_get_completed_trades_for_strategies
         
         # Normalize account_id
         account_id_normalized = account_id.strip() if account_id and account_id.strip() else None
         
-        # Get strategy UUIDs for the account
-        strategy_uuids = []
         if account_id_normalized:
             logger.info(f"Getting weekly report for account: '{account_id_normalized}', week: {week_start_date} to {week_end_date}")
-            # Get account UUID from account_id string
-            account_id_lower = account_id_normalized.lower().strip()
-            account = db.query(Account).filter(
-                Account.user_id == user_id,
-                Account.account_id == account_id_lower,
-                Account.is_active == True
-            ).first()
-            
-            if account:
-                # Get all strategies for this account
-                strategies = db.query(Strategy).filter(
-                    Strategy.user_id == user_id,
-                    Strategy.account_id == account.id
-                ).all()
-                strategy_uuids = [s.id for s in strategies]
-            else:
-                logger.warning(f"Account not found: '{account_id_normalized}', returning empty list")
         else:
             logger.info(f"Getting weekly report for ALL accounts, week: {week_start_date} to {week_end_date}")
-            # Get all strategies for user
-            strategies = db.query(Strategy).filter(Strategy.user_id == user_id).all()
-            strategy_uuids = [s.id for s in strategies]
-        
-        # Query completed trades from CompletedTrade table (pre-computed)
-        all_completed_trades = []
-        logger.info(f"Weekly report: Querying completed trades from {start_time} to {end_time} for {len(strategy_uuids)} strategies")
-        for strategy_uuid in strategy_uuids:
-            try:
-                # Get strategy_id string for the helper function
-                db_strategy = db_service.get_strategy_by_uuid(strategy_uuid)
-                if not db_strategy:
-                    continue
-                
-                strategy_id_str = db_strategy.strategy_id or str(strategy_uuid)
-                
-                # Query from CompletedTrade table with date filters
-                completed_trades = _get_completed_trades_from_database(
-                    db_service=db_service,
-                    user_id=user_id,
-                    strategy_uuid=strategy_uuid,
-                    strategy_id=strategy_id_str,
-                    start_datetime=start_time,  # Filter by exit_time >= start_time
-                    end_datetime=end_time        # Filter by exit_time <= end_time
-                )
-                if completed_trades:
-                    logger.debug(f"Weekly report: Found {len(completed_trades)} completed trades for strategy {strategy_id_str}")
-                all_completed_trades.extend(completed_trades)
-            except Exception as e:
-                logger.warning(f"Error getting completed trades from database for strategy {strategy_uuid}: {e}")
+        strategies = await _async_get_report_strategies(db_service, user_id, account_id_normalized)
+        
+        # Query completed trades of all strategies from CompletedTrade table (pre-computed)
+        logger.info(f"Weekly report: Querying completed trades from {start_time} to {end_time} for {len(strategies)} strategies")
+        all_completed_trades = await _async_get_completed_trades_for_strategies(
+            db_service=db_service,
+            user_id=user_id,
+            strategies=strategies,
+            start_datetime=start_time,  # Filter by exit_time >= start_time
+            end_datetime=end_time        # Filter by exit_time <= end_time
+        )
         
         logger.info(f"Weekly report: Total completed trades found: {len(all_completed_trades)}")
         # Calculate weekly metrics from completed trades using helper functions
@@ -1012,24 +932,18 @@ async def get_weekly_risk_report(
         
         if account_id_normalized:
             try:
-                account_service = get_account_service(request, db)
-                client_manager = get_client_manager(request)
-                account_config = account_service.get_account(user_id, account_id_normalized)
-                if account_config:
-                    client = client_manager.get_client(account_id_normalized)
-                    if not client:
-                        client_manager.add_client(account_id_normalized, account_config)
-                        client = client_manager.get_client(account_id_normalized)
-                    if client:
-                        balance = await asyncio.to_thread(client.futures_account_balance)
-                        current_balance = float(balance)
-                        if all_completed_trades:
-                            weekly_pnl = sum(_get_pnl_from_completed_trade(t) for t in all_completed_trades)
-                            initial_balance = current_balance - weekly_pnl
-                            if initial_balance <= 0:
-                                initial_balance = current_balance * 0.5
-                        else:
-                            initial_balance = current_balance
+                account_service = await get_account_service_async(request, db)
+                client = await _async_get_account_client(request, account_service, user_id, account_id_normalized)
+                if client:
+                    balance = await asyncio.to_thread(client.futures_account_balance)
+                    current_balance = float(balance)
+                    if all_completed_trades:
+                        weekly_pnl = sum(_get_pnl_from_completed_trade(t) for t in all_completed_trades)
+                        initial_balance = current_balance - weekly_pnl
+                        if initial_balance <= 0:
+                            initial_balance = current_balance * 0.5
+                    else:
+                        initial_balance = current_balance
             except Exception as e:
                 logger.warning(f"Error getting balance for weekly report: {e}, using defaults")
         
@@ -1066,8 +980,8 @@ async def get_weekly_risk_report(
 @router.get("/config", response_model=RiskManagementConfigResponse)
 async def get_risk_config(
     account_id: str = Query("default", description="Account ID"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RiskManagementConfigResponse:
     """Get risk management configuration for an account."""
     try:
@@ -1084,7 +998,7 @@ async def get_risk_config(
         # Check if account exists first
         db_service = DatabaseService(db=db)
         try:
-            account = db_service.get_account_by_id(user_id, account_id_normalized)
+            account = await db_service.async_get_account_by_id(user_id, account_id_normalized)
             if not account:
                 logger.warning(f"Account not found: user_id={user_id}, account_id={account_id_normalized}")
                 raise HTTPException(
@@ -1102,7 +1016,7 @@ async def get_risk_config(
         
         # Try to get risk config, but handle table not existing gracefully
         try:
-            config = risk_service.get_risk_config(user_id, account_id_normalized)
+            config = await risk_service.async_get_risk_config(user_id, account_id_normalized)
         except Exception as e:
             error_str = str(e).lower()
             if "does not exist" in error_str or "undefinedtable" in error_str or "relation" in error_str:
@@ -1142,8 +1056,8 @@ async def get_risk_config(
 @router.post("/config", response_model=RiskManagementConfigResponse, status_code=201)
 async def create_risk_config(
     config_data: RiskManagementConfigCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
     runner: Optional[StrategyRunner] = Depends(get_strategy_runner),
 ) -> RiskManagementConfigResponse:
     """Create risk management configuration for an account."""
@@ -1155,7 +1069,8 @@ async def create_risk_config(
             redis_storage=None  # Can be injected if needed
         )
         
-        config = risk_service.create_risk_config(user_id, config_data)
+        config = await risk_service.async_create_risk_config(user_id, config_data)
+        get_risk_config_cache().invalidate_account(user_id, config_data.account_id)
         # Invalidate circuit breaker cache so new config is used (account_id from created config)
         if config and runner and getattr(runner, "circuit_breaker_factory", None) and hasattr(runner.circuit_breaker_factory, "clear_cache"):
             aid = (config.account_id or "").strip().lower()
@@ -1173,8 +1088,8 @@ async def create_risk_config(
 async def update_risk_config(
     account_id: str = Query(..., description="Account ID"),
     config_data: RiskManagementConfigUpdate = ...,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
     runner: Optional[StrategyRunner] = Depends(get_strategy_runner),
 ) -> RiskManagementConfigResponse:
     """Update risk management configuration for an account.
@@ -1191,7 +1106,8 @@ async def update_risk_config(
             redis_storage=None  # Can be injected if needed
         )
         
-        config = risk_service.update_risk_config(user_id, account_id, config_data)
+        config = await risk_service.async_update_risk_config(user_id, account_id, config_data)
+        get_risk_config_cache().invalidate_account(user_id, account_id)
         if not config:
             raise HTTPException(
                 status_code=404,
@@ -1205,43 +1121,11 @@ async def update_risk_config(
         # CRITICAL: Resolve active circuit breaker events and reset stopped_by_risk strategies
         # This allows users to restart strategies after updating risk config
         try:
-            from app.models.db_models import CircuitBreakerEvent, Account, Strategy
-            from datetime import datetime, timezone
-            
-            # Find the account UUID
-            account = db.query(Account).filter(
-                Account.user_id == user_id,
-                Account.account_id.ilike(account_id)
-            ).first()
-            
-            if account:
-                # Resolve all active circuit breaker events for this account
-                active_events = db.query(CircuitBreakerEvent).filter(
-                    CircuitBreakerEvent.user_id == user_id,
-                    CircuitBreakerEvent.account_id == account.id,
-                    CircuitBreakerEvent.status == "active"
-                ).all()
-                
-                resolved_count = 0
-                for event in active_events:
-                    event.status = "resolved"
-                    event.resolved_at = datetime.now(timezone.utc)
-                    resolved_count += 1
-                
-                # Reset strategies with stopped_by_risk status to stopped (so they can be manually restarted)
-                stopped_by_risk_strategies = db.query(Strategy).filter(
-                    Strategy.user_id == user_id,
-                    Strategy.account_id == account.id,
-                    Strategy.status == "stopped_by_risk"
-                ).all()
-                
-                reset_count = 0
-                for strategy in stopped_by_risk_strategies:
-                    strategy.status = "stopped"
-                    reset_count += 1
-                
+            counts = await _async_resolve_account_circuit_breakers(db, user_id, account_id)
+            if counts:
+                resolved_count, reset_count = counts
                 if resolved_count > 0 or reset_count > 0:
-                    db.commit()
+                    await db.commit()
                     logger.info(
                         f"Risk config updated for account {account_id}: "
                         f"resolved {resolved_count} circuit breaker events, "
@@ -1262,8 +1146,8 @@ async def update_risk_config(
 @router.delete("/config", status_code=204, response_model=None)
 async def delete_risk_config(
     account_id: str = Query(..., description="Account ID"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Delete risk management configuration for an account."""
     try:
@@ -1274,7 +1158,8 @@ async def delete_risk_config(
             redis_storage=None  # Can be injected if needed
         )
         
-        deleted = risk_service.delete_risk_config(user_id, account_id)
+        deleted = await risk_service.async_delete_risk_config(user_id, account_id)
+        get_risk_config_cache().invalidate_account(user_id, account_id)
         if not deleted:
             raise HTTPException(
                 status_code=404,
@@ -1297,8 +1182,8 @@ class ResetCircuitBreakerResponse(BaseModel):
 @router.post("/circuit-breaker/reset", response_model=ResetCircuitBreakerResponse)
 async def reset_circuit_breaker(
     account_id: str = Query(..., description="Account ID"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
     runner: Optional[StrategyRunner] = Depends(get_strategy_runner),
 ) -> ResetCircuitBreakerResponse:
     """Manually reset circuit breakers for an account.
@@ -1310,49 +1195,17 @@ async def reset_circuit_breaker(
     or consecutive loss circuit breakers without changing the risk configuration.
     """
     try:
-        from app.models.db_models import CircuitBreakerEvent, Account, Strategy
-        from datetime import datetime, timezone
-        
         user_id = current_user.id if hasattr(current_user, 'id') else current_user
         
-        # Find the account UUID
-        account = db.query(Account).filter(
-            Account.user_id == user_id,
-            Account.account_id.ilike(account_id)
-        ).first()
-        
-        if not account:
+        counts = await _async_resolve_account_circuit_breakers(db, user_id, account_id)
+        if counts is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Account not found: {account_id}"
             )
+        resolved_count, reset_count = counts
         
-        # Resolve all active circuit breaker events for this account
-        active_events = db.query(CircuitBreakerEvent).filter(
-            CircuitBreakerEvent.user_id == user_id,
-            CircuitBreakerEvent.account_id == account.id,
-            CircuitBreakerEvent.status == "active"
-        ).all()
-        
-        resolved_count = 0
-        for event in active_events:
-            event.status = "resolved"
-            event.resolved_at = datetime.now(timezone.utc)
-            resolved_count += 1
-        
-        # Reset strategies with stopped_by_risk status to stopped
-        stopped_by_risk_strategies = db.query(Strategy).filter(
-            Strategy.user_id == user_id,
-            Strategy.account_id == account.id,
-            Strategy.status == "stopped_by_risk"
-        ).all()
-        
-        reset_count = 0
-        for strategy in stopped_by_risk_strategies:
-            strategy.status = "stopped"
-            reset_count += 1
-        
-        db.commit()
+        await db.commit()
         
         # Also clear the circuit breaker factory cache
         if runner and getattr(runner, "circuit_breaker_factory", None) and hasattr(runner.circuit_breaker_factory, "clear_cache"):
@@ -1386,8 +1239,8 @@ async def get_enforcement_history(
     end_date: Optional[datetime] = Query(None, description="End date filter (ISO format)"),
     limit: int = Query(50, ge=1, le=500, description="Maximum number of events to return"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> EnforcementHistoryResponse:
     """Get risk enforcement history with filters.
     
@@ -1401,18 +1254,18 @@ async def get_enforcement_history(
         # Convert account_id and strategy_id strings to UUIDs if provided
         account_uuid = None
         if account_id:
-            db_account = db_service.get_account_by_id(user_id, account_id)
+            db_account = await db_service.async_get_account_by_id(user_id, account_id)
             if db_account:
                 account_uuid = db_account.id
         
         strategy_uuid = None
         if strategy_id:
-            db_strategy = db_service.get_strategy(user_id, strategy_id)
+            db_strategy = await db_service.async_get_strategy(user_id, strategy_id)
             if db_strategy:
                 strategy_uuid = db_strategy.id
         
         # Query enforcement events
-        events, total = db_service.get_enforcement_events(
+        events, total = await db_service.async_get_enforcement_events(
             user_id=user_id,
             account_id=account_uuid,
             strategy_id=strategy_uuid,
@@ -1423,30 +1276,33 @@ async def get_enforcement_history(
             offset=offset
         )
         
+        # Strategy and account string IDs of the events, one query each
+        from app.models.db_models import Account
+        strategy_uuids = {event.strategy_id for event in events if event.strategy_id}
+        account_uuids = {event.account_id for event in events if event.account_id}
+        strategy_ids_by_uuid = {}
+        if strategy_uuids:
+            result = await db.execute(
+                select(Strategy.id, Strategy.strategy_id).filter(Strategy.id.in_(strategy_uuids))
+            )
+            strategy_ids_by_uuid = dict(result.all())
+        account_ids_by_uuid = {}
+        if account_uuids:
+            result = await db.execute(
+                select(Account.id, Account.account_id).filter(Account.id.in_(account_uuids))
+            )
+            account_ids_by_uuid = dict(result.all())
+        
         # Convert to response format
         event_responses = []
         for event in events:
-            # Get strategy_id string if available
-            strategy_id_str = None
-            if event.strategy_id:
-                db_strategy = db_service.get_strategy_by_uuid(event.strategy_id)
-                if db_strategy:
-                    strategy_id_str = db_strategy.strategy_id
-            
-            # Get account_id string if available
-            account_id_str = None
-            if event.account_id:
-                db_account = db_service.get_account_by_uuid(event.account_id)
-                if db_account:
-                    account_id_str = db_account.account_id
-            
             event_responses.append(EnforcementEventResponse(
                 id=str(event.id),
                 event_type=event.event_type,
                 event_level=event.event_level,
                 message=event.message,
-                strategy_id=strategy_id_str,
-                account_id=account_id_str,
+                strategy_id=strategy_ids_by_uuid.get(event.strategy_id),
+                account_id=account_ids_by_uuid.get(event.account_id),
                 event_metadata=event.event_metadata,
                 created_at=event.created_at
             ))
@@ -1465,10 +1321,10 @@ async def get_enforcement_history(
 @router.get("/status/realtime", response_model=RealTimeRiskStatusResponse)
 async def get_realtime_risk_status(
     account_id: Optional[str] = Query(None, description="Account ID (defaults to all accounts)"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
     client_manager = Depends(get_client_manager),
-    account_service = Depends(get_account_service),
+    account_service = Depends(get_account_service_async),
     runner: Optional[StrategyRunner] = Depends(get_strategy_runner),
 ) -> RealTimeRiskStatusResponse:
     """Get real-time risk status for an account or all accounts.
@@ -1488,7 +1344,7 @@ async def get_realtime_risk_status(
         if account_id_normalized:
             # Check if account exists first
             try:
-                account = db_service.get_account_by_id(user_id, account_id_normalized)
+                account = await db_service.async_get_account_by_id(user_id, account_id_normalized)
                 if not account:
                     logger.warning(f"Account not found for realtime status: user_id={user_id}, account_id={account_id_normalized}")
                     # Return empty response if account doesn't exist
@@ -1560,7 +1416,7 @@ async def get_realtime_risk_status(
             
             # Try to get risk config, but handle table not existing gracefully
             try:
-                risk_config = risk_service.get_risk_config(user_id, account_id_normalized)
+                risk_config = await _async_get_cached_account_risk_config(risk_service, user_id, account_id_normalized)
             except Exception as e:
                 error_str = str(e).lower()
                 if "does not exist" in error_str or "undefinedtable" in error_str or "relation" in error_str:
@@ -1575,7 +1431,7 @@ async def get_realtime_risk_status(
         else:
             # For "all accounts", try to get default config
             try:
-                risk_config = risk_service.get_risk_config(user_id, "default")
+                risk_config = await _async_get_cached_account_risk_config(risk_service, user_id, "default")
             except Exception as e:
                 error_str = str(e).lower()
                 if "does not exist" in error_str or "undefinedtable" in error_str or "relation" in error_str:
@@ -1622,140 +1478,61 @@ async def get_realtime_risk_status(
                 recent_enforcement_events=[]
             )
         
-        # CRITICAL: Query DBTrade objects directly from database (not OrderResponse)
-        # We need DBTrade objects to access strategy_id (UUID)
-        from app.models.db_models import Trade as DBTrade, Account
         trade_service = TradeService(db=db)
         
-        # Get trades for the account
-        if account_id_normalized:
-            # Get account UUID from account_id string
-            account_id_lower = account_id_normalized.lower().strip()
-            account = db.query(Account).filter(
-                Account.user_id == user_id,
-                Account.account_id == account_id_lower,
-                Account.is_active == True
-            ).first()
-            
-            if account:
-                # Get all strategies for this account
-                from app.models.db_models import Strategy
-                strategies = db.query(Strategy).filter(
-                    Strategy.user_id == user_id,
-                    Strategy.account_id == account.id
-                ).all()
-                strategy_ids = [s.id for s in strategies]
-                
-                # Query DBTrade objects directly
-                trades_db = db.query(DBTrade).filter(
-                    DBTrade.user_id == user_id,
-                    DBTrade.strategy_id.in_(strategy_ids)
-                ).all()
-            else:
-                logger.warning(f"Account not found: '{account_id_normalized}', returning empty list")
-                trades_db = []
-        else:
-            # Query all DBTrade objects for user
-            trades_db = db.query(DBTrade).filter(DBTrade.user_id == user_id).all()
-        
         # Calculate current exposure (simplified - would need actual position data)
         # For now, estimate from trade sizes
         total_exposure_usdt = 0.0
         # TODO: Get actual exposure from open positions via StrategyRunner
         
-        # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
-        # This is much faster than on-demand matching
-        from app.models.db_models import CompletedTrade
-        from app.api.routes.reports import _get_completed_trades_from_database, _match_trades_to_completed_positions
-        
-        all_completed_trades = []
+        # Strategies of the account (or of all accounts), with their account loaded
+        strategies = await _async_get_report_strategies(db_service, user_id, account_id_normalized)
+        strategies_by_uuid = {s.id: s for s in strategies}
         
-        # Get strategy UUIDs for the account
-        strategy_uuids = []
-        if account_id_normalized:
-            if account:
-                from app.models.db_models import Strategy
-                strategies = db.query(Strategy).filter(
-                    Strategy.user_id == user_id,
-                    Strategy.account_id == account.id
-                ).all()
-                strategy_uuids = [s.id for s in strategies]
-        else:
-            # All strategies for user
-            from app.models.db_models import Strategy
-            strategies = db.query(Strategy).filter(Strategy.user_id == user_id).all()
-            strategy_uuids = [s.id for s in strategies]
+        # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
+        # This is much faster than on-demand matching; one query for all strategies
+        from app.api.routes.reports import _async_get_completed_trades_for_strategies, _match_trades_to_completed_positions
         
-        # Try to get completed trades from database (pre-computed)
-        for strategy_uuid in strategy_uuids:
-            try:
-                # Get strategy_id string for the helper function
-                db_strategy = db_service.get_strategy_by_uuid(strategy_uuid)
-                if not db_strategy:
-                    continue
-                
-                strategy_id_str = db_strategy.strategy_id or str(strategy_uuid)
-                
-                # Query from CompletedTrade table
-                completed_trades = _get_completed_trades_from_database(
-                    db_service=db_service,
-                    user_id=user_id,
-                    strategy_uuid=strategy_uuid,
-                    strategy_id=strategy_id_str,
-                    start_datetime=None,  # Get all completed trades
-                    end_datetime=None
-                )
-                all_completed_trades.extend(completed_trades)
-            except Exception as e:
-                logger.debug(f"Could not get completed trades from database for strategy {strategy_uuid}: {e}")
+        all_completed_trades = await _async_get_completed_trades_for_strategies(
+            db_service=db_service,
+            user_id=user_id,
+            strategies=strategies,
+            start_datetime=None,  # Get all completed trades
+            end_datetime=None
+        )
         
         # ✅ FALLBACK: If no completed trades from database, use on-demand matching
-        if not all_completed_trades:
+        if not all_completed_trades and strategies_by_uuid:
             logger.debug("No completed trades from database, falling back to on-demand matching")
-            from app.models.order import OrderResponse
+            
+            # CRITICAL: Query DBTrade objects directly from database (not OrderResponse)
+            # We need DBTrade objects to access strategy_id (UUID)
+            result = await db.execute(
+                select(DBTrade).filter(
+                    DBTrade.user_id == user_id,
+                    DBTrade.strategy_id.in_(list(strategies_by_uuid))
+                )
+            )
+            trades_db = result.scalars().all()
             
             # Group trades by strategy UUID BEFORE converting (db_trade.strategy_id is a UUID)
             trades_by_strategy_uuid = {}
             for db_trade in trades_db:
-                strategy_uuid = db_trade.strategy_id if db_trade.strategy_id else None
-                if not strategy_uuid:
-                    continue
-                
-                strategy_uuid_str = str(strategy_uuid)
-                if strategy_uuid_str not in trades_by_strategy_uuid:
-                    trades_by_strategy_uuid[strategy_uuid_str] = []
-                trades_by_strategy_uuid[strategy_uuid_str].append(db_trade)
-            
-            # Convert and group OrderResponse objects by strategy
-            trades_by_strategy = {}
-            for strategy_uuid_str, db_trades in trades_by_strategy_uuid.items():
-                # Convert database trades to OrderResponse format using helper
-                order_responses = _convert_db_trades_to_order_responses(db_trades, trade_service)
-                trades_by_strategy[strategy_uuid_str] = order_responses
+                trades_by_strategy_uuid.setdefault(db_trade.strategy_id, []).append(db_trade)
             
             # Match trades for each strategy and calculate PnL
-            for strategy_uuid_str, strategy_trades in trades_by_strategy.items():
+            for strategy_uuid, db_trades in trades_by_strategy_uuid.items():
+                # Convert database trades to OrderResponse format using helper
+                strategy_trades = _convert_db_trades_to_order_responses(db_trades, trade_service)
                 if not strategy_trades:
                     continue
                 
                 # Get strategy info for matching
-                strategy_name = "Unknown"
-                symbol = strategy_trades[0].symbol if strategy_trades else ""
-                leverage = strategy_trades[0].leverage if strategy_trades and strategy_trades[0].leverage else 1
-                strategy_id_str = "unknown"  # Default strategy_id string
-                
-                # Try to get strategy info from database using UUID
-                try:
-                    from uuid import UUID
-                    strategy_uuid_obj = UUID(strategy_uuid_str)
-                    db_strategy = db_service.get_strategy_by_uuid(strategy_uuid_obj)
-                    if db_strategy:
-                        strategy_name = db_strategy.name or "Unknown"
-                        symbol = db_strategy.symbol or symbol
-                        leverage = db_strategy.leverage or leverage
-                        strategy_id_str = db_strategy.strategy_id or "unknown"
-                except Exception as e:
-                    logger.debug(f"Could not get strategy info for UUID {strategy_uuid_str}: {e}")
+                db_strategy = strategies_by_uuid[strategy_uuid]
+                strategy_name = db_strategy.name or "Unknown"
+                symbol = db_strategy.symbol or strategy_trades[0].symbol
+                leverage = db_strategy.leverage or strategy_trades[0].leverage or 1
+                strategy_id_str = db_strategy.strategy_id or "unknown"
                 
                 # Match trades to completed positions
                 try:
@@ -1787,7 +1564,7 @@ async def get_realtime_risk_status(
         account_balance = 0.0
         if account_id_normalized:
             try:
-                account_config = account_service.get_account(user_id, account_id_normalized)
+                account_config = await account_service.async_get_account(user_id, account_id_normalized)
                 if account_config:
                     client = client_manager.get_client(account_id_normalized)
                     if not client:
@@ -1801,16 +1578,12 @@ async def get_realtime_risk_status(
         else:
             # For "all accounts", sum balances from all active accounts
             try:
-                from app.models.db_models import Account
-                accounts = db.query(Account).filter(
-                    Account.user_id == user_id,
-                    Account.is_active == True
-                ).all()
+                accounts = await db_service.async_get_user_accounts(user_id)
                 
                 total_balance = 0.0
                 for account in accounts:
                     try:
-                        account_config = account_service.get_account(user_id, account.account_id)
+                        account_config = await account_service.async_get_account(user_id, account.account_id)
                         if account_config:
                             client = client_manager.get_client(account.account_id)
                             if not client:
@@ -1997,11 +1770,11 @@ async def get_realtime_risk_status(
         # Get recent enforcement events (last 10) to check for duplicates
         account_uuid = None
         if account_id_normalized and account_id_normalized != "all":
-            db_account = db_service.get_account_by_id(user_id, account_id_normalized)
+            db_account = await db_service.async_get_account_by_id(user_id, account_id_normalized)
             if db_account:
                 account_uuid = db_account.id
         
-        recent_events, _ = db_service.get_enforcement_events(
+        recent_events, _ = await db_service.async_get_enforcement_events(
             user_id=user_id,
             account_id=account_uuid,
             limit=10,
@@ -2025,7 +1798,7 @@ async def get_realtime_risk_status(
                 # Only create event if no similar recent event exists
                 if not recent_similar_event:
                     try:
-                        db_service.create_system_event(
+                        await db_service.async_create_system_event(
                             event_type=event_type,
                             event_level="ERROR",
                             message=message,
@@ -2099,8 +1872,8 @@ async def get_realtime_risk_status(
 @router.get("/status/strategy/{strategy_id}", response_model=StrategyRiskStatusResponse)
 async def get_strategy_risk_status(
     strategy_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
     runner: Optional[StrategyRunner] = Depends(get_strategy_runner),
 ) -> StrategyRiskStatusResponse:
     """Get risk status for a specific strategy.
@@ -2112,8 +1885,8 @@ async def get_strategy_risk_status(
         user_id = current_user.id if hasattr(current_user, 'id') else current_user
         db_service = DatabaseService(db=db)
         
-        # Get strategy
-        db_strategy = db_service.get_strategy(user_id, strategy_id)
+        # Get strategy (with its account loaded)
+        db_strategy = await db_service.async_get_strategy(user_id, strategy_id)
         if not db_strategy:
             raise HTTPException(status_code=404, detail=f"Strategy not found: {strategy_id}")
         
@@ -2121,7 +1894,7 @@ async def get_strategy_risk_status(
         account_id = None
         if db_strategy.account_id:
             try:
-                db_account = db_service.get_account_by_uuid(db_strategy.account_id)
+                db_account = db_strategy.account
                 if db_account:
                     account_id = db_account.account_id
             except Exception as e:
@@ -2131,7 +1904,7 @@ async def get_strategy_risk_status(
         # Get recent enforcement events for this strategy
         last_event = None
         try:
-            events, _ = db_service.get_enforcement_events(
+            events, _ = await db_service.async_get_enforcement_events(
                 user_id=user_id,
                 strategy_id=db_strategy.id,
                 limit=1,
@@ -2165,7 +1938,7 @@ async def get_strategy_risk_status(
                 account_uuid = getattr(db_strategy, "account_id", None)
                 strategy_uuid = getattr(db_strategy, "id", None)
                 if account_uuid is not None or strategy_uuid is not None:
-                    q = db.query(DBCircuitBreakerEvent).filter(
+                    q = select(DBCircuitBreakerEvent).filter(
                         DBCircuitBreakerEvent.user_id == user_id,
                         DBCircuitBreakerEvent.status == "active",
                     )
@@ -2181,7 +1954,7 @@ async def get_strategy_risk_status(
                         q = q.filter(DBCircuitBreakerEvent.account_id == account_uuid)
                     else:
                         q = q.filter(DBCircuitBreakerEvent.strategy_id == strategy_uuid)
-                    first = q.first()
+                    first = (await db.execute(q.limit(1))).scalars().first()
                     if first is not None and isinstance(first, DBCircuitBreakerEvent):
                         circuit_breaker_active = True
         except Exception as e:
@@ -2191,7 +1964,7 @@ async def get_strategy_risk_status(
         account_risk_config = None
         try:
             risk_service = RiskManagementService(db=db, redis_storage=None)
-            account_risk_config = risk_service.get_risk_config(user_id, account_id or "default")
+            account_risk_config = await _async_get_cached_account_risk_config(risk_service, user_id, account_id or "default")
         except Exception as e:
             logger.warning(f"Error getting account risk config for strategy {strategy_id}: {e}")
             account_risk_config = None
@@ -2199,7 +1972,7 @@ async def get_strategy_risk_status(
         # Get strategy-level risk config if available
         strategy_risk_config = None
         try:
-            db_strategy_risk_config = db_service.get_strategy_risk_config(user_id, strategy_id)
+            db_strategy_risk_config = await db_service.async_get_strategy_risk_config(user_id, strategy_id)
             if db_strategy_risk_config:
                 from app.models.risk_management import StrategyRiskConfigResponse
                 strategy_risk_config = StrategyRiskConfigResponse.from_orm(db_strategy_risk_config)
@@ -2312,7 +2085,7 @@ async def get_strategy_risk_status(
                 # Calculate account-level daily and weekly loss (across ALL strategies for this account)
                 # CRITICAL: Use same timezone/reset time as get_realtime_risk_status for consistency
                 from zoneinfo import ZoneInfo
-                from app.api.routes.reports import _get_completed_trades_from_database, _match_trades_to_completed_positions
+                from app.api.routes.reports import _async_get_completed_trades_for_strategies
                 
                 # Use helper functions to eliminate code duplication (same logic as get_realtime_risk_status)
                 # CRITICAL: Use account_check_config (account_risk_config) for timezone/reset times
@@ -2327,44 +2100,22 @@ async def get_strategy_risk_status(
                     reset_day = 1  # 1=Monday, 7=Sunday
                 week_start = calculate_week_start(tz_str, reset_day)
                 
-                trade_service = TradeService(db=db)
-                
-                # Get all strategies for this account
-                account_uuid = None
-                try:
-                    db_account = db_service.get_account_by_id(user_id, account_id)
-                    if db_account:
-                        account_uuid = db_account.id
-                except Exception:
-                    pass
-                
+                # Get all strategies for this account (with their account loaded)
                 account_strategies = []
-                if account_uuid:
-                    try:
-                        from app.models.db_models import Strategy
-                        account_strategies = db.query(Strategy).filter(
-                            Strategy.user_id == user_id,
-                            Strategy.account_id == account_uuid
-                        ).all()
-                    except Exception as e:
-                        logger.debug(f"Error getting strategies for account {account_id}: {e}")
+                try:
+                    account_strategies = await _async_get_report_strategies(db_service, user_id, account_id)
+                except Exception as e:
+                    logger.debug(f"Error getting strategies for account {account_id}: {e}")
                 
                 # Calculate total daily and weekly loss across all strategies for this account
-                account_all_completed_trades = []
-                for acc_strategy in account_strategies:
-                    try:
-                        # Get all completed trades for this strategy (no date filter yet - we'll filter later)
-                        completed_trades = _get_completed_trades_from_database(
-                            db_service=db_service,
-                            user_id=user_id,
-                            strategy_uuid=acc_strategy.id,
-                            strategy_id=acc_strategy.strategy_id,
-                            start_datetime=None,  # Get all trades, filter by exit_time later
-                            end_datetime=None
-                        )
-                        account_all_completed_trades.extend(completed_trades)
-                    except Exception as e:
-                        logger.debug(f"Error getting completed trades for account strategy {acc_strategy.strategy_id}: {e}")
+                # Get all completed trades (no date filter yet - we'll filter later), one query for all strategies
+                account_all_completed_trades = await _async_get_completed_trades_for_strategies(
+                    db_service=db_service,
+                    user_id=user_id,
+                    strategies=account_strategies,
+                    start_datetime=None,  # Get all trades, filter by exit_time later
+                    end_datetime=None
+                )
                 
                 # Use helper function to calculate PnL from completed trades (eliminates duplication)
                 account_daily_loss_usdt = calculate_realized_pnl_from_trades(account_all_completed_trades, today_start)
@@ -2494,7 +2245,7 @@ async def get_strategy_risk_status(
                 circuit_breaker_active = True
                 is_stopped_by_risk = True  # Treat as stopped_by_risk even if status not updated yet
                 # Refresh strategy status from database after auto-pause
-                db.refresh(db_strategy)
+                await db.refresh(db_strategy)
                 strategy_status = str(db_strategy.status) if hasattr(db_strategy, 'status') and db_strategy.status else None
             
             # CRITICAL: Both DAILY_LOSS and WEEKLY_LOSS should trigger pause_all_strategies_for_account
@@ -2502,19 +2253,21 @@ async def get_strategy_risk_status(
             if runner and account_id and limit_type:
                 try:
                     # CRITICAL: Get account object first (needed for account.id)
-                    account = db_service.get_account_by_id(user_id, account_id)
+                    account = await db_service.async_get_account_by_id(user_id, account_id)
                     running_strategies = []
                     if not account:
                         logger.warning(f"Cannot auto-pause: account {account_id} not found")
                     else:
                         # CRITICAL: Only auto-pause if strategies are actually running
                         # Don't pause if they're already stopped_by_risk (prevent duplicate pauses)
-                        from app.models.db_models import Strategy
-                        running_strategies = db.query(Strategy).filter(
-                            Strategy.user_id == current_user.id,
-                            Strategy.account_id == account.id,
-                            Strategy.status == "running"
-                        ).all()
+                        result = await db.execute(
+                            select(Strategy).filter(
+                                Strategy.user_id == current_user.id,
+                                Strategy.account_id == account.id,
+                                Strategy.status == "running"
+                            )
+                        )
+                        running_strategies = result.scalars().all()
                     
                     # Also check if current strategy is still running
                     current_strategy_running = (strategy_status == "running")
@@ -2540,10 +2293,7 @@ async def get_strategy_risk_status(
                         db.expire_all()  # Expire all cached objects to force fresh query
                         
                         # Reload strategy from database to get fresh status
-                        db_strategy_fresh = db.query(Strategy).filter(
-                            Strategy.user_id == current_user.id,
-                            Strategy.strategy_id == strategy_id
-                        ).first()
+                        db_strategy_fresh = await db_service.async_get_strategy(current_user.id, strategy_id)
                         
                         if db_strategy_fresh:
                             strategy_status = str(db_strategy_fresh.status) if hasattr(db_strategy_fresh, 'status') and db_strategy_fresh.status else None
@@ -2597,142 +2347,24 @@ async def get_strategy_risk_status(
         
         if risk_config:
             logger.debug(f"Checking risk limits for strategy {strategy_id}, account {account_id or 'default'}")
-            # Get actual trade data to calculate real risk values
-            trade_service = TradeService(db=db)
-            
             # Get completed trades for daily/weekly loss calculation
             # CRITICAL: Use completed trades from CompletedTrade table (pre-computed) for consistency
             # We'll calculate today_start and week_start later using the risk config timezone/reset settings
             daily_loss_usdt = 0.0  # Default to 0 (no loss) if we can't get trades
             weekly_loss_usdt = 0.0  # Default to 0 (no loss) if we can't get trades
             try:
-                # Only get trades if we have a valid account_id
-                today_trades = []
-                if account_id:
-                    try:
-                        today_trades = trade_service.get_trades_by_account(user_id, account_id) or []
-                    except Exception as e:
-                        logger.warning(f"Error getting trades by account for strategy {strategy_id}: {e}")
-                        today_trades = []
-                else:
-                    # If no account_id, get trades for this specific strategy instead
-                    try:
-                        today_trades = trade_service.get_strategy_trades(user_id, db_strategy.id, limit=10000) or []
-                    except Exception as e:
-                        logger.warning(f"Error getting strategy trades for strategy {strategy_id}: {e}")
-                        today_trades = []
-                # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table
                 # CRITICAL: Get ALL completed trades (no date filter) - we'll filter by date when calculating PnL
                 # This matches the account-level calculation logic for consistency
-                from app.api.routes.reports import _get_completed_trades_from_database, _match_trades_to_completed_positions
+                from app.api.routes.reports import _async_get_completed_trades_for_strategies
                 
-                # Try to get completed trades from database (pre-computed)
-                all_completed_trades = []
-                try:
-                    completed_trades = _get_completed_trades_from_database(
-                        db_service=db_service,
-                        user_id=user_id,
-                        strategy_uuid=db_strategy.id,
-                        strategy_id=strategy_id,
-                        start_datetime=None,  # Get ALL trades - filter by exit_time later when calculating PnL
-                        end_datetime=None
-                    )
-                    all_completed_trades.extend(completed_trades)
-                    logger.debug(f"Strategy {strategy_id}: Found {len(completed_trades)} completed trades from database (all time)")
-                except Exception as e:
-                    logger.debug(f"Strategy {strategy_id}: Could not get completed trades from database: {e}, falling back to on-demand matching")
-                
-                # ✅ FALLBACK: If no completed trades from database, use on-demand matching
-                if not all_completed_trades:
-                    # Get all trades (no date filter) - we'll filter by date when calculating PnL
-                    # This matches the account-level calculation logic for consistency
-                    today_trades_filtered = []
-                    for t in (today_trades or []):
-                        if not t:
-                            continue
-                        # Only process if it's a database Trade object (has strategy_id attribute)
-                        # Skip if it's already an OrderResponse (no strategy_id attribute)
-                        if hasattr(t, 'strategy_id'):
-                            today_trades_filtered.append(t)
-                        else:
-                            # Might be an OrderResponse - log warning and skip
-                            logger.debug(f"Skipping trade object without strategy_id attribute (likely OrderResponse): {type(t)}")
-                            continue
-                    
-                    # Initialize trades_by_strategy_uuid outside the if block to avoid UnboundLocalError
-                    trades_by_strategy_uuid = {}
-                    if today_trades_filtered:
-                        # CRITICAL: Match trades to completed positions (same logic as reports page)
-                        from app.models.order import OrderResponse
-                        
-                        # Group by strategy UUID BEFORE converting (db_trade.strategy_id is a UUID)
-                        for db_trade in today_trades_filtered:
-                            if not db_trade:
-                                continue
-                            # Ensure it's a database Trade object with strategy_id
-                            if not hasattr(db_trade, 'strategy_id'):
-                                logger.warning(f"Trade object missing strategy_id attribute: {type(db_trade)}")
-                                continue
-                            strategy_uuid = db_trade.strategy_id if db_trade.strategy_id else None
-                            if not strategy_uuid:
-                                continue
-                            
-                            strategy_uuid_str = str(strategy_uuid)
-                            if strategy_uuid_str not in trades_by_strategy_uuid:
-                                trades_by_strategy_uuid[strategy_uuid_str] = []
-                            trades_by_strategy_uuid[strategy_uuid_str].append(db_trade)
-                    
-                    # Convert and group OrderResponse objects by strategy
-                    trades_by_strategy = {}
-                    for strategy_uuid_str, db_trades in trades_by_strategy_uuid.items():
-                        if not db_trades:
-                            continue
-                        try:
-                            # Convert database trades to OrderResponse format using helper
-                            order_responses = _convert_db_trades_to_order_responses(db_trades, trade_service)
-                            if order_responses:
-                                trades_by_strategy[strategy_uuid_str] = order_responses
-                        except Exception as e:
-                            logger.warning(f"Error converting trades to OrderResponse for strategy {strategy_uuid_str}: {e}")
-                            continue
-                    
-                    # Match trades for each strategy
-                    for strategy_uuid_str, strategy_trades in trades_by_strategy.items():
-                        if not strategy_trades:
-                            continue
-                        
-                        # Initialize defaults
-                        strategy_name = "Unknown"
-                        symbol = strategy_trades[0].symbol if strategy_trades else ""
-                        leverage = strategy_trades[0].leverage if strategy_trades and strategy_trades[0].leverage else 1
-                        strategy_id_str = strategy_id  # Use the function parameter as default
-                        db_strategy = None
-                        
-                        try:
-                            from uuid import UUID
-                            strategy_uuid_obj = UUID(strategy_uuid_str)
-                            db_strategy = db_service.get_strategy_by_uuid(strategy_uuid_obj)
-                            if db_strategy:
-                                strategy_name = db_strategy.name or "Unknown"
-                                symbol = db_strategy.symbol or symbol
-                                leverage = db_strategy.leverage or leverage
-                                strategy_id_str = db_strategy.strategy_id or strategy_id
-                        except Exception as e:
-                            logger.debug(f"Could not get strategy info for UUID {strategy_uuid_str}: {e}")
-                        
-                        try:
-                            matched_trades = _match_trades_to_completed_positions(
-                                strategy_trades,
-                                strategy_id_str,  # Use strategy_id string, not UUID
-                                strategy_name,
-                                symbol,
-                                leverage
-                            )
-                            all_completed_trades.extend(matched_trades)
-                        except Exception as e:
-                                logger.warning(f"Error matching trades for strategy {strategy_id_str}: {e}")
-                                import traceback
-                                logger.debug(f"Traceback: {traceback.format_exc()}")
+                all_completed_trades = await _async_get_completed_trades_for_strategies(
+                    db_service=db_service,
+                    user_id=user_id,
+                    strategies=[db_strategy],
+                    start_datetime=None,  # Get ALL trades - filter by exit_time later when calculating PnL
+                    end_datetime=None
+                )
+                logger.debug(f"Strategy {strategy_id}: Found {len(all_completed_trades)} completed trades from database (all time)")
                 
                 # Calculate daily and weekly loss from completed trades
                 # Use same timezone/reset time as risk checks for consistency
@@ -2977,7 +2609,7 @@ async def get_strategy_risk_status(
                     summary = None
                     if runner:
                         try:
-                            strategies = runner.list_strategies()
+                            strategies = await asyncio.to_thread(runner.list_strategies)
                             for s in strategies:
                                 if s.id == strategy_id:
                                     summary = s
@@ -3018,7 +2650,7 @@ async def get_strategy_risk_status(
                     summary = None
                     if runner:
                         try:
-                            strategies = runner.list_strategies()
+                            strategies = await asyncio.to_thread(runner.list_strategies)
                             for s in strategies:
                                 if s.id == strategy_id:
                                     summary = s
@@ -3054,8 +2686,8 @@ async def get_strategy_risk_status(
                         # Update status to stopped_by_risk
                         if db_strategy:
                             db_strategy.status = "stopped_by_risk"
-                            db.commit()
-                            db.refresh(db_strategy)
+                            await db.commit()
+                            await db.refresh(db_strategy)
                             
                             # Update in-memory summary
                             from app.models.strategy import StrategyState
@@ -3075,7 +2707,7 @@ async def get_strategy_risk_status(
                             # CRITICAL: Create enforcement event for strategy-level breach
                             # Check for recent similar events to avoid duplicates
                             one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
-                            recent_events, _ = db_service.get_enforcement_events(
+                            recent_events, _ = await db_service.async_get_enforcement_events(
                                 user_id=user_id,
                                 strategy_id=db_strategy.id,
                                 limit=10,
@@ -3112,7 +2744,7 @@ async def get_strategy_risk_status(
                             # Only create event if no similar recent event exists
                             if not recent_similar_event:
                                 try:
-                                    db_service.create_system_event(
+                                    await db_service.async_create_system_event(
                                         event_type=event_type,
                                         event_level="ERROR",
                                         message=message,
@@ -3150,7 +2782,7 @@ async def get_strategy_risk_status(
                             # This ensures the event is recorded if it wasn't created before
                             if db_strategy:
                                 one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
-                                recent_events, _ = db_service.get_enforcement_events(
+                                recent_events, _ = await db_service.async_get_enforcement_events(
                                     user_id=user_id,
                                     strategy_id=db_strategy.id,
                                     limit=10,
@@ -3187,7 +2819,7 @@ async def get_strategy_risk_status(
                                 # Only create event if no similar recent event exists
                                 if not recent_similar_event:
                                     try:
-                                        db_service.create_system_event(
+                                        await db_service.async_create_system_event(
                                             event_type=event_type,
                                             event_level="ERROR",
                                             message=message,
@@ -3391,8 +3023,8 @@ async def get_strategy_risk_status(
 async def create_strategy_risk_config(
     strategy_id: str,
     config_data: StrategyRiskConfigCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> StrategyRiskConfigResponse:
     """Create strategy-level risk configuration.
     
@@ -3410,7 +3042,7 @@ async def create_strategy_risk_config(
         db_service = DatabaseService(db=db)
         
         # Verify strategy exists
-        db_strategy = db_service.get_strategy(user_id, strategy_id)
+        db_strategy = await db_service.async_get_strategy(user_id, strategy_id)
         if not db_strategy:
             raise HTTPException(
                 status_code=404,
@@ -3418,7 +3050,7 @@ async def create_strategy_risk_config(
             )
         
         # Check if config already exists
-        existing_config = db_service.get_strategy_risk_config(user_id, strategy_id)
+        existing_config = await db_service.async_get_strategy_risk_config(user_id, strategy_id)
         if existing_config:
             raise HTTPException(
                 status_code=400,
@@ -3432,8 +3064,8 @@ async def create_strategy_risk_config(
             today = datetime.now().date()
             daily_loss_reset_time_dt = datetime.combine(today, config_data.daily_loss_reset_time)
         
-        # Create config
-        db_config = db_service.create_strategy_risk_config(
+        # Create config (strategy relationship is loaded for from_orm)
+        db_config = await db_service.async_create_strategy_risk_config(
             user_id=user_id,
             strategy_id=strategy_id,
             max_daily_loss_usdt=config_data.max_daily_loss_usdt,
@@ -3454,9 +3086,7 @@ async def create_strategy_risk_config(
             weekly_loss_reset_day=config_data.weekly_loss_reset_day
         )
         
-        # Refresh to load relationship
-        db.refresh(db_config)
-        db.refresh(db_config.strategy)  # Load strategy relationship for from_orm
+        get_risk_config_cache().invalidate_strategy(user_id, strategy_id)
         
         # Convert to response model
         return StrategyRiskConfigResponse.from_orm(db_config)
@@ -3474,8 +3104,8 @@ async def create_strategy_risk_config(
 @router.get("/config/strategies/{strategy_id}", response_model=StrategyRiskConfigResponse)
 async def get_strategy_risk_config(
     strategy_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> StrategyRiskConfigResponse:
     """Get strategy-level risk configuration.
     
@@ -3492,7 +3122,7 @@ async def get_strategy_risk_config(
         db_service = DatabaseService(db=db)
         
         # Verify strategy exists
-        db_strategy = db_service.get_strategy(user_id, strategy_id)
+        db_strategy = await db_service.async_get_strategy(user_id, strategy_id)
         if not db_strategy:
             raise HTTPException(
                 status_code=404,
@@ -3500,18 +3130,14 @@ async def get_strategy_risk_config(
             )
         
         # Get config
-        db_config = db_service.get_strategy_risk_config(user_id, strategy_id)
+        db_config = await db_service.async_get_strategy_risk_config(user_id, strategy_id)
         if not db_config:
             raise HTTPException(
                 status_code=404,
                 detail=f"Risk config not found for strategy '{strategy_id}'"
             )
         
-        # Refresh to load relationship
-        db.refresh(db_config)
-        db.refresh(db_config.strategy)  # Load strategy relationship for from_orm
-        
-        # Convert to response model
+        # Convert to response model (strategy relationship is eager-loaded)
         return StrategyRiskConfigResponse.from_orm(db_config)
         
     except HTTPException:
@@ -3528,8 +3154,8 @@ async def get_strategy_risk_config(
 async def update_strategy_risk_config(
     strategy_id: str,
     config_data: StrategyRiskConfigUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> StrategyRiskConfigResponse:
     """Update strategy-level risk configuration.
     
@@ -3547,7 +3173,7 @@ async def update_strategy_risk_config(
         db_service = DatabaseService(db=db)
         
         # Verify strategy exists
-        db_strategy = db_service.get_strategy(user_id, strategy_id)
+        db_strategy = await db_service.async_get_strategy(user_id, strategy_id)
         if not db_strategy:
             raise HTTPException(
                 status_code=404,
@@ -3555,7 +3181,7 @@ async def update_strategy_risk_config(
             )
         
         # Get existing config
-        db_config = db_service.get_strategy_risk_config(user_id, strategy_id)
+        db_config = await db_service.async_get_strategy_risk_config(user_id, strategy_id)
         if not db_config:
             raise HTTPException(
                 status_code=404,
@@ -3578,9 +3204,9 @@ async def update_strategy_risk_config(
             if hasattr(db_config, key):
                 setattr(db_config, key, value)
         
-        db.commit()
-        db.refresh(db_config)
-        db.refresh(db_config.strategy)  # Load strategy relationship for from_orm
+        await db.commit()
+        get_risk_config_cache().invalidate_strategy(user_id, strategy_id)
+        await db.refresh(db_config)  # Also reloads the eager-loaded strategy relationship for from_orm
         
         # Convert to response model
         return StrategyRiskConfigResponse.from_orm(db_config)
@@ -3598,8 +3224,8 @@ async def update_strategy_risk_config(
 @router.delete("/config/strategies/{strategy_id}", status_code=204, response_model=None)
 async def delete_strategy_risk_config(
     strategy_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db_session_dependency),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> None:
     """Delete strategy-level risk configuration.
     
@@ -3613,7 +3239,7 @@ async def delete_strategy_risk_config(
         db_service = DatabaseService(db=db)
         
         # Verify strategy exists
-        db_strategy = db_service.get_strategy(user_id, strategy_id)
+        db_strategy = await db_service.async_get_strategy(user_id, strategy_id)
         if not db_strategy:
             raise HTTPException(
                 status_code=404,
@@ -3621,7 +3247,7 @@ async def delete_strategy_risk_config(
             )
         
         # Get config
-        db_config = db_service.get_strategy_risk_config(user_id, strategy_id)
+        db_config = await db_service.async_get_strategy_risk_config(user_id, strategy_id)
         if not db_config:
             raise HTTPException(
                 status_code=404,
@@ -3629,8 +3255,9 @@ async def delete_strategy_risk_config(
             )
         
         # Delete config
-        db.delete(db_config)
-        db.commit()
+        await db.delete(db_config)
+        await db.commit()
+        get_risk_config_cache().invalidate_strategy(user_id, strategy_id)
         
         logger.info(f"Deleted risk config for strategy '{strategy_id}' (user: {user_id})")
         
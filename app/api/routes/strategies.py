@@ -14,6 +14,7 @@ from app.api.deps import (
 from app.models.order import OrderResponse
 from app.models.strategy import CreateStrategyRequest, StrategySummary, StrategyStats, OverallStats, StrategyParams
 from app.models.db_models import User
+from app.risk.risk_config_cache import get_risk_config_cache
 from app.services.strategy_runner import StrategyRunner
 from app.services.strategy_service import StrategyService
 from app.core.redis_storage import RedisStorage
@@ -343,6 +344,8 @@ async def delete_strategy(
     logger.info(f"DELETE /strategies/{strategy_id} - User: {current_user.id}, Strategy ID: {strategy_id}")
     try:
         await runner.delete(strategy_id)
+        # Drop cached strategy UUID / risk config so a re-created strategy with the same id is re-resolved
+        get_risk_config_cache().invalidate_strategy(current_user.id, strategy_id)
         logger.info(f"Successfully deleted strategy {strategy_id}")
     except StrategyNotFoundError as e:
         logger.warning(f"Strategy {strategy_id} not found for deletion: {e}")
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from dateutil import parser as date_parser
 from fastapi import APIRouter, Depends, Query
 from loguru import logger
 
-from app.api.deps import get_strategy_runner, get_current_user, get_database_service
+from app.api.deps import get_strategy_runner, get_current_user_async, get_database_service_async
+from app.api.routes.reports import _async_get_completed_trades_by_strategy
+from app.models.report import TradeReport
+from app.models.strategy import StrategyStats
 from app.models.strategy_performance import StrategyPerformance, StrategyPerformanceList
 from app.services.strategy_runner import StrategyRunner
 from app.services.database_service import DatabaseService
+from app.services.report_cache import cached_report
 from app.models.db_models import User
 from app.core.exceptions import StrategyNotFoundError
 
@@ -22,7 +27,11 @@ router = APIRouter(prefix="/api/strategies/performance", tags=["strategy-perform
 
 @router.get("", response_model=StrategyPerformanceList)
 @router.get("/", response_model=StrategyPerformanceList)
-def get_strategy_performance(
+@cached_report(
+    "strategy_performance",
+    ("strategy_name", "symbol", "status", "rank_by", "start_date", "end_date", "account_id"),
+)
+async def get_strategy_performance(
     strategy_name: Optional[str] = Query(default=None, description="Filter by strategy name"),
     symbol: Optional[str] = Query(default=None, description="Filter by symbol"),
     status: Optional[str] = Query(default=None, description="Filter by status (running/stopped/error)"),
@@ -30,22 +39,58 @@ def get_strategy_performance(
     start_date: Optional[str] = Query(default=None, description="Filter from date/time (ISO datetime)"),
     end_date: Optional[str] = Query(default=None, description="Filter to date/time (ISO datetime)"),
     account_id: Optional[str] = Query(default=None, description="Filter by Binance account ID"),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_async),
     runner: StrategyRunner = Depends(get_strategy_runner),
-    db_service: DatabaseService = Depends(get_database_service),
+    db_service: DatabaseService = Depends(get_database_service_async),
 ) -> StrategyPerformanceList:
     """Get performance metrics for all strategies, ranked by profitability.
     
     Returns strategies sorted by total PnL (best performing first) with detailed
     performance metrics including realized/unrealized PnL, win rate, and trade statistics.
     """
-    strategies = runner.list_strategies()
+    # The runner may read strategies and trades through its sync session: keep it off the event loop
+    strategies = await asyncio.to_thread(runner.list_strategies)
     
-    # Collect performance data for each strategy
-    performance_list: List[StrategyPerformance] = []
+    # Parse date filters if provided
+    start_datetime: Optional[datetime] = None
+    end_datetime: Optional[datetime] = None
+    
+    if start_date:
+        try:
+            # Check if it's date-only format (YYYY-MM-DD) or includes time
+            if 'T' in start_date or '+' in start_date or start_date.count(':') >= 2:
+                # ISO format with time: parse as-is
+                start_datetime = date_parser.parse(start_date)
+            else:
+                # Date-only format: set to start of day (00:00:00)
+                start_datetime = datetime.strptime(start_date, "%Y-%m-%d")
+            
+            if start_datetime.tzinfo is None:
+                start_datetime = start_datetime.replace(tzinfo=timezone.utc)
+        except (ValueError, TypeError) as exc:
+            logger.warning(f"Invalid start_date format: {start_date}, error: {exc}")
+            start_datetime = None
+    
+    if end_date:
+        try:
+            # Check if it's date-only format (YYYY-MM-DD) or includes time
+            if 'T' in end_date or '+' in end_date or end_date.count(':') >= 2:
+                # ISO format with time: parse as-is
+                end_datetime = date_parser.parse(end_date)
+            else:
+                # Date-only format: set to end of day (23:59:59.999999)
+                end_datetime = datetime.strptime(end_date, "%Y-%m-%d")
+                end_datetime = end_datetime.replace(hour=23, minute=59, second=59, microsecond=999999)
+            
+            if end_datetime.tzinfo is None:
+                end_datetime = end_datetime.replace(tzinfo=timezone.utc)
+        except (ValueError, TypeError) as exc:
+            logger.warning(f"Invalid end_date format: {end_date}, error: {exc}")
+            end_datetime = None
     
+    # Apply filters
+    selected_strategies = []
     for strategy in strategies:
-        # Apply filters
         if strategy_name and strategy_name.lower() not in strategy.name.lower():
             continue
         if symbol and strategy.symbol.upper() != symbol.upper():
@@ -54,90 +99,42 @@ def get_strategy_performance(
             continue
         if account_id and strategy.account_id != account_id:
             continue
-        
+        selected_strategies.append(strategy)
+    
+    # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
+    # One query for the completed trades of all selected strategies instead of several per strategy
+    completed_trades_by_strategy: Dict[str, List[TradeReport]] = {}
+    if selected_strategies:
         try:
-            # Parse date filters if provided
-            start_datetime: Optional[datetime] = None
-            end_datetime: Optional[datetime] = None
-            
-            if start_date:
-                try:
-                    # Check if it's date-only format (YYYY-MM-DD) or includes time
-                    if 'T' in start_date or '+' in start_date or start_date.count(':') >= 2:
-                        # ISO format with time: parse as-is
-                        start_datetime = date_parser.parse(start_date)
-                    else:
-                        # Date-only format: set to start of day (00:00:00)
-                        start_datetime = datetime.strptime(start_date, "%Y-%m-%d")
-                    
-                    if start_datetime.tzinfo is None:
-                        start_datetime = start_datetime.replace(tzinfo=timezone.utc)
-                except (ValueError, TypeError) as exc:
-                    logger.warning(f"Invalid start_date format: {start_date}, error: {exc}")
-                    start_datetime = None
-            
-            if end_date:
-                try:
-                    # Check if it's date-only format (YYYY-MM-DD) or includes time
-                    if 'T' in end_date or '+' in end_date or end_date.count(':') >= 2:
-                        # ISO format with time: parse as-is
-                        end_datetime = date_parser.parse(end_date)
-                    else:
-                        # Date-only format: set to end of day (23:59:59.999999)
-                        end_datetime = datetime.strptime(end_date, "%Y-%m-%d")
-                        end_datetime = end_datetime.replace(hour=23, minute=59, second=59, microsecond=999999)
-                    
-                    if end_datetime.tzinfo is None:
-                        end_datetime = end_datetime.replace(tzinfo=timezone.utc)
-                except (ValueError, TypeError) as exc:
-                    logger.warning(f"Invalid end_date format: {end_date}, error: {exc}")
-                    end_datetime = None
-            
-            # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
-            # This is much faster than on-demand matching
-            from app.api.routes.reports import _get_completed_trades_from_database, _match_trades_to_completed_positions
-            from app.services.trade_service import TradeService
-            from app.core.redis_storage import RedisStorage
-            from app.core.config import get_settings
-            from uuid import UUID
-            
-            completed_trades_list = []
-            
-            # Get strategy UUID from database
-            db_strategy = None
-            if runner.strategy_service and runner.user_id:
-                try:
-                    db_strategy = runner.strategy_service.db_service.get_strategy(current_user.id, strategy.id)
-                except Exception as e:
-                    logger.debug(f"Could not get strategy from database: {e}")
-            
-            if db_strategy:
-                try:
-                    # Query from CompletedTrade table
-                    completed_trades_list = _get_completed_trades_from_database(
-                        db_service=db_service,
-                        user_id=current_user.id,
-                        strategy_uuid=db_strategy.id,
-                        strategy_id=strategy.id,
-                        start_datetime=start_datetime,
-                        end_datetime=end_datetime
-                    )
-                except Exception as e:
-                    logger.debug(f"Could not get completed trades from database for strategy {strategy.id}: {e}")
+            completed_trades_by_strategy = await _async_get_completed_trades_by_strategy(
+                db_service=db_service,
+                user_id=current_user.id,
+                strategy_ids=[s.id for s in selected_strategies],
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+            )
+        except Exception as e:
+            logger.debug(f"Could not get completed trades from database: {e}")
+    
+    # Collect performance data for each strategy
+    performance_list: List[StrategyPerformance] = []
+    
+    for strategy in selected_strategies:
+        try:
+            completed_trades_list = completed_trades_by_strategy.get(strategy.id, [])
             
             # ✅ FALLBACK: If no completed trades from database, use on-demand matching
             if not completed_trades_list:
                 logger.debug(f"No completed trades from database for strategy {strategy.id}, falling back to trades table")
                 # Use existing calculate_strategy_stats which uses trades table
-                stats = runner.calculate_strategy_stats(
+                stats = await asyncio.to_thread(
+                    runner.calculate_strategy_stats,
                     strategy.id,
                     start_date=start_datetime,
-                    end_date=end_datetime
+                    end_date=end_datetime,
                 )
             else:
                 # Calculate stats from completed trades (TradeReport objects)
-                from app.models.strategy import StrategyStats
-                
                 total_pnl = sum(trade.pnl_usd for trade in completed_trades_list)
                 winning_trades = len([t for t in completed_trades_list if t.pnl_usd > 0])
                 losing_trades = len([t for t in completed_trades_list if t.pnl_usd < 0])
@@ -147,10 +144,6 @@ def get_strategy_performance(
                 largest_win = max((t.pnl_usd for t in completed_trades_list), default=0.0)
                 largest_loss = min((t.pnl_usd for t in completed_trades_list), default=0.0)
                 
-                # Calculate total fees from completed trades
-                total_trade_fees = sum(trade.fee_paid for trade in completed_trades_list)
-                total_funding_fees = sum(trade.funding_fee for trade in completed_trades_list)
-                
                 # Get last trade timestamp from completed trades
                 last_trade_at = None
                 if completed_trades_list:
@@ -159,7 +152,7 @@ def get_strategy_performance(
                         last_trade_at = max(exit_times)
                 
                 # Get total trades count from runner (includes open positions)
-                all_trades = runner.get_trades(strategy.id)
+                all_trades = await asyncio.to_thread(runner.get_trades, strategy.id)
                 total_trades_count = len(all_trades) if all_trades else completed_count
                 
                 stats = StrategyStats(
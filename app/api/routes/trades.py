@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 
 from dateutil import parser as date_parser
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from pydantic import BaseModel
 
@@ -15,7 +17,7 @@ from app.api.deps import (
     get_strategy_runner, get_binance_client, get_client_manager,
     get_current_user, get_current_user_async,
     get_database_service, get_database_service_async,
-    get_account_service,
+    get_account_service_async,
     get_mark_price_stream_manager,
 )
 from app.core.binance_client_manager import BinanceClientManager
@@ -32,16 +34,23 @@ from app.services.strategy_runner import StrategyRunner
 from app.services.trade_service import TradeService
 from app.services.account_service import AccountService
 from app.services.database_service import DatabaseService
+from app.services.report_cache import cached_report
 from app.core.my_binance_client import BinanceClient
 from app.core.exceptions import StrategyNotFoundError
 from app.core.redis_storage import RedisStorage
 from app.core.config import get_settings
 from app.core.mark_price_stream_manager import MarkPriceStreamManager
 from app.core.funding_market_cache import get_position_funding_for_rest
+from app.core.pagination import after_cursor, encode_cursor
 
 
 router = APIRouter(prefix="/api/trades", tags=["trades"])
 
+# Cursor pagination: the next page's cursor is returned in this response header
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TRADES_PAGE_MAX_LIMIT = 1000
+TRADES_EXPORT_BATCH_SIZE = 500
+
 
 class ManualCloseRequest(BaseModel):
     symbol: Optional[str] = None
@@ -69,6 +78,50 @@ def _normalize_margin_type(mt: Optional[str]) -> Optional[str]:
     return None
 
 
+def _completed_trade_to_orders(ct, strategy_id: str, strategy_name: str) -> List[TradeWithTimestamp]:
+    """Convert a CompletedTrade row to its entry and exit orders (entry first)."""
+    # Create entry order
+    entry_side = "BUY" if ct.side == "LONG" else "SELL"
+    entry_trade = TradeWithTimestamp(
+        symbol=ct.symbol,
+        order_id=ct.entry_order_id,
+        status="FILLED",
+        side=entry_side,
+        price=float(ct.entry_price),
+        avg_price=float(ct.entry_price),
+        executed_qty=float(ct.quantity),
+        timestamp=ct.entry_time,
+        strategy_id=strategy_id,
+        strategy_name=strategy_name,
+        commission=float(ct.fee_paid) / 2 if ct.fee_paid else None,  # Split fee between entry/exit
+        leverage=ct.leverage or None,
+        initial_margin=float(ct.initial_margin) if ct.initial_margin else None,
+        margin_type=ct.margin_type,
+        notional_value=float(ct.notional_value) if ct.notional_value else None,
+    )
+    
+    # Create exit order
+    exit_side = "SELL" if ct.side == "LONG" else "BUY"
+    exit_trade = TradeWithTimestamp(
+        symbol=ct.symbol,
+        order_id=ct.exit_order_id,
+        status="FILLED",
+        side=exit_side,
+        price=float(ct.exit_price),
+        avg_price=float(ct.exit_price),
+        executed_qty=float(ct.quantity),
+        timestamp=ct.exit_time,
+        strategy_id=strategy_id,
+        strategy_name=strategy_name,
+        commission=float(ct.fee_paid) / 2 if ct.fee_paid else None,  # Split fee between entry/exit
+        leverage=ct.leverage or None,
+        initial_margin=None,  # Exit doesn't have initial margin
+        margin_type=ct.margin_type,
+        notional_value=float(ct.exit_price * ct.quantity) if ct.exit_price and ct.quantity else None,
+    )
+    return [entry_trade, exit_trade]
+
+
 async def _get_completed_trades_from_database_for_trades_page(
     db_service: DatabaseService,
     user_id: UUID,
@@ -140,47 +193,7 @@ async def _get_completed_trades_from_database_for_trades_page(
         # Convert to TradeWithTimestamp (create entry and exit orders)
         trade_list = []
         for ct in completed_trades:
-            # Create entry order
-            entry_side = "BUY" if ct.side == "LONG" else "SELL"
-            entry_trade = TradeWithTimestamp(
-                symbol=ct.symbol,
-                order_id=ct.entry_order_id,
-                status="FILLED",
-                side=entry_side,
-                price=float(ct.entry_price),
-                avg_price=float(ct.entry_price),
-                executed_qty=float(ct.quantity),
-                timestamp=ct.entry_time,
-                strategy_id=strategy_id,
-                strategy_name=strategy_name,
-                commission=float(ct.fee_paid) / 2 if ct.fee_paid else None,  # Split fee between entry/exit
-                leverage=ct.leverage or None,
-                initial_margin=float(ct.initial_margin) if ct.initial_margin else None,
-                margin_type=ct.margin_type,
-                notional_value=float(ct.notional_value) if ct.notional_value else None,
-            )
-            trade_list.append(entry_trade)
-            
-            # Create exit order
-            exit_side = "SELL" if ct.side == "LONG" else "BUY"
-            exit_trade = TradeWithTimestamp(
-                symbol=ct.symbol,
-                order_id=ct.exit_order_id,
-                status="FILLED",
-                side=exit_side,
-                price=float(ct.exit_price),
-                avg_price=float(ct.exit_price),
-                executed_qty=float(ct.quantity),
-                timestamp=ct.exit_time,
-                strategy_id=strategy_id,
-                strategy_name=strategy_name,
-                commission=float(ct.fee_paid) / 2 if ct.fee_paid else None,  # Split fee between entry/exit
-                leverage=ct.leverage or None,
-                initial_margin=None,  # Exit doesn't have initial margin
-                margin_type=ct.margin_type,
-                notional_value=float(ct.exit_price * ct.quantity) if ct.exit_price and ct.quantity else None,
-            )
-            trade_list.append(exit_trade)
+            trade_list.extend(_completed_trade_to_orders(ct, strategy_id, strategy_name))
         
         logger.info(
             f"_get_completed_trades_from_database_for_trades_page: Found {len(completed_trades)} completed trades "
@@ -196,6 +209,177 @@ async def _get_completed_trades_from_database_for_trades_page(
         return []
 
 
+async def _get_trade_list_strategies(
+    db_service: DatabaseService,
+    user_id: UUID,
+    strategy_id: Optional[str] = None,
+    account_id: Optional[str] = None,
+    symbol: Optional[str] = None,
+) -> list:
+    """Get the user's strategies matching the trade list filters (account relationship loaded)."""
+    strategies = await db_service.async_get_user_strategies(user_id)
+    return [
+        s for s in strategies
+        if (not strategy_id or s.strategy_id == strategy_id)
+        and (not account_id or (s.account is not None and s.account.account_id == account_id))
+        and (not symbol or (s.symbol or "").upper() == symbol.upper())
+    ]
+
+
+async def _get_completed_trades_page(
+    db,
+    user_id: UUID,
+    strategies: list,
+    limit: int,
+    cursor: Optional[str] = None,
+    start_datetime: Optional[datetime] = None,
+    end_datetime: Optional[datetime] = None,
+) -> Tuple[List[TradeWithTimestamp], Optional[str]]:
+    """Get one keyset page of completed trades of several strategies, most recent exit first.
+
+    Reads at most ``limit + 1`` rows from the (user_id, exit_time, id) index,
+    however deep the page is.
+
+    Args:
+        db: Async database session
+        user_id: User UUID
+        strategies: Strategy models with the ``account`` relationship loaded
+        limit: Completed trades per page (each yields its exit and entry order)
+        cursor: Cursor returned with the previous page
+        start_datetime: Optional start date filter (exit_time)
+        end_datetime: Optional end date filter (exit_time)
+
+    Returns:
+        (orders, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not strategies:
+        return [], None
+    from sqlalchemy import and_, or_, select
+    from app.models.db_models import CompletedTrade
+
+    # Paper trading strategies list paper trades, live strategies live trades
+    paper_ids = [s.id for s in strategies if s.account is not None and s.account.paper_trading]
+    live_ids = [s.id for s in strategies if not (s.account is not None and s.account.paper_trading)]
+    conditions = []
+    if paper_ids:
+        conditions.append(and_(CompletedTrade.strategy_id.in_(paper_ids), CompletedTrade.paper_trading == True))
+    if live_ids:
+        conditions.append(and_(CompletedTrade.strategy_id.in_(live_ids), CompletedTrade.paper_trading == False))
+
+    stmt = select(CompletedTrade).filter(CompletedTrade.user_id == user_id, or_(*conditions))
+    if start_datetime:
+        stmt = stmt.filter(CompletedTrade.exit_time >= start_datetime)
+    if end_datetime:
+        stmt = stmt.filter(CompletedTrade.exit_time <= end_datetime)
+    if cursor:
+        stmt = stmt.filter(after_cursor(CompletedTrade.exit_time, CompletedTrade.id, cursor))
+    stmt = stmt.order_by(CompletedTrade.exit_time.desc(), CompletedTrade.id.desc()).limit(limit + 1)
+
+    result = await db.execute(stmt)
+    completed_trades = list(result.scalars().all())
+
+    next_cursor = None
+    if len(completed_trades) > limit:
+        completed_trades = completed_trades[:limit]
+        next_cursor = encode_cursor(completed_trades[-1].exit_time, completed_trades[-1].id)
+
+    strategies_by_uuid = {s.id: s for s in strategies}
+    orders = []
+    for ct in completed_trades:
+        strategy = strategies_by_uuid[ct.strategy_id]
+        entry_trade, exit_trade = _completed_trade_to_orders(ct, strategy.strategy_id, strategy.name)
+        orders.extend((exit_trade, entry_trade))
+    return orders, next_cursor
+
+
+def _matches_side(trade: TradeWithTimestamp, side: Optional[str]) -> bool:
+    return not side or trade.side.upper() == side.upper()
+
+
+async def _stream_completed_trades(
+    user_id: UUID,
+    strategies: list,
+    side: Optional[str],
+    start_datetime: Optional[datetime],
+    end_datetime: Optional[datetime],
+) -> AsyncIterator[str]:
+    """Yield matching trades as NDJSON, one keyset page at a time.
+
+    Each page uses its own short session, so no connection is held while the
+    client is reading.
+    """
+    from app.core.database import get_async_session_factory
+
+    session_factory = await get_async_session_factory()
+    cursor = None
+    while True:
+        async with session_factory() as db:
+            trades, cursor = await _get_completed_trades_page(
+                db, user_id, strategies, TRADES_EXPORT_BATCH_SIZE, cursor, start_datetime, end_datetime,
+            )
+        lines = "".join(trade.model_dump_json() + "\n" for trade in trades if _matches_side(trade, side))
+        if lines:
+            yield lines
+        if cursor is None:
+            break
+
+
+def _get_symbol_trades_page(
+    db_service: DatabaseService,
+    user_id: UUID,
+    strategies: list,
+    symbol: str,
+    side: Optional[str],
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[TradeWithTimestamp], Optional[str]]:
+    """Get one keyset page of a symbol's trades from the trades table, newest first (sync).
+
+    Uses the (user_id, timestamp DESC) index; reads at most ``limit + 1`` rows.
+
+    Returns:
+        (trades, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not strategies:
+        return [], None
+    from sqlalchemy import select
+
+    stmt = select(Trade).filter(
+        Trade.user_id == user_id,
+        Trade.strategy_id.in_([s.id for s in strategies]),
+        Trade.symbol == symbol,
+    )
+    if side:
+        stmt = stmt.filter(Trade.side == side.upper())
+    if cursor:
+        stmt = stmt.filter(after_cursor(Trade.timestamp, Trade.id, cursor))
+    stmt = stmt.order_by(Trade.timestamp.desc(), Trade.id.desc()).limit(limit + 1)
+
+    db_trades = list(db_service.db.execute(stmt).scalars().all())
+    next_cursor = None
+    if len(db_trades) > limit:
+        db_trades = db_trades[:limit]
+        next_cursor = encode_cursor(db_trades[-1].timestamp, db_trades[-1].id)
+
+    trade_service = TradeService(db_service.db)
+    strategies_by_uuid = {s.id: s for s in strategies}
+    trades = []
+    for db_trade in db_trades:
+        strategy = strategies_by_uuid[db_trade.strategy_id]
+        trades.append(_convert_order_to_trade_with_timestamp(
+            trade_service._db_trade_to_order_response(db_trade),
+            strategy_id=strategy.strategy_id,
+            strategy_name=strategy.name,
+        ))
+    return trades, next_cursor
+
+
 def _convert_order_to_trade_with_timestamp(
     order: OrderResponse,
     strategy_id: Optional[str] = None,
@@ -233,12 +417,19 @@ def _convert_order_to_trade_with_timestamp(
 
 @router.get("/list", response_model=List[TradeWithTimestamp])
 async def list_all_trades(
+    response: Response,
     symbol: Optional[str] = Query(default=None, description="Filter by symbol"),
     start_date: Optional[str] = Query(default=None, description="Filter from date (ISO format or YYYY-MM-DD)"),
     end_date: Optional[str] = Query(default=None, description="Filter until date (ISO format or YYYY-MM-DD)"),
     side: Optional[str] = Query(default=None, description="Filter by side (BUY/SELL)"),
     strategy_id: Optional[str] = Query(default=None, description="Filter by strategy ID"),
     account_id: Optional[str] = Query(default=None, description="Filter by Binance account ID"),
+    limit: Optional[int] = Query(
+        default=None, ge=1, le=TRADES_PAGE_MAX_LIMIT,
+        description="Completed trades per page (each returns its entry and exit order); enables cursor pagination",
+    ),
+    cursor: Optional[str] = Query(default=None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    stream: bool = Query(default=False, description="Stream all matching trades as NDJSON"),
     current_user: User = Depends(get_current_user_async),
     runner: StrategyRunner = Depends(get_strategy_runner),
     db_service: DatabaseService = Depends(get_database_service_async),
@@ -247,6 +438,13 @@ async def list_all_trades(
     
     This endpoint prioritizes fetching from the database for accurate historical data.
     Falls back to StrategyRunner (Redis/in-memory) if database query fails.
+    
+    With ``limit`` (or ``cursor``) trades are returned one page at a time,
+    newest exit first, straight from the completed_trades index; the next
+    page's cursor is in the X-Next-Cursor header (absent on the last page).
+    The side filter is applied within a page, so it may shorten pages.
+    With ``stream`` every matching trade is streamed as NDJSON, page by page.
+    Without them the full list is returned, as before.
     """
     try:
         # Parse datetime strings
@@ -286,6 +484,24 @@ async def list_all_trades(
                 logger.warning(f"Invalid end_date format: {end_date}, error: {exc}")
                 end_datetime = None
         
+        if stream or limit is not None or cursor is not None:
+            strategies = await _get_trade_list_strategies(db_service, current_user.id, strategy_id, account_id, symbol)
+            if stream:
+                return StreamingResponse(
+                    _stream_completed_trades(current_user.id, strategies, side, start_datetime, end_datetime),
+                    media_type="application/x-ndjson",
+                )
+            try:
+                page, next_cursor = await _get_completed_trades_page(
+                    db_service.db, current_user.id, strategies, limit or TRADES_EXPORT_BATCH_SIZE, cursor,
+                    start_datetime, end_datetime,
+                )
+            except ValueError as exc:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+            if next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = next_cursor
+            return [trade for trade in page if _matches_side(trade, side)]
+        
         all_trades = []
         
         # ✅ PREFER: Get completed trades from pre-computed CompletedTrade table (ON-WRITE)
@@ -429,9 +645,10 @@ async def list_all_trades(
         logger.info(f"Returning {len(all_trades)} trades with filters: symbol={symbol}, side={side}, strategy_id={strategy_id}")
         return all_trades
     
+    except HTTPException:
+        raise
     except Exception as exc:
         logger.exception(f"Error in list_all_trades endpoint: {exc}")
-        from fastapi import HTTPException
         raise HTTPException(
             status_code=500,
             detail=f"Error retrieving trades: {str(exc)}"
@@ -511,16 +728,16 @@ async def manual_close_strategy_position(
 
 
 @router.get("/symbol/{symbol}/pnl", response_model=SymbolPnL)
-def get_symbol_pnl(
+async def get_symbol_pnl(
     symbol: str,
     account_id: Optional[str] = Query(default=None, description="Filter by Binance account ID"),
     start_date: Optional[str] = Query(default=None, description="Filter from date (ISO format or YYYY-MM-DD)"),
     end_date: Optional[str] = Query(default=None, description="Filter until date (ISO format or YYYY-MM-DD)"),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_async),
     runner: StrategyRunner = Depends(get_strategy_runner),
     client: BinanceClient = Depends(get_binance_client),
     client_manager: BinanceClientManager = Depends(get_client_manager),
-    db_service: DatabaseService = Depends(get_database_service),
+    db_service: DatabaseService = Depends(get_database_service_async),
     mark_price_manager: Optional[MarkPriceStreamManager] = Depends(get_mark_price_stream_manager),
 ) -> SymbolPnL:
     """Get profit and loss summary for a specific symbol."""
@@ -563,8 +780,8 @@ def get_symbol_pnl(
             logger.warning(f"Invalid end_date format: {end_date}, error: {exc}")
             end_datetime = None
     
-    # Get all strategies for this symbol
-    strategies = runner.list_strategies()
+    # Get all strategies for this symbol (the runner may read them through its sync session)
+    strategies = await asyncio.to_thread(runner.list_strategies)
     symbol_strategies = [s for s in strategies if s.symbol.upper() == symbol]
     
     # Apply account_id filter (case-insensitive to match get_pnl_overview)
@@ -589,61 +806,41 @@ def get_symbol_pnl(
                 db_service = None
             
             if db_service:
-                # Get completed trades from database for all strategies
-                from app.api.routes.reports import _get_completed_trades_from_database
-                from app.services.strategy_service import StrategyService
-                settings = get_settings()
-                redis_storage = None
-                if settings.redis_enabled:
-                    redis_storage = RedisStorage(
-                        redis_url=settings.redis_url,
-                        enabled=settings.redis_enabled
-                    )
+                # Get completed trades from database for all strategies (pre-computed, one query)
+                from app.api.routes.reports import _async_get_completed_trades_by_strategy
                 
                 # Ensure db_service has db attribute
                 if not hasattr(db_service, 'db'):
                     logger.warning(f"db_service does not have 'db' attribute. Type: {type(db_service)}")
                     raise AttributeError("db_service does not have 'db' attribute")
                 
-                strategy_service = StrategyService(db_service.db, redis_storage)
+                trade_reports_by_strategy = await _async_get_completed_trades_by_strategy(
+                    db_service=db_service,
+                    user_id=current_user.id,
+                    strategy_ids=[strategy.id for strategy in symbol_strategies],
+                    start_datetime=start_datetime,
+                    end_datetime=end_datetime,
+                )
                 
                 for strategy in symbol_strategies:
-                    try:
-                        # Get strategy UUID from database
-                        db_strategy = strategy_service.db_service.get_strategy(current_user.id, strategy.id)
-                        
-                        if db_strategy:
-                            # Get completed trades from database (pre-computed)
-                            trade_reports = _get_completed_trades_from_database(
-                                db_service=db_service,
-                                user_id=current_user.id,
-                                strategy_uuid=db_strategy.id,
-                                strategy_id=strategy.id,
-                                start_datetime=start_datetime,
-                                end_datetime=end_datetime,
-                            )
-                            
-                            # Convert TradeReport to TradeSummary for PnL calculation
-                            # Also accumulate fees from TradeReport
-                            for tr in trade_reports:
-                                completed_trades.append(TradeSummary(
-                                    symbol=tr.symbol,
-                                    entry_price=tr.entry_price,
-                                    exit_price=tr.exit_price,
-                                    quantity=tr.quantity,
-                                    side=tr.side,  # "LONG" or "SHORT"
-                                    realized_pnl=tr.pnl_usd,  # Use pre-computed PnL from database
-                                    entry_time=tr.entry_time,
-                                    exit_time=tr.exit_time,
-                                    strategy_id=tr.strategy_id,
-                                    strategy_name=strategy.name,
-                                ))
-                                # Accumulate fees from TradeReport
-                                total_trade_fees += tr.fee_paid
-                                total_funding_fees += tr.funding_fee
-                    except Exception as e:
-                        logger.warning(f"Could not get completed trades for strategy {strategy.id}: {e}", exc_info=True)
-                        continue
+                    # Convert TradeReport to TradeSummary for PnL calculation
+                    # Also accumulate fees from TradeReport
+                    for tr in trade_reports_by_strategy.get(strategy.id, []):
+                        completed_trades.append(TradeSummary(
+                            symbol=tr.symbol,
+                            entry_price=tr.entry_price,
+                            exit_price=tr.exit_price,
+                            quantity=tr.quantity,
+                            side=tr.side,  # "LONG" or "SHORT"
+                            realized_pnl=tr.pnl_usd,  # Use pre-computed PnL from database
+                            entry_time=tr.entry_time,
+                            exit_time=tr.exit_time,
+                            strategy_id=tr.strategy_id,
+                            strategy_name=strategy.name,
+                        ))
+                        # Accumulate fees from TradeReport
+                        total_trade_fees += tr.fee_paid
+                        total_funding_fees += tr.funding_fee
                 
                 logger.info(f"Retrieved {len(completed_trades)} completed trades from database for {symbol}")
         except Exception as e:
@@ -724,7 +921,7 @@ def get_symbol_pnl(
         else:
             logger.debug(f"Getting position for {symbol} using client (account_id: {account_id_for_client or account_id or 'default'})")
             try:
-                position_data = position_client.get_open_position(symbol)
+                position_data = await asyncio.to_thread(position_client.get_open_position, symbol)
                 if position_data:
                     position_data = _normalize_position_data(position_data)
             except Exception as pos_exc:
@@ -778,9 +975,9 @@ def get_symbol_pnl(
             # Require strategy to have unclosed entry quantity (avoid attributing when position_instance_id was recovered from old trade but position is manual)
             if strategy_match and db_service and current_user:
                 try:
-                    db_strat = db_service.get_strategy(current_user.id, strategy_match.id)
+                    db_strat = await db_service.async_get_strategy(current_user.id, strategy_match.id)
                     if db_strat and getattr(strategy_match, "position_instance_id", None):
-                        owned_qty, has_entries = db_service.get_strategy_owned_quantity(
+                        owned_qty, has_entries = await db_service.async_get_strategy_owned_quantity(
                             db_strat.id,
                             symbol,
                             strategy_match.position_instance_id,
@@ -804,14 +1001,18 @@ def get_symbol_pnl(
             manual_attribution = None
             if not strategy_match and db_service and current_user and hasattr(db_service, "db"):
                 try:
+                    from sqlalchemy import select
                     acc = (account_id_for_client or "default").lower()
-                    manual_candidate = db_service.db.query(ManualPosition).filter(
-                        ManualPosition.user_id == current_user.id,
-                        ManualPosition.symbol == symbol,
-                        ManualPosition.side == position_side,
-                        ManualPosition.status == "OPEN",
-                        ManualPosition.account_id == acc,
-                    ).first()
+                    result = await db_service.db.execute(
+                        select(ManualPosition).filter(
+                            ManualPosition.user_id == current_user.id,
+                            ManualPosition.symbol == symbol,
+                            ManualPosition.side == position_side,
+                            ManualPosition.status == "OPEN",
+                            ManualPosition.account_id == acc,
+                        ).limit(1)
+                    )
+                    manual_candidate = result.scalars().first()
                     if manual_candidate is not None:
                         binance_entry = float(position_data.get("entryPrice") or 0)
                         manual_entry = float(manual_candidate.entry_price or 0)
@@ -847,7 +1048,7 @@ def get_symbol_pnl(
                 else:
                     # Position dict had 0/missing (e.g. wrong row in hedge mode); get from Binance using non-zero position
                     try:
-                        current_lev = position_client.get_current_leverage(symbol)
+                        current_lev = await asyncio.to_thread(position_client.get_current_leverage, symbol)
                         if current_lev and current_lev >= 1:
                             display_leverage = current_lev
                         elif strategy_match:
@@ -921,11 +1122,12 @@ def get_symbol_pnl(
                     and hasattr(db_service, "db")
                 ):
                     try:
-                        db_strat = db_service.get_strategy(current_user.id, strategy_match.id)
+                        from sqlalchemy import select
+                        db_strat = await db_service.async_get_strategy(current_user.id, strategy_match.id)
                         if db_strat and db_strat.id:
                             entry_side = "BUY" if position_side == "LONG" else "SELL"
-                            first_entry = (
-                                db_service.db.query(Trade)
+                            result = await db_service.db.execute(
+                                select(Trade)
                                 .filter(
                                     Trade.strategy_id == db_strat.id,
                                     Trade.symbol == symbol,
@@ -935,8 +1137,9 @@ def get_symbol_pnl(
                                     Trade.position_instance_id == strategy_match.position_instance_id,
                                 )
                                 .order_by(Trade.timestamp.asc())
-                                .first()
+                                .limit(1)
                             )
+                            first_entry = result.scalars().first()
                             if first_entry and first_entry.timestamp:
                                 ts = first_entry.timestamp
                                 opened_at = ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
@@ -998,16 +1201,17 @@ def get_symbol_pnl(
 
 
 @router.get("/pnl/overview", response_model=List[SymbolPnL])
-def get_pnl_overview(
+@cached_report("pnl_overview", ("account_id", "start_date", "end_date"))
+async def get_pnl_overview(
     account_id: Optional[str] = Query(default=None, description="Filter by Binance account ID"),
     start_date: Optional[str] = Query(default=None, description="Filter from date (ISO format or YYYY-MM-DD)"),
     end_date: Optional[str] = Query(default=None, description="Filter until date (ISO format or YYYY-MM-DD)"),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_async),
     runner: StrategyRunner = Depends(get_strategy_runner),
     client: BinanceClient = Depends(get_binance_client),
     client_manager: BinanceClientManager = Depends(get_client_manager),
-    db_service: DatabaseService = Depends(get_database_service),
-    account_service: AccountService = Depends(get_account_service),
+    db_service: DatabaseService = Depends(get_database_service_async),
+    account_service: AccountService = Depends(get_account_service_async),
 ) -> List[SymbolPnL]:
     """Get PnL overview for all symbols with trades.
 
@@ -1018,7 +1222,8 @@ def get_pnl_overview(
     """
     from app.core.paper_binance_client import PaperBinanceClient
 
-    strategies = runner.list_strategies()
+    # The runner may read strategies and trades through its sync session: keep it off the event loop
+    strategies = await asyncio.to_thread(runner.list_strategies)
     symbols = set()
     symbol_to_account: dict[str, str] = {}
     symbol_account_pairs: set[tuple[str, str]] = set()
@@ -1026,7 +1231,7 @@ def get_pnl_overview(
     for strategy in strategies:
         if account_id and ((strategy.account_id or "default").strip().lower() != (account_id or "").strip().lower()):
             continue
-        trades = runner.get_trades(strategy.id)
+        trades = await asyncio.to_thread(runner.get_trades, strategy.id)
         if trades:
             symbols.add(strategy.symbol)
             acc = (strategy.account_id or "default").strip().lower()
@@ -1042,7 +1247,7 @@ def get_pnl_overview(
             | set(client_manager.list_accounts().keys())
         )
         try:
-            user_accounts = db_service.get_user_accounts(current_user.id)
+            user_accounts = await db_service.async_get_user_accounts(current_user.id)
             for a in user_accounts:
                 if a and getattr(a, "account_id", None):
                     aid = (a.account_id or "").strip().lower()
@@ -1058,7 +1263,7 @@ def get_pnl_overview(
         position_client = client_manager.get_client(acc_id) or (client if acc_id == "default" else None)
         if position_client is None:
             try:
-                config = account_service.get_account(current_user.id, acc_id)
+                config = await account_service.async_get_account(current_user.id, acc_id)
                 if config:
                     client_manager.add_client(acc_id, config)
                     position_client = client_manager.get_client(acc_id)
@@ -1068,10 +1273,10 @@ def get_pnl_overview(
             continue
         try:
             if isinstance(position_client, PaperBinanceClient):
-                all_binance_positions = position_client.futures_position_information()
+                all_binance_positions = await asyncio.to_thread(position_client.futures_position_information)
             else:
                 rest = position_client._ensure()
-                all_binance_positions = rest.futures_position_information()
+                all_binance_positions = await asyncio.to_thread(rest.futures_position_information)
             for pos in all_binance_positions or []:
                 position_amt = float(pos.get("positionAmt", 0))
                 if abs(position_amt) > 0:
@@ -1095,7 +1300,7 @@ def get_pnl_overview(
     pnl_by_symbol: dict[str, list[SymbolPnL]] = {}
     for (sym, acc_id) in sorted(symbol_account_pairs):
         try:
-            pnl = get_symbol_pnl(
+            pnl = await get_symbol_pnl(
                 sym,
                 account_id=acc_id,
                 start_date=start_date,
@@ -1158,14 +1363,38 @@ def get_pnl_overview(
 @router.get("/symbol/{symbol}/trades", response_model=List[TradeWithTimestamp])
 def get_symbol_trades(
     symbol: str,
+    response: Response,
     side: Optional[str] = Query(default=None, description="Filter by side (BUY/SELL)"),
     strategy_id: Optional[str] = Query(default=None, description="Filter by strategy ID"),
+    limit: Optional[int] = Query(default=None, ge=1, le=TRADES_PAGE_MAX_LIMIT, description="Page size; enables cursor pagination"),
+    cursor: Optional[str] = Query(default=None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
     current_user: User = Depends(get_current_user),
     runner: StrategyRunner = Depends(get_strategy_runner),
+    db_service: DatabaseService = Depends(get_database_service),
 ) -> List[TradeWithTimestamp]:
-    """Get all trades for a specific symbol."""
+    """Get all trades for a specific symbol.
+    
+    With ``limit`` (or ``cursor``) trades are read from the trades table one
+    page at a time, newest first; the next page's cursor is in the
+    X-Next-Cursor header (absent on the last page).
+    """
     symbol = symbol.upper()
     
+    if limit is not None or cursor is not None:
+        strategies = [
+            s for s in db_service.get_user_strategies(current_user.id)
+            if (s.symbol or "").upper() == symbol and (not strategy_id or s.strategy_id == strategy_id)
+        ]
+        try:
+            trades, next_cursor = _get_symbol_trades_page(
+                db_service, current_user.id, strategies, symbol, side, limit or TRADES_EXPORT_BATCH_SIZE, cursor,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return trades
+    
     # Get all strategies for this symbol
     strategies = runner.list_strategies()
     symbol_strategies = [s for s in strategies if s.symbol.upper() == symbol]
@@ -0,0 +1,316 @@
+"""
+Account snapshot store: wallet balance, margin and positions per account kept
+current from Futures User Data Stream ACCOUNT_UPDATE events.
+
+Risk checks (position sizing, margin status, portfolio limits) read balances
+from here in O(1) instead of calling ``futures_account`` over REST on every
+order. The stream manager seeds each snapshot with one REST call and resyncs it
+periodically, so a missed event or a reconnect gap heals itself. When no fresh
+snapshot exists (stream not running, paper client, tests) callers fall back to
+REST exactly as before.
+
+Notes on field accuracy:
+- ``wallet_balance`` and positions are updated by every ACCOUNT_UPDATE.
+- ``available_balance`` and ``total_maint_margin`` are not part of
+  ACCOUNT_UPDATE; they come from the last REST resync. Wallet deltas are applied
+  to ``available_balance`` and position changes trigger an early resync.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class PositionSnapshot:
+    """One open position (one side in hedge mode)."""
+    symbol: str
+    position_side: str  # LONG / SHORT / BOTH
+    position_amt: float
+    entry_price: float
+    unrealized_pnl: float
+    notional: float  # abs(position_amt) * price, USDT
+
+
+@dataclass(frozen=True)
+class AccountSnapshot:
+    """Point-in-time view of one futures account."""
+    account_id: str
+    wallet_balance: float  # USDT wallet balance
+    available_balance: float
+    total_maint_margin: float
+    positions: Dict[Tuple[str, str], PositionSnapshot] = field(default_factory=dict)
+    synced_at: float = 0.0  # monotonic time of last REST resync
+    updated_at: float = 0.0  # monotonic time of last change (REST or stream)
+
+    @property
+    def total_notional(self) -> float:
+        return sum(p.notional for p in self.positions.values())
+
+    @property
+    def total_unrealized_pnl(self) -> float:
+        return sum(p.unrealized_pnl for p in self.positions.values())
+
+
+def _to_float(value: Any, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _position_side(raw_side: Any, position_amt: float) -> str:
+    side = (raw_side or "BOTH").upper()
+    if side not in ("LONG", "SHORT", "BOTH"):
+        side = "BOTH"
+    # One-way mode: key by direction so it matches the rest of the codebase
+    if side == "BOTH" and position_amt != 0:
+        side = "LONG" if position_amt > 0 else "SHORT"
+    return side
+
+
+# (user id or None in single-user mode, lowercase account id)
+_StoreKey = Tuple[Optional[str], str]
+
+
+class AccountSnapshotStore:
+    """Thread-safe per-account snapshots, keyed by (user id, lowercase account id).
+
+    Account ids are only unique per user (every user may have a "default"
+    account), so every read and write is scoped by the owning user; ``user_id``
+    is None only in single-user mode. Snapshots are replaced (never mutated in place), so a reader always gets a
+    consistent object without holding the lock.
+    """
+
+    def __init__(self, max_age_seconds: float = 900.0):
+        """Initialize store.
+
+        Args:
+            max_age_seconds: A snapshot not resynced over REST for this long is
+                treated as missing (default: 15 minutes; resync runs every 5)
+        """
+        self.max_age_seconds = max_age_seconds
+        self._snapshots: Dict[_StoreKey, AccountSnapshot] = {}
+        # id(client) -> (client, key), so client-only callers (RiskManager) can find
+        # their account. The client is kept to rule out id() reuse after garbage collection.
+        self._client_accounts: Dict[int, Tuple[Any, _StoreKey]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(account_id: Optional[str]) -> str:
+        return (account_id or "default").strip().lower()
+
+    @classmethod
+    def _key(cls, account_id: Optional[str], user_id: Optional[UUID]) -> _StoreKey:
+        return (str(user_id) if user_id is not None else None, cls._normalize(account_id))
+
+    # Registration ------------------------------------------------------------
+
+    def register_client(self, account_id: str, client: Any, user_id: Optional[UUID] = None) -> None:
+        """Associate a client with a user's account (called when its stream starts)."""
+        with self._lock:
+            self._client_accounts[id(client)] = (client, self._key(account_id, user_id))
+
+    def unregister(self, account_id: str, user_id: Optional[UUID] = None) -> None:
+        """Forget an account's snapshot and client mapping (stream stopped)."""
+        key = self._key(account_id, user_id)
+        with self._lock:
+            self._snapshots.pop(key, None)
+            for client_key in [k for k, (_, acc) in self._client_accounts.items() if acc == key]:
+                del self._client_accounts[client_key]
+
+    def invalidate(self, account_id: str, user_id: Optional[UUID] = None) -> None:
+        """Drop the snapshot (callers fall back to REST until the next resync)."""
+        with self._lock:
+            self._snapshots.pop(self._key(account_id, user_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+            self._client_accounts.clear()
+
+    # Reads -------------------------------------------------------------------
+
+    def get(self, account_id: Optional[str], user_id: Optional[UUID] = None) -> Optional[AccountSnapshot]:
+        """Return the user's account snapshot, or None if missing or stale."""
+        return self._get_fresh(self._key(account_id, user_id))
+
+    def _get_fresh(self, key: _StoreKey) -> Optional[AccountSnapshot]:
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            return None
+        if time.monotonic() - snapshot.synced_at > self.max_age_seconds:
+            return None
+        return snapshot
+
+    def get_for_client(self, client: Any) -> Optional[AccountSnapshot]:
+        """Return the snapshot of the account a client was registered for."""
+        entry = self._client_accounts.get(id(client))
+        if entry is None or entry[0] is not client:
+            return None
+        return self._get_fresh(entry[1])
+
+    # Writes ------------------------------------------------------------------
+
+    def apply_rest_account(
+        self, account_id: str, account_info: Dict[str, Any], user_id: Optional[UUID] = None
+    ) -> AccountSnapshot:
+        """Replace the user's account snapshot from a REST ``/fapi/v2/account`` response."""
+        key = self._key(account_id, user_id)
+        account_id = key[1]
+        assets = account_info.get("assets") or []
+        usdt = next((a for a in assets if a.get("asset") == "USDT"), None)
+        if usdt is not None:
+            wallet_balance = _to_float(usdt.get("walletBalance"))
+        else:
+            wallet_balance = _to_float(account_info.get("totalWalletBalance"))
+
+        positions: Dict[Tuple[str, str], PositionSnapshot] = {}
+        for entry in account_info.get("positions") or []:
+            position_amt = _to_float(entry.get("positionAmt"))
+            if position_amt == 0:
+                continue
+            symbol = (entry.get("symbol") or "").strip().upper()
+            side = _position_side(entry.get("positionSide"), position_amt)
+            entry_price = _to_float(entry.get("entryPrice"))
+            notional = abs(_to_float(entry.get("notional"), abs(position_amt) * entry_price))
+            positions[(symbol, side)] = PositionSnapshot(
+                symbol=symbol,
+                position_side=side,
+                position_amt=position_amt,
+                entry_price=entry_price,
+                unrealized_pnl=_to_float(entry.get("unrealizedProfit")),
+                notional=notional,
+            )
+
+        now = time.monotonic()
+        snapshot = AccountSnapshot(
+            account_id=account_id,
+            wallet_balance=wallet_balance,
+            available_balance=_to_float(account_info.get("availableBalance"), wallet_balance),
+            total_maint_margin=_to_float(account_info.get("totalMaintMargin")),
+            positions=positions,
+            synced_at=now,
+            updated_at=now,
+        )
+        with self._lock:
+            self._snapshots[key] = snapshot
+        return snapshot
+
+    def apply_account_update(
+        self, account_id: str, update_data: Dict[str, Any], user_id: Optional[UUID] = None
+    ) -> bool:
+        """Apply the ``a`` object of an ACCOUNT_UPDATE event.
+
+        Args:
+            account_id: Account ID
+            update_data: ``payload["a"]`` with ``B`` (balances) and ``P`` (positions)
+            user_id: Owner of the account (None in single-user mode)
+
+        Returns:
+            True if positions changed (margin fields need a REST resync).
+            Events for an account without a seeded snapshot are ignored.
+        """
+        key = self._key(account_id, user_id)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                return False
+
+            wallet_balance = snapshot.wallet_balance
+            available_balance = snapshot.available_balance
+            for balance in update_data.get("B") or []:
+                if balance.get("a") != "USDT":
+                    continue
+                new_wallet = _to_float(balance.get("wb"), wallet_balance)
+                # Realized PnL / fees / funding move available margin by the same amount
+                available_balance += new_wallet - wallet_balance
+                wallet_balance = new_wallet
+
+            positions = dict(snapshot.positions)
+            positions_changed = False
+            for entry in update_data.get("P") or []:
+                symbol = (entry.get("s") or "").strip().upper()
+                if not symbol:
+                    continue
+                position_amt = _to_float(entry.get("pa"))
+                raw_side = (entry.get("ps") or "BOTH").upper()
+                if position_amt == 0:
+                    # Flat: drop every key this entry could have been stored under
+                    pos_keys = (
+                        [(symbol, "LONG"), (symbol, "SHORT"), (symbol, "BOTH")]
+                        if raw_side == "BOTH" else [(symbol, raw_side)]
+                    )
+                    for pos_key in pos_keys:
+                        if positions.pop(pos_key, None) is not None:
+                            positions_changed = True
+                    continue
+                side = _position_side(raw_side, position_amt)
+                entry_price = _to_float(entry.get("ep"))
+                previous = positions.get((symbol, side))
+                if previous is None or previous.position_amt != position_amt:
+                    positions_changed = True
+                if raw_side == "BOTH":
+                    # One-way mode flipped direction: remove the opposite key
+                    opposite = "SHORT" if side == "LONG" else "LONG"
+                    if positions.pop((symbol, opposite), None) is not None:
+                        positions_changed = True
+                positions[(symbol, side)] = PositionSnapshot(
+                    symbol=symbol,
+                    position_side=side,
+                    position_amt=position_amt,
+                    entry_price=entry_price,
+                    unrealized_pnl=_to_float(entry.get("up")),
+                    notional=abs(position_amt) * entry_price,
+                )
+
+            self._snapshots[key] = replace(
+                snapshot,
+                wallet_balance=wallet_balance,
+                available_balance=available_balance,
+                positions=positions,
+                updated_at=time.monotonic(),
+            )
+        return positions_changed
+
+
+_account_snapshot_store = AccountSnapshotStore()
+
+
+def get_account_snapshot_store() -> AccountSnapshotStore:
+    """Return the process-wide account snapshot store."""
+    return _account_snapshot_store
+
+
+def get_wallet_balance(client: Any) -> float:
+    """USDT wallet balance for a client: snapshot if fresh, REST otherwise.
+
+    Drop-in replacement for ``client.futures_account_balance()`` on hot paths.
+    """
+    snapshot = _account_snapshot_store.get_for_client(client)
+    if snapshot is not None:
+        return snapshot.wallet_balance
+    return client.futures_account_balance()
+
+
+def resync_account_snapshot(
+    account_id: str, client: Any, user_id: Optional[UUID] = None
+) -> Optional[AccountSnapshot]:
+    """Seed/refresh an account snapshot from REST (blocking; run in a thread)."""
+    fetch = getattr(client, "futures_account", None)
+    if fetch is None:
+        return None
+    try:
+        account_info = fetch()
+    except Exception as exc:
+        logger.warning(f"[AccountSnapshot] REST resync failed for {account_id}: {exc}")
+        return None
+    if not isinstance(account_info, dict):
+        return None
+    return _account_snapshot_store.apply_rest_account(account_id, account_info, user_id=user_id)
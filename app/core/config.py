@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 import os
 import re
 from pathlib import Path
@@ -57,6 +57,31 @@ class Settings(BaseSettings):
     default_leverage: int = Field(default=5, alias="DEFAULT_LEVERAGE")
     risk_per_trade: float = Field(default=0.01, alias="RISK_PER_TRADE")
     max_concurrent_strategies: int = Field(default=3, alias="MAX_CONCURRENT_STRATEGIES")
+    strategy_restore_concurrency: int = Field(
+        default=8,
+        alias="STRATEGY_RESTORE_CONCURRENCY",
+        description="Strategies started at the same time when running strategies are restored after a restart (default: 8)",
+    )
+    market_data_source: Literal["local", "redis"] = Field(
+        default="local",
+        alias="MARKET_DATA_SOURCE",
+        description="Where kline and mark price streams come from: 'local' opens Binance sockets in this process, 'redis' reads them from the market data service (python -m app.market_data_service) so workers share one set of exchange connections (default: local)",
+    )
+    strategy_leases_enabled: bool = Field(
+        default=False,
+        alias="STRATEGY_LEASES_ENABLED",
+        description="Run strategies only in the worker holding their Redis lease, so several worker processes can share the strategies and take over those of a dead worker (requires Redis; default: False)",
+    )
+    strategy_lease_ttl_seconds: int = Field(
+        default=30,
+        alias="STRATEGY_LEASE_TTL_SECONDS",
+        description="Seconds after which the strategies of a worker that stopped renewing its leases are taken over by another worker (default: 30)",
+    )
+    worker_id: Optional[str] = Field(
+        default=None,
+        alias="WORKER_ID",
+        description="Identifier of this worker process in strategy leases (default: None = hostname:pid)",
+    )
     max_concurrent_walk_forward_analyses: int = Field(
         default=5,
         alias="MAX_CONCURRENT_WALK_FORWARD_ANALYSES",
@@ -72,6 +97,76 @@ class Settings(BaseSettings):
         alias="WALK_FORWARD_TASK_CLEANUP_AGE_HOURS",
         description="Age in hours after which completed walk-forward tasks are cleaned up"
     )
+    walk_forward_window_workers: int = Field(
+        default=1,
+        alias="WALK_FORWARD_WINDOW_WORKERS",
+        description="Worker processes that optimize and train walk-forward windows in parallel (shared by all analyses); 1 processes windows one by one in the API process (default: 1)",
+    )
+    job_queue_enabled: bool = Field(
+        default=False,
+        alias="JOB_QUEUE_ENABLED",
+        description="Queue walk-forward and sensitivity analyses in Redis for job workers (python -m app.job_worker) instead of running them in the API process (requires Redis; default: False)",
+    )
+    job_worker_concurrency: int = Field(
+        default=2,
+        alias="JOB_WORKER_CONCURRENCY",
+        description="Jobs one job worker process runs at the same time (default: 2)",
+    )
+    job_max_attempts: int = Field(
+        default=3,
+        alias="JOB_MAX_ATTEMPTS",
+        description="Attempts per queued job before it fails; only transient errors and lost workers are retried (default: 3)",
+    )
+    job_lease_seconds: int = Field(
+        default=60,
+        alias="JOB_LEASE_SECONDS",
+        description="Seconds without a worker heartbeat after which a running job is retried on another worker (default: 60)",
+    )
+    job_max_pending_per_user: int = Field(
+        default=10,
+        alias="JOB_MAX_PENDING_PER_USER",
+        description="Queued or running jobs per user; further submissions are rejected with 429 (default: 10)",
+    )
+    backtest_cache_enabled: bool = Field(
+        default=True,
+        alias="BACKTEST_CACHE_ENABLED",
+        description="Memoize backtest results by request and kline data so identical runs are not re-simulated (default: True)",
+    )
+    backtest_cache_memory_mb: int = Field(
+        default=64,
+        alias="BACKTEST_CACHE_MEMORY_MB",
+        description="Size budget in MB of the in-process backtest result cache; least recently used results are evicted (default: 64)",
+    )
+    backtest_cache_redis_ttl_seconds: int = Field(
+        default=86400,
+        alias="BACKTEST_CACHE_REDIS_TTL_SECONDS",
+        description="TTL in seconds of backtest results shared through Redis when Redis is enabled; 0 disables the Redis tier (default: 86400)",
+    )
+    backtest_cache_dir: Optional[str] = Field(
+        default=None,
+        alias="BACKTEST_CACHE_DIR",
+        description="Directory for an on-disk backtest result cache (default: None = disabled)",
+    )
+    backtest_cache_disk_mb: int = Field(
+        default=512,
+        alias="BACKTEST_CACHE_DISK_MB",
+        description="Size budget in MB of the on-disk backtest result cache; least recently used files are removed (default: 512)",
+    )
+    report_cache_enabled: bool = Field(
+        default=True,
+        alias="REPORT_CACHE_ENABLED",
+        description="Cache report, strategy performance, dashboard and PnL overview responses per user until a trade, completed trade or strategy status of the user changes (default: True)",
+    )
+    report_cache_ttl_seconds: float = Field(
+        default=300.0,
+        alias="REPORT_CACHE_TTL_SECONDS",
+        description="TTL in seconds of cached report responses for date ranges that ended (default: 300)",
+    )
+    report_cache_live_ttl_seconds: float = Field(
+        default=10.0,
+        alias="REPORT_CACHE_LIVE_TTL_SECONDS",
+        description="TTL in seconds of cached report responses that include live prices and unrealized PnL (open-ended date ranges; default: 10)",
+    )
     dead_task_cleanup_interval_seconds: int = Field(
         default=60,
         alias="DEAD_TASK_CLEANUP_INTERVAL_SECONDS",
@@ -87,6 +182,16 @@ class Settings(BaseSettings):
         alias="USE_USER_DATA_STREAM_FOR_POSITION",
         description="Use Binance Futures User Data WebSocket for real-time position updates (default: True). If False, only REST and periodic refresh are used.",
     )
+    max_concurrent_order_executions: int = Field(
+        default=8,
+        alias="MAX_CONCURRENT_ORDER_EXECUTIONS",
+        description="Maximum strategy order executions running at the same time when one candle close triggers many strategies (default: 8)",
+    )
+    account_snapshot_resync_seconds: int = Field(
+        default=300,
+        alias="ACCOUNT_SNAPSHOT_RESYNC_SECONDS",
+        description="Interval in seconds for REST resync of the User Data Stream account snapshot (balance, margin, positions) used by risk checks (default: 300)",
+    )
     use_mark_price_stream: bool = Field(
         default=True,
         alias="USE_MARK_PRICE_STREAM",
@@ -95,6 +200,11 @@ class Settings(BaseSettings):
     api_port: int = Field(default=8000, alias="API_PORT")
     redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
     redis_enabled: bool = Field(default=True, alias="REDIS_ENABLED")
+    redis_value_codec: Literal["json", "zlib", "msgpack-zstd"] = Field(
+        default="zlib",
+        alias="REDIS_VALUE_CODEC",
+        description="Encoding of cached strategies, service caches and analysis results in Redis: 'json' (plain), 'zlib' (compressed JSON) or 'msgpack-zstd' (needs the msgpack and zstandard packages). Values are read whatever codec wrote them (default: zlib)",
+    )
     
     # WebSocket Configuration
     use_websocket_klines: bool = Field(
@@ -102,6 +212,11 @@ class Settings(BaseSettings):
         alias="USE_WEBSOCKET_KLINES",
         description="Enable WebSocket for klines fetching (default: True)"
     )
+    use_local_kline_aggregation: bool = Field(
+        default=True,
+        alias="USE_LOCAL_KLINE_AGGREGATION",
+        description="Build 3m/5m/15m/30m/1h/2h/4h candles locally from the 1m WebSocket stream instead of opening a stream per interval (default: True)",
+    )
     
     # PostgreSQL Database Configuration
     database_url: str = Field(
@@ -64,6 +64,19 @@ class StrategyAlreadyRunningError(BinanceBotException):
         self.strategy_id = strategy_id
 
 
+class StrategyOwnedByOtherWorkerError(StrategyAlreadyRunningError):
+    """Exception raised when another worker process holds the lease of a strategy."""
+    
+    def __init__(self, strategy_id: str, owner: str | None = None):
+        BinanceBotException.__init__(
+            self,
+            f"Strategy '{strategy_id}' is already running in another worker",
+            details={"strategy_id": strategy_id, "owner": owner},
+        )
+        self.strategy_id = strategy_id
+        self.owner = owner
+
+
 class StrategyNotRunningError(BinanceBotException):
     """Exception raised when trying to stop a strategy that is not running."""
     
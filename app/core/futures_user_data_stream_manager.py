@@ -1,13 +1,18 @@
 """
 Futures User Data Stream manager: one WebSocket per account, parses ACCOUNT_UPDATE
 and invokes on_position_update(account_id, symbol, position_data) for each position entry.
+
+ACCOUNT_UPDATE also keeps the account snapshot (app.core.account_snapshot) current;
+the snapshot is seeded over REST when a stream starts and resynced periodically.
 """
 
 import asyncio
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Set
+from uuid import UUID
 
 from loguru import logger
 
+from app.core.account_snapshot import get_account_snapshot_store, resync_account_snapshot
 from app.core.futures_user_data_connection import FuturesUserDataConnection
 
 PositionUpdateCallback = Callable[[str, str, Dict[str, Any]], Any]
@@ -52,11 +57,18 @@ class FuturesUserDataStreamManager:
         self,
         account_manager: Any,
         on_position_update: PositionUpdateCallback,
+        snapshot_resync_interval: float = 300.0,
+        user_id: Optional[UUID] = None,
     ):
         self._account_manager = account_manager
+        # Owner of the accounts; scopes their snapshots (account ids are unique per user only)
+        self._user_id = user_id
         self._on_position_update = on_position_update
+        self._snapshot_resync_interval = snapshot_resync_interval
         self._connections: Dict[str, FuturesUserDataConnection] = {}
         self._keepalive_tasks: Dict[str, asyncio.Task] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._resync_pending: Set[str] = set()
         self._listen_keys: Dict[str, str] = {}
         self._clients: Dict[str, Any] = {}
         self._lock = asyncio.Lock()
@@ -64,6 +76,11 @@ class FuturesUserDataStreamManager:
     async def _on_ws_message(self, account_id: str, event_type: str, payload: Dict[str, Any]) -> None:
         if event_type == "ACCOUNT_UPDATE":
             update_data = payload.get("a") or {}
+            if get_account_snapshot_store().apply_account_update(
+                account_id, update_data, user_id=self._user_id
+            ):
+                # Margin fields are not in the event; refresh them once positions change
+                self._schedule_snapshot_resync(account_id)
             positions = update_data.get("P") or []
             for entry in positions:
                 symbol = (entry.get("s") or "").strip()
@@ -94,6 +111,36 @@ class FuturesUserDataStreamManager:
                     )
         # ORDER_TRADE_UPDATE can be used optionally to trigger refresh; not required for position
 
+    async def _resync_snapshot(self, account_id: str, client: Any) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, resync_account_snapshot, account_id, client, self._user_id)
+
+    def _schedule_snapshot_resync(self, account_id: str) -> None:
+        """Resync the snapshot in the background; coalesces bursts of events."""
+        client = self._clients.get(account_id)
+        if client is None or account_id in self._resync_pending:
+            return
+        self._resync_pending.add(account_id)
+
+        async def _run() -> None:
+            try:
+                await self._resync_snapshot(account_id, client)
+            finally:
+                self._resync_pending.discard(account_id)
+
+        asyncio.create_task(_run())
+
+    async def _snapshot_resync_loop(self, account_id: str, client: Any) -> None:
+        """Seed the account snapshot, then resync it periodically over REST."""
+        while True:
+            if self._clients.get(account_id) is not client:
+                break
+            try:
+                await self._resync_snapshot(account_id, client)
+            except Exception as exc:
+                logger.warning(f"[UserDataStream] Snapshot resync failed for {account_id}: {exc}")
+            await asyncio.sleep(self._snapshot_resync_interval)
+
     async def _keepalive_loop(self, account_id: str, listen_key: str, client: Any) -> None:
         interval = 30 * 60  # 30 minutes
         while True:
@@ -169,6 +216,11 @@ class FuturesUserDataStreamManager:
             )
             self._keepalive_tasks[account_id] = keepalive_task
 
+            get_account_snapshot_store().register_client(account_id, client, user_id=self._user_id)
+            self._resync_tasks[account_id] = asyncio.create_task(
+                self._snapshot_resync_loop(account_id, client),
+            )
+
     async def _stop_stream_internal(self, account_id: str) -> None:
         if account_id in self._keepalive_tasks:
             self._keepalive_tasks[account_id].cancel()
@@ -177,6 +229,14 @@ class FuturesUserDataStreamManager:
             except asyncio.CancelledError:
                 pass
             del self._keepalive_tasks[account_id]
+        if account_id in self._resync_tasks:
+            self._resync_tasks[account_id].cancel()
+            try:
+                await self._resync_tasks[account_id]
+            except asyncio.CancelledError:
+                pass
+            del self._resync_tasks[account_id]
+        get_account_snapshot_store().unregister(account_id, user_id=self._user_id)
         if account_id in self._connections:
             await self._connections[account_id].disconnect()
             del self._connections[account_id]
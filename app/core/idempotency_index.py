@@ -0,0 +1,180 @@
+"""
+Idempotency Index - Bounded TTL/LRU index of recently issued order idempotency keys.
+
+Answers "was this order already sent?" in memory so order submission does not
+pay a database round trip. An optional Redis backing (one key per idempotency
+key, with expiry) makes the check safe across processes and restarts.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from typing import TYPE_CHECKING, Optional
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from app.core.redis_storage import RedisStorage
+
+
+class IdempotencyIndex(MutableMapping):
+    """Thread-safe mapping of ``idempotency_key -> (order_id, timestamp)``.
+
+    Entries expire after ``ttl_seconds`` and the oldest entries are evicted once
+    ``max_entries`` is reached, so memory stays bounded no matter how many
+    orders a process sends. Lookups and inserts are O(1); expiry is amortized
+    O(1) because entries are kept in insertion order.
+
+    The index is "cold" right after construction: keys issued by a previous
+    process are not known yet. Callers use :meth:`is_cold` to decide whether a
+    database fallback check is still needed. Redis backing keeps the index warm
+    across restarts.
+    """
+
+    REDIS_KEY_PREFIX = "binance_bot:idempotency"
+    # Redis value of a claimed key whose order is still being sent
+    PENDING_PREFIX = "pending:"
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 10_000,
+        warmup_seconds: float = 120.0,
+        redis_storage: Optional["RedisStorage"] = None,
+    ) -> None:
+        """Initialize idempotency index.
+
+        Args:
+            ttl_seconds: Seconds after which a key is forgotten (default: 1 hour)
+            max_entries: Maximum number of keys kept in memory (LRU eviction)
+            warmup_seconds: Seconds after start during which the index is
+                considered cold (keys use a 1-minute window, so two windows
+                cover any key a previous process could still collide with)
+            redis_storage: Optional Redis storage for multi-process safety
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.warmup_seconds = warmup_seconds
+        self.redis = redis_storage
+        self._entries: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._created_at = time.time()
+
+    def _redis_key(self, idempotency_key: str) -> str:
+        return f"{self.REDIS_KEY_PREFIX}:{idempotency_key}"
+
+    @property
+    def redis_enabled(self) -> bool:
+        return bool(self.redis and self.redis.enabled)
+
+    def is_cold(self) -> bool:
+        """Return True if keys issued before this index existed may be missing."""
+        if self.redis_enabled:
+            return False
+        return time.time() - self._created_at < self.warmup_seconds
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop expired entries from the oldest end (caller holds the lock)."""
+        while self._entries:
+            _, timestamp = next(iter(self._entries.values()))
+            if now - timestamp <= self.ttl_seconds:
+                break
+            self._entries.popitem(last=False)
+
+    # MutableMapping interface (in-memory only) -------------------------------
+
+    def __getitem__(self, key: str) -> tuple[int, float]:
+        now = time.time()
+        with self._lock:
+            order_id, timestamp = self._entries[key]
+            if now - timestamp > self.ttl_seconds:
+                del self._entries[key]
+                raise KeyError(key)
+            return order_id, timestamp
+
+    def __setitem__(self, key: str, value: tuple[int, float]) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._purge_expired(time.time())
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            self._purge_expired(time.time())
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge_expired(time.time())
+            return len(self._entries)
+
+    # Order helpers (memory + optional Redis) ---------------------------------
+
+    def lookup(self, idempotency_key: str) -> Optional[tuple[int, float]]:
+        """Return ``(order_id, timestamp)`` if the key was issued recently.
+
+        Checks memory first, then Redis (if enabled). A Redis hit is cached in
+        memory so repeated checks stay local.
+        """
+        try:
+            return self[idempotency_key]
+        except KeyError:
+            pass
+
+        if not self.redis_enabled:
+            return None
+
+        raw = self.redis.get(self._redis_key(idempotency_key))
+        if raw is None or str(raw).startswith(self.PENDING_PREFIX):
+            # Missing, or claimed by a worker that has not sent its order yet
+            return None
+        try:
+            order_id_str, _, timestamp_str = str(raw).partition(":")
+            entry = (int(order_id_str), float(timestamp_str) if timestamp_str else time.time())
+        except ValueError:
+            logger.debug(f"Ignoring malformed idempotency entry for {idempotency_key[:8]}...: {raw!r}")
+            return None
+        self[idempotency_key] = entry
+        return entry
+
+    def claim(self, idempotency_key: str) -> bool:
+        """Reserve ``idempotency_key`` before its order is sent.
+
+        With Redis the key is claimed with ``SET NX EX``, so of several workers
+        that all missed on :meth:`lookup` only one sends the order. Returns
+        False if another worker holds the key. Without Redis (or if Redis is
+        unreachable) the claim always succeeds and only the in-memory index
+        protects against duplicates.
+        """
+        if not self.redis_enabled:
+            return True
+        claimed = self.redis.set_if_absent(
+            self._redis_key(idempotency_key),
+            f"{self.PENDING_PREFIX}{time.time()}",
+            ex=int(self.ttl_seconds),
+        )
+        return claimed is not False
+
+    def release(self, idempotency_key: str) -> None:
+        """Give up a claim whose order was not sent, so the signal can be retried."""
+        if self.redis_enabled:
+            self.redis.delete(self._redis_key(idempotency_key))
+
+    def record(self, idempotency_key: str, order_id: int) -> None:
+        """Remember that ``order_id`` was issued for ``idempotency_key`` (overwrites a claim)."""
+        now = time.time()
+        self[idempotency_key] = (order_id, now)
+        if self.redis_enabled:
+            self.redis.set(
+                self._redis_key(idempotency_key),
+                f"{order_id}:{now}",
+                ex=int(self.ttl_seconds),
+            )
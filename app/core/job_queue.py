@@ -0,0 +1,349 @@
+"""
+Redis job queue for heavy analysis runs.
+
+With ``JOB_QUEUE_ENABLED`` the API enqueues walk-forward and sensitivity
+analyses instead of running them in its own event loop, and job worker
+processes (``python -m app.job_worker``) execute them. Workers can be added on
+any host that reaches Redis; the API and the trading loop never run an
+optimization.
+
+Keys (all under ``binance_bot:jobs``):
+
+- ``job:{id}``: hash with the job (kind, user, payload, status, attempts)
+- ``queue``: ready jobs, highest priority first, then oldest first
+- ``delayed``: jobs waiting for a retry, scored by the time they are due
+- ``running``: claimed jobs, scored by the deadline of their worker's heartbeat;
+  jobs whose deadline passed belong to a dead worker and are retried
+- ``user:{user_id}:running`` / ``user:{user_id}:active``: running count (the
+  per-user quota) and the user's queued or running job ids
+- ``cancel:{id}``: cancellation token checked by the running job
+
+Ownership changes use ZREM, which succeeds for exactly one caller, so two
+workers never run the same job.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional, Sequence
+
+from loguru import logger
+
+from app.core.redis_storage import RedisStorage
+
+JOB_KEY_PREFIX = "binance_bot:jobs"
+# Finished jobs (and their cancellation tokens) are kept this long for status queries
+JOB_TTL_SECONDS = 24 * 3600
+# Delay before each retry of a failed attempt
+RETRY_DELAYS_SECONDS = (30, 120, 600)
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Whether an error is likely to go away on retry (network, timeouts, rate limits, 5xx)."""
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError, OSError)):
+        return True
+    error_msg = str(getattr(error, "detail", None) or error).lower()
+    transient_keywords = [
+        "connection",
+        "timeout",
+        "network",
+        "temporary",
+        "retry",
+        "rate limit",
+        "too many requests",
+        "service unavailable",
+        "502",
+        "503",
+        "504"
+    ]
+    return any(keyword in error_msg for keyword in transient_keywords)
+
+
+@dataclass
+class Job:
+    """One queued unit of work."""
+    id: str
+    kind: str  # Selects the handler in the worker ("walk_forward", "sensitivity")
+    user_id: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    priority: int = 0  # Higher runs first
+    status: str = "queued"  # "queued", "running", "completed", "failed", "cancelled"
+    attempts: int = 0
+    max_attempts: int = 3
+    enqueued_at: float = 0.0
+    worker: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_hash(self) -> Dict[str, str]:
+        data = asdict(self)
+        data["payload"] = json.dumps(self.payload, default=str)
+        return {key: "" if value is None else str(value) for key, value in data.items()}
+
+    @classmethod
+    def from_hash(cls, data: Dict[str, str]) -> "Job":
+        return cls(
+            id=data["id"],
+            kind=data["kind"],
+            user_id=data["user_id"],
+            payload=json.loads(data.get("payload") or "{}"),
+            priority=int(data.get("priority") or 0),
+            status=data.get("status") or "queued",
+            attempts=int(data.get("attempts") or 0),
+            max_attempts=int(data.get("max_attempts") or 1),
+            enqueued_at=float(data.get("enqueued_at") or 0.0),
+            worker=data.get("worker") or None,
+            error=data.get("error") or None,
+        )
+
+    @property
+    def score(self) -> float:
+        """Queue order: priority first, then enqueue time (ms stays below 1e13 for centuries)."""
+        return -self.priority * 1e13 + self.enqueued_at * 1000
+
+
+class JobQueue:
+    """Persistent priority queue of jobs with per-user quotas, retries and cancellation."""
+
+    def __init__(
+        self,
+        redis_storage: RedisStorage,
+        user_quota: int = 2,
+        lease_seconds: int = 60,
+    ) -> None:
+        """Initialize job queue.
+
+        Args:
+            redis_storage: Redis storage shared by the API and the job workers
+            user_quota: Jobs of one user that may run at the same time (others wait in the queue)
+            lease_seconds: Seconds a claimed job survives without a heartbeat of its worker
+        """
+        self.redis = redis_storage
+        self.user_quota = max(1, user_quota)
+        self.lease_seconds = lease_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.redis and self.redis.enabled and self.redis._client)
+
+    @property
+    def _client(self):
+        return self.redis._client
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((JOB_KEY_PREFIX, *parts))
+
+    def enqueue(
+        self,
+        kind: str,
+        user_id: str,
+        payload: Dict[str, Any],
+        priority: int = 0,
+        max_attempts: int = 3,
+        job_id: Optional[str] = None,
+    ) -> Job:
+        """Add a job to the queue.
+
+        Args:
+            job_id: Fixed id (default: new uuid); while a job with this id is queued or
+                running, that job is returned instead of enqueuing a second one
+
+        Returns:
+            The enqueued (or already active) job
+        """
+        if job_id is not None:
+            existing = self.get(job_id)
+            if existing is not None and existing.status in ACTIVE_STATUSES:
+                return existing
+        job = Job(
+            id=job_id or str(uuid.uuid4()),
+            kind=kind,
+            user_id=str(user_id),
+            payload=payload,
+            priority=priority,
+            max_attempts=max(1, max_attempts),
+            enqueued_at=time.time(),
+        )
+        pipe = self._client.pipeline(transaction=True)
+        pipe.delete(self._key("job", job.id), self._key("cancel", job.id))
+        pipe.hset(self._key("job", job.id), mapping=job.to_hash())
+        pipe.sadd(self._key("user", job.user_id, "active"), job.id)
+        pipe.zadd(self._key("queue"), {job.id: job.score})
+        pipe.execute()
+        logger.info(f"Enqueued {kind} job {job.id} for user {job.user_id} (priority {priority})")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        data = self._client.hgetall(self._key("job", job_id))
+        return Job.from_hash(data) if data else None
+
+    def active_count(self, user_id: str) -> int:
+        """Queued and running jobs of a user."""
+        return int(self._client.scard(self._key("user", str(user_id), "active")))
+
+    def queued_count(self) -> int:
+        return int(self._client.zcard(self._key("queue")) + self._client.zcard(self._key("delayed")))
+
+    def running_count(self) -> int:
+        return int(self._client.zcard(self._key("running")))
+
+    def claim(self, worker_id: str, scan: int = 20) -> Optional[Job]:
+        """Take the first queued job whose user is below the quota.
+
+        Returns:
+            The job, now "running" and owned by ``worker_id``; None if nothing can run
+        """
+        for job_id in self._client.zrange(self._key("queue"), 0, scan - 1):
+            if not self._client.zrem(self._key("queue"), job_id):
+                continue  # Another worker took it
+            job = self.get(job_id)
+            if job is None or job.status != "queued":
+                continue  # Expired or cancelled meanwhile
+            running_key = self._key("user", job.user_id, "running")
+            if self._client.incr(running_key) > self.user_quota:
+                # User at quota: put the job back at its place and look further
+                self._client.decr(running_key)
+                self._client.zadd(self._key("queue"), {job.id: job.score})
+                continue
+            job.status = "running"
+            job.attempts += 1
+            job.worker = worker_id
+            pipe = self._client.pipeline(transaction=True)
+            pipe.hset(
+                self._key("job", job.id),
+                mapping={"status": job.status, "attempts": str(job.attempts), "worker": worker_id},
+            )
+            pipe.zadd(self._key("running"), {job.id: time.time() + self.lease_seconds})
+            pipe.execute()
+            return job
+        return None
+
+    def heartbeat(self, job_ids: Sequence[str]) -> None:
+        """Extend the claims of jobs this worker is running."""
+        if not job_ids:
+            return
+        deadline = time.time() + self.lease_seconds
+        self._client.zadd(self._key("running"), {job_id: deadline for job_id in job_ids}, xx=True)
+
+    def _release(self, job: Job, status: str, error: Optional[str] = None) -> bool:
+        """Finish a running job; False if this worker no longer owned it."""
+        if not self._client.zrem(self._key("running"), job.id):
+            return False
+        job.status, job.error = status, error
+        pipe = self._client.pipeline(transaction=True)
+        pipe.decr(self._key("user", job.user_id, "running"))
+        pipe.hset(self._key("job", job.id), mapping={"status": status, "error": error or ""})
+        if status not in ACTIVE_STATUSES:
+            pipe.srem(self._key("user", job.user_id, "active"), job.id)
+            pipe.expire(self._key("job", job.id), JOB_TTL_SECONDS)
+        pipe.execute()
+        return True
+
+    def complete(self, job: Job) -> None:
+        """Mark a running job completed (or cancelled if it was cancelled while running)."""
+        self._release(job, "cancelled" if self.is_cancelled(job.id) else "completed")
+
+    def fail(self, job: Job, error: str) -> bool:
+        """Record a failed attempt of a running job.
+
+        Returns:
+            True if the job will be retried, False if it failed for good
+        """
+        if self.is_cancelled(job.id):
+            self._release(job, "cancelled", error)
+            return False
+        if job.attempts < job.max_attempts:
+            if not self._release(job, "queued", error):
+                return False
+            delay = RETRY_DELAYS_SECONDS[min(job.attempts - 1, len(RETRY_DELAYS_SECONDS) - 1)]
+            self._client.zadd(self._key("delayed"), {job.id: time.time() + delay})
+            logger.warning(
+                f"Job {job.id} attempt {job.attempts}/{job.max_attempts} failed, retrying in {delay}s: {error}"
+            )
+            return True
+        self._release(job, "failed", error)
+        return False
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel a job: queued jobs never start, running jobs see ``is_cancelled``."""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        self._client.set(self._key("cancel", job_id), "1", ex=JOB_TTL_SECONDS)
+        if self._client.zrem(self._key("queue"), job_id) or self._client.zrem(self._key("delayed"), job_id):
+            job.status = "cancelled"
+            pipe = self._client.pipeline(transaction=True)
+            pipe.hset(self._key("job", job_id), "status", "cancelled")
+            pipe.srem(self._key("user", job.user_id, "active"), job_id)
+            pipe.expire(self._key("job", job_id), JOB_TTL_SECONDS)
+            pipe.execute()
+        return job
+
+    def is_cancelled(self, job_id: str) -> bool:
+        return bool(self._client.exists(self._key("cancel", job_id)))
+
+    def promote_delayed(self) -> int:
+        """Move retries that are due back into the queue."""
+        promoted = 0
+        for job_id in self._client.zrangebyscore(self._key("delayed"), "-inf", time.time()):
+            if not self._client.zrem(self._key("delayed"), job_id):
+                continue
+            job = self.get(job_id)
+            if job is not None:
+                self._client.zadd(self._key("queue"), {job_id: job.score})
+                promoted += 1
+        return promoted
+
+    def requeue_stale(self) -> list[Job]:
+        """Retry or fail the jobs of workers that stopped sending heartbeats.
+
+        Returns:
+            Jobs that failed for good (their attempts are used up)
+        """
+        failed = []
+        for job_id in self._client.zrangebyscore(self._key("running"), "-inf", time.time()):
+            job = self.get(job_id)
+            if job is None:
+                self._client.zrem(self._key("running"), job_id)
+                continue
+            logger.warning(f"Job {job_id} lost its worker {job.worker}")
+            if not self.fail(job, f"Worker {job.worker} stopped responding"):
+                if job.status == "failed":
+                    failed.append(job)
+        return failed
+
+
+_job_queue: Optional[JobQueue] = None
+_init_lock = threading.Lock()
+
+
+def get_job_queue() -> Optional[JobQueue]:
+    """Return the process-wide job queue (None when disabled in settings or Redis is unavailable)."""
+    global _job_queue
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    if not (settings.job_queue_enabled and settings.redis_enabled):
+        return None
+    if _job_queue is None:
+        with _init_lock:
+            if _job_queue is None:
+                _job_queue = JobQueue(
+                    RedisStorage(redis_url=settings.redis_url, enabled=True),
+                    user_quota=settings.max_walk_forward_analyses_per_user,
+                    lease_seconds=settings.job_lease_seconds,
+                )
+    return _job_queue if _job_queue.enabled else None
+
+
+def reset_job_queue() -> None:
+    """Drop the process-wide queue (tests, settings changes)."""
+    global _job_queue
+    with _init_lock:
+        _job_queue = None
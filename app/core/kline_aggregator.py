@@ -0,0 +1,183 @@
+"""
+Kline Aggregator - Builds higher-timeframe candles locally from the 1m stream.
+
+Binance futures candles up to 1d open on UTC epoch multiples of their length,
+so a 5m candle is exactly the five 1m candles whose open time falls in
+``[open, open + 5m)``. Aggregating the 1m stream therefore reproduces the
+exchange's higher-timeframe candles without extra WebSocket connections, and
+the higher-timeframe candle closes at the same instant as its last 1m candle.
+
+Klines use the Binance REST list format (as stored in KlineBuffer):
+[open_time, open, high, low, close, volume, close_time, quote_volume,
+ trades, taker_buy_base, taker_buy_quote, ignore]
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, List, Optional
+
+BASE_INTERVAL = "1m"
+BASE_INTERVAL_MS = 60_000
+
+# Intervals that can be derived from 1m candles with exact boundary alignment
+AGGREGATED_INTERVALS_MS: Dict[str, int] = {
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 60 * 60_000,
+    "2h": 2 * 60 * 60_000,
+    "4h": 4 * 60 * 60_000,
+}
+
+
+def bucket_open_time(open_time: int, interval_ms: int) -> int:
+    """Open time of the higher-timeframe candle containing ``open_time``."""
+    return open_time - (open_time % interval_ms)
+
+
+def merge_klines(klines: List[List], open_time: int, interval_ms: int) -> List:
+    """Merge consecutive 1m klines into one candle opening at ``open_time``."""
+    first, last = klines[0], klines[-1]
+    return [
+        open_time,
+        first[1],
+        str(max(float(k[2]) for k in klines)),
+        str(min(float(k[3]) for k in klines)),
+        last[4],
+        str(sum(float(k[5]) for k in klines)),
+        open_time + interval_ms - 1,
+        str(sum(float(k[7]) for k in klines)),
+        sum(int(k[8]) for k in klines),
+        str(sum(float(k[9]) for k in klines)),
+        str(sum(float(k[10]) for k in klines)),
+        "0",
+    ]
+
+
+class KlineAggregator:
+    """Higher-timeframe candles for one symbol/interval, fed with 1m klines.
+
+    Keeps closed higher-timeframe candles plus the 1m candles of the current
+    (forming) bucket. A gap in the 1m feed (e.g. a reconnect) marks the
+    aggregator ``stale`` so the owner can reseed it from REST instead of
+    serving a candle built from partial data.
+    """
+
+    def __init__(self, interval: str, max_size: int = 1000):
+        """Initialize aggregator.
+
+        Args:
+            interval: Target interval (must be in AGGREGATED_INTERVALS_MS)
+            max_size: Maximum number of closed candles to keep
+        """
+        if interval not in AGGREGATED_INTERVALS_MS:
+            raise ValueError(f"Interval {interval} cannot be aggregated from {BASE_INTERVAL}")
+        self.interval = interval
+        self.interval_ms = AGGREGATED_INTERVALS_MS[interval]
+        self._closed: deque = deque(maxlen=max_size)
+        self._bucket_open: Optional[int] = None
+        self._bucket_minutes: Dict[int, List] = {}  # open_time -> closed 1m kline
+        self._forming: Optional[List] = None  # still-forming 1m kline
+        self._last_closed_base: Optional[int] = None
+        self.stale = True  # until seeded
+
+    def seed(self, closed_candles: List[List], bucket_base_klines: List[List], now_ms: int) -> None:
+        """Seed from REST data.
+
+        Args:
+            closed_candles: Closed higher-timeframe candles (oldest first)
+            bucket_base_klines: 1m klines of the current bucket (oldest first;
+                a kline whose close time is in the future is treated as forming)
+            now_ms: Current time in milliseconds
+        """
+        self._closed.clear()
+        self._closed.extend(closed_candles)
+        self._bucket_minutes = {}
+        self._forming = None
+        self._bucket_open = None
+        self._last_closed_base = None
+        if closed_candles:
+            self._bucket_open = int(closed_candles[-1][0]) + self.interval_ms
+            self._last_closed_base = self._bucket_open - BASE_INTERVAL_MS
+        self.stale = False
+        for kline in bucket_base_klines:
+            self.add_base_kline(kline, is_closed=int(kline[6]) < now_ms)
+
+    def add_base_kline(self, kline: List, is_closed: bool) -> Optional[List]:
+        """Apply a 1m kline update.
+
+        Args:
+            kline: 1m kline (Binance list format)
+            is_closed: Whether the 1m candle is closed
+
+        Returns:
+            The higher-timeframe candle closed by this update, or None
+        """
+        if self.stale:
+            return None
+        open_time = int(kline[0])
+        bucket = bucket_open_time(open_time, self.interval_ms)
+
+        if self._bucket_open is None:
+            self._bucket_open = bucket
+        elif bucket < self._bucket_open:
+            return None  # older than the current bucket (already aggregated)
+        elif bucket > self._bucket_open:
+            # Moved past a bucket without seeing its last minute close: data is missing
+            self.stale = True
+            return None
+
+        if not is_closed:
+            self._forming = kline
+            return None
+
+        if self._last_closed_base is not None and open_time > self._last_closed_base + BASE_INTERVAL_MS:
+            self.stale = True
+            return None
+        self._bucket_minutes[open_time] = kline
+        if self._last_closed_base is None or open_time > self._last_closed_base:
+            self._last_closed_base = open_time
+        if self._forming is not None and int(self._forming[0]) == open_time:
+            self._forming = None
+
+        if open_time + BASE_INTERVAL_MS == self._bucket_open + self.interval_ms:
+            minutes = [self._bucket_minutes[t] for t in sorted(self._bucket_minutes)]
+            candle = merge_klines(minutes, self._bucket_open, self.interval_ms)
+            self._closed.append(candle)
+            self._bucket_open += self.interval_ms
+            self._bucket_minutes = {}
+            return candle
+        return None
+
+    def current_candle(self) -> Optional[List]:
+        """The forming higher-timeframe candle (closed minutes + forming minute)."""
+        if self._bucket_open is None:
+            return None
+        minutes = [self._bucket_minutes[t] for t in sorted(self._bucket_minutes)]
+        if self._forming is not None and bucket_open_time(int(self._forming[0]), self.interval_ms) == self._bucket_open:
+            minutes.append(self._forming)
+        if not minutes:
+            if self._closed and int(self._closed[-1][0]) + self.interval_ms == self._bucket_open:
+                # Bucket just opened (no trade seen yet): flat candle at the last close, as REST would
+                # return, so callers that drop the forming candle still see the one that just closed
+                last_close = self._closed[-1][4]
+                return [
+                    self._bucket_open, last_close, last_close, last_close, last_close, "0",
+                    self._bucket_open + self.interval_ms - 1, "0", 0, "0", "0", "0",
+                ]
+            return None
+        return merge_klines(minutes, self._bucket_open, self.interval_ms)
+
+    def get_klines(self, limit: int = 100) -> List[List]:
+        """Last ``limit`` candles, the last one forming (same shape as Binance REST)."""
+        current = self.current_candle()
+        if current is None:
+            closed = list(self._closed)[-limit:] if limit > 0 else []
+            return closed
+        closed = list(self._closed)[-(limit - 1):] if limit > 1 else []
+        return closed + [current]
+
+    def size(self) -> int:
+        return len(self._closed) + (1 if self.current_candle() is not None else 0)
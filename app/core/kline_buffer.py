@@ -89,7 +89,8 @@ class KlineBuffer:
                 return None
             return list(self._buffer)[-1]
     
-    def _convert_to_binance_format(self, kline_data: Dict) -> List:
+    @staticmethod
+    def _convert_to_binance_format(kline_data: Dict) -> List:
         """Convert WebSocket kline format to Binance REST API format.
         
         Args:
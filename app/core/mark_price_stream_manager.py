@@ -17,6 +17,7 @@ from loguru import logger
 from app.core.funding_from_mark import parse_funding_from_payload
 from app.core.funding_market_cache import get_funding_interval_hours
 from app.core.mark_price_connection import MarkPriceConnection
+from app.core.market_data_bus import RedisMarkPriceConnection
 from app.core.position_broadcast import PositionBroadcastService
 from app.strategies.pnl_giveback import update_peak_unrealized
 
@@ -40,9 +41,12 @@ class MarkPriceStreamManager:
         self,
         broadcast_service: PositionBroadcastService,
         testnet: bool = True,
+        use_market_data_bus: bool = False,
     ) -> None:
         self._broadcast = broadcast_service
         self._testnet = testnet
+        # Read mark prices from the market data service through Redis instead of Binance sockets
+        self._use_market_data_bus = use_market_data_bus
         self._connections: Dict[str, MarkPriceConnection] = {}
         self._subscription_counts: Dict[str, int] = {}
         self._registry: Dict[str, List[Dict[str, Any]]] = {}  # symbol -> list of position dicts (max_unrealized_pnl updated each tick)
@@ -242,7 +246,8 @@ class MarkPriceStreamManager:
             self._subscription_counts[key] = 1
             handler = self._on_mark_price_factory(key)
             self._mark_handlers[key] = handler
-            conn = MarkPriceConnection(
+            connection_class = RedisMarkPriceConnection if self._use_market_data_bus else MarkPriceConnection
+            conn = connection_class(
                 symbol=key,
                 testnet=self._testnet,
                 on_mark_price=handler,
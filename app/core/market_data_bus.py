@@ -0,0 +1,315 @@
+"""
+Market data bus: exchange streams shared between processes through Redis Streams.
+
+Without it every process that trades opens its own Binance kline and mark
+price sockets. With ``MARKET_DATA_SOURCE=redis`` the market data service
+(``python -m app.market_data_service``) owns the exchange sockets and appends
+every message to one Redis stream per exchange stream. Other processes read
+those streams through ``RedisStreamConnection`` and
+``RedisMarkPriceConnection``, drop-in replacements of ``WebSocketConnection``
+and ``MarkPriceConnection``, so kline buffers, candle events, local
+aggregation and REST seeding work unchanged. Adding workers adds Redis
+readers, not exchange connections.
+
+Every entry carries the publisher's ``epoch`` (start time in ms) and a
+per-stream ``seq``. A reader that sees a seq jump or a new epoch has missed
+messages (stream trimmed while it lagged, publisher restarted) and reports a
+gap, on which the kline manager reseeds its buffer from REST.
+
+Readers announce the streams they need in a sorted set scored by expiry time
+and refresh it while subscribed; the service opens streams with live demand
+and closes the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+DEMAND_KEY = "binance_bot:md:demand"
+# Entries kept per stream: minutes of kline updates, far more than a reader lags
+STREAM_MAXLEN = 2000
+DEMAND_TTL_SECONDS = 60
+
+MessageHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+GapHandler = Callable[[], Awaitable[None]]
+
+
+def _network(testnet: bool) -> str:
+    return "testnet" if testnet else "mainnet"
+
+
+def kline_stream_key(symbol: str, interval: str, testnet: bool) -> str:
+    """Redis stream of the Binance kline stream of ``symbol``/``interval``."""
+    return f"binance_bot:md:{_network(testnet)}:kline:{symbol.upper()}:{interval}"
+
+
+def mark_price_stream_key(symbol: str, testnet: bool) -> str:
+    """Redis stream of the Binance mark price stream of ``symbol``."""
+    return f"binance_bot:md:{_network(testnet)}:mark:{symbol.upper()}"
+
+
+def parse_stream_key(stream_key: str) -> Tuple[str, str, Optional[str], bool]:
+    """(kind, symbol, interval or None, testnet) of a market data stream key."""
+    parts = stream_key.split(":")
+    if len(parts) < 5 or parts[:2] != ["binance_bot", "md"] or parts[3] not in ("kline", "mark"):
+        raise ValueError(f"Not a market data stream key: {stream_key!r}")
+    testnet = parts[2] == "testnet"
+    if parts[3] == "kline":
+        return "kline", parts[4], parts[5], testnet
+    return "mark", parts[4], None, testnet
+
+
+def encode_entry(epoch: int, seq: int, message: Dict[str, Any]) -> Dict[str, str]:
+    """Stream entry fields for one exchange message."""
+    return {"epoch": str(epoch), "seq": str(seq), "data": json.dumps(message, separators=(",", ":"))}
+
+
+class SequenceTracker:
+    """Detects missed entries of one stream from (epoch, seq)."""
+
+    def __init__(self) -> None:
+        self.epoch: Optional[int] = None
+        self.seq: Optional[int] = None
+
+    def advance(self, epoch: int, seq: int) -> bool:
+        """Record an entry; True if entries were missed before it."""
+        gap = self.epoch is not None and (epoch != self.epoch or seq != self.seq + 1)
+        self.epoch, self.seq = epoch, seq
+        return gap
+
+
+class MarketDataBusReader:
+    """Reads all market data streams a process subscribed to with one blocking XREAD."""
+
+    def __init__(self, redis_url: str, block_ms: int = 1000) -> None:
+        self.redis_url = redis_url
+        self.block_ms = block_ms
+        self._client = None
+        self._subscribers: Dict[str, list[Tuple[MessageHandler, Optional[GapHandler]]]] = {}
+        self._last_ids: Dict[str, str] = {}
+        self._trackers: Dict[str, SequenceTracker] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self.connected = False
+
+    async def _redis(self):
+        if self._client is None:
+            import redis.asyncio as aioredis
+            self._client = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._client
+
+    async def register(self, stream_key: str, handler: MessageHandler, on_gap: Optional[GapHandler] = None) -> None:
+        """Deliver new entries of ``stream_key`` to ``handler`` and request the stream from the service."""
+        subscribers = self._subscribers.setdefault(stream_key, [])
+        subscribers.append((handler, on_gap))
+        if len(subscribers) == 1:
+            # Only messages published from now on; history comes from REST seeding
+            self._last_ids[stream_key] = await self._latest_id(stream_key)
+            self._trackers[stream_key] = SequenceTracker()
+            await self._announce([stream_key])
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+
+    async def unregister(self, stream_key: str, handler: MessageHandler) -> None:
+        """Stop delivering ``stream_key`` to ``handler`` (the service closes it once demand expires)."""
+        subscribers = [s for s in self._subscribers.get(stream_key, []) if s[0] is not handler]
+        if subscribers:
+            self._subscribers[stream_key] = subscribers
+            return
+        self._subscribers.pop(stream_key, None)
+        self._last_ids.pop(stream_key, None)
+        self._trackers.pop(stream_key, None)
+        self._wakeup.set()
+
+    async def _latest_id(self, stream_key: str) -> str:
+        # A concrete id rather than "$", so nothing published between two XREADs is skipped
+        try:
+            client = await self._redis()
+            entries = await client.xrevrange(stream_key, count=1)
+        except Exception as exc:
+            logger.warning(f"[MarketDataBus] Failed to read position of {stream_key}: {exc}")
+            return "$"
+        return entries[0][0] if entries else "0-0"
+
+    async def _announce(self, stream_keys: list[str]) -> None:
+        if not stream_keys:
+            return
+        try:
+            client = await self._redis()
+            expires_at = time.time() + DEMAND_TTL_SECONDS
+            await client.zadd(DEMAND_KEY, {key: expires_at for key in stream_keys})
+        except Exception as exc:
+            logger.warning(f"[MarketDataBus] Failed to announce {len(stream_keys)} stream(s): {exc}")
+
+    async def _dispatch(self, stream_key: str, fields: Dict[str, str]) -> None:
+        subscribers = list(self._subscribers.get(stream_key, []))
+        tracker = self._trackers.get(stream_key)
+        if tracker and tracker.advance(int(fields.get("epoch", 0)), int(fields.get("seq", 0))):
+            logger.warning(f"[MarketDataBus] Gap in {stream_key} (missed entries); resyncing")
+            for _, on_gap in subscribers:
+                if on_gap:
+                    try:
+                        await on_gap()
+                    except Exception as exc:
+                        logger.warning(f"[MarketDataBus] Gap handler for {stream_key} failed: {exc}")
+        message = json.loads(fields["data"])
+        for handler, _ in subscribers:
+            try:
+                await handler(message)
+            except Exception as exc:
+                logger.warning(f"[MarketDataBus] Handler for {stream_key} failed: {exc}")
+
+    async def _run(self) -> None:
+        last_announce = time.monotonic()
+        while self._subscribers:
+            try:
+                client = await self._redis()
+                if time.monotonic() - last_announce > DEMAND_TTL_SECONDS / 3:
+                    await self._announce(list(self._subscribers))
+                    last_announce = time.monotonic()
+                self._wakeup.clear()
+                response = await client.xread(dict(self._last_ids), count=500, block=self.block_ms)
+                self.connected = True
+                for stream_key, entries in response or []:
+                    for entry_id, fields in entries:
+                        if stream_key not in self._last_ids:
+                            break
+                        self._last_ids[stream_key] = entry_id
+                        await self._dispatch(stream_key, fields)
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                self.connected = False
+                logger.warning(f"[MarketDataBus] Read failed: {exc}; retrying")
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=2.0)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def close(self) -> None:
+        """Stop reading and close the Redis connection."""
+        self._subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_reader: Optional[MarketDataBusReader] = None
+
+
+def get_market_data_reader() -> MarketDataBusReader:
+    """Process-wide reader of the market data bus."""
+    global _reader
+    if _reader is None:
+        from app.core.config import get_settings
+        _reader = MarketDataBusReader(get_settings().redis_url)
+    return _reader
+
+
+async def close_market_data_reader() -> None:
+    """Close the process-wide reader if one was created."""
+    global _reader
+    if _reader is not None:
+        await _reader.close()
+        _reader = None
+
+
+class RedisStreamConnection:
+    """Kline stream read from the market data bus (same interface as ``WebSocketConnection``)."""
+
+    def __init__(
+        self,
+        symbol: str,
+        interval: str,
+        testnet: bool = True,
+        on_kline_update: Optional[Callable[[Dict], Awaitable[None]]] = None,
+        on_gap: Optional[GapHandler] = None,
+        reader: Optional[MarketDataBusReader] = None,
+    ):
+        self.symbol = symbol.upper()
+        self.interval = interval
+        self.testnet = testnet
+        self.on_kline_update = on_kline_update
+        self.on_gap = on_gap
+        self.url = kline_stream_key(symbol, interval, testnet)
+        self._reader = reader
+        self._running = False
+        self._connected_at_least_once = False
+
+    async def connect(self) -> None:
+        """Start receiving the stream."""
+        if self._running:
+            return
+        self._running = True
+        self._reader = self._reader or get_market_data_reader()
+        await self._reader.register(self.url, self._handle_message, self.on_gap)
+        self._connected_at_least_once = True
+        logger.info(f"Market data bus stream started: {self.symbol} {self.interval}")
+
+    async def disconnect(self) -> None:
+        """Stop receiving the stream."""
+        if not self._running:
+            return
+        self._running = False
+        await self._reader.unregister(self.url, self._handle_message)
+
+    async def _handle_message(self, data: Dict) -> None:
+        # Same contract as WebSocketConnection: only closed candles are forwarded
+        if data.get("e") != "kline" or not data.get("k", {}).get("x", False):
+            return
+        if self.on_kline_update:
+            await self.on_kline_update(data)
+
+    def is_connected(self) -> bool:
+        return self._running and self._reader is not None and self._reader.connected
+
+    async def wait_until_connected(self, timeout: float = 10.0) -> bool:
+        return self._running
+
+
+class RedisMarkPriceConnection:
+    """Mark price stream read from the market data bus (same interface as ``MarkPriceConnection``)."""
+
+    def __init__(
+        self,
+        symbol: str,
+        testnet: bool = True,
+        on_mark_price: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+        reader: Optional[MarketDataBusReader] = None,
+    ):
+        self.symbol = symbol.upper()
+        self.testnet = testnet
+        self.on_mark_price = on_mark_price
+        self.url = mark_price_stream_key(symbol, testnet)
+        self._reader = reader
+        self._running = False
+
+    async def connect(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._reader = self._reader or get_market_data_reader()
+        await self._reader.register(self.url, self._handle_message)
+
+    async def disconnect(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        await self._reader.unregister(self.url, self._handle_message)
+
+    async def _handle_message(self, payload: Dict[str, Any]) -> None:
+        if self.on_mark_price:
+            await self.on_mark_price(self.symbol, payload)
@@ -622,6 +622,31 @@ class BinanceClient:
             # Re-raise ValueError as-is (USDT not found)
             raise
 
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=8))
+    def futures_account(self) -> Dict[str, Any]:
+        """Get full futures account information (balances, margin, positions).
+        
+        Used to seed/resync the account snapshot; prefer the snapshot on hot paths.
+        
+        Raises:
+            BinanceAPIError: If API call fails
+        """
+        rest = self._ensure()
+        try:
+            return rest.futures_account()
+        except ClientError as exc:
+            error_code = getattr(exc, 'code', None)
+            status_code = getattr(exc, 'status_code', None)
+            error_msg = f"Failed to get futures account: {exc}"
+            if status_code == 429:
+                raise BinanceRateLimitError(error_msg, retry_after=10) from exc
+            elif status_code == 401:
+                raise BinanceAuthenticationError(error_msg, error_code=error_code) from exc
+            else:
+                raise BinanceAPIError(error_msg, status_code=status_code, error_code=error_code) from exc
+        except (ConnectionError, TimeoutError, OSError) as exc:
+            raise BinanceNetworkError(f"Network error getting futures account: {exc}") from exc
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=8))
     def get_order_status(self, symbol: str, order_id: int) -> Dict[str, Any]:
         """Get current status of an order from Binance.
@@ -0,0 +1,46 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor encodes the sort key ``(timestamp, id)`` of the last row of a page.
+The next page selects rows strictly after that key in ``(timestamp DESC,
+id DESC)`` order, so every page is a single index range scan of ``limit``
+rows, however deep into the listing it is (unlike OFFSET, or loading
+everything and slicing). The id breaks ties between rows with equal
+timestamps.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+from sqlalchemy import tuple_
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """Encode the sort key of the last row of a page."""
+    payload = json.dumps([timestamp.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor from ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, row_id = json.loads(payload)
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+
+
+def after_cursor(timestamp_column, id_column, cursor: str):
+    """SQL condition selecting rows after the cursor in ``(timestamp DESC, id DESC)`` order."""
+    timestamp, row_id = decode_cursor(cursor)
+    return tuple_(timestamp_column, id_column) < tuple_(timestamp, row_id)
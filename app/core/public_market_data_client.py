@@ -166,6 +166,15 @@ class PublicMarketDataClient:
             raise BinanceAPIError(f"Invalid price returned for {symbol}: {price}")
         return price
     
+    def get_all_prices(self) -> Dict[str, float]:
+        """Get current prices for all symbols in one request.
+
+        Returns:
+            Mapping of symbol to current price
+        """
+        data = self._fetch_public_data("ticker/price", {})
+        return {item["symbol"]: float(item["price"]) for item in data}
+
     def get_exchange_info(self) -> Dict:
         """Get exchange information (cached).
         
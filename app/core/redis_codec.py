@@ -0,0 +1,130 @@
+"""Encoding of structured values stored in Redis.
+
+Encoded values start with a header (magic bytes, format version, codec id),
+so a reader can tell which codec wrote a value. A value without the header
+is plain JSON, which is how everything was written before this module
+existed, so existing keys keep working. Those keys switch to the configured
+codec the next time they are written.
+
+Codecs:
+- ``json``: plain JSON with no header. Older processes can still read it.
+- ``zlib``: JSON compressed with zlib (standard library only).
+- ``msgpack-zstd``: msgpack compressed with zstd. Needs the optional
+  ``msgpack`` and ``zstandard`` packages.
+"""
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any, Dict, Optional, Union
+
+from loguru import logger
+
+try:
+    import msgpack
+    import zstandard
+    MSGPACK_ZSTD_AVAILABLE = True
+except ImportError:
+    MSGPACK_ZSTD_AVAILABLE = False
+
+# 0xB7 can never start UTF-8 (JSON) text, so headed values and legacy JSON cannot be confused
+MAGIC = b"\xb7BB"
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 2
+
+
+class RedisCodec:
+    """Encodes values to bytes and back."""
+
+    name = ""
+    codec_id = 0
+
+    def encode(self, data: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, payload: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(RedisCodec):
+    name = "json"
+    codec_id = 0
+
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(data, default=str, separators=(",", ":")).encode()
+
+    def decode(self, payload: bytes) -> Any:
+        return json.loads(payload)
+
+
+class ZlibJsonCodec(JsonCodec):
+    name = "zlib"
+    codec_id = 1
+
+    def encode(self, data: Any) -> bytes:
+        return zlib.compress(super().encode(data), 6)
+
+    def decode(self, payload: bytes) -> Any:
+        return super().decode(zlib.decompress(payload))
+
+
+class MsgpackZstdCodec(RedisCodec):
+    name = "msgpack-zstd"
+    codec_id = 2
+
+    def __init__(self, level: int = 3):
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def encode(self, data: Any) -> bytes:
+        return self._compressor.compress(msgpack.packb(data, default=str, use_bin_type=True))
+
+    def decode(self, payload: bytes) -> Any:
+        return msgpack.unpackb(self._decompressor.decompress(payload), raw=False, strict_map_key=False)
+
+
+_CODECS: Dict[str, RedisCodec] = {codec.name: codec for codec in (JsonCodec(), ZlibJsonCodec())}
+if MSGPACK_ZSTD_AVAILABLE:
+    _CODECS[MsgpackZstdCodec.name] = MsgpackZstdCodec()
+_CODECS_BY_ID: Dict[int, RedisCodec] = {codec.codec_id: codec for codec in _CODECS.values()}
+
+
+def get_codec(name: Optional[str] = None) -> RedisCodec:
+    """Codec by name (default: the REDIS_VALUE_CODEC setting).
+
+    ``msgpack-zstd`` falls back to ``zlib`` when its packages are not installed.
+    """
+    if name is None:
+        from app.core.config import get_settings
+        name = get_settings().redis_value_codec
+    if name == MsgpackZstdCodec.name and not MSGPACK_ZSTD_AVAILABLE:
+        logger.warning("msgpack/zstandard not installed; Redis values use the zlib codec. Install with: pip install msgpack zstandard")
+        name = ZlibJsonCodec.name
+    try:
+        return _CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown Redis value codec {name!r}; expected one of {sorted(_CODECS)}") from None
+
+
+def encode_value(data: Any, codec: RedisCodec) -> bytes:
+    """Encode ``data`` with ``codec`` (plain JSON for the json codec, headed bytes otherwise)."""
+    if codec.codec_id == JsonCodec.codec_id:
+        return codec.encode(data)
+    return MAGIC + bytes((FORMAT_VERSION, codec.codec_id)) + codec.encode(data)
+
+
+def decode_value(raw: Union[bytes, str, None]) -> Any:
+    """Decode a value written by ``encode_value`` or as plain JSON (None stays None)."""
+    if raw is None:
+        return None
+    if isinstance(raw, str):
+        return json.loads(raw)
+    if not raw.startswith(MAGIC):
+        return json.loads(raw)
+    version, codec_id = raw[len(MAGIC)], raw[len(MAGIC) + 1]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported Redis value format version {version}")
+    codec = _CODECS_BY_ID.get(codec_id)
+    if codec is None:
+        raise ValueError(f"Redis value written with codec id {codec_id}, which is not available here")
+    return codec.decode(raw[HEADER_SIZE:])
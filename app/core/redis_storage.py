@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
-from typing import Optional
+from typing import Iterable, Optional
 
 from loguru import logger
 
+from app.core.redis_codec import decode_value, encode_value, get_codec
+
 try:
     import redis
     REDIS_AVAILABLE = True
@@ -13,13 +15,46 @@ except ImportError:
     # Only log warning if Redis is actually enabled in config
     # This prevents false warnings during module import
 
+# Set of all strategy ids saved in Redis, so listing them never scans the keyspace
+STRATEGY_INDEX_KEY = "binance_bot:strategy_ids"
+# Keys per MGET round trip
+MGET_BATCH_SIZE = 500
+# Trades kept per strategy in its Redis list (older ones stay in the database)
+TRADES_MAX_LEN = 5000
+
+
+def _batches(items: list, size: int = MGET_BATCH_SIZE) -> Iterable[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 
 class RedisStorage:
-    """Redis storage for strategies and trades persistence."""
+    """Redis storage for strategies and trades persistence.
     
-    def __init__(self, redis_url: str = "redis://localhost:6379/0", enabled: bool = True):
+    ``_client`` is the synchronous client used by sync code paths;
+    ``async_client`` is a pooled asyncio client for code running on the event
+    loop, so Redis round trips there do not block it.
+    
+    Structured values (strategies, service caches, analysis results) go through
+    ``get_value``/``set_value``, which encode them with ``codec`` (see
+    app.core.redis_codec) on clients that return bytes.
+    """
+    
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        enabled: bool = True,
+        max_connections: int = 50,
+        codec: Optional[str] = None,
+    ):
         self.enabled = enabled and REDIS_AVAILABLE
+        self.redis_url = redis_url
+        self.max_connections = max_connections
+        self.codec = get_codec(codec)
         self._client: Optional[redis.Redis] = None
+        self._binary_client: Optional[redis.Redis] = None
+        self._async_client = None
+        self._async_binary_client = None
         
         if enabled and not REDIS_AVAILABLE:
             # Only log warning if Redis was requested but package is not available
@@ -30,11 +65,13 @@ class RedisStorage:
                 self._client = redis.from_url(redis_url, decode_responses=True)
                 # Test connection
                 self._client.ping()
+                self._binary_client = redis.from_url(redis_url)
                 logger.info(f"Connected to Redis at {redis_url}")
             except Exception as exc:
                 logger.warning(f"Failed to connect to Redis: {exc}. Falling back to in-memory only.")
                 self.enabled = False
                 self._client = None
+                self._binary_client = None
         elif enabled:
             # Redis was enabled but is not available
             logger.info("Redis storage is disabled (package not installed)")
@@ -45,6 +82,126 @@ class RedisStorage:
         """Generate Redis key for a strategy."""
         return f"binance_bot:{prefix}:{strategy_id}"
     
+    def _make_async_client(self, decode_responses: bool):
+        import redis.asyncio as aioredis
+        pool = aioredis.BlockingConnectionPool.from_url(
+            self.redis_url,
+            max_connections=self.max_connections,
+            timeout=5,
+            decode_responses=decode_responses,
+        )
+        return aioredis.Redis(connection_pool=pool)
+    
+    @property
+    def async_client(self):
+        """Pooled asyncio client (None when Redis is disabled).
+        
+        Connections are created on first use, at most ``max_connections`` of them;
+        callers wait for a free connection instead of opening more.
+        """
+        if not self.enabled or not self._client:
+            return None
+        if self._async_client is None:
+            self._async_client = self._make_async_client(decode_responses=True)
+        return self._async_client
+    
+    @property
+    def async_binary_client(self):
+        """Pooled asyncio client returning bytes, for codec-encoded values."""
+        if not self.enabled or not self._client:
+            return None
+        if self._async_binary_client is None:
+            self._async_binary_client = self._make_async_client(decode_responses=False)
+        return self._async_binary_client
+    
+    async def aclose(self) -> None:
+        """Close the pooled asyncio clients."""
+        for client in (self._async_client, self._async_binary_client):
+            if client is not None:
+                await client.aclose()
+        self._async_client = None
+        self._async_binary_client = None
+    
+    def get_value(self, key: str):
+        """Decoded value of ``key`` (None if missing or unreadable)."""
+        if not self.enabled or not self._binary_client:
+            return None
+        try:
+            return decode_value(self._binary_client.get(key))
+        except Exception as exc:
+            logger.debug(f"Redis get {key!r} failed: {exc}")
+            return None
+    
+    def set_value(self, key: str, data, ex: Optional[int] = None) -> bool:
+        """Encode ``data`` with ``self.codec`` and store it under ``key``."""
+        if not self.enabled or not self._binary_client:
+            return False
+        try:
+            if ex is not None:
+                self._binary_client.setex(key, ex, encode_value(data, self.codec))
+            else:
+                self._binary_client.set(key, encode_value(data, self.codec))
+            return True
+        except Exception as exc:
+            logger.debug(f"Redis set {key!r} failed: {exc}")
+            return False
+    
+    async def async_get_value(self, key: str):
+        """Async ``get_value``."""
+        client = self.async_binary_client
+        if client is None:
+            return None
+        try:
+            return decode_value(await client.get(key))
+        except Exception as exc:
+            logger.debug(f"Redis get {key!r} failed: {exc}")
+            return None
+    
+    async def async_mget_values(self, keys: list[str]) -> list:
+        """Decoded values of many keys, one round trip per MGET_BATCH_SIZE keys (None for missing keys)."""
+        client = self.async_binary_client
+        if client is None or not keys:
+            return [None] * len(keys)
+        try:
+            raw_values: list[Optional[bytes]] = []
+            for batch in _batches(keys):
+                raw_values.extend(await client.mget(batch))
+        except Exception as exc:
+            logger.debug(f"Redis mget of {len(keys)} keys failed: {exc}")
+            return [None] * len(keys)
+        values = []
+        for key, raw in zip(keys, raw_values):
+            try:
+                values.append(decode_value(raw))
+            except Exception as exc:
+                logger.debug(f"Undecodable Redis value at {key!r}: {exc}")
+                values.append(None)
+        return values
+    
+    async def async_set_value(self, key: str, data, ex: Optional[int] = None) -> bool:
+        """Async ``set_value``."""
+        client = self.async_binary_client
+        if client is None:
+            return False
+        try:
+            await client.set(key, encode_value(data, self.codec), ex=ex)
+            return True
+        except Exception as exc:
+            logger.debug(f"Redis set {key!r} failed: {exc}")
+            return False
+    
+    async def async_delete(self, *keys: str) -> bool:
+        """Async ``delete``."""
+        client = self.async_client
+        if client is None or not keys:
+            return False
+        try:
+            await client.delete(*keys)
+            return True
+        except Exception as exc:
+            logger.debug(f"Redis delete {keys!r} failed: {exc}")
+            return False
+    
     def get(self, key: str) -> Optional[str]:
         """Get a value by key (for generic cache use, e.g. risk config cache). Returns raw string or None."""
         if not self.enabled or not self._client:
@@ -69,6 +226,31 @@ class RedisStorage:
             logger.debug(f"Redis set {key!r} failed: {exc}")
             return False
     
+    def set_if_absent(self, key: str, value: str, ex: int) -> Optional[bool]:
+        """Atomically set ``key`` with a TTL unless it exists (``SET NX EX``).
+
+        Returns True if the key was set, False if it already existed, and None
+        if Redis is unavailable.
+        """
+        if not self.enabled or not self._client:
+            return None
+        try:
+            return bool(self._client.set(key, value, ex=ex, nx=True))
+        except Exception as exc:
+            logger.debug(f"Redis set-if-absent {key!r} failed: {exc}")
+            return None
+    
+    def delete(self, key: str) -> bool:
+        """Delete a key (for generic cache use)."""
+        if not self.enabled or not self._client:
+            return False
+        try:
+            self._client.delete(key)
+            return True
+        except Exception as exc:
+            logger.debug(f"Redis delete {key!r} failed: {exc}")
+            return False
+    
     def save_strategy(self, strategy_id: str, strategy_data: dict) -> bool:
         """Save strategy to Redis."""
         if not self.enabled or not self._client:
@@ -78,7 +260,10 @@ class RedisStorage:
             key = self._key("strategy", strategy_id)
             # Convert datetime and other non-serializable types
             serializable_data = self._make_serializable(strategy_data)
-            self._client.set(key, json.dumps(serializable_data))
+            pipe = self._binary_client.pipeline(transaction=False)
+            pipe.set(key, encode_value(serializable_data, self.codec))
+            pipe.sadd(STRATEGY_INDEX_KEY, strategy_id)
+            pipe.execute()
             return True
         except Exception as exc:
             logger.error(f"Failed to save strategy {strategy_id} to Redis: {exc}")
@@ -91,29 +276,68 @@ class RedisStorage:
         
         try:
             key = self._key("strategy", strategy_id)
-            data = self._client.get(key)
-            if data:
-                return json.loads(data)
-            return None
+            return decode_value(self._binary_client.get(key))
         except Exception as exc:
             logger.error(f"Failed to get strategy {strategy_id} from Redis: {exc}")
             return None
     
+    def _strategy_ids(self) -> list[str]:
+        """Ids in the strategy index, built once with SCAN for data saved before the index existed."""
+        if not self._client.exists(f"{STRATEGY_INDEX_KEY}:ready"):
+            prefix = self._key("strategy", "")
+            ids = [key[len(prefix):] for key in self._client.scan_iter(match=f"{prefix}*", count=1000)]
+            pipe = self._client.pipeline(transaction=False)
+            if ids:
+                pipe.sadd(STRATEGY_INDEX_KEY, *ids)
+            pipe.set(f"{STRATEGY_INDEX_KEY}:ready", "1")
+            pipe.execute()
+        return sorted(self._client.smembers(STRATEGY_INDEX_KEY))
+    
+    def _collect_strategies(self, strategy_ids: list[str], values: list[Optional[dict]]) -> dict[str, dict]:
+        strategies = {}
+        missing = []
+        for strategy_id, data in zip(strategy_ids, values):
+            if data:
+                strategies[strategy_id] = data
+            else:
+                missing.append(strategy_id)
+        if missing:
+            # Deleted outside this class (expired, flushed): drop from the index
+            try:
+                self._client.srem(STRATEGY_INDEX_KEY, *missing)
+            except Exception as exc:
+                logger.debug(f"Failed to prune strategy index: {exc}")
+        return strategies
+    
     def get_all_strategies(self) -> dict[str, dict]:
-        """Get all strategies from Redis."""
+        """Get all strategies from Redis (index lookup plus batched MGET)."""
         if not self.enabled or not self._client:
             return {}
         
         try:
-            pattern = self._key("strategy", "*")
-            keys = self._client.keys(pattern)
-            strategies = {}
-            for key in keys:
-                strategy_id = key.split(":")[-1]
-                data = self._client.get(key)
-                if data:
-                    strategies[strategy_id] = json.loads(data)
-            return strategies
+            strategy_ids = self._strategy_ids()
+            values: list[Optional[dict]] = []
+            for batch in _batches(strategy_ids):
+                raw_values = self._binary_client.mget([self._key("strategy", sid) for sid in batch])
+                values.extend(decode_value(raw) for raw in raw_values)
+            return self._collect_strategies(strategy_ids, values)
+        except Exception as exc:
+            logger.error(f"Failed to get all strategies from Redis: {exc}")
+            return {}
+    
+    async def async_get_all_strategies(self) -> dict[str, dict]:
+        """Async ``get_all_strategies``."""
+        client = self.async_client
+        if client is None:
+            return {}
+        
+        try:
+            if not await client.exists(f"{STRATEGY_INDEX_KEY}:ready"):
+                # One-off index build for data saved before the index existed
+                return self.get_all_strategies()
+            strategy_ids = sorted(await client.smembers(STRATEGY_INDEX_KEY))
+            values = await self.async_mget_values([self._key("strategy", sid) for sid in strategy_ids])
+            return self._collect_strategies(strategy_ids, values)
         except Exception as exc:
             logger.error(f"Failed to get all strategies from Redis: {exc}")
             return {}
@@ -125,7 +349,10 @@ class RedisStorage:
         
         try:
             key = self._key("strategy", strategy_id)
-            self._client.delete(key)
+            pipe = self._client.pipeline(transaction=False)
+            pipe.delete(key)
+            pipe.srem(STRATEGY_INDEX_KEY, strategy_id)
+            pipe.execute()
             # Also delete associated trades
             self.delete_trades(strategy_id)
             return True
@@ -134,34 +361,97 @@ class RedisStorage:
             return False
     
     def save_trades(self, strategy_id: str, trades: list[dict]) -> bool:
-        """Save trades for a strategy to Redis."""
+        """Replace the trades of a strategy in Redis (keeps the newest TRADES_MAX_LEN)."""
         if not self.enabled or not self._client:
             return False
         
         try:
             key = self._key("trades", strategy_id)
-            serializable_trades = [self._make_serializable(trade) for trade in trades]
-            self._client.set(key, json.dumps(serializable_trades))
+            pipe = self._client.pipeline(transaction=True)
+            pipe.delete(key)
+            if trades:
+                pipe.rpush(key, *(self._encode_trade(trade) for trade in trades[-TRADES_MAX_LEN:]))
+            pipe.execute()
             return True
         except Exception as exc:
             logger.error(f"Failed to save trades for {strategy_id} to Redis: {exc}")
             return False
     
-    def get_trades(self, strategy_id: str) -> list[dict]:
-        """Get trades for a strategy from Redis."""
+    def append_trade(self, strategy_id: str, trade: dict) -> bool:
+        """Append one trade (RPUSH + LTRIM), constant cost whatever the history length."""
         if not self.enabled or not self._client:
-            return []
+            return False
         
         try:
             key = self._key("trades", strategy_id)
-            data = self._client.get(key)
-            if data:
-                return json.loads(data)
+            pipe = self._client.pipeline(transaction=False)
+            pipe.rpush(key, self._encode_trade(trade))
+            pipe.ltrim(key, -TRADES_MAX_LEN, -1)
+            pipe.execute()
+            return True
+        except redis.ResponseError:
+            # Legacy JSON-string value: convert it, then append
+            trades = self._migrate_legacy_trades(strategy_id)
+            return self.save_trades(strategy_id, trades + [trade])
+        except Exception as exc:
+            logger.error(f"Failed to append trade for {strategy_id} to Redis: {exc}")
+            return False
+    
+    def get_trades(self, strategy_id: str, limit: Optional[int] = None) -> list[dict]:
+        """Get trades for a strategy from Redis, oldest first (only the newest ``limit`` if given)."""
+        if not self.enabled or not self._client:
             return []
+        
+        try:
+            key = self._key("trades", strategy_id)
+            start = -limit if limit else 0
+            return [json.loads(item) for item in self._client.lrange(key, start, -1)]
+        except redis.ResponseError:
+            trades = self._migrate_legacy_trades(strategy_id)
+            return trades[-limit:] if limit else trades
         except Exception as exc:
             logger.error(f"Failed to get trades for {strategy_id} from Redis: {exc}")
             return []
     
+    def get_trades_many(self, strategy_ids: list[str], limit: Optional[int] = None) -> dict[str, list[dict]]:
+        """Trades of many strategies, one pipelined LRANGE round trip per MGET_BATCH_SIZE strategies."""
+        if not self.enabled or not self._client or not strategy_ids:
+            return {}
+        
+        try:
+            trades = {}
+            start = -limit if limit else 0
+            for batch in _batches(strategy_ids):
+                pipe = self._client.pipeline(transaction=False)
+                for sid in batch:
+                    pipe.lrange(self._key("trades", sid), start, -1)
+                for sid, items in zip(batch, pipe.execute(raise_on_error=False)):
+                    if isinstance(items, redis.ResponseError):
+                        items = self._migrate_legacy_trades(sid)
+                        if items:
+                            trades[sid] = items[-limit:] if limit else items
+                    elif items:
+                        trades[sid] = [json.loads(item) for item in items]
+            return trades
+        except Exception as exc:
+            logger.error(f"Failed to get trades of {len(strategy_ids)} strategies from Redis: {exc}")
+            return {}
+    
+    def _encode_trade(self, trade: dict) -> str:
+        return json.dumps(self._make_serializable(trade))
+    
+    def _migrate_legacy_trades(self, strategy_id: str) -> list[dict]:
+        """Convert a trades key written as one JSON array into a list; returns the trades."""
+        try:
+            data = self._client.get(self._key("trades", strategy_id))
+            trades = json.loads(data) if data else []
+        except Exception as exc:
+            logger.error(f"Failed to read legacy trades for {strategy_id} from Redis: {exc}")
+            return []
+        self.save_trades(strategy_id, trades)
+        logger.info(f"Converted {len(trades)} Redis trades of {strategy_id} to a list")
+        return trades[-TRADES_MAX_LEN:]
+    
     def delete_trades(self, strategy_id: str) -> bool:
         """Delete trades for a strategy from Redis."""
         if not self.enabled or not self._client:
@@ -0,0 +1,162 @@
+"""
+Strategy leases for running the bot as several worker processes.
+
+Each running strategy is executed by exactly one worker: the one holding its
+lease, a Redis key ``binance_bot:lease:{strategy_id}`` whose value is the
+worker id and which expires after ``ttl_seconds``. Workers renew the leases
+of the strategies they run well before they expire. When a worker dies its
+leases expire and another worker takes the strategies over (see
+``app.services.strategy_takeover``).
+
+Without Redis there is only one worker, so every lease is granted.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+from typing import Iterable, Optional
+
+from loguru import logger
+
+from app.core.redis_storage import RedisStorage
+
+# Compare-and-set scripts so a worker never extends or deletes another worker's lease
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def default_worker_id() -> str:
+    """Worker id unique per process and host."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class StrategyLeaseManager:
+    """Acquire, renew and release per-strategy leases for one worker process."""
+
+    def __init__(
+        self,
+        redis_storage: Optional[RedisStorage],
+        worker_id: Optional[str] = None,
+        ttl_seconds: int = 30,
+    ) -> None:
+        """Initialize lease manager.
+
+        Args:
+            redis_storage: Redis storage shared by all workers (leases are always granted without it)
+            worker_id: Identifier of this worker (default: hostname:pid)
+            ttl_seconds: Seconds a lease stays valid without renewal
+        """
+        self.redis = redis_storage
+        self.worker_id = worker_id or default_worker_id()
+        self.ttl_seconds = ttl_seconds
+        self._owned: set[str] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.redis and self.redis.enabled and self.redis._client)
+
+    @property
+    def owned(self) -> set[str]:
+        """Strategy ids this worker holds a lease for."""
+        return set(self._owned)
+
+    def _key(self, strategy_id: str) -> str:
+        return f"binance_bot:lease:{strategy_id}"
+
+    def acquire(self, strategy_id: str) -> bool:
+        """Take the lease of a strategy, or extend it if this worker already holds it.
+
+        Returns:
+            True if this worker may run the strategy; False if another worker holds
+            the lease or Redis cannot be reached (never risk running it twice)
+        """
+        if not self.enabled:
+            self._owned.add(strategy_id)
+            return True
+        key = self._key(strategy_id)
+        ttl_ms = self.ttl_seconds * 1000
+        try:
+            client = self.redis._client
+            acquired = bool(
+                client.set(key, self.worker_id, nx=True, px=ttl_ms)
+                or client.eval(_RENEW_SCRIPT, 1, key, self.worker_id, ttl_ms)
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to acquire lease for strategy {strategy_id}: {exc}")
+            return False
+        if acquired:
+            self._owned.add(strategy_id)
+        return acquired
+
+    def renew(self, strategy_ids: Iterable[str]) -> list[str]:
+        """Extend the leases of strategies this worker runs.
+
+        Returns:
+            Strategy ids whose lease is now held by another worker (or expired and
+            was taken); the caller must stop running them. Empty if Redis is down,
+            since ownership cannot be decided then.
+        """
+        strategy_ids = list(strategy_ids)
+        if not self.enabled or not strategy_ids:
+            return []
+        ttl_ms = self.ttl_seconds * 1000
+        try:
+            pipe = self.redis._client.pipeline(transaction=False)
+            for strategy_id in strategy_ids:
+                pipe.eval(_RENEW_SCRIPT, 1, self._key(strategy_id), self.worker_id, ttl_ms)
+            results = pipe.execute()
+        except Exception as exc:
+            logger.warning(f"Failed to renew {len(strategy_ids)} strategy lease(s): {exc}")
+            return []
+        lost = []
+        for strategy_id, renewed in zip(strategy_ids, results):
+            if renewed:
+                self._owned.add(strategy_id)
+                continue
+            # Expired lease nobody else took yet: take it back instead of stopping
+            if self.acquire(strategy_id):
+                continue
+            lost.append(strategy_id)
+            self._owned.discard(strategy_id)
+        return lost
+
+    def release(self, strategy_id: str) -> None:
+        """Give up the lease of a strategy this worker stopped running."""
+        self._owned.discard(strategy_id)
+        if not self.enabled:
+            return
+        try:
+            self.redis._client.eval(_RELEASE_SCRIPT, 1, self._key(strategy_id), self.worker_id)
+        except Exception as exc:
+            # Lease expires on its own after ttl_seconds
+            logger.debug(f"Failed to release lease for strategy {strategy_id}: {exc}")
+
+    def owners(self, strategy_ids: Iterable[str]) -> dict[str, Optional[str]]:
+        """Worker id holding the lease of each strategy (None if nobody does)."""
+        strategy_ids = list(strategy_ids)
+        if not strategy_ids:
+            return {}
+        if not self.enabled:
+            return {sid: (self.worker_id if sid in self._owned else None) for sid in strategy_ids}
+        values = self.redis._client.mget([self._key(sid) for sid in strategy_ids])
+        return dict(zip(strategy_ids, values))
+
+    def held_by_other_worker(self, strategy_id: str) -> bool:
+        """Whether a live lease of another worker exists for the strategy."""
+        try:
+            owner = self.owners([strategy_id]).get(strategy_id)
+        except Exception as exc:
+            logger.debug(f"Failed to read lease owner of strategy {strategy_id}: {exc}")
+            return False
+        return owner is not None and owner != self.worker_id
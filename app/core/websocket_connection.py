@@ -21,7 +21,8 @@ class WebSocketConnection:
         symbol: str,
         interval: str,
         testnet: bool = True,
-        on_kline_update: Optional[Callable[[Dict], Awaitable[None]]] = None
+        on_kline_update: Optional[Callable[[Dict], Awaitable[None]]] = None,
+        include_forming: bool = False,
     ):
         """Initialize WebSocket connection.
         
@@ -30,11 +31,13 @@ class WebSocketConnection:
             interval: Kline interval (e.g., '1m', '5m')
             testnet: Whether to use testnet endpoints (will fallback to mainnet if testnet fails)
             on_kline_update: Callback function for kline updates
+            include_forming: Also forward updates of the still-forming candle (default: closed candles only)
         """
         self.symbol = symbol.upper()
         self.interval = interval
         self.testnet = testnet
         self.on_kline_update = on_kline_update
+        self.include_forming = include_forming
         self._use_mainnet_fallback = False  # Track if we've switched to mainnet fallback
         
         # Construct WebSocket URL
@@ -188,7 +191,7 @@ class WebSocketConnection:
         kline_data = data.get("k", {})
         is_closed = kline_data.get("x", False)
         
-        if not is_closed:
+        if not is_closed and not self.include_forming:
             # Candle is still forming, ignore for now
             # (we only process closed candles)
             return
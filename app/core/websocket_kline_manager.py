@@ -7,10 +7,13 @@ a centralized way for strategies to access real-time market data.
 
 import asyncio
 import threading
-from typing import Dict, Optional, List
+import time
+from typing import Any, Callable, Dict, Optional, List, Tuple
 from loguru import logger
 
 from app.core.websocket_connection import WebSocketConnection
+from app.core.market_data_bus import RedisStreamConnection
+from app.core.kline_aggregator import AGGREGATED_INTERVALS_MS, BASE_INTERVAL, KlineAggregator
 from app.core.kline_buffer import KlineBuffer
 from app.core.public_market_data_client import PublicMarketDataClient
 
@@ -22,7 +25,7 @@ class WebSocketKlineManager:
     _thread_lock = threading.Lock()  # Use threading.Lock for __new__
     _lock = asyncio.Lock()  # For async operations
     
-    def __new__(cls, testnet: bool = True):
+    def __new__(cls, testnet: bool = True, local_aggregation: bool = True, use_market_data_bus: bool = False):
         """Singleton pattern (thread-safe).
         
         Args:
@@ -39,11 +42,15 @@ class WebSocketKlineManager:
                     cls._instance._initialized = False
         return cls._instance
     
-    def __init__(self, testnet: bool = True):
+    def __init__(self, testnet: bool = True, local_aggregation: bool = True, use_market_data_bus: bool = False):
         """Initialize manager (only once due to singleton).
         
         Args:
             testnet: Whether to use testnet endpoints
+            local_aggregation: Build 3m..4h candles from the 1m stream instead of
+                opening extra streams (see app.core.kline_aggregator)
+            use_market_data_bus: Read streams from the market data service through Redis
+                instead of opening Binance sockets (see app.core.market_data_bus)
         """
         if self._initialized:
             # Already initialized - don't log again (singleton pattern)
@@ -55,7 +62,17 @@ class WebSocketKlineManager:
         self.subscription_counts: Dict[str, int] = {}
         # Event-based notification for new candles (key: symbol_interval)
         self.new_candle_events: Dict[str, asyncio.Event] = {}
+        # Listeners called once per closed candle: (symbol, interval, kline "k" payload)
+        self._candle_listeners: List[Callable[[str, str, Dict[str, Any]], None]] = []
+        # Latest streamed close per symbol: symbol -> (price, monotonic time)
+        self.last_prices: Dict[str, Tuple[float, float]] = {}
+        # Higher-timeframe candles derived from 1m streams (key: symbol_interval)
+        self.local_aggregation = local_aggregation
+        self.use_market_data_bus = use_market_data_bus
+        self.aggregators: Dict[str, KlineAggregator] = {}
         self._lock = asyncio.Lock()
+        # Per-stream locks for REST seeding of buffers (key: symbol_interval)
+        self._seed_locks: Dict[str, asyncio.Lock] = {}
         # Pass testnet parameter to PublicMarketDataClient
         self._public_client = PublicMarketDataClient(testnet=testnet, timeout=10.0)
         self._initialized = True
@@ -88,29 +105,40 @@ class WebSocketKlineManager:
             self.new_candle_events[key] = asyncio.Event()
             
             # Create connection
-            connection = WebSocketConnection(
-                symbol=symbol,
-                interval=interval,
-                testnet=self.testnet,
-                on_kline_update=self._on_kline_update_factory(key)
-            )
+            if self.use_market_data_bus:
+                connection = RedisStreamConnection(
+                    symbol=symbol,
+                    interval=interval,
+                    testnet=self.testnet,
+                    on_kline_update=self._on_kline_update_factory(key),
+                    on_gap=self._on_stream_gap_factory(key),
+                )
+            else:
+                connection = WebSocketConnection(
+                    symbol=symbol,
+                    interval=interval,
+                    testnet=self.testnet,
+                    on_kline_update=self._on_kline_update_factory(key)
+                )
             
             self.connections[key] = connection
             
             # Start connection
             await connection.connect()
-            
-            # Wait for connection (with timeout; 20s allows slow handshakes)
-            connected = await connection.wait_until_connected(timeout=20.0)
-            if not connected:
-                logger.warning(
-                    f"WebSocket connection timeout for {symbol} {interval}. "
-                    f"Strategies will use REST API fallback for this symbol/interval."
-                )
-                # Don't fail - strategies will use REST API fallback
-                # Keep the connection object so retries can continue in background
-            else:
-                logger.info(f"WebSocket subscribed: {symbol} {interval}")
+        
+        # Wait for connection outside the lock so subscriptions to other streams
+        # (e.g. many strategies restored at startup) handshake concurrently
+        # (with timeout; 20s allows slow handshakes)
+        connected = await connection.wait_until_connected(timeout=20.0)
+        if not connected:
+            logger.warning(
+                f"WebSocket connection timeout for {symbol} {interval}. "
+                f"Strategies will use REST API fallback for this symbol/interval."
+            )
+            # Don't fail - strategies will use REST API fallback
+            # Keep the connection object so retries can continue in background
+        else:
+            logger.info(f"WebSocket subscribed: {symbol} {interval}")
     
     async def unsubscribe(self, symbol: str, interval: str) -> None:
         """Unsubscribe from kline stream (decrements count, closes if count reaches 0).
@@ -137,6 +165,7 @@ class WebSocketKlineManager:
                 if key in self.buffers:
                     await self.buffers[key].clear()
                     del self.buffers[key]
+                self._seed_locks.pop(key, None)
                 
                 # Clean up event
                 if key in self.new_candle_events:
@@ -144,6 +173,13 @@ class WebSocketKlineManager:
                 
                 del self.subscription_counts[key]
                 
+                # Aggregated higher timeframes depend on the 1m stream
+                if interval == BASE_INTERVAL:
+                    prefix = f"{symbol.upper()}_"
+                    for agg_key in [k for k in self.aggregators if k.startswith(prefix)]:
+                        del self.aggregators[agg_key]
+                        self.new_candle_events.pop(agg_key, None)
+                
                 logger.info(f"WebSocket unsubscribed: {symbol} {interval}")
             else:
                 logger.debug(f"WebSocket subscription decremented: {symbol} {interval} (count: {self.subscription_counts[key]})")
@@ -169,6 +205,12 @@ class WebSocketKlineManager:
         """
         key = f"{symbol.upper()}_{interval}"
         
+        # Higher timeframe of a subscribed 1m stream: serve locally aggregated candles
+        if self._should_aggregate(symbol, interval):
+            klines = await self._get_aggregated_klines(symbol, interval, limit)
+            if klines is not None:
+                return klines
+        
         # Ensure subscribed
         await self.subscribe(symbol, interval)
         
@@ -181,28 +223,66 @@ class WebSocketKlineManager:
                 return klines
         
         # Buffer doesn't have enough data, fetch from REST and seed the buffer.
+        return await self._seed_from_rest(symbol, interval, limit)
+    
+    async def prefetch_klines(self, symbol: str, interval: str, limit: int) -> int:
+        """Seed the buffer of a subscribed stream with ``limit`` klines from REST (no-op if already filled).
+        
+        Unlike get_klines this does not subscribe; callers hold their own subscription.
+        Used to warm each symbol/interval once before many strategies read it.
+        
+        Args:
+            symbol: Trading symbol
+            interval: Kline interval
+            limit: Number of klines the buffer should hold
+            
+        Returns:
+            Number of klines available afterwards
+        """
+        if self._should_aggregate(symbol, interval):
+            klines = await self._get_aggregated_klines(symbol, interval, limit)
+            if klines is not None:
+                return len(klines)
+        key = f"{symbol.upper()}_{interval}"
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            return 0
+        buffer_size = await buffer.size()
+        if buffer_size >= limit:
+            return buffer_size
+        return len(await self._seed_from_rest(symbol, interval, limit))
+    
+    async def _seed_from_rest(self, symbol: str, interval: str, limit: int) -> List[List]:
+        """Fetch ``limit`` klines from REST into the stream buffer (one fetch per stream at a time).
+        
+        Seeding locks only its own stream and fetches in a thread, so warming
+        different symbols/intervals neither waits on each other nor blocks the loop.
+        """
+        key = f"{symbol.upper()}_{interval}"
+        seed_lock = self._seed_locks.setdefault(key, asyncio.Lock())
         # CRITICAL: If the buffer already has recent WebSocket rows, appending REST klines
         # (oldest→newest) would place history *after* the newest candle and break ordering.
-        async with self._lock:
-            if key not in self.buffers:
+        async with seed_lock:
+            buffer = self.buffers.get(key)
+            if buffer is None:
                 return []
-            buffer_size = await self.buffers[key].size()
+            buffer_size = await buffer.size()
             if buffer_size >= limit:
-                klines = await self.buffers[key].get_klines(limit=limit)
+                klines = await buffer.get_klines(limit=limit)
                 logger.debug(f"Got {len(klines)} klines from WebSocket buffer (after lock): {symbol} {interval}")
                 return klines
 
             logger.info(f"Fetching initial {limit} klines from REST API: {symbol} {interval}")
             try:
-                klines = self._public_client.get_klines(symbol, interval, limit)
+                klines = await asyncio.to_thread(self._public_client.get_klines, symbol, interval, limit)
             except Exception as e:
                 logger.error(f"Failed to fetch initial klines from REST API: {e}")
                 raise
 
-            await self.buffers[key].clear()
+            await buffer.clear()
             for kline in klines:
                 ws_format = self._convert_to_websocket_format(kline, symbol, interval)
-                await self.buffers[key].add_kline(ws_format)
+                await buffer.add_kline(ws_format)
 
             return klines
     
@@ -225,6 +305,15 @@ class WebSocketKlineManager:
                 # Check if this is a closed candle (x=True means candle is closed)
                 kline_data = data.get("k", {})
                 is_closed = kline_data.get("x", False)
+                symbol, _, interval = key.rpartition("_")
+                try:
+                    self.last_prices[symbol] = (float(kline_data.get("c")), time.monotonic())
+                except (TypeError, ValueError):
+                    pass
+                if is_closed:
+                    self._notify_candle_closed(symbol, interval, kline_data)
+                if interval == BASE_INTERVAL:
+                    self._feed_aggregators(symbol, data)
                 if is_closed and key in self.new_candle_events:
                     # CRITICAL: Ensure all waiting strategies are notified of the new candle
                     # Strategy: Set event (notify waiters), then clear (reset for next candle)
@@ -244,6 +333,140 @@ class WebSocketKlineManager:
         
         return on_kline_update
     
+    def _on_stream_gap_factory(self, key: str):
+        """Create the handler for missed market data bus messages of a stream.
+        
+        Clearing the buffer makes the next get_klines reseed it from REST, so
+        strategies never see history with a hole in it.
+        """
+        async def on_gap() -> None:
+            buffer = self.buffers.get(key)
+            if buffer is not None:
+                await buffer.clear()
+                logger.warning(f"Kline buffer {key} cleared after missed stream messages; reseeding from REST")
+        
+        return on_gap
+    
+    def _notify_candle_closed(self, symbol: str, interval: str, kline_data: Dict[str, Any]) -> None:
+        """Invoke candle listeners for a closed candle (native or aggregated)."""
+        for listener in list(self._candle_listeners):
+            try:
+                listener(symbol, interval, kline_data)
+            except Exception as exc:
+                logger.warning(f"Candle listener failed for {symbol}_{interval}: {exc}")
+    
+    def derives_from_base(self, interval: str) -> bool:
+        """Whether ``interval`` is built locally from the 1m stream (no own WebSocket).
+        
+        Args:
+            interval: Kline interval
+            
+        Returns:
+            True if local aggregation is enabled and the interval is aggregatable
+        """
+        return self.local_aggregation and interval in AGGREGATED_INTERVALS_MS
+    
+    def _should_aggregate(self, symbol: str, interval: str) -> bool:
+        """Aggregate only when the 1m stream is live and no native stream exists for the interval."""
+        if not self.derives_from_base(interval):
+            return False
+        symbol = symbol.upper()
+        return (
+            f"{symbol}_{BASE_INTERVAL}" in self.connections
+            and f"{symbol}_{interval}" not in self.connections
+        )
+    
+    def _feed_aggregators(self, symbol: str, data: Dict) -> None:
+        """Apply a 1m kline update to every aggregator of the symbol."""
+        prefix = f"{symbol}_"
+        aggregators = [(k, a) for k, a in self.aggregators.items() if k.startswith(prefix)]
+        if not aggregators:
+            return
+        k = data.get("k", {})
+        kline = KlineBuffer._convert_to_binance_format(data)
+        is_closed = bool(k.get("x", False))
+        for key, aggregator in aggregators:
+            closed_candle = aggregator.add_base_kline(kline, is_closed)
+            if closed_candle is None:
+                continue
+            htf_interval = aggregator.interval
+            self._notify_candle_closed(symbol, htf_interval, {
+                "t": closed_candle[0], "T": closed_candle[6], "s": symbol, "i": htf_interval,
+                "o": closed_candle[1], "h": closed_candle[2], "l": closed_candle[3],
+                "c": closed_candle[4], "v": closed_candle[5], "x": True,
+            })
+            if key in self.new_candle_events:
+                self.new_candle_events[key].set()
+                self.new_candle_events[key].clear()
+    
+    async def _get_aggregated_klines(self, symbol: str, interval: str, limit: int) -> Optional[List[List]]:
+        """Get locally aggregated klines, seeding the aggregator from REST when needed.
+        
+        Args:
+            symbol: Trading symbol
+            interval: Higher-timeframe interval
+            limit: Maximum number of klines to return
+            
+        Returns:
+            Klines in Binance format, or None to fall back to a native stream
+        """
+        symbol = symbol.upper()
+        key = f"{symbol}_{interval}"
+        aggregator = self.aggregators.get(key)
+        if aggregator is not None and not aggregator.stale and aggregator.size() >= limit:
+            return aggregator.get_klines(limit)
+        
+        async with self._lock:
+            aggregator = self.aggregators.get(key)
+            if aggregator is None:
+                aggregator = KlineAggregator(interval)
+                self.aggregators[key] = aggregator
+                self.new_candle_events.setdefault(key, asyncio.Event())
+            if aggregator.stale or aggregator.size() < limit:
+                try:
+                    # One-off seed: closed history at the target interval + 1m candles of the open bucket
+                    htf_klines = await asyncio.to_thread(
+                        self._public_client.get_klines, symbol, interval, limit + 1
+                    )
+                    if not htf_klines:
+                        return None
+                    bucket_open = int(htf_klines[-1][0])
+                    base_klines = await asyncio.to_thread(
+                        self._public_client.get_klines, symbol, BASE_INTERVAL,
+                        AGGREGATED_INTERVALS_MS[interval] // 60_000 + 1, bucket_open,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to seed {key} aggregation from REST API: {e}")
+                    return None
+                now_ms = int(time.time() * 1000)
+                aggregator.seed(htf_klines[:-1], base_klines or [], now_ms)
+                logger.info(f"Seeded local {interval} aggregation from {BASE_INTERVAL} stream: {symbol}")
+            return aggregator.get_klines(limit)
+    
+    def add_candle_listener(self, listener: Callable[[str, str, Dict[str, Any]], None]) -> None:
+        """Register a callback invoked once per closed candle on any stream (idempotent).
+        
+        Args:
+            listener: Called with (symbol, interval, kline "k" payload); must not block
+        """
+        if listener not in self._candle_listeners:
+            self._candle_listeners.append(listener)
+    
+    def get_last_price(self, symbol: str, max_age: float = 5.0) -> Optional[float]:
+        """Get the latest streamed price for a symbol (close of the forming candle).
+        
+        Args:
+            symbol: Trading symbol
+            max_age: Maximum age in seconds; older prices are ignored
+            
+        Returns:
+            Price, or None if no fresh stream price is available
+        """
+        entry = self.last_prices.get(symbol.upper())
+        if entry is None or time.monotonic() - entry[1] > max_age:
+            return None
+        return entry[0]
+    
     def _convert_to_websocket_format(self, kline: List, symbol: str, interval: str) -> Dict:
         """Convert Binance REST format to WebSocket format.
         
@@ -361,6 +584,8 @@ class WebSocketKlineManager:
             self.buffers.clear()
             self.subscription_counts.clear()
             self.new_candle_events.clear()
+            self.last_prices.clear()
+            self.aggregators.clear()
             
             logger.info("WebSocketKlineManager shut down")
 
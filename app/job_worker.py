@@ -0,0 +1,162 @@
+"""
+Job worker: runs queued walk-forward and sensitivity analyses.
+
+Run with ``python -m app.job_worker`` (``JOB_QUEUE_ENABLED=true``) on any
+host that reaches Redis and the database; start more of them to run more
+analyses at once. Each worker claims up to ``JOB_WORKER_CONCURRENCY`` jobs
+from the queue (see ``app.core.job_queue``), keeps their claims alive with
+heartbeats, retries transient failures and retries the jobs of workers that
+stopped responding.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import signal
+from typing import Awaitable, Callable, Dict, Optional
+
+from fastapi import HTTPException
+from loguru import logger
+
+from app.core.config import get_settings
+from app.core.job_queue import Job, JobQueue, get_job_queue, is_transient_error
+from app.core.logger import configure_logging
+from app.core.strategy_leases import default_worker_id
+from app.services.walk_forward_task_manager import get_task_manager
+
+JobHandler = Callable[[Job, object], Awaitable[None]]
+
+
+class JobWorker:
+    """Claims jobs from the queue and runs them with bounded concurrency."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: Dict[str, JobHandler],
+        client: object,
+        concurrency: int = 2,
+        poll_interval: float = 1.0,
+        worker_id: Optional[str] = None,
+    ) -> None:
+        self.queue = queue
+        self.handlers = handlers
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or default_worker_id()
+        self._running: Dict[str, asyncio.Task] = {}
+        self._stopping = asyncio.Event()
+
+    async def _execute(self, job: Job) -> None:
+        handler = self.handlers.get(job.kind)
+        logger.info(f"[JobWorker] Running {job.kind} job {job.id} (attempt {job.attempts}/{job.max_attempts})")
+        try:
+            if handler is None:
+                raise ValueError(f"No handler for job kind {job.kind!r}")
+            await handler(job, self.client)
+        except asyncio.CancelledError:
+            # Worker shutting down: another worker retries the job once the claim expires
+            raise
+        except HTTPException as e:
+            if e.status_code == 499:  # Cancelled
+                self.queue.complete(job)
+            else:
+                await self._record_failure(job, e, str(e.detail))
+        except Exception as e:
+            logger.error(f"[JobWorker] {job.kind} job {job.id} failed: {e}", exc_info=True)
+            await self._record_failure(job, e, str(e))
+        else:
+            self.queue.complete(job)
+        finally:
+            self._running.pop(job.id, None)
+
+    async def _record_failure(self, job: Job, error: Exception, message: str) -> None:
+        task_manager = get_task_manager()
+        if not is_transient_error(error):
+            job.max_attempts = job.attempts  # Retrying cannot help
+        if self.queue.fail(job, message):
+            await task_manager.mark_retrying(
+                job.id, f"Attempt {job.attempts}/{job.max_attempts} failed ({message}); retrying..."
+            )
+        elif job.status == "failed":
+            await task_manager.fail_task(job.id, message)
+
+    async def poll(self) -> None:
+        """One scheduling pass: heartbeats, retries, lost jobs and new claims."""
+        self.queue.heartbeat(list(self._running))
+        self.queue.promote_delayed()
+        for job in self.queue.requeue_stale():
+            await get_task_manager().fail_task(job.id, job.error or "Job failed")
+        while len(self._running) < self.concurrency:
+            job = self.queue.claim(self.worker_id)
+            if job is None:
+                break
+            self._running[job.id] = asyncio.create_task(self._execute(job))
+
+    async def run(self) -> None:
+        """Run jobs until stopped."""
+        logger.info(f"[JobWorker] Worker {self.worker_id} started (concurrency {self.concurrency})")
+        # Heartbeats must come well within the claim lease
+        interval = min(self.poll_interval, self.queue.lease_seconds / 3)
+        while not self._stopping.is_set():
+            try:
+                await self.poll()
+            except Exception as exc:
+                logger.warning(f"[JobWorker] Poll failed: {exc}")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+        for task in list(self._running.values()):
+            task.cancel()
+        await asyncio.gather(*self._running.values(), return_exceptions=True)
+        logger.info(f"[JobWorker] Worker {self.worker_id} stopped")
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+
+def _create_client():
+    from app.core.binance_client_manager import BinanceClientManager
+    from app.core.my_binance_client import BinanceClient
+
+    settings = get_settings()
+    client = BinanceClientManager(settings).get_default_client()
+    if client is None:
+        client = BinanceClient(
+            api_key=settings.binance_api_key,
+            api_secret=settings.binance_api_secret,
+            testnet=settings.binance_testnet,
+        )
+    return client
+
+
+async def main() -> None:
+    from app.core.database import init_database_async
+    from app.services.analysis_jobs import JOB_HANDLERS
+
+    configure_logging()
+    settings = get_settings()
+    queue = get_job_queue()
+    if queue is None:
+        raise SystemExit("Job worker needs JOB_QUEUE_ENABLED=true and a reachable Redis")
+    await init_database_async()
+    worker = JobWorker(
+        queue,
+        JOB_HANDLERS,
+        client=_create_client(),
+        concurrency=settings.job_worker_concurrency,
+        worker_id=settings.worker_id,
+    )
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:  # Windows
+            pass
+    await worker.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
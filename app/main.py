@@ -222,12 +222,27 @@ def create_app() -> FastAPI:
         mark_price_stream_manager = MarkPriceStreamManager(
             broadcast_service=position_broadcast_service,
             testnet=mark_price_testnet,
+            use_market_data_bus=settings.market_data_source == "redis",
         )
         logger.info(
             f"Mark price stream: {'testnet' if mark_price_testnet else 'mainnet'} "
             f"(wss://{'testnet.binancefuture.com' if mark_price_testnet else 'fstream.binance.com'}/...)"
         )
 
+    # Multi-worker mode: strategies are shared between worker processes through Redis leases
+    lease_manager = None
+    if settings.strategy_leases_enabled:
+        if redis_storage and redis_storage.enabled:
+            from app.core.strategy_leases import StrategyLeaseManager
+            lease_manager = StrategyLeaseManager(
+                redis_storage,
+                worker_id=settings.worker_id,
+                ttl_seconds=settings.strategy_lease_ttl_seconds,
+            )
+            logger.info(f"Strategy leases enabled (worker: {lease_manager.worker_id})")
+        else:
+            logger.warning("STRATEGY_LEASES_ENABLED requires Redis; running strategies without leases")
+
     runner = StrategyRunner(
         client_manager=client_manager,
         client=default_client,  # For backward compatibility
@@ -240,6 +255,7 @@ def create_app() -> FastAPI:
         testnet=settings.binance_testnet,  # Get testnet from config
         position_broadcast_service=position_broadcast_service,
         mark_price_stream_manager=mark_price_stream_manager,
+        lease_manager=lease_manager,
     )
     
     # Initialize Telegram command handler if enabled
@@ -414,6 +430,10 @@ def create_app() -> FastAPI:
                 startup_errors.append(error_msg)
                 logger.error(f"Failed to restore running strategies on startup: {exc}", exc_info=True)
 
+            # Multi-worker mode: renew leases and take over strategies of dead workers
+            if runner.lease_manager:
+                runner.start_lease_maintenance()
+
             # Eager: start User Data Stream for all accounts so manual/external positions get real-time updates without a running strategy
             try:
                 if getattr(settings, "use_user_data_stream_for_position", True):
@@ -554,6 +574,27 @@ def create_app() -> FastAPI:
                 except (asyncio.CancelledError, Exception) as e:
                     logger.debug(f"Error cancelling strategy tasks: {type(e).__name__}")
                 
+                # Release strategy leases (after tasks are cancelled) so other workers take over now
+                try:
+                    if hasattr(app.state, 'strategy_runner') and app.state.strategy_runner:
+                        await app.state.strategy_runner.stop_lease_maintenance()
+                except (asyncio.CancelledError, Exception) as e:
+                    logger.debug(f"Error releasing strategy leases: {type(e).__name__}")
+                
+                # Close the market data bus reader (MARKET_DATA_SOURCE=redis)
+                try:
+                    from app.core.market_data_bus import close_market_data_reader
+                    await close_market_data_reader()
+                except (asyncio.CancelledError, Exception) as e:
+                    logger.debug(f"Error closing market data bus reader: {type(e).__name__}")
+                
+                # Close the pooled async Redis client
+                try:
+                    if hasattr(app.state, 'strategy_runner') and app.state.strategy_runner and app.state.strategy_runner.redis:
+                        await app.state.strategy_runner.redis.aclose()
+                except (asyncio.CancelledError, Exception) as e:
+                    logger.debug(f"Error closing async Redis client: {type(e).__name__}")
+                
                 # Stop Telegram command handler
                 try:
                     if telegram_command_handler:
@@ -581,6 +622,13 @@ def create_app() -> FastAPI:
                 except (asyncio.CancelledError, Exception) as e:
                     logger.debug(f"Error cancelling background tasks: {type(e).__name__}")
                 
+                # Stop walk-forward window worker processes
+                try:
+                    from app.services.walk_forward import shutdown_window_pool
+                    shutdown_window_pool()
+                except (asyncio.CancelledError, Exception) as e:
+                    logger.debug(f"Error stopping walk-forward workers: {type(e).__name__}")
+                
                 # Stop service monitor
                 try:
                     if service_monitor:
@@ -0,0 +1,139 @@
+"""
+Market data service: the one process that connects to Binance market data streams.
+
+Run with ``python -m app.market_data_service`` next to API/trader processes
+started with ``MARKET_DATA_SOURCE=redis``. It opens the kline and mark price
+streams those processes request on the market data bus (see
+``app.core.market_data_bus``), publishes every message, forming and closed
+candles alike, to the matching Redis stream with a sequence number, and
+closes streams nobody has requested for ``DEMAND_TTL_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import signal
+import time
+from typing import Any, Dict, Union
+
+from loguru import logger
+
+from app.core.config import get_settings
+from app.core.logger import configure_logging
+from app.core.mark_price_connection import MarkPriceConnection
+from app.core.market_data_bus import DEMAND_KEY, STREAM_MAXLEN, encode_entry, parse_stream_key
+from app.core.websocket_connection import WebSocketConnection
+
+Connection = Union[WebSocketConnection, MarkPriceConnection]
+
+
+class MarketDataService:
+    """Owns the exchange sockets and publishes their messages to Redis streams."""
+
+    def __init__(self, redis_url: str, reconcile_interval: float = 2.0) -> None:
+        self.redis_url = redis_url
+        self.reconcile_interval = reconcile_interval
+        self.epoch = int(time.time() * 1000)
+        self._client = None
+        self._connections: Dict[str, Connection] = {}
+        self._seq: Dict[str, int] = {}
+        self._stopping = asyncio.Event()
+
+    async def _redis(self):
+        if self._client is None:
+            import redis.asyncio as aioredis
+            self._client = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._client
+
+    async def publish(self, stream_key: str, message: Dict[str, Any]) -> None:
+        """Append one exchange message to its stream with the next sequence number."""
+        seq = self._seq.get(stream_key, 0) + 1
+        self._seq[stream_key] = seq
+        try:
+            client = await self._redis()
+            await client.xadd(
+                stream_key, encode_entry(self.epoch, seq, message), maxlen=STREAM_MAXLEN, approximate=True
+            )
+        except Exception as exc:
+            # Readers see the seq jump and resync
+            logger.warning(f"[MarketData] Failed to publish to {stream_key}: {exc}")
+
+    def _open(self, stream_key: str) -> Connection:
+        kind, symbol, interval, testnet = parse_stream_key(stream_key)
+        if kind == "kline":
+            async def on_kline(data: Dict) -> None:
+                await self.publish(stream_key, data)
+
+            return WebSocketConnection(
+                symbol=symbol, interval=interval, testnet=testnet, on_kline_update=on_kline, include_forming=True
+            )
+
+        async def on_mark_price(_symbol: str, payload: Dict[str, Any]) -> None:
+            await self.publish(stream_key, payload)
+
+        return MarkPriceConnection(symbol=symbol, testnet=testnet, on_mark_price=on_mark_price)
+
+    async def reconcile(self) -> None:
+        """Open streams with live demand and close streams whose demand expired."""
+        client = await self._redis()
+        now = time.time()
+        await client.zremrangebyscore(DEMAND_KEY, "-inf", now)
+        wanted = set(await client.zrangebyscore(DEMAND_KEY, now, "+inf"))
+
+        for stream_key in wanted - set(self._connections):
+            try:
+                connection = self._open(stream_key)
+            except ValueError as exc:
+                logger.warning(f"[MarketData] Ignoring demand: {exc}")
+                await client.zrem(DEMAND_KEY, stream_key)
+                continue
+            self._connections[stream_key] = connection
+            await connection.connect()
+            logger.info(f"[MarketData] Streaming {stream_key}")
+
+        for stream_key in set(self._connections) - wanted:
+            connection = self._connections.pop(stream_key)
+            await connection.disconnect()
+            logger.info(f"[MarketData] Closed {stream_key} (no readers)")
+
+    async def run(self) -> None:
+        """Reconcile streams with demand until stopped."""
+        logger.info(f"[MarketData] Service started (epoch {self.epoch})")
+        while not self._stopping.is_set():
+            try:
+                await self.reconcile()
+            except Exception as exc:
+                logger.warning(f"[MarketData] Reconcile failed: {exc}")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.reconcile_interval)
+            except asyncio.TimeoutError:
+                pass
+        for connection in self._connections.values():
+            try:
+                await connection.disconnect()
+            except Exception as exc:
+                logger.debug(f"[MarketData] Disconnect failed: {exc}")
+        self._connections.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        logger.info("[MarketData] Service stopped")
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+
+async def main() -> None:
+    configure_logging()
+    service = MarketDataService(get_settings().redis_url)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, service.stop)
+        except NotImplementedError:  # Windows
+            pass
+    await service.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
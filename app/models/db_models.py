@@ -1212,6 +1212,8 @@ class CompletedTrade(Base):
         UniqueConstraint("user_id", "strategy_id", "close_event_id", name="uq_completed_trade_idempotency"),
         Index("idx_completed_trades_user_strategy", "user_id", "strategy_id"),
         Index("idx_completed_trades_exit_time", "exit_time"),
+        # Keyset pagination of the trades page: (exit_time, id) < cursor ORDER BY exit_time DESC, id DESC
+        Index("idx_completed_trades_user_exit_time", "user_id", "exit_time", "id", postgresql_ops={"exit_time": "DESC", "id": "DESC"}),
         Index("idx_completed_trades_symbol", "symbol"),
         Index("idx_completed_trades_account", "account_id"),
         # Index for position_instance_id tracking
@@ -19,6 +19,11 @@ from app.risk.metrics_calculator import (
     RiskMetricsCalculator,
     RiskMetrics,
 )
+from app.risk.risk_config_cache import (
+    RiskConfigCache,
+    StrategyRiskContext,
+    get_risk_config_cache,
+)
 
 __all__ = [
     "RiskManager",
@@ -40,4 +45,7 @@ __all__ = [
     "TradeFrequencyStatus",
     "RiskMetricsCalculator",
     "RiskMetrics",
+    "RiskConfigCache",
+    "StrategyRiskContext",
+    "get_risk_config_cache",
 ]
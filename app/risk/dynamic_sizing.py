@@ -15,6 +15,7 @@ from datetime import datetime, timezone, timedelta
 
 from loguru import logger
 
+from app.core.account_snapshot import get_wallet_balance
 from app.core.my_binance_client import BinanceClient
 from app.core.exceptions import PositionSizingError
 from app.risk.manager import RiskManager, PositionSizingResult
@@ -332,7 +333,7 @@ class DynamicPositionSizer:
         fractional_kelly = kelly_fraction * self.config.kelly_fraction
         
         # Cap at maximum position size
-        balance = self.client.futures_account_balance()
+        balance = get_wallet_balance(self.client)
         max_position_notional = balance * self.config.max_kelly_position_pct
         kelly_notional = base_notional * (1 + fractional_kelly)
         
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from loguru import logger
 
+from app.core.account_snapshot import get_wallet_balance
 from app.core.my_binance_client import BinanceClient
 from app.core.exceptions import PositionSizingError
 
@@ -134,7 +135,8 @@ class RiskManager:
                 f"(fixed_amount={fixed_amount} is NOT used)"
             )
             
-            balance = self.client.futures_account_balance()
+            # Stream-fed snapshot when available, REST otherwise
+            balance = get_wallet_balance(self.client)
             at_risk = balance * risk_per_trade
             
             # Check if calculated amount meets minimum notional
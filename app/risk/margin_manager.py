@@ -15,6 +15,7 @@ from typing import Optional, Dict
 
 from loguru import logger
 
+from app.core.account_snapshot import get_account_snapshot_store
 from app.core.exceptions import RiskLimitExceededError
 from app.core.my_binance_client import BinanceClient
 
@@ -80,28 +81,37 @@ class MarginManager:
             MarginStatus or None if unavailable
         """
         try:
-            # Get account balance
-            balance = self.client.futures_account_balance()
-            
-            # Get account information (includes margin data)
-            # Note: futures_account() may not exist, use get_account_info() or similar
-            try:
-                account_info = getattr(self.client, 'futures_account', lambda: {})()
-            except Exception:
-                # Fallback if method doesn't exist
-                account_info = {}
+            # Prefer the stream-fed account snapshot (no REST round trips). Looked up
+            # by this manager's client, since account ids alone are not unique across users.
+            snapshot = get_account_snapshot_store().get_for_client(self.client)
+            if snapshot is not None and snapshot.account_id == (account_id or "default").strip().lower():
+                total_balance = snapshot.wallet_balance
+                available_balance = snapshot.available_balance
+                maintenance_margin = snapshot.total_maint_margin
+            else:
+                # Get account balance
+                balance = self.client.futures_account_balance()
+                
+                # Get account information (includes margin data)
+                # Note: futures_account() may not exist, use get_account_info() or similar
+                try:
+                    account_info = getattr(self.client, 'futures_account', lambda: {})()
+                except Exception:
+                    # Fallback if method doesn't exist
+                    account_info = {}
+                
+                # Extract margin data
+                total_balance = float(account_info.get('totalWalletBalance', balance))
+                available_balance = float(account_info.get('availableBalance', balance * 0.5))
+                
+                # Get maintenance margin (Binance provides this)
+                maintenance_margin = float(account_info.get('totalMaintMargin', 0.0))
             
-            # Extract margin data
-            total_balance = float(account_info.get('totalWalletBalance', balance))
-            available_balance = float(account_info.get('availableBalance', balance * 0.5))
             used_margin = total_balance - available_balance
             
             # Calculate margin ratio
             margin_ratio = used_margin / total_balance if total_balance > 0 else 0.0
             
-            # Get maintenance margin (Binance provides this)
-            maintenance_margin = float(account_info.get('totalMaintMargin', 0.0))
-            
             # Binance thresholds (typical values)
             margin_call_ratio = 0.8  # 80% triggers margin call
             liquidation_ratio = 1.0  # 100% triggers liquidation
@@ -12,10 +12,17 @@ order_manager after fetching klines via strategy.get_klines() or kline manager.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
 from loguru import logger
 
+# Optional: only needed for market_regime_metrics_batch
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 @dataclass
 class MarketRegimeResult:
@@ -101,6 +108,36 @@ def analyze_market_regime(
     # Total range (sum of high-low) vs net move (abs) to detect ranging
     total_range = sum(h - l for _, h, l, _ in recent)
     avg_range_pct = (total_range / len(recent) / current_price) * 100.0 if current_price else 0
+
+    return classify_market_regime(
+        net_move_pct=net_move_pct,
+        atr_pct=atr_pct,
+        avg_range_pct=avg_range_pct,
+        candles=lookback,
+        strategy_type=strategy_type,
+        symbol=symbol,
+    )
+
+
+def classify_market_regime(
+    net_move_pct: float,
+    atr_pct: float,
+    avg_range_pct: float,
+    candles: int,
+    strategy_type: Optional[str] = None,
+    symbol: str = "",
+) -> MarketRegimeResult:
+    """
+    Classify regime/volatility from precomputed metrics and build the reason string.
+
+    Args:
+        net_move_pct: Net close-to-close move over the window (%)
+        atr_pct: ATR as % of price
+        avg_range_pct: Average candle range (high-low) as % of price
+        candles: Number of candles in the window
+        strategy_type: e.g. "ema_crossover", "range_mean_reversion"
+        symbol: Optional symbol for the reason string
+    """
     abs_net_move = abs(net_move_pct)
 
     # Simple regime: if net move is small relative to typical range → ranging
@@ -159,6 +196,42 @@ def analyze_market_regime(
         "volatility": volatility,
         "net_move_pct": round(net_move_pct, 4),
         "atr_pct": round(atr_pct, 4),
-        "candles": lookback,
+        "candles": candles,
     }
     return MarketRegimeResult(regime=regime, volatility=volatility, reason=reason.strip(), meta=meta)
+
+
+def market_regime_metrics_batch(
+    highs: "np.ndarray",
+    lows: "np.ndarray",
+    closes: "np.ndarray",
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", int]:
+    """
+    Vectorized regime metrics for many symbols at once (same math as analyze_market_regime).
+
+    Args:
+        highs, lows, closes: Arrays of shape (symbols, candles), oldest first,
+            with at least 10 candles per row
+
+    Returns:
+        (net_move_pct, atr_pct, avg_range_pct, candles) - one value per row
+        for the three arrays, plus the window length used
+    """
+    lookback = min(50, closes.shape[1])
+    h, l, c = highs[:, -lookback:], lows[:, -lookback:], closes[:, -lookback:]
+    first_close, last_close = c[:, 0], c[:, -1]
+    current_price = np.where(last_close != 0, last_close, np.where(first_close != 0, first_close, 1.0))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        net_move_pct = np.where(first_close > 0, (last_close - first_close) / first_close * 100.0, 0.0)
+
+        # Same window as _atr_pct: the first `period` true ranges of the lookback window
+        period = min(14, lookback)
+        m = min(lookback, period + 1) - 1
+        prev_close = c[:, 0:m]
+        hh, ll = h[:, 1:m + 1], l[:, 1:m + 1]
+        true_range = np.maximum(hh - ll, np.maximum(np.abs(hh - prev_close), np.abs(ll - prev_close)))
+        atr_pct = np.where(last_close > 0, true_range.mean(axis=1) / last_close * 100.0, 0.0)
+
+        avg_range_pct = (h - l).mean(axis=1) / current_price * 100.0
+    return net_move_pct, atr_pct, avg_range_pct, lookback
@@ -17,6 +17,7 @@ from uuid import UUID
 
 from loguru import logger
 
+from app.core.account_snapshot import get_account_snapshot_store
 from app.core.exceptions import RiskLimitExceededError
 from app.models.order import OrderResponse
 from app.models.strategy import StrategySummary
@@ -90,6 +91,18 @@ class PortfolioRiskManager:
         # Track notified warnings to prevent spam (80% threshold)
         # Format: {account_id: {warning_type: last_notified_value}}
         self._warning_notified: Dict[str, Dict[str, float]] = {}
+        
+        # Memoized effective configs: {strategy_id: (account_config, strategy_config, effective_config)}
+        # Inputs are stored as copies and compared by value, so the merged config is reused
+        # while neither input changed (even if a caller mutates a config in place).
+        self._effective_configs: Dict[
+            str,
+            Tuple[
+                Optional[RiskManagementConfigResponse],
+                StrategyRiskConfigResponse,
+                Optional[RiskManagementConfigResponse],
+            ],
+        ] = {}
     
     def _safe_create_notification_task(self, coro):
         """Safely create a notification task, handling both real coroutines and mocks in tests.
@@ -398,6 +411,11 @@ class PortfolioRiskManager:
         
         Bug #2 Fix: Properly fetch balance from BinanceClient using async wrapper.
         """
+        # Stream-fed account snapshot: O(1), no REST call
+        snapshot = get_account_snapshot_store().get(account_id, user_id=self.user_id)
+        if snapshot is not None:
+            return snapshot.wallet_balance
+        
         if not self.strategy_runner:
             return None
         
@@ -1347,6 +1365,26 @@ class PortfolioRiskManager:
         if not strategy_config:
             return self.config
         
+        # Reuse the merged config while neither input changed (no rebuild per order)
+        memo = self._effective_configs.get(strategy_config.strategy_id)
+        if memo is not None:
+            memo_account_config, memo_strategy_config, memo_effective = memo
+            if memo_account_config == self.config and memo_strategy_config == strategy_config:
+                return memo_effective
+        
+        effective_config = self._build_effective_risk_config(strategy_config)
+        self._effective_configs[strategy_config.strategy_id] = (
+            self.config.model_copy() if self.config is not None else None,
+            strategy_config.model_copy(),
+            effective_config,
+        )
+        return effective_config
+    
+    def _build_effective_risk_config(
+        self,
+        strategy_config: StrategyRiskConfigResponse
+    ) -> Optional[RiskManagementConfigResponse]:
+        """Build the effective config for a strategy config (see get_effective_risk_config)."""
         # Convert strategy config to RiskManagementConfigResponse format
         strategy_config_conv = self._convert_strategy_to_risk_config(strategy_config)
         
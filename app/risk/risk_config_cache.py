@@ -0,0 +1,213 @@
+"""
+Process-wide cache of resolved risk configuration.
+
+The pre-trade risk path needs, for every order, the strategy UUID, the
+strategy-level risk config and the account-level risk config. These change
+only when a user edits them through the risk config endpoints, so they are
+cached here and invalidated by those endpoints instead of being re-queried
+on every order.
+
+Invalidation bumps a per-user generation number, and entries stored under an
+older generation are misses. When Redis is enabled the generations live in
+Redis, so a config edited through one API worker also takes effect in the
+worker running the user's strategies (the same scheme as the report cache).
+
+Entries also carry a long safety TTL so a missed invalidation (e.g. a config
+edited directly in the database) heals itself.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from loguru import logger
+
+from app.core.redis_storage import RedisStorage
+from app.models.risk_management import (
+    RiskManagementConfigResponse,
+    StrategyRiskConfigResponse,
+)
+
+
+@dataclass(frozen=True)
+class StrategyRiskContext:
+    """Risk lookups for one strategy needed by the pre-trade check."""
+    strategy_uuid: Optional[UUID]
+    strategy_config: Optional[StrategyRiskConfigResponse]  # None = no enabled strategy config
+
+
+class RiskConfigCache:
+    """Cache of strategy risk contexts and account risk configs per user.
+
+    Keys:
+    - strategy context: (user_id, strategy_id)
+    - account config: (user_id, account_id)  # account_id normalized to lowercase
+
+    A cached ``None`` account config is a valid entry ("no config"), distinct
+    from a cache miss. Values are stored as ``(value, stored_at, generation)``.
+    """
+
+    def __init__(self, ttl_seconds: float = 600.0, redis: Optional[RedisStorage] = None):
+        """Initialize cache.
+
+        Args:
+            ttl_seconds: Safety TTL for entries (default: 10 minutes)
+            redis: Optional Redis storage holding generations shared by all processes
+        """
+        self.ttl_seconds = ttl_seconds
+        self.redis = redis if redis is not None and redis.enabled else None
+        self._strategy_contexts: Dict[Tuple[str, str], Tuple[StrategyRiskContext, float, int]] = {}
+        self._account_configs: Dict[
+            Tuple[str, str], Tuple[Optional[RiskManagementConfigResponse], float, int]
+        ] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _generation_key(user_id: str) -> str:
+        return f"binance_bot:risk_config_generation:{user_id}"
+
+    def generation(self, user_id: Any) -> int:
+        """Current generation of a user's risk configs.
+
+        Read it before loading a config from the database and pass it to the
+        ``set_*`` method, so a config loaded while another worker changed it is
+        stored as already stale.
+        """
+        user_id = str(user_id)
+        if self.redis is not None:
+            raw = self.redis.get(self._generation_key(user_id))
+            if raw is not None:
+                return int(raw)
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def _bump_generation(self, user_id: Any) -> None:
+        user_id = str(user_id)
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+        if self.redis is not None:
+            try:
+                self.redis._client.incr(self._generation_key(user_id))
+            except Exception as exc:
+                logger.warning(f"Failed to bump risk config generation of user {user_id} in Redis: {exc}")
+
+    @staticmethod
+    def _strategy_key(user_id: Any, strategy_id: str) -> Tuple[str, str]:
+        return str(user_id), str(strategy_id)
+
+    @staticmethod
+    def _account_key(user_id: Any, account_id: Optional[str]) -> Tuple[str, str]:
+        return str(user_id), (account_id or "default").strip().lower()
+
+    def _is_fresh(self, stored_at: float, stored_generation: int, generation: int) -> bool:
+        return stored_generation == generation and time.monotonic() - stored_at <= self.ttl_seconds
+
+    # Strategy contexts -------------------------------------------------------
+
+    def get_strategy_context(self, user_id: Any, strategy_id: str) -> Optional[StrategyRiskContext]:
+        """Return cached context, or None on miss/expiry/invalidation."""
+        key = self._strategy_key(user_id, strategy_id)
+        generation = self.generation(user_id)
+        with self._lock:
+            entry = self._strategy_contexts.get(key)
+            if entry is None:
+                return None
+            context, stored_at, stored_generation = entry
+            if not self._is_fresh(stored_at, stored_generation, generation):
+                del self._strategy_contexts[key]
+                return None
+            return context
+
+    def set_strategy_context(
+        self,
+        user_id: Any,
+        strategy_id: str,
+        context: StrategyRiskContext,
+        generation: Optional[int] = None,
+    ) -> None:
+        if generation is None:
+            generation = self.generation(user_id)
+        with self._lock:
+            self._strategy_contexts[self._strategy_key(user_id, strategy_id)] = (
+                context, time.monotonic(), generation,
+            )
+
+    def invalidate_strategy(self, user_id: Any, strategy_id: str) -> None:
+        """Drop the cached context for one strategy (config created/updated/deleted) in every process."""
+        with self._lock:
+            self._strategy_contexts.pop(self._strategy_key(user_id, strategy_id), None)
+        self._bump_generation(user_id)
+
+    # Account configs ---------------------------------------------------------
+
+    def get_account_config(
+        self, user_id: Any, account_id: Optional[str]
+    ) -> Tuple[bool, Optional[RiskManagementConfigResponse]]:
+        """Return ``(hit, config)``; ``config`` may be None on a hit (no config exists)."""
+        key = self._account_key(user_id, account_id)
+        generation = self.generation(user_id)
+        with self._lock:
+            entry = self._account_configs.get(key)
+            if entry is None:
+                return False, None
+            config, stored_at, stored_generation = entry
+            if not self._is_fresh(stored_at, stored_generation, generation):
+                del self._account_configs[key]
+                return False, None
+            return True, config
+
+    def set_account_config(
+        self,
+        user_id: Any,
+        account_id: Optional[str],
+        config: Optional[RiskManagementConfigResponse],
+        generation: Optional[int] = None,
+    ) -> None:
+        if generation is None:
+            generation = self.generation(user_id)
+        with self._lock:
+            self._account_configs[self._account_key(user_id, account_id)] = (
+                config, time.monotonic(), generation,
+            )
+
+    def invalidate_account(self, user_id: Any, account_id: Optional[str] = None) -> None:
+        """Drop cached account config (None = all accounts of the user) in every process."""
+        with self._lock:
+            if account_id:
+                self._account_configs.pop(self._account_key(user_id, account_id), None)
+            else:
+                user_key = str(user_id)
+                for key in [k for k in self._account_configs if k[0] == user_key]:
+                    del self._account_configs[key]
+        self._bump_generation(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._strategy_contexts.clear()
+            self._account_configs.clear()
+            self._generations.clear()
+
+
+_risk_config_cache: Optional[RiskConfigCache] = None
+_init_lock = threading.Lock()
+
+
+def get_risk_config_cache() -> RiskConfigCache:
+    """Return the process-wide risk config cache (generations in Redis when enabled)."""
+    global _risk_config_cache
+    if _risk_config_cache is None:
+        with _init_lock:
+            if _risk_config_cache is None:
+                from app.core.config import get_settings
+
+                settings = get_settings()
+                redis = None
+                if settings.redis_enabled:
+                    redis = RedisStorage(redis_url=settings.redis_url, enabled=True)
+                _risk_config_cache = RiskConfigCache(redis=redis)
+    return _risk_config_cache
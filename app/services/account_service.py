@@ -165,7 +165,34 @@ class AccountService(BaseCacheService):
         self._save_to_cache(key, metadata)
         
         return config
-    
+
+    async def async_get_account(
+        self,
+        user_id: UUID,
+        account_id: str,
+        decrypt_func: Optional[callable] = None
+    ) -> Optional[BinanceAccountConfig]:
+        """Get account (async).
+
+        Only metadata is cached in Redis (never API keys), so the account is
+        always read from the database; the metadata cache is refreshed.
+        """
+        if not self._is_async:
+            raise RuntimeError("Use get_account() with Session")
+        db_account = await self.db_service.async_get_account_by_id(user_id, account_id)
+        if not db_account:
+            return None
+
+        config = self._db_account_to_config(db_account, decrypt_func)
+        await self._async_save_to_cache(self._redis_key(user_id, account_id), {
+            "account_id": config.account_id,
+            "name": config.name,
+            "testnet": config.testnet,
+            "is_active": db_account.is_active,
+            "is_default": db_account.is_default,
+        })
+        return config
+
     def list_accounts(
         self,
         user_id: UUID,
@@ -401,7 +428,7 @@ class AccountService(BaseCacheService):
         # Invalidate cache
         key = self._redis_key(user_id, account_id)
         list_key = self._redis_list_key(user_id)
-        self._invalidate_cache(key, list_key)
+        await self._async_invalidate_cache(key, list_key)
         
         return config
     
@@ -417,7 +444,7 @@ class AccountService(BaseCacheService):
             # Delete from cache
             key = self._redis_key(user_id, account_id)
             list_key = self._redis_list_key(user_id)
-            self._invalidate_cache(key, list_key)
+            await self._async_invalidate_cache(key, list_key)
         
         return success
 
@@ -0,0 +1,198 @@
+"""
+Walk-forward and sensitivity analysis runs, in the API process or in job workers.
+
+The API starts an analysis either as a background task of its own event loop
+(default) or, with ``JOB_QUEUE_ENABLED``, as a job in the Redis queue that a
+job worker (``python -m app.job_worker``) picks up. Both paths run the same
+``execute_*`` functions and report through the walk-forward task manager.
+"""
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict
+from uuid import UUID
+
+from fastapi import HTTPException
+from loguru import logger
+
+from app.core.job_queue import Job, get_job_queue
+from app.services.sensitivity_analysis import SensitivityAnalysisRequest, run_sensitivity_analysis
+from app.services.walk_forward import WalkForwardRequest, run_walk_forward_analysis
+from app.services.walk_forward_task_manager import get_task_manager
+
+if TYPE_CHECKING:
+    from app.core.my_binance_client import BinanceClient
+
+# Sensitivity analyses are much shorter than walk-forward runs, so they go first
+JOB_PRIORITIES = {"sensitivity": 1, "walk_forward": 0}
+
+
+def _result_dict(result: Any) -> Any:
+    if hasattr(result, 'model_dump'):
+        return result.model_dump()
+    if hasattr(result, 'dict'):
+        return result.dict()
+    return result
+
+
+async def execute_walk_forward(
+    task_id: str,
+    user_id: UUID,
+    request: WalkForwardRequest,
+    client: "BinanceClient",
+) -> None:
+    """Run a walk-forward analysis task, store its result and save it to the database.
+
+    Raises:
+        HTTPException: status 499 if the task was cancelled
+        Exception: If the analysis fails (the task is not marked failed here)
+    """
+    from app.core.database import get_async_session_factory
+    from app.services.database_service import DatabaseService
+
+    task_manager = get_task_manager()
+    start_time = time.time()
+    result = await run_walk_forward_analysis(request, client, task_id=task_id)
+    execution_time_ms = int((time.time() - start_time) * 1000)
+
+    try:
+        result_dict = _result_dict(result)
+        if isinstance(result_dict, dict) and 'equity_curve' in result_dict:
+            logger.info(f"Storing result with equity_curve containing {len(result_dict.get('equity_curve', []))} points")
+        await task_manager.complete_task(task_id, result=result_dict)
+    except Exception as serialize_error:
+        logger.error(f"Error serializing result: {serialize_error}", exc_info=True)
+        await task_manager.fail_task(task_id, f"Failed to serialize result: {str(serialize_error)}")
+        return
+
+    # Auto-save to database after successful completion
+    try:
+        async_session_factory = await get_async_session_factory()
+        async with async_session_factory() as db:
+            # Rough estimate: each window processes training + test period candles (assuming 1m candles)
+            candles_processed = 0
+            if hasattr(result, 'windows') and result.windows:
+                candles_processed = len(result.windows) * (
+                    request.training_period_days * 24 * 60 + request.test_period_days * 24 * 60
+                )
+            analysis_id = await DatabaseService(db).save_walk_forward_analysis(
+                user_id=user_id,
+                result=result,
+                request=request,
+                execution_time_ms=execution_time_ms,
+                candles_processed=candles_processed,
+                name=request.name,
+                keep_details=True
+            )
+            logger.info(f"✅ Saved walk-forward analysis {analysis_id} to database for user {user_id}")
+    except Exception as save_error:
+        # Don't fail the analysis - just log the error
+        logger.error(f"❌ Failed to save walk-forward analysis to database: {save_error}", exc_info=True)
+
+
+async def execute_sensitivity(
+    task_id: str,
+    user_id: UUID,
+    request: SensitivityAnalysisRequest,
+    client: "BinanceClient",
+) -> None:
+    """Run a sensitivity analysis task, store its result and save it to the database.
+
+    Raises:
+        HTTPException: status 499 if the task was cancelled
+        Exception: If the analysis fails (the task is not marked failed here)
+    """
+    from app.core.database import get_async_session_factory
+    from app.services.database_service import DatabaseService
+
+    task_manager = get_task_manager()
+    start_time = time.time()
+    await task_manager.update_progress(
+        task_id,
+        current_phase="initializing",
+        message="Starting sensitivity analysis..."
+    )
+
+    async def update_progress_callback(current_window, total_windows, current_phase, message, phase_progress):
+        # Note: total_windows is set at task creation, not in update_progress
+        await task_manager.update_progress(
+            task_id,
+            current_window=current_window,
+            current_phase=current_phase,
+            message=message,
+            phase_progress=phase_progress
+        )
+
+    result = await run_sensitivity_analysis(
+        request,
+        client,
+        task_id=task_id,
+        progress_callback=update_progress_callback
+    )
+    execution_time_ms = int((time.time() - start_time) * 1000)
+
+    try:
+        await task_manager.complete_task(task_id, _result_dict(result))
+        logger.info(f"✅ Sensitivity analysis {task_id} completed in {execution_time_ms}ms")
+    except Exception as serialize_error:
+        logger.error(f"Error serializing result: {serialize_error}", exc_info=True)
+        await task_manager.fail_task(task_id, f"Failed to serialize result: {str(serialize_error)}")
+        return
+
+    try:
+        async_session_factory = await get_async_session_factory()
+        async with async_session_factory() as db:
+            analysis_id = await DatabaseService(db).save_sensitivity_analysis(
+                user_id=user_id,
+                result=result,
+                request=request,
+                name=request.name
+            )
+            logger.info(f"✅ Saved sensitivity analysis {analysis_id} to database for user {user_id}")
+    except Exception as save_error:
+        # Don't fail the analysis - just log the error
+        logger.error(f"❌ Failed to save sensitivity analysis to database: {save_error}", exc_info=True)
+
+
+async def run_in_process(task_id: str, execution: Awaitable[None]) -> None:
+    """Background task of the API process: run an analysis and record how it ended."""
+    task_manager = get_task_manager()
+    try:
+        await execution
+    except HTTPException as e:
+        if e.status_code == 499:  # Cancelled
+            await task_manager.cancel_task(task_id)
+        else:
+            await task_manager.fail_task(task_id, str(e.detail))
+    except Exception as e:
+        logger.error(f"Error in analysis task {task_id}: {e}", exc_info=True)
+        await task_manager.fail_task(task_id, str(e))
+
+
+def enqueue_analysis(kind: str, task_id: str, user_id: UUID, request: Any) -> Job:
+    """Queue an analysis for the job workers under its task id."""
+    from app.core.config import get_settings
+
+    return get_job_queue().enqueue(
+        kind,
+        str(user_id),
+        {"request": request.model_dump(mode="json")},
+        priority=JOB_PRIORITIES.get(kind, 0),
+        max_attempts=get_settings().job_max_attempts,
+        job_id=task_id,
+    )
+
+
+async def _walk_forward_job(job: Job, client: "BinanceClient") -> None:
+    await execute_walk_forward(job.id, UUID(job.user_id), WalkForwardRequest(**job.payload["request"]), client)
+
+
+async def _sensitivity_job(job: Job, client: "BinanceClient") -> None:
+    await execute_sensitivity(job.id, UUID(job.user_id), SensitivityAnalysisRequest(**job.payload["request"]), client)
+
+
+# Handlers of the job worker by job kind
+JOB_HANDLERS: Dict[str, Callable[[Job, "BinanceClient"], Awaitable[None]]] = {
+    "walk_forward": _walk_forward_job,
+    "sensitivity": _sensitivity_job,
+}
@@ -11,6 +11,7 @@ from uuid import UUID
 
 from loguru import logger
 
+from app.core.job_queue import is_transient_error
 from app.services.auto_tuning_service import AutoTuningService
 
 
@@ -128,60 +129,61 @@ class AutoTuningTaskManager:
         retry_delays = [60, 300, 900]  # 1 min, 5 min, 15 min (exponential backoff)
         last_error = None
         
-        for attempt in range(max_retries):
-            try:
-                if attempt > 0:
-                    wait_time = retry_delays[min(attempt - 1, len(retry_delays) - 1)]
-                    logger.info(
-                        f"Retrying tuning for strategy {strategy_uuid} "
-                        f"(attempt {attempt + 1}/{max_retries}) after {wait_time}s delay"
-                    )
-                    await asyncio.sleep(wait_time)
-                else:
-                    logger.info(f"Starting tuning for strategy {strategy_uuid}")
-                
-                # Run tuning logic
-                result = await self.auto_tuning_service.tune_strategy(str(strategy_uuid))
-                
-                logger.info(f"Tuning completed for strategy {strategy_uuid}: {result.get('status')}")
-                return result
-                
-            except asyncio.CancelledError:
-                # Don't retry on cancellation
-                logger.info(f"Tuning cancelled for strategy {strategy_uuid}")
-                raise
-            except Exception as e:
-                last_error = str(e)
-                error_type = type(e).__name__
-                
-                # Log error with attempt information
-                logger.error(
-                    f"Tuning failed for strategy {strategy_uuid} "
-                    f"(attempt {attempt + 1}/{max_retries}): {error_type}: {e}",
-                    exc_info=True
-                )
-                
-                # Store error in database for debugging
-                await self.auto_tuning_service._log_tuning_failure(
-                    strategy_uuid,
-                    reason=f"execution_error_attempt_{attempt + 1}",
-                    message=f"{error_type}: {last_error}"
-                )
-                
-                # Check if this is a transient error that should be retried
-                is_transient = self._is_transient_error(e)
-                
-                if attempt < max_retries - 1 and is_transient:
-                    # Will retry on next iteration
-                    continue
-                else:
-                    # Final attempt failed or non-transient error
+        try:
+            for attempt in range(max_retries):
+                try:
+                    if attempt > 0:
+                        wait_time = retry_delays[min(attempt - 1, len(retry_delays) - 1)]
+                        logger.info(
+                            f"Retrying tuning for strategy {strategy_uuid} "
+                            f"(attempt {attempt + 1}/{max_retries}) after {wait_time}s delay"
+                        )
+                        await asyncio.sleep(wait_time)
+                    else:
+                        logger.info(f"Starting tuning for strategy {strategy_uuid}")
+                    
+                    # Run tuning logic
+                    result = await self.auto_tuning_service.tune_strategy(str(strategy_uuid))
+                    
+                    logger.info(f"Tuning completed for strategy {strategy_uuid}: {result.get('status')}")
+                    return result
+                    
+                except asyncio.CancelledError:
+                    # Don't retry on cancellation
+                    logger.info(f"Tuning cancelled for strategy {strategy_uuid}")
+                    raise
+                except Exception as e:
+                    last_error = str(e)
+                    error_type = type(e).__name__
+                    
+                    # Log error with attempt information
                     logger.error(
-                        f"Tuning failed permanently for strategy {strategy_uuid} "
-                        f"after {attempt + 1} attempts. Last error: {last_error}"
+                        f"Tuning failed for strategy {strategy_uuid} "
+                        f"(attempt {attempt + 1}/{max_retries}): {error_type}: {e}",
+                        exc_info=True
                     )
-                    raise
-            
+                    
+                    # Store error in database for debugging
+                    await self.auto_tuning_service._log_tuning_failure(
+                        strategy_uuid,
+                        reason=f"execution_error_attempt_{attempt + 1}",
+                        message=f"{error_type}: {last_error}"
+                    )
+                    
+                    # Check if this is a transient error that should be retried
+                    is_transient = self._is_transient_error(e)
+                    
+                    if attempt < max_retries - 1 and is_transient:
+                        # Will retry on next iteration
+                        continue
+                    else:
+                        # Final attempt failed or non-transient error
+                        logger.error(
+                            f"Tuning failed permanently for strategy {strategy_uuid} "
+                            f"after {attempt + 1} attempts. Last error: {last_error}"
+                        )
+                        raise
+                
         finally:
             # Always cleanup task entry
             async with self._lock:
@@ -198,34 +200,7 @@ class AutoTuningTaskManager:
         Returns:
             True if error is transient, False otherwise
         """
-        transient_errors = (
-            ConnectionError,
-            TimeoutError,
-            asyncio.TimeoutError,
-            OSError,  # Network errors
-        )
-        
-        # Check exception type
-        if isinstance(error, transient_errors):
-            return True
-        
-        # Check error message for common transient issues
-        error_msg = str(error).lower()
-        transient_keywords = [
-            "connection",
-            "timeout",
-            "network",
-            "temporary",
-            "retry",
-            "rate limit",
-            "too many requests",
-            "service unavailable",
-            "502",
-            "503",
-            "504"
-        ]
-        
-        return any(keyword in error_msg for keyword in transient_keywords)
+        return is_transient_error(error)
     
     async def _monitor_strategy(self, strategy_uuid: UUID) -> None:
         """Monitor strategy and enqueue tuning requests with improved error handling.
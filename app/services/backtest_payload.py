@@ -0,0 +1,189 @@
+"""
+Compact chart payloads for backtest responses.
+
+A 30-day 1m backtest returns ~43k klines and, for range mean reversion, nine
+indicator series of ``{"time", "value"}`` objects per candle. Two opt-in
+reductions for ``POST /backtesting/run``:
+
+- ``max_points``: downsample chart data server-side. Klines are merged into
+  OHLCV buckets (high/low extremes are kept), indicator lines are reduced
+  with LTTB (Largest-Triangle-Three-Buckets), and TP/SL step levels keep only
+  the points where they change. Candles containing a trade entry or exit stay
+  unmerged so trade markers still land on a bar.
+- ``format=columnar``: klines and indicator series as parallel arrays
+  (``{"time": [...], "value": [...]}``) instead of one object per point.
+
+Trades and statistics are never reduced.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional, Sequence
+
+from app.api.routes.backtesting import BacktestResult
+
+COLUMNAR_FORMAT_VERSION = 1
+KLINE_COLUMNS = ("time", "open", "high", "low", "close", "volume")
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> list[int]:
+    """Indices of the points LTTB keeps to draw ``(xs, ys)`` with ``threshold`` points.
+
+    First and last points are always kept.
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    bucket_size = (n - 2) / (threshold - 2)
+    kept = [0]
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third vertex of the triangle
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / count
+        avg_y = sum(ys[next_start:next_end]) / count
+
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = xs[a], ys[a]
+        best_area = -1.0
+        best = start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+        kept.append(best)
+        a = best
+    kept.append(n - 1)
+    return kept
+
+
+def downsample_points(points: list[dict], max_points: int) -> list[dict]:
+    """LTTB-reduce a ``[{"time", "value"}, ...]`` line series to at most ``max_points``."""
+    if len(points) <= max_points:
+        return points
+    xs = [p["time"] for p in points]
+    ys = [p["value"] for p in points]
+    return [points[i] for i in lttb_indices(xs, ys, max_points)]
+
+
+def downsample_levels(levels: list[dict]) -> list[dict]:
+    """Keep the first and last point of every run of identical TP/SL levels (lossless for step lines)."""
+    if len(levels) <= 2:
+        return levels
+
+    def level(entry: dict) -> tuple:
+        return tuple(v for k, v in entry.items() if k != "time")
+
+    kept = [levels[0]]
+    for previous, current, following in zip(levels, levels[1:], levels[2:]):
+        if level(current) != level(previous) or level(current) != level(following):
+            kept.append(current)
+    kept.append(levels[-1])
+    return kept
+
+
+def downsample_klines(klines: list[list], max_points: int, keep_times_ms: Iterable[int] = ()) -> list[list]:
+    """Merge ``[time, open, high, low, close, volume]`` klines into about ``max_points`` OHLCV bars.
+
+    Candles containing one of ``keep_times_ms`` are kept as their own bar.
+    """
+    n = len(klines)
+    if n <= max_points:
+        return klines
+    size = math.ceil(n / max_points)
+    boundaries = set(range(0, n, size))
+    times = [int(k[0]) for k in klines]
+    for t in keep_times_ms:
+        i = bisect_right(times, t) - 1
+        if 0 <= i < n:
+            boundaries.update((i, i + 1))
+    starts = sorted(b for b in boundaries if b < n)
+
+    bars = []
+    for start, end in zip(starts, starts[1:] + [n]):
+        bucket = klines[start:end]
+        bars.append([
+            bucket[0][0],
+            bucket[0][1],
+            max(k[2] for k in bucket),
+            min(k[3] for k in bucket),
+            bucket[-1][4],
+            sum(k[5] for k in bucket),
+        ])
+    return bars
+
+
+def _to_ms(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1000)
+    return int(value)
+
+
+def trade_times_ms(trades: list[dict]) -> list[int]:
+    """Entry and exit times of all trades in epoch milliseconds."""
+    times = []
+    for trade in trades:
+        for key in ("entry_time", "exit_time"):
+            t = _to_ms(trade.get(key))
+            if t is not None:
+                times.append(t)
+    return times
+
+
+def downsample_backtest_result(result: BacktestResult, max_points: int) -> BacktestResult:
+    """Copy of ``result`` with klines and indicator series reduced to about ``max_points`` each."""
+    klines = result.klines
+    if klines is not None:
+        klines = downsample_klines(klines, max_points, trade_times_ms(result.trades))
+
+    indicators = result.indicators
+    if indicators is not None:
+        indicators = dict(indicators)
+        for name, series in indicators.items():
+            if not isinstance(series, list) or not series or not isinstance(series[0], dict):
+                continue
+            if set(series[0]) == {"time", "value"}:
+                indicators[name] = downsample_points(series, max_points)
+            else:
+                indicators[name] = downsample_levels(series)
+
+    return result.model_copy(update={"klines": klines, "indicators": indicators})
+
+
+def _columns(rows: list[dict]) -> dict[str, list]:
+    keys = list(rows[0]) if rows else ["time", "value"]
+    return {key: [row.get(key) for row in rows] for key in keys}
+
+
+def columnar_backtest_payload(result: BacktestResult) -> dict:
+    """Backtest result as JSON-ready dict with klines and indicator series as parallel arrays."""
+    payload = result.model_dump(mode="json", exclude={"klines", "indicators"})
+    payload["format"] = "columnar"
+    payload["format_version"] = COLUMNAR_FORMAT_VERSION
+
+    payload["klines"] = None
+    if result.klines is not None:
+        payload["klines"] = {
+            column: [k[i] for k in result.klines] for i, column in enumerate(KLINE_COLUMNS)
+        }
+
+    payload["indicators"] = None
+    if result.indicators is not None:
+        payload["indicators"] = {
+            name: _columns(series) if isinstance(series, list) else series
+            for name, series in result.indicators.items()
+        }
+    return payload
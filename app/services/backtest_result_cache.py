@@ -0,0 +1,326 @@
+"""
+Content-addressed cache of backtest results.
+
+A backtest is a pure function of its request and the klines it simulates
+over, so results are keyed by a hash of both:
+
+- the normalized ``BacktestRequest`` (UTC times, sorted params) and the
+  effective kline interval
+- a fingerprint of the kline data (open time + OHLCV of every candle)
+- a fingerprint of the simulation code (the backtest route, strategies, risk
+  and backtest utility modules), so results persisted in Redis or on disk by
+  an older deploy are not served after the simulation changed
+
+Grid search, sensitivity analysis, auto-tuning, overlapping walk-forward
+windows and repeated UI runs hitting the same key get the stored result
+instead of re-simulating. Because the key covers the data and the code,
+entries never go stale; they only need to be evicted for space.
+
+Tiers, checked in order:
+- memory: LRU bounded by the serialized size of the results
+- Redis (when enabled): shared across workers, expires by TTL
+- disk (when ``BACKTEST_CACHE_DIR`` is set): LRU by file mtime, bounded by total size
+
+Results are stored as JSON and validated into a fresh model on every hit, so
+callers can mutate what they get back.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Type, TypeVar
+
+from loguru import logger
+from pydantic import BaseModel
+
+from app.core.redis_storage import RedisStorage
+
+M = TypeVar("M", bound=BaseModel)
+
+# Bump when results change without a change to the sources below (e.g. a
+# dependency upgrade); source changes are picked up by simulation_fingerprint()
+CACHE_VERSION = 1
+
+# Modules the simulation runs, relative to the app package
+_SIMULATION_SOURCES = (
+    "api/routes/backtesting.py",
+    "strategies",
+    "risk",
+    "utils/backtest_params.py",
+    "utils/kline_series.py",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def simulation_fingerprint() -> str:
+    """Hash of the simulation source files (computed once per process)."""
+    app_root = Path(__file__).resolve().parents[1]
+    digest = hashlib.blake2b(digest_size=16)
+    for relative in _SIMULATION_SOURCES:
+        path = app_root / relative
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for file in files:
+            try:
+                source = file.read_bytes()
+            except OSError:
+                continue
+            digest.update(file.relative_to(app_root).as_posix().encode())
+            digest.update(source)
+    return digest.hexdigest()
+
+
+def kline_fingerprint(klines: Sequence[list]) -> str:
+    """Hash of open time, OHLCV and close time of every kline."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([k[:7] for k in klines], separators=(",", ":"), default=str).encode())
+    return f"{len(klines)}-{digest.hexdigest()}"
+
+
+def backtest_cache_key(request: BaseModel, interval: str, klines: Sequence[list]) -> str:
+    """Stable key for a backtest of ``request`` at ``interval`` over ``klines``."""
+    normalized = json.dumps(
+        {
+            "v": CACHE_VERSION,
+            "code": simulation_fingerprint(),
+            "request": request.model_dump(mode="json"),
+            "interval": interval,
+            "klines": kline_fingerprint(klines),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class _MemoryTier:
+    """LRU of serialized results bounded by total size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key: str, payload: str) -> None:
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = payload
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _RedisTier:
+    """Results shared through Redis; expiry by TTL (and the server's maxmemory policy)."""
+
+    def __init__(self, redis: RedisStorage, ttl_seconds: int):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(key: str) -> str:
+        return f"binance_bot:backtest_result:{key}"
+
+    def get(self, key: str) -> Optional[str]:
+        return self.redis.get(self._key(key))
+
+    def put(self, key: str, payload: str) -> None:
+        self.redis.set(self._key(key), payload, ex=self.ttl_seconds)
+
+
+class _DiskTier:
+    """One JSON file per result; least recently used files are removed above ``max_bytes``."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None  # total bytes on disk, scanned lazily
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            payload = path.read_text(encoding="utf-8")
+            os.utime(path)  # mtime doubles as last access for eviction
+            return payload
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logger.debug(f"Backtest cache read {path} failed: {exc}")
+            return None
+
+    def put(self, key: str, payload: str) -> None:
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        path = self._path(key)
+        with self._lock:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                if self._size is None:
+                    self._size = sum(p.stat().st_size for p in self.directory.glob("*.json"))
+                existed = path.stat().st_size if path.exists() else 0
+                tmp = path.with_suffix(".tmp")
+                tmp.write_text(payload, encoding="utf-8")
+                os.replace(tmp, path)
+                self._size += size - existed
+                if self._size > self.max_bytes:
+                    self._evict()
+            except OSError as exc:
+                logger.debug(f"Backtest cache write {path} failed: {exc}")
+
+    def _evict(self) -> None:
+        files = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in files)
+        for path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                size = path.stat().st_size
+                path.unlink()
+                total -= size
+            except OSError:
+                continue
+        self._size = total
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.directory.glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._size = 0
+
+
+class BacktestResultCache:
+    """Tiered cache of backtest results by content key (see ``backtest_cache_key``)."""
+
+    def __init__(
+        self,
+        memory_max_bytes: int = 64 * 1024 * 1024,
+        redis: Optional[RedisStorage] = None,
+        redis_ttl_seconds: int = 86400,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """Initialize cache.
+
+        Args:
+            memory_max_bytes: Size budget of the in-process tier
+            redis: Optional Redis storage for a shared tier (used when enabled)
+            redis_ttl_seconds: TTL of Redis entries (0 disables the Redis tier)
+            disk_dir: Optional directory for an on-disk tier
+            disk_max_bytes: Size budget of the on-disk tier
+        """
+        self.memory = _MemoryTier(memory_max_bytes)
+        self._lower_tiers: List[Any] = []
+        if redis is not None and redis.enabled and redis_ttl_seconds > 0:
+            self._lower_tiers.append(_RedisTier(redis, redis_ttl_seconds))
+        if disk_dir:
+            self._lower_tiers.append(_DiskTier(disk_dir, disk_max_bytes))
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, model: Type[M]) -> Optional[M]:
+        """Return a fresh ``model`` instance for ``key``, or None on miss."""
+        payload = self.memory.get(key)
+        if payload is None:
+            for tier in self._lower_tiers:
+                payload = tier.get(key)
+                if payload is not None:
+                    self.memory.put(key, payload)
+                    break
+        if payload is None:
+            self.misses += 1
+            return None
+        try:
+            result = model.model_validate_json(payload)
+        except ValueError as exc:
+            # Written by an incompatible version of the model; recompute
+            logger.debug(f"Discarding unreadable backtest cache entry {key[:12]}: {exc}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: BaseModel) -> None:
+        payload = result.model_dump_json()
+        self.memory.put(key, payload)
+        for tier in self._lower_tiers:
+            tier.put(key, payload)
+
+    def clear(self) -> None:
+        """Drop in-process and on-disk entries (Redis entries expire by TTL)."""
+        self.memory.clear()
+        for tier in self._lower_tiers:
+            if isinstance(tier, _DiskTier):
+                tier.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_backtest_result_cache: Optional[BacktestResultCache] = None
+_init_lock = threading.Lock()
+
+
+def get_backtest_result_cache() -> Optional[BacktestResultCache]:
+    """Return the process-wide backtest result cache (None when disabled in settings)."""
+    global _backtest_result_cache
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    if not settings.backtest_cache_enabled:
+        return None
+    if _backtest_result_cache is None:
+        with _init_lock:
+            if _backtest_result_cache is None:
+                redis = None
+                if settings.redis_enabled and settings.backtest_cache_redis_ttl_seconds > 0:
+                    redis = RedisStorage(redis_url=settings.redis_url, enabled=True)
+                _backtest_result_cache = BacktestResultCache(
+                    memory_max_bytes=settings.backtest_cache_memory_mb * 1024 * 1024,
+                    redis=redis,
+                    redis_ttl_seconds=settings.backtest_cache_redis_ttl_seconds,
+                    disk_dir=settings.backtest_cache_dir,
+                    disk_max_bytes=settings.backtest_cache_disk_mb * 1024 * 1024,
+                )
+    return _backtest_result_cache
+
+
+def reset_backtest_result_cache() -> None:
+    """Drop the process-wide cache (tests, settings changes)."""
+    global _backtest_result_cache
+    with _init_lock:
+        _backtest_result_cache = None
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 from typing import Optional
 from app.core.my_binance_client import BinanceClient
+from app.strategies.indicator_cache import IndicatorSeriesCache
 
 # Re-export models and functions from API routes
 # TODO: Move these to a shared models file or keep in service
@@ -42,18 +43,20 @@ class BacktestService:
     async def run_backtest(
         self,
         request: BacktestRequest,
-        pre_fetched_klines: Optional[list[list]] = None
+        pre_fetched_klines: Optional[list[list]] = None,
+        indicator_cache: Optional[IndicatorSeriesCache] = None
     ) -> BacktestResult:
         """Run backtesting on historical data.
         
         Args:
             request: Backtest request with parameters
             pre_fetched_klines: Optional pre-fetched klines to use instead of fetching
+            indicator_cache: Optional indicator cache over ``pre_fetched_klines`` shared across a sweep
         
         Returns:
             BacktestResult with statistics and trades
         """
-        return await _run_backtest_impl(request, self.client, pre_fetched_klines)
+        return await _run_backtest_impl(request, self.client, pre_fetched_klines, indicator_cache)
 
 
 # Re-export helper functions for backward compatibility
@@ -105,7 +108,8 @@ def slice_klines_by_time_range(
 async def run_backtest(
     request: BacktestRequest,
     client: BinanceClient,
-    pre_fetched_klines: Optional[list[list]] = None
+    pre_fetched_klines: Optional[list[list]] = None,
+    indicator_cache: Optional[IndicatorSeriesCache] = None
 ) -> BacktestResult:
     """Run backtesting on historical data (convenience function).
     
@@ -116,12 +120,13 @@ async def run_backtest(
         request: Backtest request with parameters
         client: BinanceClient instance
         pre_fetched_klines: Optional pre-fetched klines to use instead of fetching
+        indicator_cache: Optional indicator cache over ``pre_fetched_klines`` shared across a sweep
     
     Returns:
         BacktestResult with statistics and trades
     """
     service = BacktestService(client)
-    return await service.run_backtest(request, pre_fetched_klines)
+    return await service.run_backtest(request, pre_fetched_klines, indicator_cache)
 
 
 
@@ -4,8 +4,7 @@ Provides common caching functionality for StrategyService, AccountService, and T
 """
 from __future__ import annotations
 
-import json
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -66,9 +65,9 @@ class BaseCacheService:
             return None
         
         try:
-            cached = self.redis._client.get(key) if self.redis._client else None
+            cached = self.redis.get_value(key)
             if cached:
-                return json.loads(cached)
+                return cached
         except Exception as e:
             logger.warning(f"Redis cache read error for key {key}: {e}")
         
@@ -79,18 +78,13 @@ class BaseCacheService:
         
         Args:
             key: Redis key
-            data: Data to cache (will be JSON serialized)
+            data: Data to cache (encoded with the Redis value codec)
         """
         if not self.redis or not self.redis.enabled:
             return
         
         try:
-            if self.redis._client:
-                self.redis._client.setex(
-                    key,
-                    self._cache_ttl,
-                    json.dumps(data, default=str)
-                )
+            self.redis.set_value(key, data, ex=self._cache_ttl)
         except Exception as e:
             logger.warning(f"Redis cache write error for key {key}: {e}")
     
@@ -111,4 +105,92 @@ class BaseCacheService:
                 self.redis._client.delete(*keys)
         except Exception as e:
             logger.warning(f"Redis cache delete error for keys {keys}: {e}")
-
+    
+    # Async variants for services running on the event loop (AsyncSession):
+    # they use the pooled asyncio client so cache round trips never block the loop.
+    
+    async def _async_get_from_cache(self, key: str) -> Optional[dict]:
+        """Get data from Redis cache (async).
+        
+        Args:
+            key: Redis key
+        
+        Returns:
+            Cached data as dict if found, None otherwise
+        """
+        if not self.redis or not self.redis.enabled:
+            return None
+        
+        try:
+            cached = await self.redis.async_get_value(key)
+            if cached:
+                return cached
+        except Exception as e:
+            logger.warning(f"Redis cache read error for key {key}: {e}")
+        
+        return None
+    
+    async def _async_get_many_from_cache(self, keys: list[str]) -> list[Optional[dict]]:
+        """Get many cached entries in one round trip (None for misses).
+        
+        Args:
+            keys: Redis keys
+        
+        Returns:
+            Cached data per key, in the order of ``keys``
+        """
+        if not self.redis or not self.redis.enabled or not keys:
+            return [None] * len(keys)
+        
+        return [cached or None for cached in await self.redis.async_mget_values(keys)]
+    
+    async def _async_save_to_cache(self, key: str, data: dict) -> None:
+        """Save data to Redis cache (async).
+        
+        Args:
+            key: Redis key
+            data: Data to cache (encoded with the Redis value codec)
+        """
+        if not self.redis or not self.redis.enabled:
+            return
+        
+        try:
+            await self.redis.async_set_value(key, data, ex=self._cache_ttl)
+        except Exception as e:
+            logger.warning(f"Redis cache write error for key {key}: {e}")
+    
+    async def _async_invalidate_cache(self, *keys: str) -> None:
+        """Invalidate one or more cache keys (async).
+        
+        Args:
+            *keys: One or more Redis keys to delete
+        """
+        if not self.redis or not self.redis.enabled or not keys:
+            return
+        
+        try:
+            await self.redis.async_delete(*keys)
+        except Exception as e:
+            logger.warning(f"Redis cache delete error for keys {keys}: {e}")
+    
+    async def _async_cache_aside(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[dict]]],
+    ) -> Optional[dict]:
+        """Cached data for ``key``, loading and caching it on a miss.
+        
+        Args:
+            key: Redis key
+            loader: Coroutine function returning the data to cache (None = nothing to cache)
+        
+        Returns:
+            Cached or freshly loaded data, None if the loader found nothing
+        """
+        cached = await self._async_get_from_cache(key)
+        if cached is not None:
+            return cached
+        data = await loader()
+        if data is not None:
+            await self._async_save_to_cache(key, data)
+        return data
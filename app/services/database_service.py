@@ -651,6 +651,13 @@ class DatabaseService:
             raise RuntimeError("Use async_get_account_by_uuid() with AsyncSession")
         return self.db.query(Account).filter(Account.id == account_uuid).first()
     
+    async def async_get_account_by_uuid(self, account_uuid: UUID) -> Optional[Account]:
+        """Get account by UUID (async)."""
+        if not self._is_async:
+            raise RuntimeError("Use get_account_by_uuid() with Session")
+        result = await self.db.execute(select(Account).filter(Account.id == account_uuid))
+        return result.scalars().first()
+    
     def update_strategy(
         self,
         user_id: UUID,
@@ -775,6 +782,46 @@ class DatabaseService:
             logger.info(f"Created strategy risk config for strategy {strategy_id}")
         return config
     
+    async def async_create_strategy_risk_config(
+        self,
+        user_id: UUID,
+        strategy_id: str,  # String ID (e.g., "strategy-1"), NOT UUID
+        **fields
+    ) -> StrategyRiskConfig:
+        """Create a new strategy risk configuration (async).
+        
+        Args:
+            user_id: User UUID
+            strategy_id: Strategy string ID (e.g., "strategy-1"), NOT UUID
+            **fields: Config fields, as accepted by create_strategy_risk_config()
+        
+        Returns:
+            Created StrategyRiskConfig, with its strategy relationship loaded
+        
+        Raises:
+            ValueError: If strategy_id not found
+        """
+        if not self._is_async:
+            raise RuntimeError("Use create_strategy_risk_config() with Session")
+        
+        # Get strategy to get UUID for foreign key
+        strategy = await self.async_get_strategy(user_id, strategy_id)
+        if not strategy:
+            raise ValueError(f"Strategy {strategy_id} not found for user {user_id}")
+        
+        config = StrategyRiskConfig(strategy_id=strategy.id, user_id=user_id, **fields)
+        self.db.add(config)
+        try:
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to create strategy risk config for {strategy_id}: {e}")
+            raise
+        await self.db.refresh(config)
+        await self.db.refresh(config, attribute_names=["strategy"])
+        logger.info(f"Created strategy risk config for strategy {strategy_id}")
+        return config
+    
     def get_strategy_risk_config(
         self,
         user_id: UUID,
@@ -1047,6 +1094,47 @@ class DatabaseService:
         owned = max(0.0, entry_val - exit_val)
         return (owned, entry_count > 0)
 
+    async def async_get_strategy_owned_quantity(
+        self,
+        strategy_uuid: UUID,
+        symbol: str,
+        position_instance_id: Optional[UUID],
+        position_side: str,
+    ) -> Tuple[float, bool]:
+        """Compute strategy-owned quantity from trade ledger (async version of get_strategy_owned_quantity).
+
+        Returns:
+            (owned_quantity, has_entry_trades). If position_instance_id is None or invalid position_side, returns (0.0, False).
+        """
+        if not self._is_async:
+            raise RuntimeError("Use get_strategy_owned_quantity() with Session")
+        if position_instance_id is None or position_side not in ("LONG", "SHORT"):
+            return (0.0, False)
+        entry_side = "BUY" if position_side == "LONG" else "SELL"
+        exit_side = "SELL" if position_side == "LONG" else "BUY"
+        filters = (
+            Trade.strategy_id == strategy_uuid,
+            Trade.symbol == symbol,
+            Trade.position_instance_id == position_instance_id,
+            Trade.position_side == position_side,
+            Trade.status.in_(["FILLED", "PARTIALLY_FILLED"]),
+        )
+        result = await self.db.execute(
+            select(
+                func.coalesce(func.sum(Trade.executed_qty).filter(Trade.side == entry_side), 0),
+                func.coalesce(func.sum(Trade.executed_qty).filter(Trade.side == exit_side), 0),
+                func.count(Trade.id).filter(Trade.side == entry_side),
+            ).filter(*filters)
+        )
+        entry_sum, exit_sum, entry_count = result.one()
+        try:
+            entry_val = float(entry_sum) if entry_sum is not None else 0.0
+            exit_val = float(exit_sum) if exit_sum is not None else 0.0
+        except (TypeError, ValueError):
+            entry_val = exit_val = 0.0
+        owned = max(0.0, entry_val - exit_val)
+        return (owned, (entry_count or 0) > 0)
+
     def get_strategy_entry_quantity(
         self,
         strategy_uuid: UUID,
@@ -1692,6 +1780,36 @@ class DatabaseService:
             pass
         return event
     
+    async def async_create_system_event(
+        self,
+        event_type: str,
+        event_level: str,
+        message: str,
+        strategy_id: Optional[UUID] = None,
+        account_id: Optional[UUID] = None,
+        event_metadata: Optional[dict] = None
+    ) -> SystemEvent:
+        """Create a system event (audit log entry) (async)."""
+        if not self._is_async:
+            raise RuntimeError("Use create_system_event() with Session")
+        event = SystemEvent(
+            event_type=event_type,
+            event_level=event_level,
+            message=message,
+            strategy_id=strategy_id,
+            account_id=account_id,
+            event_metadata=event_metadata or {}
+        )
+        self.db.add(event)
+        try:
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to create system event: {e}")
+            raise
+        await self.db.refresh(event)
+        return event
+    
     def get_enforcement_events(
         self,
         user_id: UUID,
@@ -1752,6 +1870,52 @@ class DatabaseService:
         
         return events, total
     
+    async def async_get_enforcement_events(
+        self,
+        user_id: UUID,
+        account_id: Optional[UUID] = None,
+        strategy_id: Optional[UUID] = None,
+        event_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> tuple[List[SystemEvent], int]:
+        """Get risk enforcement events with filters (async).
+        
+        Same filters as get_enforcement_events(); the user's strategies and
+        accounts are matched with subqueries instead of being loaded first.
+        """
+        if not self._is_async:
+            raise RuntimeError("Use get_enforcement_events() with Session")
+        
+        # Build query - filter by user's strategies and accounts
+        stmt = select(SystemEvent).filter(
+            (SystemEvent.strategy_id.in_(select(Strategy.id).filter(Strategy.user_id == user_id))) |
+            (SystemEvent.account_id.in_(select(Account.id).filter(Account.user_id == user_id, Account.is_active == True)))
+        )
+        
+        # Apply filters
+        if account_id:
+            stmt = stmt.filter(SystemEvent.account_id == account_id)
+        if strategy_id:
+            stmt = stmt.filter(SystemEvent.strategy_id == strategy_id)
+        if event_type:
+            stmt = stmt.filter(SystemEvent.event_type == event_type)
+        if start_date:
+            stmt = stmt.filter(SystemEvent.created_at >= start_date)
+        if end_date:
+            stmt = stmt.filter(SystemEvent.created_at <= end_date)
+        
+        # Get total count
+        total = (await self.db.execute(select(func.count()).select_from(stmt.subquery()))).scalar_one()
+        
+        # Get paginated results
+        result = await self.db.execute(
+            stmt.order_by(SystemEvent.created_at.desc()).offset(offset).limit(limit)
+        )
+        return list(result.scalars().all()), total
+    
     def get_strategy_events(
         self,
         strategy_id: UUID,
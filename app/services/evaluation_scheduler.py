@@ -0,0 +1,272 @@
+"""
+Evaluation scheduler - fans out closed candles to strategies and shares per-candle market data.
+
+Every running strategy keeps its own loop (status refresh, error handling and
+notifications stay per strategy), but the work that is identical for all
+strategies on one (symbol, interval) stream is done once per candle:
+
+- Candle fan-out: one closed candle wakes every strategy on the stream in the
+  same pass. Each strategy remembers the last candle generation it evaluated,
+  so a strategy that was still busy when the candle closed evaluates it right
+  away instead of missing it (the old set/clear event could drop wake-ups).
+- Market snapshot: close time/price of the candle is built once per stream,
+  and the klines view strategies evaluate on is fetched once per candle for
+  every strategy on the stream asking for the same window (``get_klines``).
+- Live price: served from the kline stream (O(1)) or fetched once per symbol
+  and shared by concurrent callers (single-flight, short TTL).
+- Position sync: concurrent loop syncs for the same (account, symbol) share
+  one in-flight REST request.
+- Order execution: bounded by a global semaphore so a candle that triggers
+  many strategies at once does not burst the exchange API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from app.core.websocket_kline_manager import WebSocketKlineManager
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """Shared view of one closed candle on a stream."""
+    symbol: str
+    interval: str
+    generation: int  # increments on every closed candle of the stream
+    close_time: int  # ms
+    close_price: float
+    created_at: float  # monotonic
+
+
+def _stream_key(symbol: str, interval: str) -> str:
+    # Same key format as WebSocketKlineManager
+    return f"{(symbol or '').upper()}_{interval}"
+
+
+class EvaluationScheduler:
+    """Per-stream candle fan-out plus shared price/position lookups and order slots."""
+
+    def __init__(
+        self,
+        kline_manager: Optional["WebSocketKlineManager"] = None,
+        max_concurrent_orders: int = 8,
+        shared_fetch_ttl: float = 1.0,
+        stream_price_max_age: float = 5.0,
+    ) -> None:
+        """Initialize scheduler.
+
+        Args:
+            kline_manager: WebSocket kline manager to receive closed candles from (optional)
+            max_concurrent_orders: Maximum order executions running at the same time
+            shared_fetch_ttl: Seconds a shared REST price is reused
+            stream_price_max_age: Seconds a stream price is considered live
+        """
+        self.kline_manager: Optional["WebSocketKlineManager"] = None
+        self.max_concurrent_orders = max_concurrent_orders
+        self.order_slots = asyncio.Semaphore(max_concurrent_orders)
+        self.shared_fetch_ttl = shared_fetch_ttl
+        self.stream_price_max_age = stream_price_max_age
+
+        self._snapshots: Dict[str, MarketSnapshot] = {}
+        self._generations: Dict[str, int] = {}
+        # Replaced (not cleared) on every candle so no waiter can miss a set()
+        self._candle_events: Dict[str, asyncio.Event] = {}
+        # strategy_id -> (stream_key, last evaluated generation)
+        self._last_seen: Dict[str, Tuple[str, int]] = {}
+
+        # Single-flight caches: key -> (value, monotonic time) and key -> in-flight task
+        self._shared_results: Dict[Tuple[Any, ...], Tuple[Any, float]] = {}
+        self._in_flight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+
+        if kline_manager is not None:
+            self.attach(kline_manager)
+
+    def attach(self, kline_manager: "WebSocketKlineManager") -> None:
+        """Receive closed candles from a kline manager (idempotent)."""
+        if self.kline_manager is kline_manager:
+            return
+        self.kline_manager = kline_manager
+        kline_manager.add_candle_listener(self.on_candle_closed)
+
+    # Candle fan-out ----------------------------------------------------------
+
+    def on_candle_closed(self, symbol: str, interval: str, kline: Dict[str, Any]) -> None:
+        """Build the stream snapshot once and wake every strategy waiting on the stream."""
+        key = _stream_key(symbol, interval)
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        try:
+            close_time = int(kline.get("T", 0))
+            close_price = float(kline.get("c", 0.0))
+        except (TypeError, ValueError):
+            close_time, close_price = 0, 0.0
+        self._snapshots[key] = MarketSnapshot(
+            symbol=symbol.upper(),
+            interval=interval,
+            generation=generation,
+            close_time=close_time,
+            close_price=close_price,
+            created_at=time.monotonic(),
+        )
+        event = self._candle_events.pop(key, None)
+        if event is not None:
+            event.set()
+        logger.debug(f"[EvaluationScheduler] Candle {generation} closed for {key}, waking strategies")
+
+    def get_snapshot(self, symbol: str, interval: str) -> Optional[MarketSnapshot]:
+        return self._snapshots.get(_stream_key(symbol, interval))
+
+    async def get_klines(self, symbol: str, interval: str, limit: int = 100) -> List[List]:
+        """Klines of a stream, fetched once per closed candle for all strategies on it.
+
+        Strategies woken by the same candle share one ``kline_manager.get_klines``
+        call per window size. The view is reused for ``shared_fetch_ttl`` seconds
+        after the fetch, so a later timeout-driven evaluation still sees the
+        forming candle move.
+        """
+        if self.kline_manager is None:
+            raise RuntimeError("EvaluationScheduler has no kline manager attached")
+        snapshot = self.get_snapshot(symbol, interval)
+        generation = snapshot.generation if snapshot is not None else 0
+        klines = await self._single_flight(
+            ("klines", _stream_key(symbol, interval), generation, limit),
+            lambda: self.kline_manager.get_klines(symbol=symbol, interval=interval, limit=limit),
+            ttl=self.shared_fetch_ttl,
+        )
+        # Shared between strategies: hand out a copy of the list
+        return list(klines)
+
+    async def wait_for_candle(
+        self,
+        strategy_id: str,
+        symbol: str,
+        interval: str,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Wait until a candle this strategy has not evaluated yet has closed.
+
+        Returns immediately if a candle closed while the strategy was busy.
+
+        Args:
+            strategy_id: Strategy ID (tracks the last evaluated candle)
+            symbol: Trading symbol
+            interval: Kline interval
+            timeout: Maximum time to wait (None = wait indefinitely)
+
+        Returns:
+            True if a new candle is available, False on timeout
+        """
+        key = _stream_key(symbol, interval)
+        current = self._generations.get(key, 0)
+        seen_key, seen = self._last_seen.get(strategy_id, (key, current))
+        if seen_key != key:
+            # Strategy switched stream (e.g. interval changed): start fresh
+            seen = current
+
+        if current > seen:
+            self._last_seen[strategy_id] = (key, current)
+            return True
+
+        event = self._candle_events.get(key)
+        if event is None:
+            event = asyncio.Event()
+            self._candle_events[key] = event
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._last_seen[strategy_id] = (key, seen)
+            return False
+        self._last_seen[strategy_id] = (key, self._generations.get(key, current))
+        return True
+
+    def forget(self, strategy_id: str) -> None:
+        """Drop per-strategy state (strategy stopped)."""
+        self._last_seen.pop(strategy_id, None)
+
+    # Shared lookups ----------------------------------------------------------
+
+    async def _single_flight(
+        self,
+        key: Tuple[Any, ...],
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float = 0.0,
+    ) -> Any:
+        """Run ``fetch`` once for concurrent callers with the same key.
+
+        With ``ttl > 0`` the result is also reused by callers arriving within ``ttl`` seconds.
+        """
+        cached = self._shared_results.get(key)
+        if ttl > 0 and cached is not None and time.monotonic() - cached[1] <= ttl:
+            return cached[0]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.ensure_future(fetch())
+        self._in_flight[key] = future
+        try:
+            result = await asyncio.shield(future)
+            if ttl > 0:
+                self._shared_results[key] = (result, time.monotonic())
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+            if len(self._shared_results) > 1024:
+                # Bounded: drop expired entries
+                now = time.monotonic()
+                for stale in [k for k, (_, ts) in self._shared_results.items() if now - ts > self.shared_fetch_ttl]:
+                    del self._shared_results[stale]
+
+    async def get_price(self, symbol: str, client: Any) -> float:
+        """Current price for a symbol.
+
+        Uses the kline stream when it is on the same network as the client
+        (streams are mainnet; testnet prices differ), otherwise one shared REST
+        call per symbol.
+        """
+        symbol = (symbol or "").upper()
+        if self.kline_manager is not None and getattr(client, "testnet", None) == self.kline_manager.testnet:
+            price = self.kline_manager.get_last_price(symbol, max_age=self.stream_price_max_age)
+            if price is not None:
+                return price
+        return await self._single_flight(
+            ("price", id(client), symbol),
+            lambda: asyncio.to_thread(client.get_price, symbol),
+            ttl=self.shared_fetch_ttl,
+        )
+
+    async def get_open_position(self, account_id: str, symbol: str, client: Any) -> Optional[Dict[str, Any]]:
+        """``client.get_open_position(symbol)`` shared by concurrent callers on the same account and symbol.
+
+        Only in-flight requests are shared (no TTL), so a caller never sees a
+        position older than its own request.
+        """
+        return await self._single_flight(
+            ("position", (account_id or "default").lower(), id(client), (symbol or "").upper()),
+            lambda: asyncio.to_thread(client.get_open_position, symbol),
+        )
+
+
+_scheduler: Optional[EvaluationScheduler] = None
+
+
+def get_evaluation_scheduler(
+    kline_manager: Optional["WebSocketKlineManager"] = None,
+) -> EvaluationScheduler:
+    """Return the process-wide evaluation scheduler (attached to ``kline_manager`` if given)."""
+    global _scheduler
+    if _scheduler is None:
+        from app.core.config import get_settings
+        _scheduler = EvaluationScheduler(
+            max_concurrent_orders=get_settings().max_concurrent_order_executions,
+        )
+    if kline_manager is not None:
+        _scheduler.attach(kline_manager)
+    return _scheduler
@@ -0,0 +1,428 @@
+"""
+Market scanner - market analyzer indicators for many symbols in one pass.
+
+``/api/market-analyzer/analyze`` looks at one symbol per request. The scanner
+computes the same indicators (EMAs, RSI, ATR, range, volume analysis, market
+structure) plus the circuit-breaker market regime for a whole list of symbols:
+
+- klines are fetched concurrently (bounded, off the event loop)
+- indicators are computed for all symbols at once with NumPy (one array of
+  shape (symbols, candles) per series); without NumPy the scalar indicator
+  functions are used per symbol
+- results depend only on closed candles, so each one is cached until the
+  forming candle closes; repeated scans only refresh prices
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from app.risk.market_regime_analyzer import (
+    MarketRegimeResult,
+    analyze_market_regime,
+    classify_market_regime,
+    market_regime_metrics_batch,
+)
+from app.strategies.indicators import (
+    build_market_structure,
+    calculate_atr,
+    calculate_ema,
+    calculate_market_structure,
+    calculate_rsi,
+    calculate_volume_analysis,
+)
+
+# Try to import numpy, fall back to pure Python if not available
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+ATR_PERIOD = 14
+VOLUME_PERIOD = 20
+
+
+@dataclass(frozen=True)
+class ScanParams:
+    """Analysis parameters (part of the cache key)."""
+    interval: str = "5m"
+    lookback_period: int = 150
+    ema_fast_period: int = 20
+    ema_slow_period: int = 50
+    rsi_period: int = 14
+    swing_period: int = 5
+
+    @property
+    def kline_limit(self) -> int:
+        # Same fetch size as /analyze
+        return max(self.lookback_period + 50, 200)
+
+    @property
+    def min_klines(self) -> int:
+        return self.lookback_period + 10
+
+
+@dataclass
+class SymbolIndicators:
+    """Closed-candle indicators for one symbol (valid until ``expires_at``)."""
+    symbol: str
+    lookback_candles: int
+    last_close: float
+    candle_close_time: int  # close time of the last closed candle (ms)
+    expires_at: int  # close time of the forming candle (ms)
+    fast_ema: Optional[float]
+    slow_ema: Optional[float]
+    rsi: Optional[float]
+    atr: Optional[float]
+    range_high: Optional[float]
+    range_low: Optional[float]
+    market_structure: Optional[dict]
+    volume_analysis: Optional[dict]
+    regime: Optional[MarketRegimeResult]
+
+
+@dataclass
+class ScanResult:
+    """Outcome of a scan: indicators per symbol, errors per symbol, cache hits."""
+    indicators: Dict[str, SymbolIndicators] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    cached: int = 0
+
+
+def _lookback_window(klines: List[list], params: ScanParams) -> Tuple[List[list], List[list]]:
+    """(closed klines, lookback klines) - the forming candle is excluded."""
+    closed = klines[:-1]
+    lookback = closed[-params.lookback_period:] if len(closed) >= params.lookback_period else closed
+    return closed, lookback
+
+
+def compute_indicators(symbol: str, klines: List[list], params: ScanParams) -> SymbolIndicators:
+    """Indicators for one symbol with the scalar indicator functions (same as /analyze)."""
+    closed, lookback = _lookback_window(klines, params)
+    closes = [float(k[4]) for k in lookback]
+    highs = [float(k[2]) for k in lookback]
+    lows = [float(k[3]) for k in lookback]
+    return SymbolIndicators(
+        symbol=symbol,
+        lookback_candles=len(lookback),
+        last_close=closes[-1] if closes else 0.0,
+        candle_close_time=int(closed[-1][6]) if closed else 0,
+        expires_at=int(klines[-1][6]) if klines else 0,
+        fast_ema=calculate_ema(closes, params.ema_fast_period),
+        slow_ema=calculate_ema(closes, params.ema_slow_period),
+        rsi=calculate_rsi(closes, params.rsi_period),
+        atr=calculate_atr(lookback, period=ATR_PERIOD),
+        range_high=max(highs) if highs else None,
+        range_low=min(lows) if lows else None,
+        market_structure=calculate_market_structure(highs=highs, lows=lows, swing_period=params.swing_period),
+        volume_analysis=calculate_volume_analysis(klines=lookback, period=min(VOLUME_PERIOD, len(lookback))),
+        regime=analyze_market_regime(closed, symbol=symbol),
+    )
+
+
+def _batch_ema(closes: "np.ndarray", period: int) -> Optional["np.ndarray"]:
+    """calculate_ema for every row (SMA seed, then the same recursion across all rows)."""
+    n = closes.shape[1]
+    if n < period:
+        return None
+    smoothing = 2.0 / (period + 1)
+    ema = closes[:, :period].mean(axis=1)
+    for k in range(period, n):
+        ema = (closes[:, k] - ema) * smoothing + ema
+    return ema
+
+
+def _batch_rsi(closes: "np.ndarray", period: int) -> Optional["np.ndarray"]:
+    """calculate_rsi (simple-mean RSI) for every row."""
+    n = closes.shape[1]
+    if n < period + 1:
+        return None
+    deltas = closes[:, n - period:] - closes[:, n - period - 1:n - 1]
+    avg_gain = np.where(deltas > 0, deltas, 0.0).mean(axis=1)
+    avg_loss = np.where(deltas < 0, -deltas, 0.0).mean(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return np.where(avg_loss == 0, np.where(avg_gain > 0, 100.0, 50.0), rsi)
+
+
+def _batch_atr(highs: "np.ndarray", lows: "np.ndarray", closes: "np.ndarray", period: int) -> Optional["np.ndarray"]:
+    """calculate_atr (mean of the last ``period`` true ranges) for every row."""
+    n = closes.shape[1]
+    if n < period + 1:
+        return None
+    prev_close = closes[:, n - period - 1:n - 1]
+    h, l = highs[:, n - period:], lows[:, n - period:]
+    return np.maximum(h - l, np.maximum(np.abs(h - prev_close), np.abs(l - prev_close))).mean(axis=1)
+
+
+def _batch_volume_analysis(volumes: "np.ndarray") -> List[Optional[dict]]:
+    """calculate_volume_analysis(period=min(20, candles)) for every row."""
+    rows, n = volumes.shape
+    period = min(VOLUME_PERIOD, n)
+    if n < period + 1 or period < 1:
+        return [None] * rows
+    current = volumes[:, -1]
+    average = volumes[:, -period:].mean(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(average > 0, current / average, 1.0)
+        if n >= period * 2:
+            previous = volumes[:, -period * 2:-period].mean(axis=1)
+            change = np.where(previous > 0, (average - previous) / previous * 100.0, 0.0)
+        else:
+            change = np.zeros(rows)
+    out: List[Optional[dict]] = []
+    for i in range(rows):
+        change_pct = float(change[i])
+        trend = "INCREASING" if change_pct > 5 else ("DECREASING" if change_pct < -5 else "STABLE")
+        out.append({
+            "current_volume": float(current[i]),
+            "average_volume": float(average[i]),
+            # Volume EMA over exactly `period` values is its SMA seed
+            "volume_ema": float(average[i]),
+            "volume_ratio": float(ratio[i]),
+            "volume_trend": trend,
+            "volume_change_pct": change_pct,
+            "is_high_volume": bool(ratio[i] > 1.5),
+            "is_low_volume": bool(ratio[i] < 0.5),
+        })
+    return out
+
+
+def _batch_market_structure(highs: "np.ndarray", lows: "np.ndarray", swing_period: int) -> List[Optional[dict]]:
+    """calculate_market_structure for every row (strict pivots via sliding-window extrema)."""
+    rows, n = highs.shape
+    k = swing_period
+    if n < k * 2 + 1:
+        return [None] * rows
+    # window_max[:, j] = max(values[:, j:j+k]); bar i compares against windows at i-k and i+1
+    high_max = sliding_window_view(highs, k, axis=1).max(axis=2)
+    low_min = sliding_window_view(lows, k, axis=1).min(axis=2)
+    centre_h, centre_l = highs[:, k:n - k], lows[:, k:n - k]
+    is_high = (centre_h > high_max[:, :n - 2 * k]) & (centre_h > high_max[:, k + 1:n - k + 1])
+    is_low = (centre_l < low_min[:, :n - 2 * k]) & (centre_l < low_min[:, k + 1:n - k + 1])
+    out: List[Optional[dict]] = []
+    for r in range(rows):
+        swing_highs = [(int(i) + k, float(highs[r, int(i) + k])) for i in np.flatnonzero(is_high[r])]
+        swing_lows = [(int(i) + k, float(lows[r, int(i) + k])) for i in np.flatnonzero(is_low[r])]
+        out.append(build_market_structure(swing_highs, swing_lows))
+    return out
+
+
+def _optional(values: Optional["np.ndarray"], i: int) -> Optional[float]:
+    return float(values[i]) if values is not None else None
+
+
+def compute_indicators_batch(
+    klines_by_symbol: Dict[str, List[list]],
+    params: ScanParams,
+) -> Dict[str, SymbolIndicators]:
+    """
+    Indicators for many symbols at once.
+
+    Symbols with the same window length are stacked into (symbols, candles)
+    arrays; anything that cannot be vectorized (no NumPy, unusual periods,
+    short windows, malformed values) goes through ``compute_indicators``.
+    """
+    results: Dict[str, SymbolIndicators] = {}
+    vectorizable = HAS_NUMPY and min(
+        params.ema_fast_period, params.ema_slow_period, params.rsi_period, params.swing_period
+    ) >= 1
+
+    groups: Dict[int, List[str]] = {}
+    for symbol, klines in klines_by_symbol.items():
+        _, lookback = _lookback_window(klines, params)
+        # Regime uses the last 50 closed candles; the lookback window must cover them
+        if vectorizable and len(lookback) >= 50:
+            groups.setdefault(len(lookback), []).append(symbol)
+        else:
+            results[symbol] = compute_indicators(symbol, klines, params)
+
+    for length, symbols in groups.items():
+        try:
+            data = np.array(
+                [[k[2:6] for k in _lookback_window(klines_by_symbol[s], params)[1]] for s in symbols],
+                dtype=float,
+            )
+        except (TypeError, ValueError):
+            for symbol in symbols:
+                results[symbol] = compute_indicators(symbol, klines_by_symbol[symbol], params)
+            continue
+        highs, lows, closes, volumes = data[:, :, 0], data[:, :, 1], data[:, :, 2], data[:, :, 3]
+
+        fast = _batch_ema(closes, params.ema_fast_period)
+        slow = _batch_ema(closes, params.ema_slow_period)
+        rsi = _batch_rsi(closes, params.rsi_period)
+        atr = _batch_atr(highs, lows, closes, ATR_PERIOD)
+        range_high, range_low = highs.max(axis=1), lows.min(axis=1)
+        volume = _batch_volume_analysis(volumes)
+        structure = _batch_market_structure(highs, lows, params.swing_period)
+        net_move, atr_pct, avg_range_pct, regime_candles = market_regime_metrics_batch(highs, lows, closes)
+
+        for i, symbol in enumerate(symbols):
+            klines = klines_by_symbol[symbol]
+            results[symbol] = SymbolIndicators(
+                symbol=symbol,
+                lookback_candles=length,
+                last_close=float(closes[i, -1]),
+                candle_close_time=int(klines[-2][6]),
+                expires_at=int(klines[-1][6]),
+                fast_ema=_optional(fast, i),
+                slow_ema=_optional(slow, i),
+                rsi=_optional(rsi, i),
+                atr=_optional(atr, i),
+                range_high=float(range_high[i]),
+                range_low=float(range_low[i]),
+                market_structure=structure[i],
+                volume_analysis=volume[i],
+                regime=classify_market_regime(
+                    net_move_pct=float(net_move[i]),
+                    atr_pct=float(atr_pct[i]),
+                    avg_range_pct=float(avg_range_pct[i]),
+                    candles=regime_candles,
+                    symbol=symbol,
+                ),
+            )
+    return results
+
+
+def usdt_perpetual_symbols(exchange_info: Dict[str, Any]) -> List[str]:
+    """Trading USDT-margined perpetual symbols from futures exchange info."""
+    return sorted(
+        s["symbol"]
+        for s in exchange_info.get("symbols", [])
+        if s.get("contractType") == "PERPETUAL"
+        and s.get("status") == "TRADING"
+        and s.get("quoteAsset") == "USDT"
+    )
+
+
+class MarketScanner:
+    """Concurrent kline fetch + batch indicators, cached per symbol until the next candle close."""
+
+    def __init__(self, max_concurrent_fetches: int = 16, max_entries: int = 5000):
+        """Initialize scanner.
+
+        Args:
+            max_concurrent_fetches: Maximum kline/price requests in flight
+            max_entries: Maximum cached (symbol, params) results
+        """
+        self.max_concurrent_fetches = max_concurrent_fetches
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, ScanParams], SymbolIndicators]" = OrderedDict()
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def get_cached(self, symbol: str, params: ScanParams, now_ms: Optional[int] = None) -> Optional[SymbolIndicators]:
+        """Cached indicators if the candle they were computed for has not closed yet."""
+        key = (symbol, params)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+        if now_ms > entry.expires_at:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry
+
+    def _store(self, indicators: SymbolIndicators, params: ScanParams, now_ms: int) -> None:
+        if indicators.expires_at < now_ms:
+            return  # forming candle already closed (stale REST data): nothing to reuse
+        self._cache[(indicators.symbol, params)] = indicators
+        self._cache.move_to_end((indicators.symbol, params))
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    async def scan(self, client: Any, symbols: Iterable[str], params: ScanParams) -> ScanResult:
+        """Indicators for ``symbols``, fetching klines only for symbols without a live cache entry.
+
+        Per-symbol failures (API errors, insufficient history) are reported in
+        ``errors`` and do not fail the scan.
+        """
+        result = ScanResult()
+        now_ms = int(time.time() * 1000)
+        missing: List[str] = []
+        for symbol in dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()):
+            cached = self.get_cached(symbol, params, now_ms)
+            if cached is not None:
+                result.indicators[symbol] = cached
+                result.cached += 1
+            else:
+                missing.append(symbol)
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+
+        async def fetch(symbol: str) -> Tuple[str, Any]:
+            async with semaphore:
+                try:
+                    klines = await asyncio.to_thread(
+                        client.get_klines, symbol=symbol, interval=params.interval, limit=params.kline_limit
+                    )
+                except Exception as exc:
+                    return symbol, exc
+            return symbol, klines
+
+        fetched: Dict[str, List[list]] = {}
+        for symbol, klines in await asyncio.gather(*(fetch(s) for s in missing)):
+            if isinstance(klines, Exception):
+                result.errors[symbol] = f"Error fetching klines: {klines}"
+            elif not klines or len(klines) < params.min_klines:
+                result.errors[symbol] = (
+                    f"Insufficient data: need at least {params.min_klines} candles, got {len(klines) if klines else 0}"
+                )
+            else:
+                fetched[symbol] = klines
+
+        if fetched:
+            started = time.perf_counter()
+            computed = compute_indicators_batch(fetched, params)
+            logger.debug(
+                f"[MarketScanner] Computed indicators for {len(computed)} symbols "
+                f"in {(time.perf_counter() - started) * 1000:.1f}ms (numpy={HAS_NUMPY})"
+            )
+            for symbol, indicators in computed.items():
+                result.indicators[symbol] = indicators
+                self._store(indicators, params, now_ms)
+        return result
+
+    async def get_prices(self, client: Any, symbols: Iterable[str]) -> Dict[str, float]:
+        """Current prices: one all-symbol ticker call when the client supports it, else one call per symbol."""
+        symbols = list(symbols)
+        if hasattr(client, "get_all_prices"):
+            try:
+                prices = await asyncio.to_thread(client.get_all_prices)
+                return {s: prices[s] for s in symbols if s in prices}
+            except Exception as exc:
+                logger.warning(f"[MarketScanner] All-symbol price fetch failed, falling back per symbol: {exc}")
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+
+        async def fetch(symbol: str) -> Tuple[str, Optional[float]]:
+            async with semaphore:
+                try:
+                    return symbol, float(await asyncio.to_thread(client.get_price, symbol))
+                except Exception as exc:
+                    logger.debug(f"[MarketScanner] Price fetch failed for {symbol}: {exc}")
+                    return symbol, None
+
+        return {s: p for s, p in await asyncio.gather(*(fetch(s) for s in symbols)) if p is not None}
+
+
+_scanner: Optional[MarketScanner] = None
+
+
+def get_market_scanner() -> MarketScanner:
+    """Return the process-wide market scanner (shares its cache across requests)."""
+    global _scanner
+    if _scanner is None:
+        _scanner = MarketScanner()
+    return _scanner
@@ -7,6 +7,7 @@ from typing import Optional
 
 from loguru import logger
 
+from app.core.idempotency_index import IdempotencyIndex
 from app.core.my_binance_client import BinanceClient
 from app.models.order import OrderResponse
 from app.risk.manager import PositionSizingResult
@@ -19,15 +20,20 @@ class OrderExecutor:
         client: BinanceClient,
         trade_service: Optional[Any] = None,
         user_id: Optional[Any] = None,
+        idempotency_index: Optional[IdempotencyIndex] = None,
     ) -> None:
         self.client = client
-        self.trade_service = trade_service  # For database duplicate checking
-        self.user_id = user_id  # For database duplicate checking
-        # Track recent orders for idempotency (in-memory cache)
+        self.trade_service = trade_service  # For database duplicate checking (cold fallback)
+        self.user_id = user_id  # For database duplicate checking (cold fallback)
+        # Track recent orders for idempotency (bounded TTL/LRU index, optionally Redis-backed)
         # Format: {idempotency_key: (order_id, timestamp)}
-        self._recent_orders: dict[str, tuple[int, float]] = {}
-        # Cleanup old entries after 1 hour
+        # Pass a shared index so executors created per strategy/manual close see each other's keys
         self._order_cache_ttl = 3600  # 1 hour
+        self._recent_orders: IdempotencyIndex = (
+            idempotency_index
+            if idempotency_index is not None
+            else IdempotencyIndex(ttl_seconds=self._order_cache_ttl)
+        )
 
     def _generate_idempotency_key(
         self,
@@ -66,6 +72,9 @@ class OrderExecutor:
     ) -> Optional[int]:
         """Check if an order with the same idempotency key was recently executed.
         
+        Answered from the in-memory index (then Redis, if the index is Redis-backed);
+        expired entries are dropped lazily by the index.
+        
         Args:
             idempotency_key: The idempotency key to check
             symbol: Trading symbol (for logging)
@@ -73,19 +82,10 @@ class OrderExecutor:
         Returns:
             Order ID if duplicate found, None otherwise
         """
-        # Cleanup old entries
-        current_time = time.time()
-        expired_keys = [
-            key for key, (_, timestamp) in self._recent_orders.items()
-            if current_time - timestamp > self._order_cache_ttl
-        ]
-        for key in expired_keys:
-            self._recent_orders.pop(key, None)
-        
-        # Check for duplicate
-        if idempotency_key in self._recent_orders:
-            order_id, timestamp = self._recent_orders[idempotency_key]
-            age_seconds = current_time - timestamp
+        entry = self._recent_orders.lookup(idempotency_key)
+        if entry is not None:
+            order_id, timestamp = entry
+            age_seconds = time.time() - timestamp
             logger.warning(
                 f"Duplicate order detected for {symbol} (idempotency_key={idempotency_key[:8]}...). "
                 f"Previous order_id={order_id} was executed {age_seconds:.1f}s ago. "
@@ -270,6 +270,15 @@ class OrderExecutor:
             # Return None to indicate duplicate was skipped
             return None
         
+        # Claim the key before sending: another worker may have missed on the same key just now
+        if not self._recent_orders.claim(idempotency_key):
+            logger.warning(
+                f"Duplicate order detected for {signal.symbol} (idempotency_key={idempotency_key[:8]}...). "
+                f"Another worker is already placing this order. Skipping duplicate order execution."
+            )
+            return None
+        
+        order_response = None
         logger.info(
             f"Executing order: {side} {sizing.quantity} {signal.symbol} "
             f"(reduce_only={reduce_only}, price={signal.price}, idempotency_key={idempotency_key[:8]}...)"
@@ -293,8 +302,10 @@ class OrderExecutor:
             
             if order_response:
                 # CRITICAL: Check database for duplicate order (additional safety)
-                # This catches duplicates even if in-memory cache was cleared
-                if self.trade_service and self.user_id and strategy_id:
+                # Cold fallback only: catches duplicates issued before this process's
+                # index existed (e.g. right after a restart without Redis). Once the
+                # index is warm, the in-memory check above is authoritative.
+                if self.trade_service and self.user_id and strategy_id and self._recent_orders.is_cold():
                     # Note: We need strategy UUID, not strategy_id string
                     # For now, we'll check by order_id only (simpler)
                     is_duplicate = self._check_duplicate_in_database(
@@ -314,10 +325,7 @@ class OrderExecutor:
                         return order_response
                 
                 # Track order for idempotency
-                self._recent_orders[idempotency_key] = (
-                    order_response.order_id,
-                    time.time()
-                )
+                self._recent_orders.record(idempotency_key, order_response.order_id)
                 
                 logger.info(
                     f"Order created successfully: {order_response.order_id} | "
@@ -341,10 +349,7 @@ class OrderExecutor:
                     )
                     if verified_order:
                         # Update tracked order with verified data
-                        self._recent_orders[idempotency_key] = (
-                            verified_order.order_id,
-                            time.time()
-                        )
+                        self._recent_orders.record(idempotency_key, verified_order.order_id)
                         return verified_order
                     else:
                         logger.warning(
@@ -353,6 +358,7 @@ class OrderExecutor:
                         )
                 
                 return order_response
+            self._recent_orders.release(idempotency_key)
             return None
         except Exception as exc:
             # RetryError with successful last attempt: use result and avoid misleading "Failed to create order"
@@ -366,7 +372,7 @@ class OrderExecutor:
                             "RetryError but last attempt succeeded (order_id=%s), using result.",
                             res.order_id,
                         )
-                        self._recent_orders[idempotency_key] = (res.order_id, time.time())
+                        self._recent_orders.record(idempotency_key, res.order_id)
                         return res
             except Exception:
                 pass
@@ -374,5 +380,8 @@ class OrderExecutor:
                 f"Failed to create order: {side} {sizing.quantity} {signal.symbol} | "
                 f"Error: {type(exc).__name__}: {exc}"
             )
+            if order_response is None:
+                # Nothing was sent: free the key so the signal can be retried
+                self._recent_orders.release(idempotency_key)
             raise
 
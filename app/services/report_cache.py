@@ -0,0 +1,317 @@
+"""
+Process-wide cache of report and dashboard responses.
+
+The trading report, strategy performance, dashboard overview and PnL overview
+endpoints recompute everything from trades and completed trades on every
+call, and dashboards poll them. Responses are cached per
+(endpoint, user, filters) and tagged with a per-user generation number.
+
+The generation is bumped when a session commits a change that can alter a
+report of that user: a Trade or CompletedTrade is written, or a Strategy is
+created, deleted or changes status (SQLAlchemy session events below). A
+cached response whose generation is older is treated as a miss. When Redis
+is enabled the generations live in Redis, so a commit in any worker
+invalidates the caches of every process.
+
+Responses of open-ended date ranges include live prices and unrealized PnL,
+so they get a short TTL. Responses for ranges that already ended only need
+the longer safety TTL.
+
+Cached objects are returned as-is; callers must not mutate them.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+import time
+import typing
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from dateutil import parser as date_parser
+from fastapi.params import Depends as DependsParam
+from loguru import logger
+from pydantic.fields import FieldInfo
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from app.core.redis_storage import RedisStorage
+from app.models.db_models import CompletedTrade, Strategy, Trade
+
+_SESSION_USERS_KEY = "report_cache_users"
+
+
+class ReportCache:
+    """LRU cache of report responses, invalidated per user by generation number."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        live_ttl_seconds: float = 10.0,
+        max_entries: int = 1000,
+        redis: Optional[RedisStorage] = None,
+    ):
+        """Initialize cache.
+
+        Args:
+            ttl_seconds: TTL of responses for date ranges that ended
+            live_ttl_seconds: TTL of responses that include live prices
+            max_entries: Responses kept; least recently used are evicted
+            redis: Optional Redis storage holding generations shared by all processes
+        """
+        self.ttl_seconds = ttl_seconds
+        self.live_ttl_seconds = live_ttl_seconds
+        self.max_entries = max_entries
+        self.redis = redis if redis is not None and redis.enabled else None
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[Any, int, float]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _generation_key(user_id: str) -> str:
+        return f"binance_bot:report_generation:{user_id}"
+
+    def generation(self, user_id: Any) -> int:
+        """Current generation of a user's reports."""
+        user_id = str(user_id)
+        if self.redis is not None:
+            raw = self.redis.get(self._generation_key(user_id))
+            if raw is not None:
+                return int(raw)
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def invalidate_user(self, user_id: Any) -> None:
+        """Make every cached report of the user stale."""
+        user_id = str(user_id)
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            for key in [k for k in self._entries if k[0] == user_id]:
+                del self._entries[key]
+        if self.redis is not None:
+            try:
+                self.redis._client.incr(self._generation_key(user_id))
+            except Exception as exc:
+                logger.warning(f"Failed to bump report generation of user {user_id} in Redis: {exc}")
+
+    @staticmethod
+    def _key(user_id: Any, endpoint: str, params: Dict[str, Any]) -> Tuple[Hashable, ...]:
+        return (str(user_id), endpoint, tuple(sorted(params.items())))
+
+    def get(self, user_id: Any, endpoint: str, params: Dict[str, Any]) -> Tuple[Optional[Any], int]:
+        """Return ``(response, generation)``; response is None on a miss.
+
+        Pass the returned generation to ``put`` so a response computed while
+        a write committed is stored as already stale.
+        """
+        generation = self.generation(user_id)
+        key = self._key(user_id, endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, entry_generation, expires_at = entry
+                if entry_generation == generation and time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value, generation
+                del self._entries[key]
+            self.misses += 1
+        return None, generation
+
+    def put(
+        self,
+        user_id: Any,
+        endpoint: str,
+        params: Dict[str, Any],
+        value: Any,
+        generation: int,
+        live: bool,
+    ) -> None:
+        ttl = self.live_ttl_seconds if live else self.ttl_seconds
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[self._key(user_id, endpoint, params)] = (value, generation, time.monotonic() + ttl)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_report_cache: Optional[ReportCache] = None
+_init_lock = threading.Lock()
+
+
+def get_report_cache() -> Optional[ReportCache]:
+    """Return the process-wide report cache (None when disabled in settings)."""
+    global _report_cache
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    if not settings.report_cache_enabled:
+        return None
+    if _report_cache is None:
+        with _init_lock:
+            if _report_cache is None:
+                redis = None
+                if settings.redis_enabled:
+                    redis = RedisStorage(redis_url=settings.redis_url, enabled=True)
+                _report_cache = ReportCache(
+                    ttl_seconds=settings.report_cache_ttl_seconds,
+                    live_ttl_seconds=settings.report_cache_live_ttl_seconds,
+                    redis=redis,
+                )
+    return _report_cache
+
+
+def reset_report_cache() -> None:
+    """Drop the process-wide cache (tests, settings changes)."""
+    global _report_cache
+    with _init_lock:
+        _report_cache = None
+
+
+# Route decorator ---------------------------------------------------------------
+
+
+def _ends_in_past(end_date: Optional[str]) -> bool:
+    """Whether an ``end_date`` query value lies before now (date-only values cover the whole day)."""
+    if not end_date:
+        return False
+    try:
+        end = date_parser.parse(end_date)
+    except (ValueError, TypeError, OverflowError):
+        return False
+    if len(end_date.strip()) <= 10:
+        end += timedelta(days=1)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return end < datetime.now(timezone.utc)
+
+
+def _plain(value: Any) -> Any:
+    # Direct calls (not through FastAPI) leave unset parameters at their Query(...) default
+    if isinstance(value, FieldInfo):
+        return value.default
+    return value
+
+
+def cached_report(endpoint: str, key_params: Sequence[str]) -> Callable:
+    """Serve a report route from the report cache.
+
+    ``key_params`` are the route parameters the response depends on, besides
+    the user. The route must take ``current_user`` and ``end_date``; it may be
+    a plain or an ``async`` function. Calls without a resolved user (e.g.
+    direct calls in tests) bypass the cache.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        # Resolve postponed annotations here: FastAPI would evaluate them in this module's globals
+        hints = typing.get_type_hints(func, include_extras=True)
+
+        def lookup(args, kwargs) -> Tuple[Optional[Callable[[Any], None]], Optional[Any]]:
+            """Return ``(store, cached)``; store is None when the call bypasses the cache."""
+            cache = get_report_cache()
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+            user = arguments.get("current_user")
+            user_id = None if isinstance(user, DependsParam) else getattr(user, "id", None)
+            if cache is None or user_id is None:
+                return None, None
+
+            params = {name: _plain(arguments.get(name)) for name in key_params}
+            cached, generation = cache.get(user_id, endpoint, params)
+
+            def store(result: Any) -> None:
+                cache.put(
+                    user_id, endpoint, params, result, generation,
+                    live=not _ends_in_past(params.get("end_date")),
+                )
+
+            return store, cached
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                store, cached = lookup(args, kwargs)
+                if cached is not None:
+                    return cached
+                result = await func(*args, **kwargs)
+                if store is not None:
+                    store(result)
+                return result
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                store, cached = lookup(args, kwargs)
+                if cached is not None:
+                    return cached
+                result = func(*args, **kwargs)
+                if store is not None:
+                    store(result)
+                return result
+
+        wrapper.__signature__ = signature.replace(
+            parameters=[p.replace(annotation=hints.get(p.name, p.annotation)) for p in signature.parameters.values()],
+            return_annotation=hints.get("return", signature.return_annotation),
+        )
+        return wrapper
+
+    return decorator
+
+
+# Invalidation from committed writes ------------------------------------------
+
+
+_REPORT_MODELS = (Trade, CompletedTrade, Strategy)
+
+
+def _changed_report_users(session: Session) -> set:
+    users = set()
+    for obj in chain(session.new, session.deleted):
+        if isinstance(obj, _REPORT_MODELS):
+            users.add(obj.user_id)
+    for obj in session.dirty:
+        if isinstance(obj, (Trade, CompletedTrade)):
+            users.add(obj.user_id)
+        elif isinstance(obj, Strategy) and sa_inspect(obj).attrs.status.history.has_changes():
+            users.add(obj.user_id)
+    users.discard(None)
+    return users
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_report_users(session: Session, flush_context) -> None:
+    users = _changed_report_users(session)
+    if users:
+        session.info.setdefault(_SESSION_USERS_KEY, set()).update(users)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_report_users(session: Session) -> None:
+    users = session.info.pop(_SESSION_USERS_KEY, None)
+    if not users:
+        return
+    cache = get_report_cache()
+    if cache is None:
+        return
+    for user_id in users:
+        cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_report_users(session: Session) -> None:
+    session.info.pop(_SESSION_USERS_KEY, None)
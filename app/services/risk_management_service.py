@@ -86,9 +86,7 @@ class RiskManagementService(BaseCacheService):
             return None
         
         if self._is_async:
-            # For async, we need to use asyncio.run or make this method async
-            # For now, raise an error - async support should be handled at the API level
-            raise RuntimeError("Async get_risk_config not supported. Use async method directly.")
+            raise RuntimeError("Use async_get_risk_config() with AsyncSession")
         else:
             try:
                 return self._get_risk_config_sync(user_id, account.id, account_id, cache_key)
@@ -196,6 +194,20 @@ class RiskManagementService(BaseCacheService):
         if existing:
             raise ValueError(f"Risk config already exists for account: {config_data.account_id}")
         
+        db_config = self._new_db_config(user_id, account.id, config_data)
+        
+        if self._is_async:
+            raise RuntimeError("Use async_create_risk_config() with AsyncSession")
+        else:
+            return self._create_risk_config_sync(db_config, config_data.account_id)
+    
+    def _new_db_config(
+        self,
+        user_id: UUID,
+        account_uuid: UUID,
+        config_data: RiskManagementConfigCreate
+    ) -> DBRiskConfig:
+        """Build a new risk config row from create data."""
         # Prepare config data, converting time to datetime
         config_dict = config_data.model_dump(exclude={"account_id"})
         
@@ -219,19 +231,12 @@ class RiskManagementService(BaseCacheService):
                 config_dict["daily_loss_reset_time"] = datetime.combine(datetime.now().date(), time_value)
         
         # Create new config
-        db_config = DBRiskConfig(
+        return DBRiskConfig(
             id=uuid4(),
             user_id=user_id,
-            account_id=account.id,
+            account_id=account_uuid,
             **config_dict
         )
-        
-        if self._is_async:
-            # For async, we need to use asyncio.run or make this method async
-            # For now, raise an error - async support should be handled at the API level
-            raise RuntimeError("Async create_risk_config not supported. Use async method directly.")
-        else:
-            return self._create_risk_config_sync(db_config, config_data.account_id)
     
     def _create_risk_config_sync(
         self,
@@ -289,9 +294,7 @@ class RiskManagementService(BaseCacheService):
             return None
         
         if self._is_async:
-            # For async, we need to use asyncio.run or make this method async
-            # For now, raise an error - async support should be handled at the API level
-            raise RuntimeError("Async update_risk_config not supported. Use async method directly.")
+            raise RuntimeError("Use async_update_risk_config() with AsyncSession")
         else:
             return self._update_risk_config_sync(user_id, account.id, account_id, config_data)
     
@@ -423,9 +426,7 @@ class RiskManagementService(BaseCacheService):
             return False
         
         if self._is_async:
-            # For async, we need to use asyncio.run or make this method async
-            # For now, raise an error - async support should be handled at the API level
-            raise RuntimeError("Async delete_risk_config not supported. Use async method directly.")
+            raise RuntimeError("Use async_delete_risk_config() with AsyncSession")
         else:
             return self._delete_risk_config_sync(user_id, account.id, account_id)
     
@@ -481,6 +482,108 @@ class RiskManagementService(BaseCacheService):
         
         return True
     
+    async def async_get_risk_config(
+        self,
+        user_id: UUID,
+        account_id: str
+    ) -> Optional[RiskManagementConfigResponse]:
+        """Get risk management configuration for an account (async).
+        
+        Same cache-aside lookup and error handling as get_risk_config().
+        """
+        if not self._is_async:
+            raise RuntimeError("Use get_risk_config() with Session")
+        
+        # Try cache first
+        cache_key = self._redis_key(user_id, account_id)
+        if self.redis and self.redis.enabled:
+            cached = self.redis.get(cache_key)
+            if cached:
+                try:
+                    data = json.loads(cached)
+                    logger.debug(f"Cache HIT for risk config: {cache_key}")
+                    return RiskManagementConfigResponse(**data)
+                except Exception as e:
+                    logger.warning(f"Failed to deserialize cached risk config: {e}")
+        
+        # Cache miss - query database
+        logger.debug(f"Cache MISS for risk config: {cache_key}, querying database")
+        try:
+            account = await self.db_service.async_get_account_by_id(user_id, account_id)
+            if not account:
+                logger.warning(f"Account not found: user_id={user_id}, account_id={account_id}")
+                return None
+        except Exception as e:
+            logger.error(f"Error getting account by ID: user_id={user_id}, account_id={account_id}, error={e}")
+            return None
+        
+        try:
+            return await self._get_risk_config_async(user_id, account.id, account_id, cache_key)
+        except Exception as e:
+            logger.error(f"Error in _get_risk_config_async: {e}")
+            return None
+    
+    async def async_create_risk_config(
+        self,
+        user_id: UUID,
+        config_data: RiskManagementConfigCreate
+    ) -> RiskManagementConfigResponse:
+        """Create risk management configuration (async).
+        
+        Raises:
+            ValueError: If account not found or config already exists
+        """
+        if not self._is_async:
+            raise RuntimeError("Use create_risk_config() with Session")
+        
+        account = await self.db_service.async_get_account_by_id(user_id, config_data.account_id)
+        if not account:
+            raise ValueError(f"Account not found: {config_data.account_id}")
+        
+        existing = await self.async_get_risk_config(user_id, config_data.account_id)
+        if existing:
+            raise ValueError(f"Risk config already exists for account: {config_data.account_id}")
+        
+        db_config = self._new_db_config(user_id, account.id, config_data)
+        return await self._create_risk_config_async(db_config, config_data.account_id)
+    
+    async def async_update_risk_config(
+        self,
+        user_id: UUID,
+        account_id: str,
+        config_data: RiskManagementConfigUpdate
+    ) -> Optional[RiskManagementConfigResponse]:
+        """Update risk management configuration (async).
+        
+        Returns:
+            Updated RiskManagementConfigResponse if found, None otherwise
+        """
+        if not self._is_async:
+            raise RuntimeError("Use update_risk_config() with Session")
+        
+        account = await self.db_service.async_get_account_by_id(user_id, account_id)
+        if not account:
+            return None
+        return await self._update_risk_config_async(user_id, account.id, account_id, config_data)
+    
+    async def async_delete_risk_config(
+        self,
+        user_id: UUID,
+        account_id: str
+    ) -> bool:
+        """Delete risk management configuration (async).
+        
+        Returns:
+            True if deleted, False if not found
+        """
+        if not self._is_async:
+            raise RuntimeError("Use delete_risk_config() with Session")
+        
+        account = await self.db_service.async_get_account_by_id(user_id, account_id)
+        if not account:
+            return False
+        return await self._delete_risk_config_async(user_id, account.id, account_id)
+    
     def _db_to_response(
         self,
         db_config: DBRiskConfig,
@@ -22,6 +22,7 @@ from app.services.backtest_service import (
     run_backtest,
     fetch_historical_klines as _fetch_historical_klines,
 )
+from app.strategies.indicator_cache import IndicatorSeriesCache
 
 
 # ============================================================================
@@ -297,10 +298,13 @@ async def run_sensitivity_analysis(
     if final_kline_interval:
         base_backtest_request.params['kline_interval'] = final_kline_interval
     
+    # Every test value shares the indicator series of the unchanged parameters
+    indicator_cache = IndicatorSeriesCache(klines)
     base_backtest_result = await run_backtest(
         base_backtest_request,
         client,
-        pre_fetched_klines=klines
+        pre_fetched_klines=klines,
+        indicator_cache=indicator_cache
     )
     base_metric_value, _ = extract_metric_value(base_backtest_result, request.metric)
     
@@ -359,7 +363,8 @@ async def run_sensitivity_analysis(
                 backtest_result = await run_backtest(
                     backtest_request,
                     client,
-                    pre_fetched_klines=klines  # Reuse fetched klines
+                    pre_fetched_klines=klines,  # Reuse fetched klines
+                    indicator_cache=indicator_cache
                 )
                 
                 # Handle no-trade cases (store with flag instead of skipping)
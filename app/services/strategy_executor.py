@@ -17,6 +17,7 @@ from app.core.circuit_breaker import CircuitBreakerOpenError
 from app.models.strategy import StrategyState, StrategySummary
 from app.risk.manager import RiskManager
 from app.services.notifier import NotificationService
+from app.services.evaluation_scheduler import EvaluationScheduler
 from app.services.order_executor import OrderExecutor
 from app.services.strategy_account_manager import StrategyAccountManager
 from app.services.strategy_order_manager import StrategyOrderManager
@@ -40,6 +41,7 @@ class StrategyExecutor:
         default_executor: Optional[OrderExecutor] = None,
         notification_service: Optional[NotificationService] = None,
         lock: Optional[asyncio.Lock] = None,
+        evaluation_scheduler: Optional[EvaluationScheduler] = None,
     ) -> None:
         """Initialize the strategy executor.
         
@@ -52,6 +54,7 @@ class StrategyExecutor:
             default_executor: Default order executor (optional)
             notification_service: Notification service for PnL alerts
             lock: Async lock for thread safety
+            evaluation_scheduler: Shared candle fan-out, price/position lookups and order slots (optional)
         """
         self.account_manager = account_manager
         self.state_manager = state_manager
@@ -61,6 +64,7 @@ class StrategyExecutor:
         self.default_executor = default_executor
         self.notifications = notification_service
         self._lock = lock
+        self.evaluation_scheduler = evaluation_scheduler
     
     # Throttle: do not send the same order-failure notification more than once per 15 minutes per strategy
     _ORDER_FAILURE_NOTIFY_THROTTLE_MINUTES = 15
@@ -174,7 +178,7 @@ class StrategyExecutor:
                 # CRITICAL: Add timeout to prevent getting stuck on position sync
                 try:
                     await asyncio.wait_for(
-                        self.state_manager.update_position_info(summary),
+                        self.state_manager.update_position_info(summary, shared_fetch=True),
                         timeout=30.0  # 30 second timeout for position sync
                     )
                 except asyncio.TimeoutError:
@@ -278,8 +282,13 @@ class StrategyExecutor:
                 # Wrap sync BinanceClient call in to_thread to avoid blocking event loop
                 # CRITICAL: Add timeout to prevent getting stuck on price fetch
                 try:
+                    if self.evaluation_scheduler:
+                        # Stream price or one shared REST call per symbol (not one per strategy)
+                        price_fetch = self.evaluation_scheduler.get_price(summary.symbol, account_client)
+                    else:
+                        price_fetch = asyncio.to_thread(account_client.get_price, summary.symbol)
                     summary.current_price = await asyncio.wait_for(
-                        asyncio.to_thread(account_client.get_price, summary.symbol),
+                        price_fetch,
                         timeout=10.0  # 10 second timeout for price fetch (not critical)
                     )
                 except asyncio.TimeoutError:
@@ -309,7 +318,7 @@ class StrategyExecutor:
                 # CRITICAL: Add timeout to prevent strategy from getting stuck if order execution hangs
                 try:
                     await asyncio.wait_for(
-                        self._execute_order(signal, summary, strategy, account_risk, account_executor),
+                        self._execute_order_bounded(signal, summary, strategy, account_risk, account_executor),
                         timeout=60.0  # 60 second timeout for order execution (prevents infinite hang)
                     )
                 except asyncio.TimeoutError:
@@ -457,6 +466,8 @@ class StrategyExecutor:
                         )
                     )
 
+                if self.evaluation_scheduler:
+                    self.evaluation_scheduler.forget(summary.id)
                 await strategy.teardown()
                 raise
             except (RiskLimitExceededError, CircuitBreakerActiveError) as exc:
@@ -522,6 +533,17 @@ class StrategyExecutor:
             finally:
                 # CRITICAL: Always remove task from _tasks when loop exits
                 logger.debug(f"Strategy loop ended for {summary.id}")
+        
+        if self.evaluation_scheduler:
+            self.evaluation_scheduler.forget(summary.id)
+    
+    async def _execute_order_bounded(self, *args, **kwargs) -> None:
+        """Run _execute_order in one of the scheduler's order slots (bounded concurrency)."""
+        if not self.evaluation_scheduler:
+            await self._execute_order(*args, **kwargs)
+            return
+        async with self.evaluation_scheduler.order_slots:
+            await self._execute_order(*args, **kwargs)
     
     async def _execute_order(
         self,
@@ -1538,11 +1560,20 @@ class StrategyExecutor:
                 # Wait for new candle event with timeout (interval_seconds)
                 # This ensures strategies evaluate simultaneously when new candle arrives,
                 # but still evaluate periodically for TP/SL checks even if no new candle
-                new_candle_arrived = await strategy.kline_manager.wait_for_new_candle(
-                    symbol=summary.symbol,
-                    interval=kline_interval,
-                    timeout=strategy.context.interval_seconds
-                )
+                if self.evaluation_scheduler and self.evaluation_scheduler.kline_manager is strategy.kline_manager:
+                    # Scheduler fan-out: also catches a candle that closed while this strategy was busy
+                    new_candle_arrived = await self.evaluation_scheduler.wait_for_candle(
+                        summary.id,
+                        summary.symbol,
+                        kline_interval,
+                        timeout=strategy.context.interval_seconds,
+                    )
+                else:
+                    new_candle_arrived = await strategy.kline_manager.wait_for_new_candle(
+                        symbol=summary.symbol,
+                        interval=kline_interval,
+                        timeout=strategy.context.interval_seconds
+                    )
                 
                 if new_candle_arrived:
                     logger.debug(
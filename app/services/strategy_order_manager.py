@@ -20,6 +20,7 @@ from app.models.order import OrderResponse
 from app.models.strategy import StrategySummary
 from app.risk.manager import RiskManager, PositionSizingResult
 from app.risk.dynamic_sizing import DynamicPositionSizer, DynamicSizingConfig
+from app.risk.risk_config_cache import StrategyRiskContext, get_risk_config_cache
 from app.services.order_executor import OrderExecutor
 from app.services.strategy_account_manager import StrategyAccountManager
 from app.strategies.base import Strategy, StrategySignal
@@ -187,6 +188,73 @@ class StrategyOrderManager:
                 mem.current_price = None
         return True
 
+    async def _load_strategy_risk_context(
+        self,
+        summary: StrategySummary,
+    ) -> tuple[Optional["UUID"], Optional[Any]]:
+        """Resolve strategy UUID and enabled strategy risk config for the pre-trade check.
+        
+        Served from the process-wide risk config cache in steady state; the risk config
+        endpoints invalidate it, so the database is only hit on a cold/invalidated entry.
+        
+        Args:
+            summary: Strategy summary
+            
+        Returns:
+            Tuple of (strategy_uuid, strategy_config); either may be None
+        """
+        strategy_config = None
+        strategy_uuid = None
+        if not (self.db_service and self.user_id):
+            return strategy_uuid, strategy_config
+        
+        risk_config_cache = get_risk_config_cache()
+        cached_context = risk_config_cache.get_strategy_context(self.user_id, summary.id)
+        if cached_context is not None:
+            return cached_context.strategy_uuid, cached_context.strategy_config
+        generation = risk_config_cache.generation(self.user_id)
+        
+        try:
+            # Get strategy UUID from database (needed for strategy-specific PnL calculation)
+            db_strategy = None
+            if hasattr(self.db_service, '_is_async') and self.db_service._is_async:
+                db_strategy = await self.db_service.async_get_strategy(self.user_id, summary.id)
+            else:
+                db_strategy = self.db_service.get_strategy(self.user_id, summary.id)
+            
+            if db_strategy:
+                strategy_uuid = db_strategy.id
+                
+                # Load strategy risk config
+                if hasattr(self.db_service, '_is_async') and self.db_service._is_async:
+                    db_risk_config = await self.db_service.async_get_strategy_risk_config(
+                        self.user_id, summary.id
+                    )
+                else:
+                    db_risk_config = self.db_service.get_strategy_risk_config(
+                        self.user_id, summary.id
+                    )
+                
+                if db_risk_config and db_risk_config.enabled:
+                    # Convert database model to Pydantic response model
+                    from app.models.risk_management import StrategyRiskConfigResponse
+                    strategy_config = StrategyRiskConfigResponse.from_orm(db_risk_config)
+                
+                risk_config_cache.set_strategy_context(
+                    self.user_id,
+                    summary.id,
+                    StrategyRiskContext(strategy_uuid=strategy_uuid, strategy_config=strategy_config),
+                    generation=generation,
+                )
+        except Exception as e:
+            # Log but don't fail - strategy config is optional
+            logger.debug(
+                f"[{summary.id}] Failed to load strategy risk config: {e}. "
+                f"Using account-level config only."
+            )
+        
+        return strategy_uuid, strategy_config
+    
     async def execute_order(
         self,
         signal: StrategySignal,
@@ -241,6 +309,7 @@ class StrategyOrderManager:
                 client=account_client,
                 trade_service=self.trade_service,
                 user_id=self.user_id,
+                idempotency_index=getattr(self.strategy_runner, "idempotency_index", None),
             )
         
         # Log account being used for order execution
@@ -397,41 +466,8 @@ class StrategyOrderManager:
         if self.portfolio_risk_manager_factory:
             portfolio_risk_manager = self.portfolio_risk_manager_factory(account_id)
         
-        # Load strategy risk config if available
-        strategy_config = None
-        strategy_uuid = None
-        if self.db_service and self.user_id:
-            try:
-                # Get strategy UUID from database (needed for strategy-specific PnL calculation)
-                db_strategy = None
-                if hasattr(self.db_service, '_is_async') and self.db_service._is_async:
-                    db_strategy = await self.db_service.async_get_strategy(self.user_id, summary.id)
-                else:
-                    db_strategy = self.db_service.get_strategy(self.user_id, summary.id)
-                
-                if db_strategy:
-                    strategy_uuid = db_strategy.id
-                    
-                    # Load strategy risk config
-                    if hasattr(self.db_service, '_is_async') and self.db_service._is_async:
-                        db_risk_config = await self.db_service.async_get_strategy_risk_config(
-                            self.user_id, summary.id
-                        )
-                    else:
-                        db_risk_config = self.db_service.get_strategy_risk_config(
-                            self.user_id, summary.id
-                        )
-                    
-                    if db_risk_config and db_risk_config.enabled:
-                        # Convert database model to Pydantic response model
-                        from app.models.risk_management import StrategyRiskConfigResponse
-                        strategy_config = StrategyRiskConfigResponse.from_orm(db_risk_config)
-            except Exception as e:
-                # Log but don't fail - strategy config is optional
-                logger.debug(
-                    f"[{summary.id}] Failed to load strategy risk config: {e}. "
-                    f"Using account-level config only."
-                )
+        # Load strategy risk config if available (cached; see _load_strategy_risk_context)
+        strategy_uuid, strategy_config = await self._load_strategy_risk_context(summary)
         
         if portfolio_risk_manager:
             # CRITICAL: check_order_allowed() uses async locking internally
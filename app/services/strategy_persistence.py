@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from app.services.trade_service import TradeService
     from app.core.position_broadcast import PositionBroadcastService
     from app.core.mark_price_stream_manager import MarkPriceStreamManager
+    from app.services.evaluation_scheduler import EvaluationScheduler
     from app.services.notifier import NotificationService
     from app.services.notifier import NotificationService
 
@@ -66,6 +67,8 @@ class StrategyPersistence:
         self.mark_price_stream_manager = mark_price_stream_manager
         self.trade_service = trade_service
         self.notification_service = notification_service
+        # Set by StrategyRunner: shares position lookups across strategies (see EvaluationScheduler)
+        self.evaluation_scheduler: Optional["EvaluationScheduler"] = None
         
         # Cooldown tracking for unrealized PnL alerts: {strategy_id: {alert_type: last_alert_time}}
         self._unrealized_pnl_alert_cooldowns: Dict[str, Dict[str, datetime]] = {}
@@ -187,8 +190,18 @@ class StrategyPersistence:
         except Exception as exc:
             logger.warning(f"Failed to save strategy {strategy_id} to Redis: {exc}")
     
+    def append_trade_to_redis(self, strategy_id: str, trade: OrderResponse) -> None:
+        """Append one new trade of a strategy to Redis."""
+        if not self.redis or not self.redis.enabled:
+            return
+        
+        try:
+            self.redis.append_trade(strategy_id, trade.model_dump(mode='json'))
+        except Exception as exc:
+            logger.warning(f"Failed to append trade for {strategy_id} to Redis: {exc}")
+    
     def save_trades_to_redis(self, strategy_id: str) -> None:
-        """Save trades for a strategy to Redis."""
+        """Rewrite all trades of a strategy in Redis (use append_trade_to_redis for new trades)."""
         if not self.redis or not self.redis.enabled:
             return
         
@@ -296,6 +309,7 @@ class StrategyPersistence:
             # Load all strategies
             strategies_data = self.redis.get_all_strategies()
             logger.info(f"Loading {len(strategies_data)} strategies from Redis")
+            trades_by_strategy = self.redis.get_trades_many(list(strategies_data))
             
             loaded_count = 0
             trades_loaded_count = 0
@@ -317,7 +331,7 @@ class StrategyPersistence:
                     loaded_count += 1
                     
                     # Load trades for this strategy
-                    trades_data = self.redis.get_trades(strategy_id)
+                    trades_data = trades_by_strategy.get(strategy_id)
                     if trades_data:
                         trades = []
                         for trade_data in trades_data:
@@ -635,7 +649,7 @@ class StrategyPersistence:
                     f"[{summary.id}] mark price register/subscribe on broadcast failed: {exc}"
                 )
 
-    async def update_position_info(self, summary: StrategySummary) -> None:
+    async def update_position_info(self, summary: StrategySummary, shared_fetch: bool = False) -> None:
         """Update position information and unrealized PnL for a strategy.
         
         CRITICAL: Database is single source of truth. Position state is synced:
@@ -648,6 +662,8 @@ class StrategyPersistence:
         
         Args:
             summary: Strategy summary to update
+            shared_fetch: Join an in-flight position request for the same account/symbol
+                (periodic loop sync only; post-order syncs must see the fill)
         """
         if not self.account_manager:
             logger.warning("Cannot update position info: account_manager not available")
@@ -669,7 +685,13 @@ class StrategyPersistence:
             
             # Get current position from Binance (reality)
             # Wrap sync BinanceClient call in to_thread to avoid blocking event loop
-            position = await asyncio.to_thread(account_client.get_open_position, summary.symbol)
+            if shared_fetch and self.evaluation_scheduler:
+                # Strategies on the same account/symbol share one REST call per evaluation pass
+                position = await self.evaluation_scheduler.get_open_position(
+                    account_id, summary.symbol, account_client
+                )
+            else:
+                position = await asyncio.to_thread(account_client.get_open_position, summary.symbol)
             
             # Track previous state for change detection (capture BEFORE overwriting)
             previous_position_size = summary.position_size
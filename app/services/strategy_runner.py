@@ -11,6 +11,7 @@ from loguru import logger
 from app.core.my_binance_client import BinanceClient
 from app.core.binance_client_manager import BinanceClientManager
 from app.models.order import OrderResponse
+from app.core.idempotency_index import IdempotencyIndex
 from app.core.redis_storage import RedisStorage
 from app.core.exceptions import (
     StrategyNotFoundError,
@@ -22,6 +23,7 @@ from app.core.exceptions import (
     OrderExecutionError,
     BinanceAPIError,
     SymbolConflictError,
+    StrategyOwnedByOtherWorkerError,
 )
 from app.risk.manager import RiskManager, PositionSizingResult
 from app.models.strategy import CreateStrategyRequest, StrategyState, StrategySummary, StrategyType, StrategyStats, OverallStats
@@ -32,6 +34,7 @@ from app.services.strategy_registry import StrategyRegistry
 from app.services.strategy_account_manager import StrategyAccountManager
 from app.services.strategy_persistence import StrategyPersistence
 from app.services.strategy_order_manager import StrategyOrderManager
+from app.services.evaluation_scheduler import get_evaluation_scheduler
 from app.services.strategy_executor import StrategyExecutor
 from app.services.strategy_statistics import StrategyStatistics
 from app.services.manual_trading_service import (
@@ -46,6 +49,12 @@ if TYPE_CHECKING:
     from app.services.trade_service import TradeService
     from app.core.position_broadcast import PositionBroadcastService
     from app.core.mark_price_stream_manager import MarkPriceStreamManager
+    from app.core.strategy_leases import StrategyLeaseManager
+
+
+# Klines seeded per symbol/interval before restored strategies start; covers
+# the history every built-in strategy requests on its first evaluation
+RESTORE_KLINE_WARMUP_LIMIT = 500
 
 
 async def _run_completed_trade_on_manual_close(
@@ -106,6 +115,8 @@ class StrategyRunner:
         skip_strategy_load: bool = False,
         position_broadcast_service: Optional["PositionBroadcastService"] = None,
         mark_price_stream_manager: Optional["MarkPriceStreamManager"] = None,
+        lease_manager: Optional["StrategyLeaseManager"] = None,
+        idempotency_index: Optional[IdempotencyIndex] = None,
     ) -> None:
         """Initialize StrategyRunner.
         
@@ -124,6 +135,9 @@ class StrategyRunner:
             trade_service: TradeService for trade persistence (optional, will be created if not provided and strategy_service/user_id are available)
             position_broadcast_service: Optional service to push real-time position updates to client WebSockets
             mark_price_stream_manager: Optional manager for mark price streams (real-time PnL push)
+            lease_manager: Optional Redis leases so several worker processes share the strategies
+            idempotency_index: Optional shared index of recent order idempotency keys (per-request
+                runners pass the base runner's, so duplicate protection spans requests)
         """
         # Support both single client (backward compatibility) and client manager (multi-account)
         if client_manager:
@@ -160,6 +174,11 @@ class StrategyRunner:
         
         # Initialize core components
         self.max_concurrent = max_concurrent
+        from app.core.config import get_settings
+        self.restore_concurrency = max(1, get_settings().strategy_restore_concurrency)
+        self.lease_manager = lease_manager
+        self._lease_task: Optional[asyncio.Task] = None  # Periodic lease renewal / takeover
+        self._lease_running: bool = False
         self.redis = redis_storage
         self.notifications = notification_service
         self.strategy_service = strategy_service
@@ -169,6 +188,12 @@ class StrategyRunner:
         self._strategies: Dict[str, StrategySummary] = {}
         self._tasks: Dict[str, asyncio.Task] = {}
         self._trades: Dict[str, List[OrderResponse]] = {}  # Track trades per strategy
+        # Shared idempotency index so every executor this runner creates sees the same recent keys
+        self.idempotency_index = (
+            idempotency_index
+            if idempotency_index is not None
+            else IdempotencyIndex(redis_storage=redis_storage)
+        )
         self._cleanup_task: Optional[asyncio.Task] = None  # Periodic cleanup task
         self._cleanup_running: bool = False  # Flag to control cleanup loop
         self._position_refresh_task: Optional[asyncio.Task] = None  # Periodic position refresh
@@ -219,9 +244,15 @@ class StrategyRunner:
         self.kline_manager: Optional["WebSocketKlineManager"] = None
         if use_websocket:
             try:
+                from app.core.config import get_settings
                 from app.core.websocket_kline_manager import WebSocketKlineManager
-                self.kline_manager = WebSocketKlineManager(testnet=False)
-                logger.info("WebSocket kline manager initialized (mainnet)")
+                settings = get_settings()
+                self.kline_manager = WebSocketKlineManager(
+                    testnet=False,
+                    local_aggregation=settings.use_local_kline_aggregation,
+                    use_market_data_bus=settings.market_data_source == "redis",
+                )
+                logger.info(f"WebSocket kline manager initialized (mainnet, source: {settings.market_data_source})")
             except Exception as e:
                 logger.warning(f"Failed to initialize WebSocket manager: {e}. Falling back to REST API.")
                 self.kline_manager = None
@@ -315,6 +346,10 @@ class StrategyRunner:
             circuit_breaker_factory=circuit_breaker_factory,
         )
         
+        # Process-wide candle fan-out / shared market data (one per kline manager)
+        self.evaluation_scheduler = get_evaluation_scheduler(self.kline_manager)
+        self.state_manager.evaluation_scheduler = self.evaluation_scheduler
+        
         # Initialize executor
         self.executor = StrategyExecutor(
             account_manager=self.account_manager,
@@ -325,6 +360,7 @@ class StrategyRunner:
             default_executor=executor,
             notification_service=notification_service,
             lock=self._lock,
+            evaluation_scheduler=self.evaluation_scheduler,
         )
         
         # Initialize statistics
@@ -338,9 +374,12 @@ class StrategyRunner:
         )
 
         # User Data Stream for real-time position updates (one WebSocket per account)
+        from app.core.config import get_settings
         self.user_data_stream_manager = FuturesUserDataStreamManager(
             account_manager=self.account_manager,
             on_position_update=self._on_user_data_position_update,
+            snapshot_resync_interval=get_settings().account_snapshot_resync_seconds,
+            user_id=user_id,
         )
         
         # Load strategies on startup
@@ -639,6 +678,11 @@ class StrategyRunner:
         This is called on startup to restore strategies that were running
         before the server was restarted. It respects max_concurrent limit.
         
+        Strategies are started ``restore_concurrency`` at a time. Klines are
+        warmed once per symbol/interval before any strategy starts, and all
+        started tasks are checked for liveness in a single pass, so restart
+        time does not grow with the number of strategies.
+        
         Returns:
             List of strategy IDs that were successfully restored
         """
@@ -662,79 +706,164 @@ class StrategyRunner:
             
             logger.info(f"Found {len(running_strategies)} strategies with status=running to restore")
             
-            # Restore each strategy (respects max_concurrent limit)
-            for strategy_id in running_strategies:
-                try:
-                    await self.start(strategy_id)
-                    
-                    # CRITICAL: Verify task is actually running after start
-                    # Wait a moment for task to start, then check if it's still alive
-                    await asyncio.sleep(0.5)  # 500ms to allow task to start
-                    
-                    # Check if task exists and is running
-                    async with self._lock:
-                        if strategy_id in self._tasks:
-                            task = self._tasks[strategy_id]
-                            if task.done():
-                                # Task completed immediately - mark as error
-                                exception = None
-                                try:
-                                    exception = task.exception()
-                                except Exception:
-                                    pass
-                                
-                                logger.error(
-                                    f"Restored strategy {strategy_id} but task died immediately. "
-                                    f"Exception: {exception}"
-                                )
-                                # Remove dead task and mark as error
-                                del self._tasks[strategy_id]
+            # Skip strategies already running here or, in multi-worker mode, in another worker
+            running_strategies = [
+                sid for sid in running_strategies
+                if not (sid in self._tasks and not self._tasks[sid].done())
+                and not (self.lease_manager and self.lease_manager.held_by_other_worker(sid))
+            ]
+            
+            # Respect max_concurrent limit: only restore as many as there are free slots
+            await self._cleanup_dead_tasks()
+            free_slots = max(0, self.max_concurrent - len(self._tasks))
+            if len(running_strategies) > free_slots:
+                logger.warning(
+                    f"Cannot restore {len(running_strategies) - free_slots} strategies: max_concurrent limit reached. "
+                    f"Will retry on next restore cycle."
+                )
+                running_strategies = running_strategies[:free_slots]
+            if not running_strategies:
+                return []
+            
+            semaphore = asyncio.Semaphore(self.restore_concurrency)
+            warmed_streams = await self._warm_up_restore_klines(running_strategies, semaphore)
+            try:
+                async def start_one(strategy_id: str) -> Optional[str]:
+                    async with semaphore:
+                        try:
+                            await self.start(strategy_id)
+                            return strategy_id
+                        except StrategyOwnedByOtherWorkerError:
+                            logger.info(f"Not restoring strategy {strategy_id}: another worker runs it")
+                        except MaxConcurrentStrategiesError:
+                            logger.warning(
+                                f"Cannot restore strategy {strategy_id}: max_concurrent limit reached. "
+                                f"Will retry on next restore cycle."
+                            )
+                        except Exception as exc:
+                            logger.error(f"Failed to restore strategy {strategy_id}: {exc}", exc_info=True)
+                            # Mark as error if restore fails
+                            if strategy_id in self._strategies:
                                 self._strategies[strategy_id].status = StrategyState.error
                                 self.state_manager.update_strategy_in_db(
                                     strategy_id,
                                     save_to_redis=True,
                                     status=StrategyState.error.value
                                 )
-                                # Don't add to restored_ids - restoration failed
-                                continue
-                            else:
-                                # Task is running - restoration successful
-                                logger.info(f"✅ Restored running strategy: {strategy_id} (task is active)")
-                                restored_ids.append(strategy_id)
-                        else:
-                            # Task was never created - mark as error
-                            logger.error(
-                                f"Restored strategy {strategy_id} but task was not created"
-                            )
-                            self._strategies[strategy_id].status = StrategyState.error
-                            self.state_manager.update_strategy_in_db(
-                                strategy_id,
-                                save_to_redis=True,
-                                status=StrategyState.error.value
-                            )
-                            # Don't add to restored_ids - restoration failed
-                            continue
-                except MaxConcurrentStrategiesError:
-                    logger.warning(
-                        f"Cannot restore strategy {strategy_id}: max_concurrent limit reached. "
-                        f"Will retry on next restore cycle."
-                    )
-                    break  # Stop restoring if limit reached
-                except Exception as exc:
-                    logger.error(f"Failed to restore strategy {strategy_id}: {exc}", exc_info=True)
-                    # Mark as error if restore fails
-                    if strategy_id in self._strategies:
-                        self._strategies[strategy_id].status = StrategyState.error
-                        self.state_manager.update_strategy_in_db(
-                            strategy_id,
-                            save_to_redis=True,
-                            status=StrategyState.error.value
-                        )
+                        return None
+                
+                started = await asyncio.gather(*(start_one(sid) for sid in running_strategies))
+            finally:
+                # Strategies hold their own subscriptions now; release the warmup ones
+                for symbol, interval in warmed_streams:
+                    try:
+                        await self.kline_manager.unsubscribe(symbol, interval)
+                    except Exception as exc:
+                        logger.debug(f"Failed to release warmup subscription {symbol} {interval}: {exc}")
+            
+            restored_ids = await self._verify_restored_tasks([sid for sid in started if sid])
         except Exception as exc:
             logger.error(f"Failed to restore running strategies: {exc}", exc_info=True)
         
         return restored_ids
 
+    def _restore_kline_streams(self, strategy_ids: list[str]) -> set[tuple[str, str]]:
+        """Unique (symbol, interval) streams the given strategies subscribe to on start."""
+        streams: set[tuple[str, str]] = set()
+        for strategy_id in strategy_ids:
+            summary = self.state_manager._strategies.get(strategy_id)
+            if summary is None:
+                continue
+            params = summary.params
+            get = params.get if isinstance(params, dict) else lambda name, default: getattr(params, name, default)
+            symbol = summary.symbol.upper()
+            interval = get('kline_interval', '1m') or '1m'
+            streams.add((symbol, interval))
+            if get('enable_htf_bias', False) and interval == "1m" and not self.kline_manager.derives_from_base("5m"):
+                streams.add((symbol, "5m"))
+        return streams
+
+    async def _warm_up_restore_klines(
+        self, strategy_ids: list[str], semaphore: asyncio.Semaphore
+    ) -> list[tuple[str, str]]:
+        """Subscribe and seed each stream the restored strategies read, once per (symbol, interval).
+        
+        Without this every restored strategy opens its stream and fetches its
+        initial klines through REST itself. Returns the streams subscribed here;
+        the caller releases them once the strategies hold their own subscriptions.
+        """
+        if not self.kline_manager:
+            return []
+        
+        async def warm(symbol: str, interval: str) -> Optional[tuple[str, str]]:
+            async with semaphore:
+                try:
+                    await self.kline_manager.subscribe(symbol, interval)
+                except Exception as exc:
+                    logger.warning(f"Failed to subscribe {symbol} {interval} for restore warmup: {exc}")
+                    return None
+                try:
+                    await self.kline_manager.prefetch_klines(symbol, interval, RESTORE_KLINE_WARMUP_LIMIT)
+                except Exception as exc:
+                    # Strategies fetch their own klines (or fall back to REST) if warmup fails
+                    logger.warning(f"Failed to warm klines for {symbol} {interval}: {exc}")
+                return symbol, interval
+        
+        streams = sorted(self._restore_kline_streams(strategy_ids))
+        warmed = await asyncio.gather(*(warm(symbol, interval) for symbol, interval in streams))
+        logger.info(f"Warmed {len(streams)} kline stream(s) for {len(strategy_ids)} restored strategies")
+        return [stream for stream in warmed if stream]
+
+    async def _verify_restored_tasks(self, strategy_ids: list[str]) -> list[str]:
+        """Check once that the tasks of restored strategies are alive; mark dead ones as error.
+        
+        CRITICAL: Verify tasks are actually running after start.
+        Wait a moment for tasks to start, then check if they're still alive.
+        """
+        if not strategy_ids:
+            return []
+        await asyncio.sleep(0.5)  # 500ms to allow tasks to start
+        
+        restored_ids = []
+        failed_ids = []
+        async with self._lock:
+            for strategy_id in strategy_ids:
+                task = self._tasks.get(strategy_id)
+                if task is None:
+                    # Task was never created - mark as error
+                    logger.error(f"Restored strategy {strategy_id} but task was not created")
+                    failed_ids.append(strategy_id)
+                elif task.done():
+                    # Task completed immediately - mark as error
+                    exception = None
+                    try:
+                        exception = task.exception()
+                    except Exception:
+                        pass
+                    logger.error(
+                        f"Restored strategy {strategy_id} but task died immediately. "
+                        f"Exception: {exception}"
+                    )
+                    # Remove dead task
+                    del self._tasks[strategy_id]
+                    failed_ids.append(strategy_id)
+                else:
+                    # Task is running - restoration successful
+                    logger.info(f"✅ Restored running strategy: {strategy_id} (task is active)")
+                    restored_ids.append(strategy_id)
+            for strategy_id in failed_ids:
+                if strategy_id in self._strategies:
+                    self._strategies[strategy_id].status = StrategyState.error
+        
+        # Perform DB/Redis updates outside lock to avoid blocking
+        for strategy_id in failed_ids:
+            self.state_manager.update_strategy_in_db(
+                strategy_id,
+                save_to_redis=True,
+                status=StrategyState.error.value
+            )
+        return restored_ids
+
     async def _cleanup_dead_tasks(self) -> None:
         """Remove completed/cancelled tasks from _tasks dictionary.
         
@@ -864,6 +993,89 @@ class StrategyRunner:
         self._cleanup_task = None
         logger.info("✅ Periodic dead task cleanup stopped")
 
+    def _release_lease_if_idle(self, strategy_id: str) -> None:
+        """Release the lease taken by a failed start unless a task of this worker still runs the strategy."""
+        if not self.lease_manager:
+            return
+        task = self._tasks.get(strategy_id)
+        if task is None or task.done():
+            self.lease_manager.release(strategy_id)
+
+    async def _abandon_strategy(self, strategy_id: str, reason: str) -> None:
+        """Stop running a strategy in this worker only (no DB status change, positions untouched).
+        
+        Used when another worker owns the strategy now: it took over the lease,
+        or it handled a stop request and already closed the position.
+        """
+        async with self._lock:
+            task = self._tasks.pop(strategy_id, None)
+        if task and not task.done():
+            task.cancel()
+        logger.warning(f"Strategy {strategy_id} no longer runs in this worker: {reason}")
+
+    async def _maintain_leases(self) -> None:
+        """Renew the leases of local strategies, drop lost ones and take over orphaned strategies."""
+        from app.services.strategy_takeover import stopped_by_other_worker, take_over_orphaned_strategies
+        
+        live = [sid for sid, task in list(self._tasks.items()) if not task.done()]
+        for strategy_id in self.lease_manager.renew(live):
+            await self._abandon_strategy(strategy_id, "another worker took over its lease")
+        for strategy_id in self.lease_manager.owned - set(live):
+            self.lease_manager.release(strategy_id)
+        
+        try:
+            for strategy_id in await stopped_by_other_worker(live):
+                await self._abandon_strategy(strategy_id, "stopped through another worker")
+                self.lease_manager.release(strategy_id)
+        except Exception as exc:
+            logger.debug(f"Failed to check stop requests from other workers: {exc}")
+        
+        await take_over_orphaned_strategies(self)
+
+    async def _periodic_lease_loop(self, interval_seconds: float) -> None:
+        """Periodic background task keeping the strategy leases of this worker alive."""
+        logger.info(f"🔄 Starting strategy lease maintenance (worker: {self.lease_manager.worker_id}, interval: {interval_seconds}s)")
+        while self._lease_running:
+            try:
+                await self._maintain_leases()
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                logger.error(f"Error in strategy lease maintenance: {exc}", exc_info=True)
+            try:
+                await asyncio.sleep(interval_seconds)
+            except asyncio.CancelledError:
+                break
+        logger.info("🛑 Strategy lease maintenance stopped")
+
+    def start_lease_maintenance(self) -> None:
+        """Start renewing strategy leases (every third of the lease TTL) and taking over orphaned strategies."""
+        if not self.lease_manager:
+            return
+        if self._lease_task is not None and not self._lease_task.done():
+            logger.warning("Strategy lease maintenance is already running")
+            return
+        self._lease_running = True
+        self._lease_task = asyncio.create_task(
+            self._periodic_lease_loop(max(1.0, self.lease_manager.ttl_seconds / 3))
+        )
+
+    async def stop_lease_maintenance(self) -> None:
+        """Stop lease maintenance and release all leases so other workers take over immediately."""
+        if self._lease_task is not None and not self._lease_task.done():
+            self._lease_running = False
+            self._lease_task.cancel()
+            try:
+                await asyncio.wait_for(self._lease_task, timeout=5.0)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+            except Exception as exc:
+                logger.warning(f"Error stopping strategy lease maintenance: {exc}")
+        self._lease_task = None
+        if self.lease_manager:
+            for strategy_id in self.lease_manager.owned:
+                self.lease_manager.release(strategy_id)
+
     async def _periodic_position_refresh_loop(self, interval_seconds: int) -> None:
         """Periodic background task to refresh open position info (PnL, price) for running strategies.
 
@@ -1196,6 +1408,7 @@ class StrategyRunner:
             client=account_client,
             trade_service=self.trade_service,
             user_id=self.user_id,
+            idempotency_index=self.idempotency_index,
         )
         
         # For backward compatibility: if ema_crossover type, set default 5/20 EMA
@@ -1244,6 +1457,14 @@ class StrategyRunner:
                 self.user_id,
             )
             strategy.set_trail_recorder(trail_recorder)
+        # Strategies on the same stream evaluate one shared klines view per closed candle
+        scheduler = getattr(self, "evaluation_scheduler", None)
+        if scheduler is not None and self.kline_manager is not None and scheduler.kline_manager is self.kline_manager:
+            strategy.set_market_data(scheduler)
+        
+        # Multi-worker mode: only the worker holding the strategy's lease may run it
+        if self.lease_manager and not self.lease_manager.acquire(strategy_id):
+            raise StrategyOwnedByOtherWorkerError(strategy_id)
         
         # Subscribe to WebSocket stream (non-blocking - don't fail strategy start if this fails)
         websocket_subscribed = False
@@ -1258,8 +1479,8 @@ class StrategyRunner:
                 
                 # Subscribe to HTF interval if HTF bias is enabled
                 enable_htf_bias = summary.params.get('enable_htf_bias', False) if isinstance(summary.params, dict) else getattr(summary.params, 'enable_htf_bias', False)
-                if enable_htf_bias and interval == "1m":
-                    # Subscribe to 5m stream for HTF bias
+                if enable_htf_bias and interval == "1m" and not self.kline_manager.derives_from_base("5m"):
+                    # Subscribe to 5m stream for HTF bias (otherwise aggregated from the 1m stream)
                     await self.kline_manager.subscribe(summary.symbol, "5m")
                     websocket_htf_subscribed = True
                     logger.info(f"Subscribed to HTF WebSocket stream: {summary.symbol} 5m")
@@ -1396,8 +1617,10 @@ class StrategyRunner:
                             logger.warning(f"Failed to cleanup WebSocket subscription: {cleanup_exc}")
         except (MaxConcurrentStrategiesError, StrategyAlreadyRunningError) as exc:
             # These errors already have cleanup, just re-raise
+            self._release_lease_if_idle(strategy_id)
             raise
         except Exception as exc:
+            self._release_lease_if_idle(strategy_id)
             # Cleanup WebSocket subscription if strategy start fails
             if websocket_subscribed and self.kline_manager:
                 try:
@@ -1581,6 +1804,7 @@ class StrategyRunner:
             client=account_client,
             trade_service=self.trade_service,
             user_id=self.user_id,
+            idempotency_index=self.idempotency_index,
         )
         close_order = await asyncio.to_thread(
             manual_executor.execute,
@@ -1860,6 +2084,8 @@ class StrategyRunner:
             if task:
                 task.cancel()
             summary.status = StrategyState.stopped
+        if self.lease_manager:
+            self.lease_manager.release(strategy_id)
         
         # Unsubscribe from WebSocket stream
         if self.kline_manager:
@@ -1869,7 +2095,7 @@ class StrategyRunner:
                 
                 # Unsubscribe from HTF interval if HTF bias was enabled
                 enable_htf_bias = summary.params.get('enable_htf_bias', False) if isinstance(summary.params, dict) else getattr(summary.params, 'enable_htf_bias', False)
-                if enable_htf_bias and interval == "1m":
+                if enable_htf_bias and interval == "1m" and not self.kline_manager.derives_from_base("5m"):
                     await self.kline_manager.unsubscribe(summary.symbol, "5m")
                     logger.info(f"Unsubscribed from HTF WebSocket stream: {summary.symbol} 5m")
                 
@@ -200,7 +200,7 @@ class StrategyService(BaseCacheService):
         key = self._redis_key(user_id, strategy_id)
         
         # Try Redis first
-        cached_data = self._get_from_cache(key)
+        cached_data = await self._async_get_from_cache(key)
         if cached_data:
             logger.debug(f"Cache HIT for strategy {strategy_id}")
             return self._dict_to_strategy_summary(cached_data)
@@ -217,7 +217,7 @@ class StrategyService(BaseCacheService):
         
         # Cache in Redis
         data = self._strategy_summary_to_dict(summary)
-        self._save_to_cache(key, data)
+        await self._async_save_to_cache(key, data)
         
         return summary
     
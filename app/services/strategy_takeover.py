@@ -0,0 +1,110 @@
+"""
+Strategy takeover between worker processes.
+
+With ``STRATEGY_LEASES_ENABLED`` every worker periodically looks for
+strategies that should be running (``status=running`` in the database) but
+whose lease no live worker holds, e.g. because their worker died, and starts
+them itself. Starting takes the lease first, so when several workers race for
+the same strategy exactly one of them runs it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable
+from uuid import UUID
+
+from loguru import logger
+
+from app.core.database import get_db_session
+from app.models.db_models import Strategy
+from app.models.strategy import StrategyState
+
+if TYPE_CHECKING:
+    from app.services.strategy_runner import StrategyRunner
+
+
+def _strategy_statuses(strategy_ids: Iterable[str] | None = None) -> list[tuple[UUID, str, str]]:
+    """(user_id, strategy_id, status) of the given strategies, or of all running ones."""
+    with get_db_session() as db:
+        query = db.query(Strategy.user_id, Strategy.strategy_id, Strategy.status)
+        if strategy_ids is None:
+            query = query.filter(Strategy.status == StrategyState.running.value)
+        else:
+            query = query.filter(Strategy.strategy_id.in_(list(strategy_ids)))
+        return [tuple(row) for row in query.all()]
+
+
+async def stopped_by_other_worker(strategy_ids: list[str]) -> list[str]:
+    """Strategies running in this worker that were stopped through another worker.
+
+    The worker handling a stop request only updates the database when the
+    strategy runs elsewhere; the owning worker learns about it here.
+    """
+    if not strategy_ids:
+        return []
+    rows = await asyncio.to_thread(_strategy_statuses, strategy_ids)
+    return [strategy_id for _, strategy_id, status in rows if status == StrategyState.stopped.value]
+
+
+async def _restore_user_strategies(base_runner: "StrategyRunner", user_id: UUID) -> list[str]:
+    from app.services.strategy_runner import StrategyRunner
+    from app.services.strategy_service import StrategyService
+    from app.services.trade_service import TradeService
+
+    with get_db_session() as db:
+        # Same wiring as the per-user runners of API requests (see app.api.deps.get_strategy_runner)
+        runner = StrategyRunner(
+            client_manager=base_runner.client_manager,
+            client=base_runner.client,
+            max_concurrent=base_runner.max_concurrent,
+            redis_storage=base_runner.redis,
+            notification_service=base_runner.notifications,
+            strategy_service=StrategyService(db, base_runner.redis),
+            user_id=user_id,
+            use_websocket=False,
+            trade_service=TradeService(db, base_runner.redis),
+            skip_strategy_load=True,
+            position_broadcast_service=getattr(base_runner, "position_broadcast_service", None),
+            mark_price_stream_manager=getattr(base_runner, "mark_price_stream_manager", None),
+            lease_manager=base_runner.lease_manager,
+            idempotency_index=base_runner.idempotency_index,
+        )
+        runner.kline_manager = base_runner.kline_manager
+        runner._tasks = base_runner._tasks
+        runner._trades = base_runner._trades
+        return await runner.restore_running_strategies()
+
+
+async def take_over_orphaned_strategies(base_runner: "StrategyRunner") -> list[str]:
+    """Start running strategies of any user that no live worker holds a lease for.
+
+    Args:
+        base_runner: The application's StrategyRunner (owns the task registry of this worker)
+
+    Returns:
+        IDs of the strategies this worker took over
+    """
+    lease_manager = base_runner.lease_manager
+    if not (lease_manager and lease_manager.enabled):
+        return []
+
+    rows = await asyncio.to_thread(_strategy_statuses)
+    owners = lease_manager.owners(strategy_id for _, strategy_id, _ in rows)
+    orphaned: dict[UUID, list[str]] = defaultdict(list)
+    for user_id, strategy_id, _ in rows:
+        if owners.get(strategy_id) is None and strategy_id not in base_runner._tasks:
+            orphaned[user_id].append(strategy_id)
+
+    taken_over: list[str] = []
+    for user_id, strategy_ids in orphaned.items():
+        logger.warning(
+            f"Taking over {len(strategy_ids)} running strategies of user {user_id} without a live worker: "
+            f"{', '.join(strategy_ids[:5])}{'...' if len(strategy_ids) > 5 else ''}"
+        )
+        try:
+            taken_over.extend(await _restore_user_strategies(base_runner, user_id))
+        except Exception as exc:
+            logger.error(f"Failed to take over strategies of user {user_id}: {exc}", exc_info=True)
+    return taken_over
@@ -6,8 +6,13 @@ Splits historical data into multiple training/test windows for robust validation
 """
 from __future__ import annotations
 
+import asyncio
 import itertools
+import math
+import multiprocessing
 import statistics
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Literal
 
@@ -15,6 +20,7 @@ from fastapi import HTTPException
 from pydantic import BaseModel, Field
 from loguru import logger
 
+from app.core.config import get_settings
 from app.core.my_binance_client import BinanceClient
 from app.services.backtest_service import (
     BacktestRequest, 
@@ -25,6 +31,8 @@ from app.services.backtest_service import (
     normalize_interval as validate_and_normalize_interval,
 )
 from app.services.walk_forward_task_manager import get_task_manager
+from app.strategies.indicator_cache import IndicatorSeriesCache
+from app.utils.kline_series import KlineSeries
 
 
 # ============================================================================
@@ -72,9 +80,9 @@ class WalkForwardRequest(BaseModel):
         default="robust_score",
         description="Metric to optimize during training. 'robust_score' uses return-adjusted-by-drawdown (recommended)"
     )
-    optimization_method: Literal["grid_search", "random_search"] = Field(
+    optimization_method: Literal["grid_search", "random_search", "successive_halving"] = Field(
         default="grid_search",
-        description="Optimization algorithm"
+        description="Optimization algorithm. 'successive_halving' screens combinations on growing slices of the training window and fully backtests only the best"
     )
     
     # Optimization guardrails (configurable thresholds)
@@ -110,6 +118,7 @@ class WalkForwardWindow(BaseModel):
     training_result: BacktestResult
     optimized_params: Optional[dict] = None  # Best params found during training
     optimization_results: Optional[list[dict]] = None  # All parameter combinations tested during training
+    optimization_budget: Optional[dict] = None  # Backtests spent by the optimizer (method, backtests, full-window equivalents)
     
     # Test results (using optimized params)
     test_result: BacktestResult
@@ -680,6 +689,40 @@ def calculate_metric_score(
         return calculate_robust_score(result)
 
 
+def guardrail_failure_reason(
+    result: BacktestResult,
+    min_trades: int = 5,
+    max_dd_cap: float = 50.0,
+    lottery_threshold: float = 0.5
+) -> Optional[str]:
+    """
+    Explain which guardrail of ``calculate_metric_score`` rejects a result.
+    
+    Returns:
+        Human-readable reason, or None if no guardrail applies
+    """
+    if not result.trades or result.completed_trades < min_trades:
+        return f"Insufficient trades: {result.completed_trades} < {min_trades} (minimum required)"
+    if result.max_drawdown_pct > max_dd_cap:
+        return f"Max drawdown too high: {result.max_drawdown_pct:.2f}% > {max_dd_cap:.2f}% (maximum allowed)"
+    # Check for lottery trade
+    if result.completed_trades > 0:
+        winning_trades = [t for t in result.trades if t.get('net_pnl', 0) > 0]
+        if winning_trades:
+            total_profit = sum(t.get('net_pnl', 0) for t in winning_trades)
+            max_single_profit = max((t.get('net_pnl', 0) for t in winning_trades), default=0)
+            if total_profit > 0 and (max_single_profit / total_profit) > lottery_threshold:
+                return f"Lottery trade detected (single trade > {lottery_threshold:.1%} of total profit)"
+            elif total_profit <= 0:
+                # Edge case: All winning trades have net_pnl <= 0 (shouldn't happen, but handle it)
+                return "No profitable trades (all winning trades have zero or negative profit)"
+            return None
+        # Edge case: No winning trades at all
+        return "No winning trades (all trades resulted in losses or break-even)"
+    # Edge case: completed_trades is 0 but we got here (shouldn't happen due to first check)
+    return "No completed trades"
+
+
 async def optimize_parameters(
     request: WalkForwardRequest,
     training_start: datetime,
@@ -689,7 +732,8 @@ async def optimize_parameters(
     method: str,
     pre_fetched_klines: Optional[list[list]] = None,
     task_manager=None,
-    task_id: Optional[str] = None
+    task_id: Optional[str] = None,
+    budget: Optional[dict] = None
 ) -> tuple[dict, list[dict]]:
     """
     Optimize strategy parameters during training window.
@@ -700,7 +744,8 @@ async def optimize_parameters(
         training_end: Training period end
         client: Binance client
         metric: Metric to optimize (sharpe_ratio, total_return, etc.)
-        method: Optimization method (grid_search, random_search)
+        method: Optimization method (grid_search, random_search, successive_halving)
+        budget: Optional dict filled with the evaluation budget spent
     
     Returns:
         Tuple of (optimized_parameters_dict, all_optimization_results_list)
@@ -708,14 +753,19 @@ async def optimize_parameters(
     if method == "grid_search":
         return await grid_search_optimization(
             request, training_start, training_end, client, metric, pre_fetched_klines,
-            task_manager=task_manager, task_id=task_id
+            task_manager=task_manager, task_id=task_id, budget=budget
         )
     elif method == "random_search":
         # For now, use grid search (random search can be added later)
         logger.warning("Random search not yet implemented, using grid search")
         return await grid_search_optimization(
             request, training_start, training_end, client, metric, pre_fetched_klines,
-            task_manager=task_manager, task_id=task_id
+            task_manager=task_manager, task_id=task_id, budget=budget
+        )
+    elif method == "successive_halving":
+        return await successive_halving_optimization(
+            request, training_start, training_end, client, metric, pre_fetched_klines,
+            task_manager=task_manager, task_id=task_id, budget=budget
         )
     else:
         # Fallback: return fixed params with empty results
@@ -731,7 +781,8 @@ async def grid_search_optimization(
     metric: str,
     pre_fetched_klines: Optional[list[list]] = None,
     task_manager=None,
-    task_id: Optional[str] = None
+    task_id: Optional[str] = None,
+    budget: Optional[dict] = None
 ) -> tuple[dict, list[dict]]:
     """
     Grid search optimization - tests all parameter combinations.
@@ -742,6 +793,7 @@ async def grid_search_optimization(
         training_end: Training period end
         client: Binance client
         metric: Metric to optimize
+        budget: Optional dict filled with the evaluation budget spent
     
     Returns:
         Dictionary of optimized parameters
@@ -782,6 +834,8 @@ async def grid_search_optimization(
     import heapq
     top_results = []  # Min-heap to track top N results (we'll keep the worst of the best)
     MAX_STORED_RESULTS = 20
+    # Combinations sharing indicator periods reuse each other's EMA/RSI/ATR values
+    indicator_cache = IndicatorSeriesCache(pre_fetched_klines) if pre_fetched_klines is not None else None
     for i, param_set in enumerate(param_combinations_gen):
         # Check for cancellation during optimization loop
         if task_manager and task_id and task_manager.is_cancelled(task_id):
@@ -815,7 +869,9 @@ async def grid_search_optimization(
         
         try:
             # Use pre-fetched klines if available, otherwise fetch
-            result = await run_backtest(test_request, client, pre_fetched_klines=pre_fetched_klines)
+            result = await run_backtest(
+                test_request, client, pre_fetched_klines=pre_fetched_klines, indicator_cache=indicator_cache
+            )
             combinations_tested += 1
             
             # Calculate score based on metric (with guardrails)
@@ -830,28 +886,12 @@ async def grid_search_optimization(
             # Determine failure reason if score is -inf
             failure_reason = None
             if score == float('-inf'):
-                if not result.trades or result.completed_trades < request.min_trades_guardrail:
-                    failure_reason = f"Insufficient trades: {result.completed_trades} < {request.min_trades_guardrail} (minimum required)"
-                elif result.max_drawdown_pct > request.max_drawdown_cap:
-                    failure_reason = f"Max drawdown too high: {result.max_drawdown_pct:.2f}% > {request.max_drawdown_cap:.2f}% (maximum allowed)"
-                else:
-                    # Check for lottery trade
-                    if result.completed_trades > 0:
-                        winning_trades = [t for t in result.trades if t.get('net_pnl', 0) > 0]
-                        if winning_trades:
-                            total_profit = sum(t.get('net_pnl', 0) for t in winning_trades)
-                            max_single_profit = max((t.get('net_pnl', 0) for t in winning_trades), default=0)
-                            if total_profit > 0 and (max_single_profit / total_profit) > request.lottery_trade_threshold:
-                                failure_reason = f"Lottery trade detected (single trade > {request.lottery_trade_threshold:.1%} of total profit)"
-                            elif total_profit <= 0:
-                                # Edge case: All winning trades have net_pnl <= 0 (shouldn't happen, but handle it)
-                                failure_reason = "No profitable trades (all winning trades have zero or negative profit)"
-                        else:
-                            # Edge case: No winning trades at all
-                            failure_reason = "No winning trades (all trades resulted in losses or break-even)"
-                    else:
-                        # Edge case: completed_trades is 0 but we got here (shouldn't happen due to first check)
-                        failure_reason = "No completed trades"
+                failure_reason = guardrail_failure_reason(
+                    result,
+                    min_trades=request.min_trades_guardrail,
+                    max_dd_cap=request.max_drawdown_cap,
+                    lottery_threshold=request.lottery_trade_threshold
+                )
                 
                 # Fallback: If we still don't have a failure reason, log it for debugging
                 if not failure_reason:
@@ -1024,6 +1064,16 @@ async def grid_search_optimization(
         f"(out of {total_combinations} total combinations)"
     )
     
+    if budget is not None:
+        budget.update({
+            "method": "grid_search",
+            "combinations": total_combinations,
+            "skipped": combinations_skipped,
+            "backtests": total_combinations - combinations_skipped,
+            "full_window_equivalents": total_combinations - combinations_skipped,
+            "grid_search_equivalents": total_combinations - combinations_skipped
+        })
+    
     # Ensure optimized is not empty if optimization was attempted
     # If all combinations failed, return None instead of empty dict to indicate no optimization occurred
     if len(optimized) == 0 and best_score == float('-inf'):
@@ -1040,10 +1090,548 @@ async def grid_search_optimization(
     return optimized, all_optimization_results
 
 
+# Successive halving: each rung keeps the best 1/ETA of its candidates for a slice ETA times longer
+SUCCESSIVE_HALVING_ETA = 3
+SUCCESSIVE_HALVING_MIN_CANDLES = 300  # smallest slice a rung may use (indicator warm-up + some trades)
+
+
+def plan_successive_halving(
+    n_candidates: int,
+    n_klines: int,
+    eta: int = SUCCESSIVE_HALVING_ETA,
+    min_candles: int = SUCCESSIVE_HALVING_MIN_CANDLES
+) -> list[float]:
+    """
+    Data fractions of the successive halving rungs, smallest first, ending with the full window.
+    
+    One rung per factor ``eta`` of candidates, so about ``eta`` survivors reach
+    the full window; rungs whose slice would be shorter than ``min_candles``
+    are dropped.
+    """
+    if n_candidates <= 1:
+        return [1.0]
+    rungs = max(1, math.ceil(math.log(n_candidates) / math.log(eta) - 1e-9))
+    fractions = [eta ** -(rungs - 1 - k) for k in range(rungs)]
+    while len(fractions) > 1 and fractions[0] * n_klines < min_candles:
+        fractions.pop(0)
+    return fractions
+
+
+async def successive_halving_optimization(
+    request: WalkForwardRequest,
+    training_start: datetime,
+    training_end: datetime,
+    client: BinanceClient,
+    metric: str,
+    pre_fetched_klines: Optional[list[list]] = None,
+    task_manager=None,
+    task_id: Optional[str] = None,
+    budget: Optional[dict] = None
+) -> tuple[dict, list[dict]]:
+    """
+    Successive halving optimization - finds near-best parameters with a fraction of grid search's backtests.
+    
+    Every combination is backtested on the most recent slice of the training
+    window; the best 1/ETA move on to a slice ETA times longer, and so on until
+    the last survivors are scored on the full window exactly as grid search
+    scores them. Partial rungs apply the drawdown cap and a minimum-trades
+    guardrail scaled to the slice; the lottery-trade guardrail (meaningless
+    with a handful of trades) and the full minimum only apply on the full window.
+    
+    Args:
+        request: Walk-forward request
+        training_start: Training period start
+        training_end: Training period end
+        client: Binance client (only used if klines are not pre-fetched)
+        metric: Metric to optimize
+        budget: Optional dict filled with the evaluation budget spent
+    
+    Returns:
+        Tuple of (optimized_parameters_dict, top_results_list)
+    """
+    optimize_params = request.optimize_params
+    if not optimize_params or not isinstance(optimize_params, dict):
+        logger.warning("successive_halving_optimization: optimize_params is None or empty, returning base params")
+        return request.params, []
+    
+    klines = pre_fetched_klines
+    if klines is None:
+        raw_interval = request.params.get("kline_interval", "1m" if request.strategy_type in ("scalping", "reverse_scalping") else "5m")
+        klines = await _fetch_historical_klines(
+            client=client,
+            symbol=request.symbol,
+            interval=validate_and_normalize_interval(raw_interval, request.strategy_type),
+            start_time=training_start,
+            end_time=training_end
+        )
+    
+    total_combinations = count_param_combinations(optimize_params)
+    candidates = [
+        (i + 1, param_set)
+        for i, param_set in enumerate(generate_param_combinations_generator(optimize_params))
+        if is_valid_ema_combination(param_set, request.strategy_type)
+    ]
+    n_candidates = len(candidates)
+    combinations_skipped = total_combinations - n_candidates
+    fractions = plan_successive_halving(n_candidates, len(klines))
+    
+    planned_units = 0.0
+    remaining = n_candidates
+    for fraction in fractions:
+        planned_units += remaining * fraction
+        remaining = max(1, math.ceil(remaining / SUCCESSIVE_HALVING_ETA))
+    logger.info(
+        f"Successive halving: {n_candidates} combinations ({combinations_skipped} skipped), "
+        f"{len(fractions)} rungs over {len(klines)} candles, "
+        f"budget ~{planned_units:.1f} full-window backtests instead of {n_candidates}"
+    )
+    
+    best_params = request.params.copy()
+    best_score = float('-inf')
+    evaluations: dict[int, dict] = {}  # combination_number -> latest (deepest rung) evaluation
+    rung_summary = []
+    backtests = 0
+    units_done = 0.0
+    MAX_STORED_RESULTS = 20
+    
+    for rung, fraction in enumerate(fractions):
+        final_rung = rung == len(fractions) - 1
+        if final_rung:
+            rung_klines = klines
+            rung_start = training_start
+        else:
+            rung_klines = klines[len(klines) - max(1, round(len(klines) * fraction)):]
+            rung_start = datetime.fromtimestamp(int(rung_klines[0][0]) / 1000, tz=timezone.utc)
+        min_trades = request.min_trades_guardrail if final_rung else max(1, math.floor(request.min_trades_guardrail * fraction))
+        lottery_threshold = request.lottery_trade_threshold if final_rung else 1.0
+        indicator_cache = IndicatorSeriesCache(rung_klines)
+        
+        ranked = []
+        for combination_number, param_set in candidates:
+            if task_manager and task_id and task_manager.is_cancelled(task_id):
+                logger.info(f"Optimization cancelled in successive halving rung {rung+1}/{len(fractions)}")
+                raise HTTPException(
+                    status_code=499,
+                    detail="Walk-forward analysis was cancelled"
+                )
+            
+            test_params = {**request.params, **param_set}
+            record = {
+                "combination_number": combination_number,
+                "params": param_set.copy(),
+                "full_params": test_params.copy(),
+                "rung": rung + 1,
+                "data_fraction": round(fraction, 4),
+            }
+            test_request = BacktestRequest(
+                symbol=request.symbol,
+                strategy_type=request.strategy_type,
+                start_time=rung_start,
+                end_time=training_end,
+                leverage=request.leverage,
+                risk_per_trade=request.risk_per_trade,
+                fixed_amount=request.fixed_amount,
+                initial_balance=request.initial_balance,
+                params=test_params
+            )
+            try:
+                result = await run_backtest(
+                    test_request, client, pre_fetched_klines=rung_klines, indicator_cache=indicator_cache
+                )
+                score = calculate_metric_score(
+                    result,
+                    metric,
+                    min_trades=min_trades,
+                    max_dd_cap=request.max_drawdown_cap,
+                    lottery_threshold=lottery_threshold
+                )
+                passed = score > float('-inf')
+                record.update({
+                    "score": score if passed else None,
+                    "status": "passed" if passed else "failed",
+                    "failure_reason": None if passed else (
+                        guardrail_failure_reason(result, min_trades, request.max_drawdown_cap, lottery_threshold)
+                        or "Failed guardrails"
+                    ),
+                    "total_return_pct": result.total_return_pct,
+                    "total_trades": result.total_trades,
+                    "completed_trades": result.completed_trades,
+                    "win_rate": result.win_rate,
+                    "max_drawdown_pct": result.max_drawdown_pct,
+                    "sharpe_ratio": calculate_sharpe_ratio(result) if passed else None
+                })
+                # Passing combinations rank by score; failing ones behind them by return
+                ranked.append(((1, score) if passed else (0, result.total_return_pct), combination_number))
+                if final_rung and passed and score > best_score:
+                    best_score = score
+                    best_params = test_params
+            except Exception as e:
+                logger.warning(f"Error testing parameter set {combination_number} in rung {rung+1}: {e}")
+                record.update({
+                    "score": None,
+                    "status": "error",
+                    "failure_reason": f"Backtest error: {type(e).__name__} - {str(e)[:100]}",
+                    "error": str(e),
+                    "total_return_pct": None,
+                    "total_trades": None,
+                    "completed_trades": None,
+                    "win_rate": None,
+                    "max_drawdown_pct": None,
+                    "sharpe_ratio": None
+                })
+                ranked.append(((-1, 0.0), combination_number))
+            
+            evaluations[combination_number] = record
+            backtests += 1
+            units_done += fraction
+            if task_manager and task_id and (backtests % 10 == 0 or final_rung):
+                await task_manager.update_progress(
+                    task_id,
+                    current_phase="optimizing",
+                    message=(
+                        f"Optimizing (successive halving): rung {rung+1}/{len(fractions)}, "
+                        f"{backtests} backtests (~{units_done:.1f}/{planned_units:.1f} full-window equivalents)..."
+                    ),
+                    phase_progress=min(1.0, units_done / planned_units) if planned_units else 1.0
+                )
+        
+        rung_summary.append({
+            "rung": rung + 1,
+            "data_fraction": round(fraction, 4),
+            "candles": len(rung_klines),
+            "candidates": len(candidates)
+        })
+        if not final_rung:
+            # Best first; earlier combinations win ties (as in grid search)
+            ranked.sort(key=lambda r: (r[0], -r[1]), reverse=True)
+            keep = max(1, math.ceil(len(ranked) / SUCCESSIVE_HALVING_ETA))
+            survivors = {combination_number for _, combination_number in ranked[:keep]}
+            candidates = [c for c in candidates if c[0] in survivors]
+    
+    if budget is not None:
+        budget.update({
+            "method": "successive_halving",
+            "combinations": total_combinations,
+            "skipped": combinations_skipped,
+            "backtests": backtests,
+            "full_window_equivalents": round(units_done, 2),
+            "grid_search_equivalents": n_candidates,
+            "rungs": rung_summary
+        })
+    
+    if best_score == float('-inf'):
+        logger.warning(
+            f"All successive halving finalists failed optimization guardrails "
+            f"(min_trades={request.min_trades_guardrail}, max_dd_cap={request.max_drawdown_cap:.1f}%, "
+            f"lottery_threshold={request.lottery_trade_threshold:.1%}). Returning base parameters."
+        )
+    
+    optimized = {param_name: best_params.get(param_name) for param_name in optimize_params.keys()}
+    if len(optimized) == 0 and best_score == float('-inf'):
+        optimized = None
+    
+    # Deepest rung first, then by score
+    all_optimization_results = sorted(
+        evaluations.values(),
+        key=lambda r: (r["rung"], r["score"] if r["score"] is not None else float('-inf'), -r["combination_number"]),
+        reverse=True
+    )[:MAX_STORED_RESULTS]
+    
+    logger.info(
+        f"Successive halving complete: {backtests} backtests "
+        f"(~{units_done:.1f} full-window equivalents vs {n_candidates} for grid search), "
+        f"best params: {optimized}"
+    )
+    return optimized, all_optimization_results
+
+
 # ============================================================================
 # Core Walk-Forward Analysis
 # ============================================================================
 
+def _slice_window_klines(all_klines, window: dict, window_index: int) -> tuple:
+    """Return (train_klines, test_klines) for a window, failing if either period has no data."""
+    # CRITICAL: Slice klines per window to prevent data leakage
+    # Training slice: only training period data
+    train_klines = _slice_klines_by_time_range(
+        all_klines,
+        window['training_start'],
+        window['training_end']
+    )
+    if not train_klines:
+        raise HTTPException(
+            status_code=400,
+            detail=f"No klines found for training period {window['training_start']} to {window['training_end']}"
+        )
+    
+    # Test slice: only test period data
+    test_klines = _slice_klines_by_time_range(
+        all_klines,
+        window['test_start'],
+        window['test_end']
+    )
+    if not test_klines:
+        logger.warning(
+            f"Window {window_index+1}: No klines found for test period {window['test_start']} to {window['test_end']}. "
+            f"Total klines available: {len(all_klines)}, "
+            f"First kline time: {datetime.fromtimestamp(int(all_klines[0][0])/1000, tz=timezone.utc) if all_klines else 'N/A'}, "
+            f"Last kline time: {datetime.fromtimestamp(int(all_klines[-1][6])/1000, tz=timezone.utc) if all_klines else 'N/A'}"
+        )
+        raise HTTPException(
+            status_code=400,
+            detail=f"No klines found for test period {window['test_start']} to {window['test_end']}. "
+                   f"Available data: {datetime.fromtimestamp(int(all_klines[0][0])/1000, tz=timezone.utc) if all_klines else 'N/A'} to "
+                   f"{datetime.fromtimestamp(int(all_klines[-1][6])/1000, tz=timezone.utc) if all_klines else 'N/A'}"
+        )
+    
+    logger.debug(
+        f"Window {window_index+1}: Training klines={len(train_klines)}, Test klines={len(test_klines)}"
+    )
+    
+    return train_klines, test_klines
+
+
+async def _optimize_and_train_window(
+    request: WalkForwardRequest,
+    window: dict,
+    window_index: int,
+    total_windows: int,
+    train_klines,
+    client: Optional[BinanceClient],
+    task_manager=None,
+    task_id: Optional[str] = None
+) -> tuple[Optional[dict], list[dict], Optional[dict], dict, BacktestResult]:
+    """
+    Optimize parameters (if enabled) and run the training backtest for one window.
+    
+    Only the window's training slice is used, so windows are independent of
+    each other here and can run in any order or in parallel.
+    
+    Returns:
+        Tuple of (optimized_params, optimization_results, optimization_budget, training_params, training_result)
+    """
+    optimization_budget = None
+    # Step 2a: Run training backtest (with optimization if enabled)
+    logger.info(f"Window {window_index+1}: Checking optimization - optimize_params={request.optimize_params is not None}, "
+               f"optimize_params keys={list(request.optimize_params.keys()) if request.optimize_params else 'None'}, "
+               f"optimize_params values={request.optimize_params if request.optimize_params else 'None'}")
+    
+    if request.optimize_params and len(request.optimize_params) > 0:
+        # Optimize parameters during training
+        # CRITICAL: Pass only training klines to prevent data leakage
+        logger.info(f"Optimizing parameters for window {window_index+1}...")
+        logger.info(f"Optimization config: metric={request.optimization_metric}, method={request.optimization_method}")
+        logger.info(f"Parameters to optimize: {request.optimize_params}")
+        logger.info(f"Base params: {request.params}")
+        
+        if task_manager and task_id:
+            await task_manager.update_progress(
+                task_id,
+                current_window=window_index,
+                current_phase="optimizing",
+                message=f"Optimizing parameters for window {window_index+1}/{total_windows}..."
+            )
+        try:
+            optimization_budget = {}
+            result = await optimize_parameters(
+                request=request,
+                training_start=window['training_start'],
+                training_end=window['training_end'],
+                client=client,
+                metric=request.optimization_metric,
+                method=request.optimization_method,
+                pre_fetched_klines=train_klines,  # Only training data for optimization
+                task_manager=task_manager,
+                task_id=task_id,
+                budget=optimization_budget
+            )
+            # Safely unpack result, ensuring we always have valid values
+            if result is None or not isinstance(result, tuple) or len(result) != 2:
+                logger.error(f"optimize_parameters returned invalid result: {result}")
+                optimized_params = None
+                optimization_results = []
+            else:
+                optimized_params, optimization_results = result
+                # Ensure optimization_results is a list, not None
+                if optimization_results is None:
+                    logger.warning(f"Optimization returned None for results, using empty list")
+                    optimization_results = []
+            
+            logger.info(f"Optimization returned params: {optimized_params}")
+            logger.info(f"Optimization tested {len(optimization_results)} combinations")
+            logger.info(f"Optimization results type: {type(optimization_results)}, length: {len(optimization_results) if optimization_results else 'None'}")
+            training_params = {**request.params, **optimized_params} if optimized_params else request.params
+            logger.info(f"Final training params for window {window_index+1}: {training_params}")
+            logger.info(f"Optimized parameters for window {window_index+1}: {optimized_params}")
+            # Ensure optimization_results is always a list (not None) for proper serialization
+            if optimization_results is None:
+                logger.warning(f"optimization_results is None for window {window_index+1}, converting to empty list")
+                optimization_results = []
+        except Exception as e:
+            logger.error(f"Optimization failed for window {window_index+1}: {e}", exc_info=True)
+            logger.warning(f"Using fixed parameters due to optimization failure.")
+            optimized_params = None
+            optimization_results = []  # Use empty list instead of None for consistency
+            training_params = request.params
+    else:
+        # Use fixed parameters
+        if request.optimize_params is None:
+            logger.info(f"Window {window_index+1}: Using fixed parameters (optimization disabled - optimize_params is None)")
+        elif len(request.optimize_params) == 0:
+            logger.info(f"Window {window_index+1}: Using fixed parameters (optimization disabled - optimize_params is empty)")
+        else:
+            logger.warning(f"Window {window_index+1}: Using fixed parameters despite optimize_params being set (this should not happen)")
+        optimized_params = None
+        optimization_results = []  # Use empty list instead of None for consistency
+        training_params = request.params
+    
+    # Check for cancellation before training backtest
+    if task_manager and task_id and task_manager.is_cancelled(task_id):
+        logger.info(f"Walk-forward analysis cancelled before training backtest for window {window_index+1}")
+        raise HTTPException(
+            status_code=499,
+            detail="Walk-forward analysis was cancelled"
+        )
+    
+    # Run training backtest (using training slice only)
+    if task_manager and task_id:
+        await task_manager.update_progress(
+            task_id,
+            current_window=window_index,
+            current_phase="training",
+            message=f"Running training backtest for window {window_index+1}/{total_windows}..."
+        )
+    try:
+        training_request = BacktestRequest(
+            symbol=request.symbol,
+            strategy_type=request.strategy_type,
+            start_time=window['training_start'],
+            end_time=window['training_end'],
+            leverage=request.leverage,
+            risk_per_trade=request.risk_per_trade,
+            fixed_amount=request.fixed_amount,
+            initial_balance=request.initial_balance,  # Use initial balance for each training window
+            params=training_params
+        )
+        training_result = await run_backtest(training_request, client, pre_fetched_klines=train_klines)
+    except Exception as e:
+        logger.error(f"Error running training backtest for window {window_index+1}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to run training backtest for window {window_index+1}: {str(e)}"
+        )
+    
+    return optimized_params, optimization_results, optimization_budget or None, training_params, training_result
+
+
+class _WindowWorkerError(Exception):
+    """Picklable stand-in for an HTTPException raised in a window worker process."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _optimize_and_train_window_in_worker(
+    request: WalkForwardRequest,
+    window: dict,
+    window_index: int,
+    total_windows: int,
+    train_klines: list[list]
+) -> tuple[Optional[dict], list[dict], Optional[dict], dict, BacktestResult]:
+    """Process pool entry point for ``_optimize_and_train_window`` (klines are pre-fetched, no client needed)."""
+    try:
+        return asyncio.run(
+            _optimize_and_train_window(request, window, window_index, total_windows, train_klines, client=None)
+        )
+    except HTTPException as exc:
+        raise _WindowWorkerError(exc.status_code, str(exc.detail)) from None
+
+
+_window_pool: Optional[ProcessPoolExecutor] = None
+_WINDOW_POLL_SECONDS = 1.0  # progress/cancellation check interval while waiting on workers
+
+
+def _get_window_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the process-wide window worker pool (shared by concurrent analyses)."""
+    global _window_pool
+    if _window_pool is None:
+        # spawn: the API process runs threads (websockets, loggers) that must not be forked
+        _window_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    return _window_pool
+
+
+def shutdown_window_pool() -> None:
+    """Stop the window worker processes (application shutdown)."""
+    global _window_pool
+    if _window_pool is not None:
+        _window_pool.shutdown(wait=False, cancel_futures=True)
+        _window_pool = None
+
+
+def _submit_windows(
+    request: WalkForwardRequest,
+    windows: list[dict],
+    window_slices: list[tuple],
+    workers: int
+) -> list[asyncio.Future]:
+    """Start optimization + training of every window in the worker pool; futures are in window order."""
+    global _window_pool
+    pool = _get_window_pool(workers)
+    try:
+        return [
+            asyncio.wrap_future(pool.submit(
+                _optimize_and_train_window_in_worker,
+                request, window, i, len(windows), list(train_klines)
+            ))
+            for i, (window, (train_klines, _)) in enumerate(zip(windows, window_slices))
+        ]
+    except BrokenProcessPool:
+        _window_pool = None
+        raise
+
+
+async def _await_window_future(
+    window_futures: list[asyncio.Future],
+    window_index: int,
+    task_manager=None,
+    task_id: Optional[str] = None
+) -> tuple[Optional[dict], list[dict], dict, BacktestResult]:
+    """Wait for one window's worker result, reporting how many windows are done and honouring cancellation."""
+    global _window_pool
+    future = window_futures[window_index]
+    reported_done = -1
+    while not future.done():
+        if task_manager and task_id:
+            if task_manager.is_cancelled(task_id):
+                logger.info(f"Walk-forward analysis cancelled while optimizing window {window_index+1}")
+                raise HTTPException(
+                    status_code=499,
+                    detail="Walk-forward analysis was cancelled"
+                )
+            done = sum(1 for f in window_futures if f.done())
+            if done != reported_done:
+                reported_done = done
+                await task_manager.update_progress(
+                    task_id,
+                    current_window=window_index,
+                    current_phase="optimizing",
+                    message=f"Optimized {done}/{len(window_futures)} windows in parallel..."
+                )
+        await asyncio.wait({future}, timeout=_WINDOW_POLL_SECONDS)
+    try:
+        return future.result()
+    except _WindowWorkerError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.detail)
+    except BrokenProcessPool as exc:
+        _window_pool = None
+        raise HTTPException(
+            status_code=500,
+            detail=f"Window worker process failed for window {window_index+1}: {exc}"
+        )
+
+
 async def run_walk_forward_analysis(
     request: WalkForwardRequest,
     client: BinanceClient,
@@ -1154,6 +1742,9 @@ async def run_walk_forward_analysis(
             start_time=request.start_time,
             end_time=request.end_time
         )
+        # Index by open/close time once: each window slice is then two binary
+        # searches returning a view over all_klines instead of a filtered copy
+        all_klines = KlineSeries(all_klines)
         logger.info(
             f"✅ Fetched {len(all_klines)} klines for entire time range. "
             f"Will reuse cached data for all windows (no additional Binance API calls)."
@@ -1178,327 +1769,219 @@ async def run_walk_forward_analysis(
     equity_curve_points = []
     cumulative_balance = request.initial_balance
     
-    for i, window in enumerate(windows):
-        # Check for cancellation
-        if task_manager and task_id and task_manager.is_cancelled(task_id):
-            logger.info(f"Walk-forward analysis cancelled at window {i+1}/{len(windows)}")
-            # Don't call fail_task here - let the endpoint handler set status to "cancelled"
-            # Just raise the exception and the endpoint will handle it properly
-            raise HTTPException(
-                status_code=499,  # Client Closed Request
-                detail="Walk-forward analysis was cancelled"
-            )
-        logger.info(
-            f"Processing window {i+1}/{len(windows)}: "
-            f"Training {window['training_start'].date()} to {window['training_end'].date()}, "
-            f"Test {window['test_start'].date()} to {window['test_end'].date()}"
-        )
-        
-        # Update progress
-        if task_manager and task_id:
-            await task_manager.update_progress(
-                task_id,
-                current_window=i,
-                current_phase="processing_windows",
-                message=f"Processing window {i+1}/{len(windows)}..."
-            )
-        
-        # CRITICAL: Slice klines per window to prevent data leakage
-        # Training slice: only training period data
-        train_klines = _slice_klines_by_time_range(
-            all_klines,
-            window['training_start'],
-            window['training_end']
-        )
-        if not train_klines:
-            raise HTTPException(
-                status_code=400,
-                detail=f"No klines found for training period {window['training_start']} to {window['training_end']}"
+    # Optimization and training only read their own window's training slice, so
+    # with more than one worker they run for all windows at once in worker
+    # processes. Test backtests below stay in window order: each one starts from
+    # the balance the previous test window ended with.
+    window_workers = get_settings().walk_forward_window_workers
+    window_slices = None
+    window_futures = None
+    if window_workers > 1 and len(windows) > 1:
+        window_slices = [_slice_window_klines(all_klines, window, i) for i, window in enumerate(windows)]
+        window_futures = _submit_windows(request, windows, window_slices, window_workers)
+        logger.info(f"Optimizing and training {len(windows)} windows in up to {window_workers} worker processes")
+    
+    try:
+        for i, window in enumerate(windows):
+            # Check for cancellation
+            if task_manager and task_id and task_manager.is_cancelled(task_id):
+                logger.info(f"Walk-forward analysis cancelled at window {i+1}/{len(windows)}")
+                # Don't call fail_task here - let the endpoint handler set status to "cancelled"
+                # Just raise the exception and the endpoint will handle it properly
+                raise HTTPException(
+                    status_code=499,  # Client Closed Request
+                    detail="Walk-forward analysis was cancelled"
+                )
+            logger.info(
+                f"Processing window {i+1}/{len(windows)}: "
+                f"Training {window['training_start'].date()} to {window['training_end'].date()}, "
+                f"Test {window['test_start'].date()} to {window['test_end'].date()}"
             )
         
-        # Test slice: only test period data
-        test_klines = _slice_klines_by_time_range(
-            all_klines,
-            window['test_start'],
-            window['test_end']
-        )
-        if not test_klines:
-            logger.warning(
-                f"Window {i+1}: No klines found for test period {window['test_start']} to {window['test_end']}. "
-                f"Total klines available: {len(all_klines)}, "
-                f"First kline time: {datetime.fromtimestamp(int(all_klines[0][0])/1000, tz=timezone.utc) if all_klines else 'N/A'}, "
-                f"Last kline time: {datetime.fromtimestamp(int(all_klines[-1][6])/1000, tz=timezone.utc) if all_klines else 'N/A'}"
-            )
-            raise HTTPException(
-                status_code=400,
-                detail=f"No klines found for test period {window['test_start']} to {window['test_end']}. "
-                       f"Available data: {datetime.fromtimestamp(int(all_klines[0][0])/1000, tz=timezone.utc) if all_klines else 'N/A'} to "
-                       f"{datetime.fromtimestamp(int(all_klines[-1][6])/1000, tz=timezone.utc) if all_klines else 'N/A'}"
-            )
+            # Update progress
+            if task_manager and task_id:
+                await task_manager.update_progress(
+                    task_id,
+                    current_window=i,
+                    current_phase="processing_windows",
+                    message=f"Processing window {i+1}/{len(windows)}..."
+                )
         
-        logger.debug(
-            f"Window {i+1}: Training klines={len(train_klines)}, Test klines={len(test_klines)}"
-        )
+            if window_slices is not None:
+                train_klines, test_klines = window_slices[i]
+            else:
+                train_klines, test_klines = _slice_window_klines(all_klines, window, i)
         
-        # Step 2a: Run training backtest (with optimization if enabled)
-        logger.info(f"Window {i+1}: Checking optimization - optimize_params={request.optimize_params is not None}, "
-                   f"optimize_params keys={list(request.optimize_params.keys()) if request.optimize_params else 'None'}, "
-                   f"optimize_params values={request.optimize_params if request.optimize_params else 'None'}")
+            # Step 2a: Run training backtest (with optimization if enabled)
+            if window_futures is not None:
+                (optimized_params, optimization_results, optimization_budget,
+                 training_params, training_result) = await _await_window_future(
+                    window_futures, i, task_manager, task_id
+                )
+            else:
+                (optimized_params, optimization_results, optimization_budget,
+                 training_params, training_result) = await _optimize_and_train_window(
+                    request, window, i, len(windows), train_klines, client,
+                    task_manager=task_manager, task_id=task_id
+                )
         
-        if request.optimize_params and len(request.optimize_params) > 0:
-            # Optimize parameters during training
-            # CRITICAL: Pass only training klines to prevent data leakage
-            logger.info(f"Optimizing parameters for window {i+1}...")
-            logger.info(f"Optimization config: metric={request.optimization_metric}, method={request.optimization_method}")
-            logger.info(f"Parameters to optimize: {request.optimize_params}")
-            logger.info(f"Base params: {request.params}")
-            
+            # Step 2b: Run test backtest using optimized/fixed params (using test slice only)
+            test_params = training_params  # Use same params as training
             if task_manager and task_id:
                 await task_manager.update_progress(
                     task_id,
                     current_window=i,
-                    current_phase="optimizing",
-                    message=f"Optimizing parameters for window {i+1}/{len(windows)}..."
+                    current_phase="testing",
+                    message=f"Running test backtest for window {i+1}/{len(windows)}..."
+                )
+        
+            # Check for cancellation before test backtest
+            if task_manager and task_id and task_manager.is_cancelled(task_id):
+                logger.info(f"Walk-forward analysis cancelled before test backtest for window {i+1}")
+                raise HTTPException(
+                    status_code=499,
+                    detail="Walk-forward analysis was cancelled"
                 )
+        
             try:
-                result = await optimize_parameters(
-                    request=request,
-                    training_start=window['training_start'],
-                    training_end=window['training_end'],
-                    client=client,
-                    metric=request.optimization_metric,
-                    method=request.optimization_method,
-                    pre_fetched_klines=train_klines,  # Only training data for optimization
-                    task_manager=task_manager,
-                    task_id=task_id
+                test_request = BacktestRequest(
+                    symbol=request.symbol,
+                    strategy_type=request.strategy_type,
+                    start_time=window['test_start'],
+                    end_time=window['test_end'],
+                    leverage=request.leverage,
+                    risk_per_trade=request.risk_per_trade,
+                    fixed_amount=request.fixed_amount,
+                    initial_balance=cumulative_balance,  # Use cumulative balance from previous windows
+                    params=test_params
                 )
-                # Safely unpack result, ensuring we always have valid values
-                if result is None or not isinstance(result, tuple) or len(result) != 2:
-                    logger.error(f"optimize_parameters returned invalid result: {result}")
-                    optimized_params = None
-                    optimization_results = []
-                else:
-                    optimized_params, optimization_results = result
-                    # Ensure optimization_results is a list, not None
-                    if optimization_results is None:
-                        logger.warning(f"Optimization returned None for results, using empty list")
-                        optimization_results = []
-                
-                logger.info(f"Optimization returned params: {optimized_params}")
-                logger.info(f"Optimization tested {len(optimization_results)} combinations")
-                logger.info(f"Optimization results type: {type(optimization_results)}, length: {len(optimization_results) if optimization_results else 'None'}")
-                training_params = {**request.params, **optimized_params} if optimized_params else request.params
-                logger.info(f"Final training params for window {i+1}: {training_params}")
-                logger.info(f"Optimized parameters for window {i+1}: {optimized_params}")
-                # Ensure optimization_results is always a list (not None) for proper serialization
-                if optimization_results is None:
-                    logger.warning(f"optimization_results is None for window {i+1}, converting to empty list")
-                    optimization_results = []
+                test_result = await run_backtest(test_request, client, pre_fetched_klines=test_klines)
             except Exception as e:
-                logger.error(f"Optimization failed for window {i+1}: {e}", exc_info=True)
-                logger.warning(f"Using fixed parameters due to optimization failure.")
-                optimized_params = None
-                optimization_results = []  # Use empty list instead of None for consistency
-                training_params = request.params
-        else:
-            # Use fixed parameters
-            if request.optimize_params is None:
-                logger.info(f"Window {i+1}: Using fixed parameters (optimization disabled - optimize_params is None)")
-            elif len(request.optimize_params) == 0:
-                logger.info(f"Window {i+1}: Using fixed parameters (optimization disabled - optimize_params is empty)")
-            else:
-                logger.warning(f"Window {i+1}: Using fixed parameters despite optimize_params being set (this should not happen)")
-            optimized_params = None
-            optimization_results = []  # Use empty list instead of None for consistency
-            training_params = request.params
+                logger.error(f"Error running test backtest for window {i+1}: {e}")
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Failed to run test backtest for window {i+1}: {str(e)}"
+                )
         
-        # Check for cancellation before training backtest
-        if task_manager and task_id and task_manager.is_cancelled(task_id):
-            logger.info(f"Walk-forward analysis cancelled before training backtest for window {i+1}")
-            raise HTTPException(
-                status_code=499,
-                detail="Walk-forward analysis was cancelled"
-            )
+            # Store balance at start of test (before updating)
+            test_start_balance = cumulative_balance
         
-        # Run training backtest (using training slice only)
-        if task_manager and task_id:
-            await task_manager.update_progress(
-                task_id,
-                current_window=i,
-                current_phase="training",
-                message=f"Running training backtest for window {i+1}/{len(windows)}..."
-            )
-        try:
-            training_request = BacktestRequest(
-                symbol=request.symbol,
-                strategy_type=request.strategy_type,
-                start_time=window['training_start'],
-                end_time=window['training_end'],
-                leverage=request.leverage,
-                risk_per_trade=request.risk_per_trade,
-                fixed_amount=request.fixed_amount,
-                initial_balance=request.initial_balance,  # Use initial balance for each training window
-                params=training_params
-            )
-            training_result = await run_backtest(training_request, client, pre_fetched_klines=train_klines)
-        except Exception as e:
-            logger.error(f"Error running training backtest for window {i+1}: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to run training backtest for window {i+1}: {str(e)}"
-            )
+            # Update cumulative balance after test
+            cumulative_balance = test_result.final_balance
         
-        # Step 2b: Run test backtest using optimized/fixed params (using test slice only)
-        test_params = training_params  # Use same params as training
-        if task_manager and task_id:
-            await task_manager.update_progress(
-                task_id,
-                current_window=i,
-                current_phase="testing",
-                message=f"Running test backtest for window {i+1}/{len(windows)}..."
-            )
+            # Calculate window metrics
+            training_sharpe = calculate_sharpe_ratio(training_result)
+            test_sharpe = calculate_sharpe_ratio(test_result)
         
-        # Check for cancellation before test backtest
-        if task_manager and task_id and task_manager.is_cancelled(task_id):
-            logger.info(f"Walk-forward analysis cancelled before test backtest for window {i+1}")
-            raise HTTPException(
-                status_code=499,
-                detail="Walk-forward analysis was cancelled"
+            window_result = WalkForwardWindow(
+                window_number=i + 1,
+                training_start=window['training_start'],
+                training_end=window['training_end'],
+                test_start=window['test_start'],
+                test_end=window['test_end'],
+                training_result=training_result,
+                optimized_params=optimized_params,
+                optimization_results=optimization_results,
+                optimization_budget=optimization_budget,
+                test_result=test_result,
+                training_sharpe=training_sharpe,
+                test_sharpe=test_sharpe,
+                training_return_pct=training_result.total_return_pct,
+                test_return_pct=test_result.total_return_pct,
+                training_win_rate=training_result.win_rate,
+                test_win_rate=test_result.win_rate
             )
+            window_results.append(window_result)
         
-        try:
-            test_request = BacktestRequest(
-                symbol=request.symbol,
-                strategy_type=request.strategy_type,
-                start_time=window['test_start'],
-                end_time=window['test_end'],
-                leverage=request.leverage,
-                risk_per_trade=request.risk_per_trade,
-                fixed_amount=request.fixed_amount,
-                initial_balance=cumulative_balance,  # Use cumulative balance from previous windows
-                params=test_params
-            )
-            test_result = await run_backtest(test_request, client, pre_fetched_klines=test_klines)
-        except Exception as e:
-            logger.error(f"Error running test backtest for window {i+1}: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to run test backtest for window {i+1}: {str(e)}"
-            )
-        
-        # Store balance at start of test (before updating)
-        test_start_balance = cumulative_balance
-        
-        # Update cumulative balance after test
-        cumulative_balance = test_result.final_balance
-        
-        # Calculate window metrics
-        training_sharpe = calculate_sharpe_ratio(training_result)
-        test_sharpe = calculate_sharpe_ratio(test_result)
-        
-        window_result = WalkForwardWindow(
-            window_number=i + 1,
-            training_start=window['training_start'],
-            training_end=window['training_end'],
-            test_start=window['test_start'],
-            test_end=window['test_end'],
-            training_result=training_result,
-            optimized_params=optimized_params,
-            optimization_results=optimization_results,
-            test_result=test_result,
-            training_sharpe=training_sharpe,
-            test_sharpe=test_sharpe,
-            training_return_pct=training_result.total_return_pct,
-            test_return_pct=test_result.total_return_pct,
-            training_win_rate=training_result.win_rate,
-            test_win_rate=test_result.win_rate
-        )
-        window_results.append(window_result)
-        
-        # Add equity curve points from test period
-        # Add start of test window (balance before test)
-        equity_curve_points.append({
-            "time": int(window['test_start'].timestamp()),
-            "balance": test_start_balance
-        })
+            # Add equity curve points from test period
+            # Add start of test window (balance before test)
+            equity_curve_points.append({
+                "time": int(window['test_start'].timestamp()),
+                "balance": test_start_balance
+            })
         
-        # Extract per-trade equity points for granular visualization
-        # This provides much better equity curve granularity than just start/end points
-        # CRITICAL: Even if there are no trades, we still need to add the end point
-        # to ensure the equity curve is continuous and shows the balance progression
-        if test_result.trades and len(test_result.trades) > 0:
-            # Sort trades by entry_time to ensure chronological order
-            # Trades should already be in order from backtest, but sort to be safe
-            def get_entry_time(trade):
-                entry_time = trade.get('entry_time')
-                if isinstance(entry_time, datetime):
-                    return entry_time
-                elif isinstance(entry_time, str):
-                    try:
-                        return datetime.fromisoformat(entry_time.replace('Z', '+00:00'))
-                    except:
+            # Extract per-trade equity points for granular visualization
+            # This provides much better equity curve granularity than just start/end points
+            # CRITICAL: Even if there are no trades, we still need to add the end point
+            # to ensure the equity curve is continuous and shows the balance progression
+            if test_result.trades and len(test_result.trades) > 0:
+                # Sort trades by entry_time to ensure chronological order
+                # Trades should already be in order from backtest, but sort to be safe
+                def get_entry_time(trade):
+                    entry_time = trade.get('entry_time')
+                    if isinstance(entry_time, datetime):
+                        return entry_time
+                    elif isinstance(entry_time, str):
+                        try:
+                            return datetime.fromisoformat(entry_time.replace('Z', '+00:00'))
+                        except:
+                            return datetime.fromtimestamp(0, tz=timezone.utc)
+                    else:
                         return datetime.fromtimestamp(0, tz=timezone.utc)
-                else:
-                    return datetime.fromtimestamp(0, tz=timezone.utc)
             
-            sorted_trades = sorted(test_result.trades, key=get_entry_time)
+                sorted_trades = sorted(test_result.trades, key=get_entry_time)
             
-            current_balance = test_start_balance
-            for trade in sorted_trades:
-                # Add point at trade entry (balance before trade)
-                if trade.get('entry_time'):
-                    entry_time = trade['entry_time']
-                    if isinstance(entry_time, str):
-                        entry_dt = datetime.fromisoformat(entry_time.replace('Z', '+00:00'))
-                    elif isinstance(entry_time, datetime):
-                        entry_dt = entry_time
-                    else:
-                        continue
-                    equity_curve_points.append({
-                        "time": int(entry_dt.timestamp()),
-                        "balance": current_balance
-                    })
+                current_balance = test_start_balance
+                for trade in sorted_trades:
+                    # Add point at trade entry (balance before trade)
+                    if trade.get('entry_time'):
+                        entry_time = trade['entry_time']
+                        if isinstance(entry_time, str):
+                            entry_dt = datetime.fromisoformat(entry_time.replace('Z', '+00:00'))
+                        elif isinstance(entry_time, datetime):
+                            entry_dt = entry_time
+                        else:
+                            continue
+                        equity_curve_points.append({
+                            "time": int(entry_dt.timestamp()),
+                            "balance": current_balance
+                        })
                 
-                # Add point at trade exit (balance after trade)
-                if trade.get('exit_time') and trade.get('net_pnl') is not None:
-                    exit_time = trade['exit_time']
-                    if isinstance(exit_time, str):
-                        exit_dt = datetime.fromisoformat(exit_time.replace('Z', '+00:00'))
-                    elif isinstance(exit_time, datetime):
-                        exit_dt = exit_time
-                    else:
-                        continue
-                    # Update balance with trade PnL
-                    # Note: net_pnl already accounts for entry and exit fees
-                    current_balance += trade.get('net_pnl', 0)
-                    equity_curve_points.append({
-                        "time": int(exit_dt.timestamp()),
-                        "balance": current_balance
-                    })
+                    # Add point at trade exit (balance after trade)
+                    if trade.get('exit_time') and trade.get('net_pnl') is not None:
+                        exit_time = trade['exit_time']
+                        if isinstance(exit_time, str):
+                            exit_dt = datetime.fromisoformat(exit_time.replace('Z', '+00:00'))
+                        elif isinstance(exit_time, datetime):
+                            exit_dt = exit_time
+                        else:
+                            continue
+                        # Update balance with trade PnL
+                        # Note: net_pnl already accounts for entry and exit fees
+                        current_balance += trade.get('net_pnl', 0)
+                        equity_curve_points.append({
+                            "time": int(exit_dt.timestamp()),
+                            "balance": current_balance
+                        })
             
-            # Verify final balance matches test_result.final_balance
-            # If there's a discrepancy, use test_result.final_balance (more accurate)
-            if abs(current_balance - cumulative_balance) > 0.01:  # Allow small floating point differences
-                logger.warning(
-                    f"Window {i+1}: Balance mismatch in equity curve: "
-                    f"calculated={current_balance:.2f}, actual={cumulative_balance:.2f}. "
-                    f"Using actual balance for final point."
-                )
-                # Update the last point with actual balance
-                if equity_curve_points:
-                    equity_curve_points[-1]["balance"] = cumulative_balance
+                # Verify final balance matches test_result.final_balance
+                # If there's a discrepancy, use test_result.final_balance (more accurate)
+                if abs(current_balance - cumulative_balance) > 0.01:  # Allow small floating point differences
+                    logger.warning(
+                        f"Window {i+1}: Balance mismatch in equity curve: "
+                        f"calculated={current_balance:.2f}, actual={cumulative_balance:.2f}. "
+                        f"Using actual balance for final point."
+                    )
+                    # Update the last point with actual balance
+                    if equity_curve_points:
+                        equity_curve_points[-1]["balance"] = cumulative_balance
         
-        # Always add end point to ensure continuity (only once)
-        equity_curve_points.append({
-            "time": int(window['test_end'].timestamp()),
-            "balance": cumulative_balance
-        })
+            # Always add end point to ensure continuity (only once)
+            equity_curve_points.append({
+                "time": int(window['test_end'].timestamp()),
+                "balance": cumulative_balance
+            })
         
-        logger.info(
-            f"Window {i+1} completed: Training return={training_result.total_return_pct:.2f}%, "
-            f"Test return={test_result.total_return_pct:.2f}%, "
-            f"Cumulative balance={cumulative_balance:.2f}"
-        )
+            logger.info(
+                f"Window {i+1} completed: Training return={training_result.total_return_pct:.2f}%, "
+                f"Test return={test_result.total_return_pct:.2f}%, "
+                f"Cumulative balance={cumulative_balance:.2f}"
+            )
+    finally:
+        if window_futures is not None:
+            # Cancelled/failed analysis: drop windows not yet started by a worker
+            for future in window_futures:
+                future.cancel()
     
     # Step 3: Aggregate results
     logger.info("Aggregating walk-forward results...")
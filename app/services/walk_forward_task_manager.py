@@ -2,16 +2,29 @@
 Task Manager for Walk-Forward Analysis
 
 Manages running walk-forward analyses, tracks progress, and handles cancellation.
+
+Every change to a task's progress bumps its version and wakes the coroutines
+waiting in ``wait_for_update``, so progress streams (SSE) push updates as they
+happen instead of polling ``get_progress``. With the job queue enabled the
+analyses run in job workers and ``RedisWalkForwardTaskManager`` keeps the same
+progress in Redis for every API process.
 """
 from __future__ import annotations
 
 import asyncio
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Callable, Dict
+from typing import TYPE_CHECKING, Optional, Callable, Dict
 from dataclasses import dataclass, field
 from loguru import logger
 
+from app.core.config import get_settings
+from app.core.job_queue import get_job_queue
+
+if TYPE_CHECKING:
+    from app.core.job_queue import JobQueue
+
 
 @dataclass
 class WalkForwardProgress:
@@ -85,6 +98,37 @@ class WalkForwardTaskManager:
         self._tasks: Dict[str, WalkForwardProgress] = {}
         self._cancellation_flags: Dict[str, bool] = {}
         self._lock = asyncio.Lock()
+        # Change notification: version per task, and an event set (then replaced) on each change
+        self._versions: Dict[str, int] = {}
+        self._changed: Dict[str, asyncio.Event] = {}
+    
+    def _publish(self, task_id: str) -> None:
+        """Record a change to a task and wake its subscribers."""
+        self._versions[task_id] = self._versions.get(task_id, 0) + 1
+        event = self._changed.pop(task_id, None)
+        if event is not None:
+            event.set()
+    
+    def progress_version(self, task_id: str) -> int:
+        """Current change counter of a task (read it before ``get_progress``, pass it to ``wait_for_update``)."""
+        return self._versions.get(task_id, 0)
+    
+    async def wait_for_update(self, task_id: str, seen_version: int, timeout: float) -> int:
+        """Wait until the task changes after ``seen_version`` or ``timeout`` seconds pass.
+        
+        Returns:
+            The task's current version (unchanged on timeout)
+        """
+        if self._versions.get(task_id, 0) != seen_version:
+            return self._versions.get(task_id, 0)
+        event = self._changed.get(task_id)
+        if event is None:
+            event = self._changed[task_id] = asyncio.Event()
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self._versions.get(task_id, 0)
     
     async def create_task(self, total_windows: int, user_id: str) -> str:
         """Create a new task and return its ID.
@@ -106,6 +150,7 @@ class WalkForwardTaskManager:
                 start_time=datetime.now()
             )
             self._cancellation_flags[task_id] = False
+            self._publish(task_id)
             logger.info(f"Created walk-forward task {task_id} for user {user_id} with {total_windows} windows")
             return task_id
     
@@ -163,6 +208,8 @@ class WalkForwardTaskManager:
                     remaining_work = remaining_windows
                 
                 progress.estimated_time_remaining_seconds = avg_time_per_window * remaining_work
+            
+            self._publish(task_id)
     
     async def get_progress(self, task_id: str) -> Optional[WalkForwardProgress]:
         """Get progress for a task."""
@@ -194,6 +241,7 @@ class WalkForwardTaskManager:
                 if task_id in self._tasks:
                     self._tasks[task_id].status = "cancelled"
                     self._tasks[task_id].message = "Cancelled by user"
+                self._publish(task_id)
                 logger.info(f"Cancelled walk-forward task {task_id}")
                 return True
             return False
@@ -224,6 +272,7 @@ class WalkForwardTaskManager:
                 self._tasks[task_id].estimated_time_remaining_seconds = 0.0
                 if result is not None:
                     self._tasks[task_id].result = result
+                self._publish(task_id)
                 logger.info(f"Completed walk-forward task {task_id}")
     
     async def fail_task(self, task_id: str, error: str) -> None:
@@ -232,6 +281,7 @@ class WalkForwardTaskManager:
             if task_id in self._tasks:
                 self._tasks[task_id].status = "error"
                 self._tasks[task_id].error = error
+                self._publish(task_id)
                 logger.error(f"Failed walk-forward task {task_id}: {error}")
     
     async def cleanup_task(self, task_id: str) -> None:
@@ -239,6 +289,8 @@ class WalkForwardTaskManager:
         async with self._lock:
             self._tasks.pop(task_id, None)
             self._cancellation_flags.pop(task_id, None)
+            self._publish(task_id)  # Wake subscribers so they see the task is gone
+            self._versions.pop(task_id, None)
             logger.debug(f"Cleaned up walk-forward task {task_id}")
     
     async def count_running_tasks(self) -> int:
@@ -277,6 +329,8 @@ class WalkForwardTaskManager:
             for task_id in to_remove:
                 self._tasks.pop(task_id, None)
                 self._cancellation_flags.pop(task_id, None)
+                self._publish(task_id)
+                self._versions.pop(task_id, None)
             
             if to_remove:
                 logger.info(f"Cleaned up {len(to_remove)} old walk-forward tasks (older than {max_age_hours} hours)")
@@ -305,11 +359,238 @@ class WalkForwardTaskManager:
                 ]
 
 
-# Global task manager instance
+    async def mark_retrying(self, task_id: str, message: str) -> None:
+        """Put a failed task back to running while its job waits for another attempt."""
+        async with self._lock:
+            if task_id in self._tasks:
+                self._tasks[task_id].status = "running"
+                self._tasks[task_id].error = None
+                self._tasks[task_id].message = message
+                self._publish(task_id)
+
+
+class RedisWalkForwardTaskManager(WalkForwardTaskManager):
+    """Task manager keeping progress in Redis, used with the job queue.
+    
+    Analyses run in job workers (see app.core.job_queue) while any API process
+    serves their progress, results and cancellation, so nothing lives in
+    process memory. Progress is a hash per task whose ``version`` field is
+    bumped on every change; ``wait_for_update`` polls it since the change
+    happens in another process.
+    """
+    
+    # How often a waiting SSE stream re-reads the version, and how stale a
+    # cancellation check in a tight loop may be
+    POLL_INTERVAL_SECONDS = 0.5
+    
+    def __init__(self, job_queue: "JobQueue"):
+        super().__init__()
+        self.job_queue = job_queue
+        self._client = job_queue.redis._client
+        self._ttl_seconds = get_settings().walk_forward_task_cleanup_age_hours * 3600
+        self._cancel_checks: Dict[str, tuple[float, bool]] = {}
+    
+    def _key(self, task_id: str) -> str:
+        return f"binance_bot:wf_task:{task_id}"
+    
+    def _user_key(self, user_id: str) -> str:
+        return f"binance_bot:wf_tasks:user:{user_id}"
+    
+    def _write(self, task_id: str, fields: Dict[str, object]) -> None:
+        """Update fields of an existing task and bump its version."""
+        key = self._key(task_id)
+        pipe = self._client.pipeline(transaction=True)
+        pipe.hset(key, mapping={name: "" if value is None else str(value) for name, value in fields.items()})
+        pipe.hincrby(key, "version", 1)
+        pipe.execute()
+    
+    def _exists(self, task_id: str) -> bool:
+        return bool(self._client.exists(self._key(task_id)))
+    
+    @staticmethod
+    def _from_hash(data: Dict[str, str], result: Optional[dict] = None) -> WalkForwardProgress:
+        def number(name: str, cast=float):
+            return cast(data[name]) if data.get(name) else None
+        
+        return WalkForwardProgress(
+            task_id=data["task_id"],
+            user_id=data["user_id"],
+            status=data.get("status") or "running",
+            current_window=number("current_window", int) or 0,
+            total_windows=number("total_windows", int) or 0,
+            current_phase=data.get("current_phase", ""),
+            message=data.get("message", ""),
+            start_time=datetime.fromisoformat(data["start_time"]) if data.get("start_time") else None,
+            estimated_time_remaining_seconds=number("estimated_time_remaining_seconds"),
+            error=data.get("error") or None,
+            result=result,
+            phase_progress=number("phase_progress") or 0.0,
+        )
+    
+    def progress_version(self, task_id: str) -> int:
+        return int(self._client.hget(self._key(task_id), "version") or 0)
+    
+    async def wait_for_update(self, task_id: str, seen_version: int, timeout: float) -> int:
+        deadline = time.monotonic() + timeout
+        while True:
+            version = self.progress_version(task_id)
+            remaining = deadline - time.monotonic()
+            if version != seen_version or remaining <= 0:
+                return version
+            await asyncio.sleep(min(self.POLL_INTERVAL_SECONDS, remaining))
+    
+    async def create_task(self, total_windows: int, user_id: str) -> str:
+        task_id = str(uuid.uuid4())
+        progress = {
+            "task_id": task_id,
+            "user_id": user_id,
+            "status": "running",
+            "current_window": 0,
+            "total_windows": total_windows,
+            "start_time": datetime.now().isoformat(),
+            "phase_progress": 0.0,
+            "version": 1,
+        }
+        pipe = self._client.pipeline(transaction=True)
+        pipe.hset(self._key(task_id), mapping={name: str(value) for name, value in progress.items()})
+        pipe.expire(self._key(task_id), self._ttl_seconds)
+        pipe.sadd(self._user_key(user_id), task_id)
+        pipe.expire(self._user_key(user_id), self._ttl_seconds)
+        pipe.execute()
+        logger.info(f"Created walk-forward task {task_id} for user {user_id} with {total_windows} windows")
+        return task_id
+    
+    async def update_progress(
+        self,
+        task_id: str,
+        current_window: Optional[int] = None,
+        current_phase: Optional[str] = None,
+        message: Optional[str] = None,
+        phase_progress: Optional[float] = None
+    ) -> None:
+        data = self._client.hgetall(self._key(task_id))
+        if not data:
+            logger.warning(f"Task {task_id} not found for progress update")
+            return
+        progress = self._from_hash(data)
+        fields: Dict[str, object] = {}
+        if current_window is not None:
+            progress.current_window = fields["current_window"] = current_window
+        if current_phase is not None:
+            fields["current_phase"] = current_phase
+            if phase_progress is None:
+                progress.phase_progress = fields["phase_progress"] = 0.0
+        if message is not None:
+            fields["message"] = message
+        if phase_progress is not None:
+            progress.phase_progress = fields["phase_progress"] = max(0.0, min(1.0, phase_progress))
+        
+        if progress.current_window > 0 and progress.start_time:
+            elapsed = (datetime.now() - progress.start_time).total_seconds()
+            remaining_work = progress.total_windows - progress.current_window
+            if progress.phase_progress > 0:
+                remaining_work += 1.0 - progress.phase_progress
+            fields["estimated_time_remaining_seconds"] = elapsed / progress.current_window * remaining_work
+        
+        self._write(task_id, fields)
+    
+    async def get_progress(self, task_id: str) -> Optional[WalkForwardProgress]:
+        data = self._client.hgetall(self._key(task_id))
+        if not data:
+            return None
+        result = None
+        if data.get("status") == "completed":
+            result = self.job_queue.redis.get_value(f"{self._key(task_id)}:result")
+        return self._from_hash(data, result)
+    
+    async def cancel_task(self, task_id: str) -> bool:
+        if not self._exists(task_id):
+            return False
+        self.job_queue.cancel(task_id)
+        self._write(task_id, {"status": "cancelled", "message": "Cancelled by user"})
+        self._cancel_checks[task_id] = (time.monotonic(), True)
+        logger.info(f"Cancelled walk-forward task {task_id}")
+        return True
+    
+    def is_cancelled(self, task_id: str) -> bool:
+        # Called in tight optimization loops: ask Redis at most every POLL_INTERVAL_SECONDS
+        checked_at, cancelled = self._cancel_checks.get(task_id, (0.0, False))
+        if cancelled or time.monotonic() - checked_at < self.POLL_INTERVAL_SECONDS:
+            return cancelled
+        try:
+            cancelled = self.job_queue.is_cancelled(task_id)
+        except Exception as exc:
+            logger.debug(f"Failed to read cancellation of task {task_id}: {exc}")
+        self._cancel_checks[task_id] = (time.monotonic(), cancelled)
+        return cancelled
+    
+    async def is_cancelled_async(self, task_id: str) -> bool:
+        return self.is_cancelled(task_id)
+    
+    async def complete_task(self, task_id: str, result: Optional[dict] = None) -> None:
+        data = self._client.hmget(self._key(task_id), ["total_windows"])
+        if data[0] is None:
+            return
+        if result is not None:
+            self.job_queue.redis.set_value(f"{self._key(task_id)}:result", result, ex=self._ttl_seconds)
+        self._write(task_id, {
+            "status": "completed",
+            "current_window": data[0],
+            "estimated_time_remaining_seconds": 0.0,
+        })
+        logger.info(f"Completed walk-forward task {task_id}")
+    
+    async def fail_task(self, task_id: str, error: str) -> None:
+        if self._exists(task_id):
+            self._write(task_id, {"status": "error", "error": error})
+            logger.error(f"Failed walk-forward task {task_id}: {error}")
+    
+    async def mark_retrying(self, task_id: str, message: str) -> None:
+        if self._exists(task_id):
+            self._write(task_id, {"status": "running", "error": None, "message": message})
+    
+    async def cleanup_task(self, task_id: str) -> None:
+        user_id = self._client.hget(self._key(task_id), "user_id")
+        pipe = self._client.pipeline(transaction=True)
+        pipe.delete(self._key(task_id), f"{self._key(task_id)}:result")
+        if user_id:
+            pipe.srem(self._user_key(user_id), task_id)
+        pipe.execute()
+        self._cancel_checks.pop(task_id, None)
+        logger.debug(f"Cleaned up walk-forward task {task_id}")
+    
+    async def count_running_tasks(self) -> int:
+        return self.job_queue.running_count()
+    
+    async def count_user_running_tasks(self, user_id: str) -> int:
+        return self.job_queue.active_count(user_id)
+    
+    async def cleanup_old_tasks(self, max_age_hours: int = 24) -> int:
+        # Task keys expire on their own after walk_forward_task_cleanup_age_hours
+        self._cancel_checks.clear()
+        return 0
+    
+    async def get_user_tasks(self, user_id: str) -> list[WalkForwardProgress]:
+        tasks = []
+        for task_id in self._client.smembers(self._user_key(user_id)):
+            progress = await self.get_progress(task_id)
+            if progress is not None:
+                tasks.append(progress)
+        return tasks
+
+
+# Global task manager instances
 _task_manager = WalkForwardTaskManager()
+_redis_task_manager: Optional[RedisWalkForwardTaskManager] = None
 
 
 def get_task_manager() -> WalkForwardTaskManager:
-    """Get the global task manager instance."""
-    return _task_manager
+    """Get the global task manager instance (Redis-backed when the job queue is enabled)."""
+    global _redis_task_manager
+    job_queue = get_job_queue()
+    if job_queue is None:
+        return _task_manager
+    if _redis_task_manager is None or _redis_task_manager.job_queue is not job_queue:
+        _redis_task_manager = RedisWalkForwardTaskManager(job_queue)
+    return _redis_task_manager
 
@@ -57,11 +57,33 @@ class Strategy(ABC):
         self.kline_manager = kline_manager  # Store kline_manager
         self._stopped = asyncio.Event()
         self.trail_recorder: Optional[Any] = None  # TrailingStopUpdateService for recording trail updates
+        self.indicator_cache: Optional[Any] = None  # IndicatorSeriesCache over the backtest klines
+        self.market_data: Optional[Any] = None  # EvaluationScheduler sharing klines per closed candle
 
     def set_trail_recorder(self, recorder: Any) -> None:
         """Set optional recorder for trailing-stop level updates (used by runner for live/paper)."""
         self.trail_recorder = recorder
 
+    def set_indicator_cache(self, cache: Any) -> None:
+        """Set a precomputed indicator cache over the klines the client serves (used by backtests)."""
+        self.indicator_cache = cache
+
+    def set_market_data(self, scheduler: Any) -> None:
+        """Set the evaluation scheduler that shares stream klines between strategies (used by runner)."""
+        self.market_data = scheduler
+
+    async def _get_stream_klines(self, symbol: str, interval: str, limit: int) -> list[list]:
+        """Klines from the kline stream, shared with other strategies on it when a scheduler is set."""
+        if self.market_data is not None:
+            return await self.market_data.get_klines(symbol=symbol, interval=interval, limit=limit)
+        return await self.kline_manager.get_klines(symbol=symbol, interval=interval, limit=limit)
+
+    def _indicator_cache_end(self, closed_klines: list[list]) -> Optional[int]:
+        """Index of ``closed_klines`` in the indicator cache, or None to compute indicators inline."""
+        if self.indicator_cache is None:
+            return None
+        return self.indicator_cache.end_for(closed_klines)
+
     @staticmethod
     def parse_bool_param(value: bool | int | str | None, default: bool = False) -> bool:
         """Safely parse a boolean parameter from various input types.
@@ -0,0 +1,90 @@
+"""
+Indicator series shared by every backtest run over one kline list.
+
+A parameter sweep (grid search, successive halving, sensitivity analysis)
+backtests many combinations over the same pre-fetched klines, and most of
+them share indicator settings: every combination with ``ema_slow=21`` needs
+the same slow EMA at every candle. ``IndicatorSeriesCache`` computes the
+value of each (indicator, period) at each candle once and serves it to all
+runs, so a sweep costs one indicator pass per unique configuration plus a
+signal pass per combination.
+
+Values are indexed by ``end``, the number of closed candles they are computed
+from (``klines[:end]``), and come from the same functions strategies call
+inline (``calculate_ema``/``calculate_rsi``/``calculate_atr``) on the same
+inputs, so they are bit-identical to the inline results.
+"""
+
+from __future__ import annotations
+
+from statistics import fmean
+from typing import Callable, Optional, Sequence
+
+from app.strategies.indicators import calculate_atr, calculate_ema, calculate_rsi
+
+_MISSING = object()
+
+
+class IndicatorSeriesCache:
+    """Lazily filled per-candle indicator values over a fixed kline list."""
+
+    def __init__(self, klines: Sequence[list]):
+        """Initialize cache.
+
+        Args:
+            klines: Klines in Binance format; must not be modified while the cache is in use
+        """
+        self.klines = klines
+        self.closes = [float(k[4]) for k in klines]
+        self._series: dict[tuple, list] = {}
+        self._prefix_ema: dict[int, list[Optional[float]]] = {}
+
+    def end_for(self, closed_klines: Sequence[list]) -> Optional[int]:
+        """Index of ``closed_klines`` in this cache, or None if they are not a prefix of its klines."""
+        end = len(closed_klines)
+        if 0 < end <= len(self.klines) and self.klines[end - 1] is closed_klines[-1]:
+            return end
+        return None
+
+    def _get(self, key: tuple, end: int, compute: Callable[[int], Optional[float]]) -> Optional[float]:
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [_MISSING] * (len(self.klines) + 1)
+        value = series[end]
+        if value is _MISSING:
+            value = series[end] = compute(end)
+        return value
+
+    def ema(self, period: int, end: int, window: Optional[int] = None) -> Optional[float]:
+        """``calculate_ema`` of the last ``window`` closes before ``end`` (all of them when window is None)."""
+        if window is not None and end > window:
+            closes = self.closes
+            return self._get(("ema", period, window), end, lambda e: calculate_ema(closes[e - window:e], period))
+        return self._ema_over_prefix(period, end)
+
+    def _ema_over_prefix(self, period: int, end: int) -> Optional[float]:
+        # Extends the series one close at a time with the same operations as
+        # calculate_ema, so every prefix EMA costs O(1) instead of O(end)
+        series = self._prefix_ema.setdefault(period, [])
+        closes = self.closes
+        smoothing = 2.0 / (period + 1)
+        while len(series) <= end:
+            e = len(series)
+            if e < period:
+                series.append(None)
+            elif e == period:
+                series.append(fmean(closes[:period]))
+            else:
+                ema = series[-1]
+                series.append((closes[e - 1] - ema) * smoothing + ema)
+        return series[end]
+
+    def rsi(self, period: int, end: int) -> Optional[float]:
+        """``calculate_rsi`` of the closes before ``end`` (only the last ``period + 1`` are read)."""
+        closes = self.closes
+        return self._get(("rsi", period), end, lambda e: calculate_rsi(closes[max(0, e - period - 1):e], period))
+
+    def atr(self, period: int, end: int) -> Optional[float]:
+        """``calculate_atr`` of the klines before ``end`` (only the last ``period + 1`` are read)."""
+        klines = self.klines
+        return self._get(("atr", period), end, lambda e: calculate_atr(klines[max(0, e - period - 1):e], period))
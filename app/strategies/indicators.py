@@ -7,6 +7,8 @@ from __future__ import annotations
 from typing import Optional
 from statistics import fmean
 
+from app.strategies.swing_pivots import find_swing_pivots
+
 
 def calculate_ema(prices: list[float], period: int) -> Optional[float]:
     """
@@ -199,33 +201,26 @@ def calculate_market_structure(
     # Find swing highs and swing lows
     # A swing high is a high that is higher than N candles before and after
     # A swing low is a low that is lower than N candles before and after
-    swing_highs: list[tuple[int, float]] = []
-    swing_lows: list[tuple[int, float]] = []
-    
-    # Check for swing points (excluding edges where we can't check both sides)
-    for i in range(swing_period, len(highs) - swing_period):
-        # Check if this is a swing high
-        is_swing_high = True
-        current_high = highs[i]
-        for j in range(i - swing_period, i + swing_period + 1):
-            if j != i and highs[j] >= current_high:
-                is_swing_high = False
-                break
-        
-        if is_swing_high:
-            swing_highs.append((i, current_high))
-        
-        # Check if this is a swing low
-        is_swing_low = True
-        current_low = lows[i]
-        for j in range(i - swing_period, i + swing_period + 1):
-            if j != i and lows[j] <= current_low:
-                is_swing_low = False
-                break
-        
-        if is_swing_low:
-            swing_lows.append((i, current_low))
+    # (edges where we can't check both sides are excluded)
+    swing_highs, swing_lows = find_swing_pivots(highs, lows, swing_period, swing_period)
+    
+    return build_market_structure(swing_highs, swing_lows)
+
+
+def build_market_structure(
+    swing_highs: list[tuple[int, float]],
+    swing_lows: list[tuple[int, float]],
+) -> dict:
+    """
+    Classify market structure from swing points (see calculate_market_structure).
+    
+    Args:
+        swing_highs: Swing highs as (index, price), oldest first
+        swing_lows: Swing lows as (index, price), oldest first
     
+    Returns:
+        Market structure dictionary (same shape as calculate_market_structure)
+    """
     # Need at least 2 swing highs and 2 swing lows to determine structure
     if len(swing_highs) < 2 or len(swing_lows) < 2:
         return {
@@ -11,7 +11,8 @@ from app.strategies.base import Strategy, StrategyContext, StrategySignal
 
 if TYPE_CHECKING:
     from app.core.websocket_kline_manager import WebSocketKlineManager
-from app.strategies.indicators import calculate_ema, calculate_rsi, calculate_atr
+from app.strategies.indicators import calculate_rsi
+from app.strategies.rolling_range import RollingRangeState
 
 
 # Shared functionality reuse:
@@ -101,6 +102,8 @@ class RangeMeanReversionStrategy(Strategy):
         self.range_valid: bool = False
         self.range_invalid_count: int = 0  # Track consecutive invalid range detections
         self.max_range_invalid_candles: int = int(context.params.get("max_range_invalid_candles", 20))  # Reset range after N invalid candles
+        # Rolling window indicators (max/min, ATR, EMAs) advanced once per closed candle
+        self._range_state = RollingRangeState(self.lookback_period, self.ema_fast_period, self.ema_slow_period)
 
         # SL trigger: live_price (any tick) or candle_close (only when candle close is beyond SL)
         _sl_mode = str(context.params.get("sl_trigger_mode", "live_price")).lower()
@@ -292,12 +295,13 @@ class RangeMeanReversionStrategy(Strategy):
         if len(lookback_klines) < self.lookback_period:
             return None, None, None, False
         
-        # Calculate range boundaries
-        highs = [float(k[2]) for k in lookback_klines]
-        lows = [float(k[3]) for k in lookback_klines]
+        # Calculate range boundaries (rolling window state, only new candles are applied)
+        snapshot = self._range_state.update(lookback_klines)
+        if snapshot is None:
+            return None, None, None, False
         
-        range_high = max(highs)
-        range_low = min(lows)
+        range_high = snapshot.range_high
+        range_low = snapshot.range_low
         range_mid = (range_high + range_low) / 2
         
         # Check if range is valid (not too narrow, not too wide)
@@ -305,8 +309,8 @@ class RangeMeanReversionStrategy(Strategy):
         if range_size <= 0:
             return None, None, None, False
         
-        # Calculate ATR for volatility check
-        atr = calculate_atr(lookback_klines, period=14)
+        # ATR for volatility check
+        atr = snapshot.atr
         if atr is None:
             return None, None, None, False
         
@@ -316,15 +320,14 @@ class RangeMeanReversionStrategy(Strategy):
             return None, None, None, False
         
         # Check if market is trending (using EMA spread)
-        closes = [float(k[4]) for k in lookback_klines]
-        fast_ema = calculate_ema(closes, self.ema_fast_period)
-        slow_ema = calculate_ema(closes, self.ema_slow_period)
+        fast_ema = snapshot.fast_ema
+        slow_ema = snapshot.slow_ema
         
         if fast_ema is None or slow_ema is None:
             return None, None, None, False
         
         # Check EMA spread (if too wide, market is trending, not ranging)
-        current_price = closes[-1]
+        current_price = snapshot.last_close
         ema_spread_pct = abs(fast_ema - slow_ema) / current_price if current_price > 0 else 0
         
         if ema_spread_pct > self.max_ema_spread_pct:
@@ -353,7 +356,7 @@ class RangeMeanReversionStrategy(Strategy):
             # Try WebSocket first, fallback to REST API
             if self.kline_manager:
                 try:
-                    klines = await self.kline_manager.get_klines(
+                    klines = await self._get_stream_klines(
                         symbol=self.context.symbol,
                         interval=self.interval,
                         limit=limit
@@ -19,6 +19,7 @@ from app.strategies.structure_filters import (
     passes_market_structure_filter,
     required_closed_candles_for_structure,
 )
+from app.strategies.swing_pivots import SwingPivotTracker
 from app.strategies.pnl_giveback import (
     giveback_should_trigger,
     update_peak_unrealized,
@@ -98,6 +99,8 @@ class ReverseScalpingStrategy(Strategy):
         self.structure_confirm_on_close = self.parse_bool_param(
             p.get("structure_confirm_on_close"), default=True
         )
+        # Incremental pivots: only newly closed candles are scanned on each evaluation
+        self._structure_pivots = SwingPivotTracker(self.structure_left_bars, self.structure_right_bars)
 
         # Kline interval (default 1 minute for scalping)
         _ki = p.get("kline_interval", "1m")
@@ -111,6 +114,8 @@ class ReverseScalpingStrategy(Strategy):
         
         # Store closing prices from klines (enough for stable EMA)
         self.closes: Deque[float] = deque(maxlen=self.slow_period * 5)
+        # Position of the current closed candles in indicator_cache (None: compute indicators inline)
+        self._indicator_end: Optional[int] = None
         
         # Track previous EMA values for crossover detection
         self.prev_fast: Optional[float] = None
@@ -178,7 +183,10 @@ class ReverseScalpingStrategy(Strategy):
         candle_time: int,
     ) -> bool:
         if self.use_rsi_filter:
-            rsi_value = calculate_rsi(closing_prices, period=self.rsi_period_filter)
+            if self._indicator_end is not None:
+                rsi_value = self.indicator_cache.rsi(self.rsi_period_filter, self._indicator_end)
+            else:
+                rsi_value = calculate_rsi(closing_prices, period=self.rsi_period_filter)
             if rsi_value is None or not math.isfinite(rsi_value):
                 logger.info(f"[{self.context.id}] Entry blocked by RSI insufficiency: side={candidate_side}, candle={candle_time}")
                 return False
@@ -194,7 +202,10 @@ class ReverseScalpingStrategy(Strategy):
                 return False
 
         if self.use_atr_filter:
-            atr_value = calculate_atr(closed_klines, period=self.atr_period_filter)
+            if self._indicator_end is not None:
+                atr_value = self.indicator_cache.atr(self.atr_period_filter, self._indicator_end)
+            else:
+                atr_value = calculate_atr(closed_klines, period=self.atr_period_filter)
             close_price = closing_prices[-1] if closing_prices else 0.0
             if (
                 atr_value is None
@@ -240,6 +251,7 @@ class ReverseScalpingStrategy(Strategy):
                 self.structure_left_bars,
                 self.structure_right_bars,
                 self.structure_confirm_on_close,
+                pivot_tracker=self._structure_pivots,
             )
             if not ok:
                 logger.info(
@@ -318,7 +330,7 @@ class ReverseScalpingStrategy(Strategy):
             return False
         if self.kline_manager:
             try:
-                htf_klines = await self.kline_manager.get_klines(
+                htf_klines = await self._get_stream_klines(
                     symbol=self.context.symbol,
                     interval="5m",
                     limit=self.slow_period + 5,
@@ -368,7 +380,7 @@ class ReverseScalpingStrategy(Strategy):
             return False
         if self.kline_manager:
             try:
-                htf_klines = await self.kline_manager.get_klines(
+                htf_klines = await self._get_stream_klines(
                     symbol=self.context.symbol,
                     interval="5m",
                     limit=self.slow_period + 5,
@@ -831,7 +843,7 @@ class ReverseScalpingStrategy(Strategy):
             # Try WebSocket first, fallback to REST API
             if self.kline_manager:
                 try:
-                    klines = await self.kline_manager.get_klines(
+                    klines = await self._get_stream_klines(
                         symbol=self.context.symbol,
                         interval=self.interval,
                         limit=limit
@@ -1009,10 +1021,11 @@ class ReverseScalpingStrategy(Strategy):
                 f"live_price={live_price:.8f}, position={self.position}"
             )
             
-            # Rebuild closes from recent closed candles
-            closing_prices = [float(k[4]) for k in closed_klines]
+            # Rebuild closes from recent closed candles (only the tail the EMAs and RSI filter read)
+            closing_prices = [float(k[4]) for k in closed_klines[-max(self.closes.maxlen, self.rsi_period_filter + 1):]]
             self.closes.clear()
             self.closes.extend(closing_prices)
+            self._indicator_end = self._indicator_cache_end(closed_klines)
             
             if len(self.closes) < self.slow_period:
                 logger.warning(
@@ -1614,6 +1627,10 @@ class ReverseScalpingStrategy(Strategy):
         - Seeds with SMA(period) for first value
         - Then iterates forward with EMA smoothing
         """
+        if self._indicator_end is not None:
+            ema = self.indicator_cache.ema(period, self._indicator_end, window=self.closes.maxlen)
+            if ema is not None:
+                return ema
         return self._calculate_ema_from_prices(list(self.closes), period)
     
     def _calculate_ema_from_prices(self, prices: list[float], period: int) -> float:
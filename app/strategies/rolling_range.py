@@ -0,0 +1,190 @@
+"""
+Rolling range state for RangeMeanReversionStrategy.
+
+The strategy validates its range over the last ``lookback`` closed candles:
+range high/low, ATR(14) and a fast/slow EMA of closes over that window. This
+state advances those values once per closed candle instead of rebuilding them
+from the whole window on every evaluation:
+
+- range high/low: sliding-window max/min (monotonic deques)
+- ATR: the last ``atr_period`` true ranges (same mean as ``calculate_atr``)
+- EMA: ``calculate_ema`` over the window (SMA-seeded) kept in closed form, see
+  ``_WindowedEma``
+
+Values match a fresh computation over the same window (EMAs up to float
+rounding; they are re-anchored from scratch once per window length).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from statistics import fmean
+from typing import Deque, List, Optional, Tuple
+
+from app.strategies.swing_pivots import _MonotonicWindow
+
+
+@dataclass(frozen=True)
+class RangeSnapshot:
+    """Indicators over the current lookback window."""
+    range_high: float
+    range_low: float
+    atr: Optional[float]
+    fast_ema: Optional[float]
+    slow_ema: Optional[float]
+    last_close: float
+
+
+class _WindowedEma:
+    """``calculate_ema(closes, period)`` over a sliding window of fixed length, O(1) per slide.
+
+    With smoothing ``a``, ``b = 1 - a`` and window closes ``c[0..W-1]``:
+
+        ema = b**(W-p) * mean(c[0:p]) + sum(a * b**(W-1-k) * c[k] for k in p..W-1)
+
+    so sliding the window only adjusts the seed sum and the weighted tail.
+    """
+
+    def __init__(self, period: int, window: int):
+        self.period = period
+        self.window = window
+        self.a = 2.0 / (period + 1)
+        self.b = 1.0 - self.a
+        self._seed_weight = self.b ** (window - period)
+        self._oldest_tail_weight = self.a * self.b ** (window - 1 - period)
+        self._seed_sum = 0.0
+        self._tail = 0.0
+
+    def anchor(self, closes: List[float]) -> None:
+        """Recompute from a full window (bounds float drift)."""
+        p = self.period
+        self._seed_sum = sum(closes[:p])
+        tail = 0.0
+        for c in closes[p:]:
+            tail = tail * self.b + self.a * c
+        self._tail = tail
+
+    def slide(self, closes: Deque[float], new_close: float) -> None:
+        """Advance by one bar; ``closes`` is the full window *before* dropping its oldest close."""
+        p = self.period
+        if self.window > p:
+            self._tail = self.b * (self._tail - self._oldest_tail_weight * closes[p]) + self.a * new_close
+            self._seed_sum += closes[p] - closes[0]
+        else:
+            self._seed_sum += new_close - closes[0]
+
+    def value(self) -> float:
+        return self._seed_weight * (self._seed_sum / self.period) + self._tail
+
+
+class RollingRangeState:
+    """Range indicators over the last ``lookback`` closed candles, advanced once per candle."""
+
+    def __init__(self, lookback: int, ema_fast_period: int, ema_slow_period: int, atr_period: int = 14):
+        """Initialize state.
+
+        Args:
+            lookback: Window length (closed candles)
+            ema_fast_period: Fast EMA period over window closes
+            ema_slow_period: Slow EMA period over window closes
+            atr_period: ATR period (simple mean of true ranges)
+        """
+        self.lookback = lookback
+        self.atr_period = atr_period
+        # EMAs that cannot be computed over the window (period < 1 or > lookback) stay None
+        self._emas = [
+            _WindowedEma(period, lookback) if 1 <= period <= lookback else None
+            for period in (ema_fast_period, ema_slow_period)
+        ]
+        self.reset()
+
+    def reset(self) -> None:
+        self._seq = -1
+        self._last_bar: Optional[Tuple[int, float, float, float]] = None  # (open_time, high, low, close)
+        self._closes: Deque[float] = deque()
+        self._highs = _MonotonicWindow()
+        self._lows = _MonotonicWindow()  # negated lows
+        self._true_ranges: Deque[float] = deque(maxlen=self.atr_period)
+        self._slides_since_anchor = 0
+
+    def _append_bar(self, high: float, low: float, close: float) -> None:
+        if self._closes:
+            prev_close = self._closes[-1]
+            self._true_ranges.append(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+        self._seq += 1
+        self._highs.push(self._seq, high)
+        self._lows.push(self._seq, -low)
+        self._highs.evict_before(self._seq + 1 - self.lookback)
+        self._lows.evict_before(self._seq + 1 - self.lookback)
+
+        if len(self._closes) < self.lookback:
+            self._closes.append(close)
+            if len(self._closes) == self.lookback:
+                self._anchor()
+            return
+
+        self._slides_since_anchor += 1
+        if self._slides_since_anchor >= self.lookback:
+            self._closes.popleft()
+            self._closes.append(close)
+            self._anchor()
+            return
+        for ema in self._emas:
+            if ema is not None:
+                ema.slide(self._closes, close)
+        self._closes.popleft()
+        self._closes.append(close)
+
+    def _anchor(self) -> None:
+        closes = list(self._closes)
+        for ema in self._emas:
+            if ema is not None:
+                ema.anchor(closes)
+        self._slides_since_anchor = 0
+
+    @staticmethod
+    def _bar(kline: list) -> Tuple[int, float, float, float]:
+        return int(kline[0]), float(kline[2]), float(kline[3]), float(kline[4])
+
+    def update(self, lookback_klines: List[list]) -> Optional[RangeSnapshot]:
+        """
+        Feed the current lookback window (closed candles, oldest first) and return its indicators.
+
+        Only candles after the last one seen are applied; the state is rebuilt
+        when the window does not contain that candle unchanged. Returns None if
+        the window is not exactly ``lookback`` candles long.
+        """
+        n = len(lookback_klines)
+        if n != self.lookback or n == 0:
+            return None
+
+        start = 0
+        if self._last_bar is not None:
+            start = -1
+            last_open_time = self._last_bar[0]
+            for pos in range(n - 1, -1, -1):
+                open_time = int(lookback_klines[pos][0])
+                if open_time == last_open_time:
+                    if self._bar(lookback_klines[pos]) == self._last_bar:
+                        start = pos + 1
+                    break
+                if open_time < last_open_time:
+                    break
+            if start == -1:
+                self.reset()
+                start = 0
+        for kline in lookback_klines[start:]:
+            self._append_bar(*self._bar(kline)[1:])
+        self._last_bar = self._bar(lookback_klines[-1])
+
+        atr = fmean(self._true_ranges) if len(self._closes) >= self.atr_period + 1 else None
+        fast, slow = (ema.value() if ema is not None else None for ema in self._emas)
+        return RangeSnapshot(
+            range_high=self._highs.max(),
+            range_low=-self._lows.max(),
+            atr=atr,
+            fast_ema=fast,
+            slow_ema=slow,
+            last_close=self._closes[-1],
+        )
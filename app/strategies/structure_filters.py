@@ -9,11 +9,9 @@ SHORT: Lower High + Lower Low.
 from __future__ import annotations
 
 import math
-from typing import List, Literal, Tuple
+from typing import List, Literal, Optional, Tuple
 
-
-def _parse_high_low(kline: list) -> Tuple[float, float]:
-    return float(kline[2]), float(kline[3])
+from app.strategies.swing_pivots import SwingPivotTracker, _parse_high_low, find_swing_pivots
 
 
 def _find_swing_highs_lows(
@@ -36,23 +34,7 @@ def _find_swing_highs_lows(
         highs.append(h)
         lows.append(l_)
 
-    swing_highs: List[Tuple[int, float]] = []
-    swing_lows: List[Tuple[int, float]] = []
-
-    for i in range(left, n - right):
-        hi = highs[i]
-        left_max = max(highs[i - left : i])
-        right_max = max(highs[i + 1 : i + right + 1])
-        if hi > left_max and hi > right_max:
-            swing_highs.append((i, hi))
-
-        lo = lows[i]
-        left_min = min(lows[i - left : i])
-        right_min = min(lows[i + 1 : i + right + 1])
-        if lo < left_min and lo < right_min:
-            swing_lows.append((i, lo))
-
-    return swing_highs, swing_lows
+    return find_swing_pivots(highs, lows, left, right)
 
 
 def required_closed_candles_for_structure(left: int, right: int) -> int:
@@ -68,6 +50,7 @@ def passes_market_structure_filter(
     left: int,
     right: int,
     confirm_on_close: bool,
+    pivot_tracker: Optional[SwingPivotTracker] = None,
 ) -> Tuple[bool, str]:
     """
     Returns (pass, reason_code).
@@ -80,6 +63,9 @@ def passes_market_structure_filter(
             (avoids impossible close >= wick when the newest swing high is on the signal bar).
       SHORT: if the last swing low is not on the signal bar, close <= that swing low; if the pivot
              is on the last bar, skip this check (close is almost never <= candle low).
+
+    pivot_tracker: optional per-strategy tracker (same left/right) so only newly
+    closed candles are scanned; results are identical to a full scan.
     """
     if not closed_klines:
         return False, "INSUFFICIENT_DATA"
@@ -88,7 +74,10 @@ def passes_market_structure_filter(
     if not math.isfinite(last_close):
         return False, "INVALID_CLOSE"
 
-    swing_highs, swing_lows = _find_swing_highs_lows(closed_klines, left, right)
+    if pivot_tracker is not None:
+        swing_highs, swing_lows = pivot_tracker.update(closed_klines)
+    else:
+        swing_highs, swing_lows = _find_swing_highs_lows(closed_klines, left, right)
     if len(swing_highs) < 2 or len(swing_lows) < 2:
         return False, "INSUFFICIENT_SWINGS"
 
@@ -0,0 +1,209 @@
+"""
+Swing pivot (fractal) detection shared by the structure filter and market structure indicator.
+
+A bar ``i`` is a swing high when its high is strictly greater than every high in
+the ``left`` bars before it and the ``right`` bars after it (swing lows mirror
+this with strictly lower lows). Window extrema are computed with monotonic
+deques, so a full scan is O(n) regardless of the window sizes.
+
+``SwingPivotTracker`` keeps that state across evaluations: when a candle closes
+only the one pivot that just became confirmable (``right`` bars ago) is checked.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, List, Optional, Sequence, Tuple
+
+Pivot = Tuple[int, float]  # (bar_index, price)
+
+
+def _sliding_max(values: Sequence[float], width: int) -> List[float]:
+    """``out[j] = max(values[j : j + width])`` for every full window (monotonic deque)."""
+    out: List[float] = []
+    window: Deque[int] = deque()  # indices, values decreasing
+    for j, value in enumerate(values):
+        while window and values[window[-1]] <= value:
+            window.pop()
+        window.append(j)
+        if window[0] <= j - width:
+            window.popleft()
+        if j >= width - 1:
+            out.append(values[window[0]])
+    return out
+
+
+def _strict_extrema(values: Sequence[float], left: int, right: int) -> List[int]:
+    """Indices whose value is strictly greater than every value ``left`` before and ``right`` after."""
+    n = len(values)
+    left_max = _sliding_max(values, left) if left > 0 else None
+    right_max = _sliding_max(values, right) if right > 0 else None
+    pivots: List[int] = []
+    for i in range(left, n - right):
+        value = values[i]
+        if left_max is not None and not value > left_max[i - left]:
+            continue
+        if right_max is not None and not value > right_max[i + 1]:
+            continue
+        pivots.append(i)
+    return pivots
+
+
+def find_swing_pivots(
+    highs: Sequence[float],
+    lows: Sequence[float],
+    left: int,
+    right: int,
+) -> Tuple[List[Pivot], List[Pivot]]:
+    """
+    Return (swing_highs, swing_lows) as lists of (bar_index, price).
+
+    Only bars with a full ``left``/``right`` window are considered.
+    """
+    negated_lows = [-low for low in lows]
+    swing_highs = [(i, highs[i]) for i in _strict_extrema(highs, left, right)]
+    swing_lows = [(i, lows[i]) for i in _strict_extrema(negated_lows, left, right)]
+    return swing_highs, swing_lows
+
+
+def _parse_high_low(kline: list) -> Tuple[float, float]:
+    return float(kline[2]), float(kline[3])
+
+
+class _MonotonicWindow:
+    """Maximum of a sliding window of (sequence, value) pairs, amortized O(1) per bar."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self) -> None:
+        self._items: Deque[Tuple[int, float]] = deque()  # values decreasing
+
+    def push(self, seq: int, value: float) -> None:
+        while self._items and self._items[-1][1] <= value:
+            self._items.pop()
+        self._items.append((seq, value))
+
+    def evict_before(self, seq: int) -> None:
+        while self._items and self._items[0][0] < seq:
+            self._items.popleft()
+
+    def max(self) -> Optional[float]:
+        return self._items[0][1] if self._items else None
+
+
+class SwingPivotTracker:
+    """
+    Incremental swing pivots over a stream of closed klines.
+
+    ``update(closed_klines)`` accepts the strategy's usual closed-kline window
+    (oldest first, Binance list format). Bars already seen (matched by open
+    time) are skipped, so a new candle costs O(1) amortized. Results are
+    reported as indices into the list passed in and match
+    ``find_swing_pivots`` on that list.
+    """
+
+    def __init__(self, left: int, right: int):
+        """Initialize tracker.
+
+        Args:
+            left: Bars before the pivot that must be strictly lower (higher for lows)
+            right: Bars after the pivot that must be strictly lower (higher for lows)
+        """
+        self.left = left
+        self.right = right
+        self.reset()
+
+    def reset(self) -> None:
+        self._seq = -1  # sequence number of the last bar processed
+        self._last_open_time: Optional[int] = None
+        self._last_high_low: Optional[Tuple[float, float]] = None
+        self._window_size: Optional[int] = None  # length of the last window passed to update()
+        self._recent: Deque[Tuple[float, float]] = deque(maxlen=self.right + 1)  # (high, low) of bars seq-right..seq
+        # Left windows end just before the candidate; right windows are the bars after it
+        self._left_highs = _MonotonicWindow()
+        self._left_lows = _MonotonicWindow()  # negated lows
+        self._right_highs = _MonotonicWindow()
+        self._right_lows = _MonotonicWindow()
+        self._swing_highs: Deque[Pivot] = deque()  # (seq, price)
+        self._swing_lows: Deque[Pivot] = deque()
+
+    def _append_bar(self, high: float, low: float) -> None:
+        self._seq += 1
+        seq = self._seq
+        self._recent.append((high, low))
+        self._right_highs.push(seq, high)
+        self._right_lows.push(seq, -low)
+
+        candidate = seq - self.right
+        if candidate < 0:
+            return
+        cand_high, cand_low = self._recent[0]
+        # Right window is candidate+1..seq; the candidate itself leaves it now
+        self._right_highs.evict_before(candidate + 1)
+        self._right_lows.evict_before(candidate + 1)
+
+        if candidate >= self.left:
+            left_high = self._left_highs.max()
+            right_high = self._right_highs.max()
+            if (left_high is None or cand_high > left_high) and (right_high is None or cand_high > right_high):
+                self._swing_highs.append((candidate, cand_high))
+            left_low = self._left_lows.max()
+            right_low = self._right_lows.max()
+            if (left_low is None or -cand_low > left_low) and (right_low is None or -cand_low > right_low):
+                self._swing_lows.append((candidate, cand_low))
+
+        # Slide the left window: candidate joins, candidate-left leaves
+        if self.left > 0:
+            self._left_highs.push(candidate, cand_high)
+            self._left_lows.push(candidate, -cand_low)
+            self._left_highs.evict_before(candidate + 1 - self.left)
+            self._left_lows.evict_before(candidate + 1 - self.left)
+
+    def update(self, closed_klines: List[list]) -> Tuple[List[Pivot], List[Pivot]]:
+        """
+        Feed the current closed-kline window and return (swing_highs, swing_lows).
+
+        Rebuilds from scratch when the window does not contain the last bar seen
+        unchanged (first call, long pause, different data), reaches back before
+        the tracked bars, or changes size (pivots that scrolled out of a smaller
+        window are no longer tracked).
+        """
+        n = len(closed_klines)
+        if n < self.left + self.right + 1 or self.left < 1 or self.right < 1:
+            return [], []
+
+        if self._window_size is not None and n != self._window_size:
+            self.reset()
+        start = 0
+        if self._last_open_time is not None:
+            start = -1
+            # New bars are appended at the end; scan back to the last bar already seen
+            for pos in range(n - 1, -1, -1):
+                open_time = int(closed_klines[pos][0])
+                if open_time == self._last_open_time:
+                    if _parse_high_low(closed_klines[pos]) == self._last_high_low:
+                        start = pos + 1
+                    break
+                if open_time < self._last_open_time:
+                    break
+            if start == -1 or start - 1 > self._seq:
+                # Not a continuation, or the window reaches back before the first bar tracked
+                self.reset()
+                start = 0
+        for kline in closed_klines[start:]:
+            self._append_bar(*_parse_high_low(kline))
+        self._last_open_time = int(closed_klines[-1][0])
+        self._last_high_low = _parse_high_low(closed_klines[-1])
+        self._window_size = n
+
+        # Map sequence numbers to indices in this window; pivots without a full
+        # left window inside it are excluded, as in a fresh scan of the list
+        offset = n - 1 - self._seq
+        for pivots in (self._swing_highs, self._swing_lows):
+            while pivots and pivots[0][0] + offset < 0:
+                pivots.popleft()  # scrolled out of the window
+        min_index = self.left
+        max_index = n - 1 - self.right
+        swing_highs = [(seq + offset, p) for seq, p in self._swing_highs if min_index <= seq + offset <= max_index]
+        swing_lows = [(seq + offset, p) for seq, p in self._swing_lows if min_index <= seq + offset <= max_index]
+        return swing_highs, swing_lows
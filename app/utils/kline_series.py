@@ -0,0 +1,92 @@
+"""
+Time-indexed kline container for slicing one history into many windows.
+
+Walk-forward analysis fetches the whole range once and cuts it into training
+and test windows. ``KlineSeries`` keeps the open/close times of the sorted
+klines as int lists, so a window is located with two binary searches and
+returned as a ``KlineView`` over the shared list instead of a filtered copy.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Iterator, List, Union
+
+
+def _to_ms(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+class KlineView(Sequence):
+    """Read-only window ``[start, stop)`` of a kline list, without copying it.
+
+    Integer indexing and iteration read through to the underlying list.
+    Slicing a view returns a plain list (like slicing a list), so code that
+    takes ``klines[:-1]`` keeps getting lists.
+    """
+
+    __slots__ = ("_klines", "_start", "_stop")
+
+    def __init__(self, klines: List[list], start: int, stop: int):
+        self._klines = klines
+        self._start = start
+        self._stop = max(start, stop)
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            begin, end, step = index.indices(len(self))
+            if step == 1:
+                return self._klines[self._start + begin:self._start + max(begin, end)]
+            return [self._klines[self._start + i] for i in range(begin, end, step)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("kline view index out of range")
+        return self._klines[self._start + index]
+
+    def __iter__(self) -> Iterator[list]:
+        klines = self._klines
+        for i in range(self._start, self._stop):
+            yield klines[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (KlineView, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"KlineView({len(self)} klines)"
+
+
+class KlineSeries(KlineView):
+    """Klines sorted by open time with an index for O(log n) time-range slices."""
+
+    __slots__ = ("_open_times", "_close_times")
+
+    def __init__(self, klines: List[list]):
+        """Initialize series.
+
+        Args:
+            klines: Klines in Binance format; sorted by open time here if they are not already
+        """
+        open_times = [int(k[0]) for k in klines]
+        if any(a > b for a, b in zip(open_times, open_times[1:])):
+            klines = sorted(klines, key=lambda k: int(k[0]))
+            open_times = [int(k[0]) for k in klines]
+        super().__init__(klines, 0, len(klines))
+        self._open_times = open_times
+        self._close_times = [int(k[6]) for k in klines]
+
+    def slice(self, start_time: datetime, end_time: datetime) -> KlineView:
+        """Klines with ``open_time >= start_time`` and ``close_time <= end_time``.
+
+        Both boundaries are inclusive, matching ``_slice_klines_by_time_range``.
+        """
+        lo = bisect_left(self._open_times, _to_ms(start_time))
+        hi = bisect_right(self._close_times, _to_ms(end_time))
+        return KlineView(self._klines, lo, hi)
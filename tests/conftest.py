@@ -5,3 +5,27 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_backtest_result_cache(monkeypatch):
+    """Give every test an empty, memory-only backtest result cache.
+
+    Many backtest tests patch strategy behaviour and re-run identical inputs,
+    which would otherwise be answered from results cached by earlier tests.
+    """
+    from app.services import backtest_result_cache
+
+    monkeypatch.setattr(
+        backtest_result_cache, "_backtest_result_cache", backtest_result_cache.BacktestResultCache()
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_report_cache(monkeypatch):
+    """Give every test an empty, memory-only report cache."""
+    from app.services import report_cache
+
+    monkeypatch.setattr(report_cache, "_report_cache", report_cache.ReportCache())
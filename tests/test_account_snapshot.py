@@ -0,0 +1,176 @@
+"""
+Tests for the stream-fed account snapshot used by risk checks.
+
+Covers:
+1. AccountSnapshotStore: REST seed, ACCOUNT_UPDATE application, staleness
+2. get_wallet_balance: snapshot vs REST fallback
+3. MarginManager / RiskManager read the snapshot instead of REST
+4. FuturesUserDataStreamManager feeds ACCOUNT_UPDATE into the store
+"""
+
+import time
+from dataclasses import replace
+from uuid import uuid4
+
+import pytest
+from unittest.mock import MagicMock
+
+from app.core.account_snapshot import (
+    AccountSnapshotStore,
+    get_account_snapshot_store,
+    get_wallet_balance,
+)
+from app.core.futures_user_data_stream_manager import FuturesUserDataStreamManager
+from app.risk.manager import RiskManager
+from app.risk.margin_manager import MarginManager
+
+
+REST_ACCOUNT = {
+    "totalWalletBalance": "1000.0",
+    "availableBalance": "800.0",
+    "totalMaintMargin": "5.0",
+    "assets": [{"asset": "USDT", "walletBalance": "1000.0"}],
+    "positions": [
+        {"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000",
+         "notional": "505", "unrealizedProfit": "5", "positionSide": "BOTH"},
+        {"symbol": "ETHUSDT", "positionAmt": "0", "entryPrice": "0",
+         "notional": "0", "unrealizedProfit": "0", "positionSide": "BOTH"},
+    ],
+}
+
+
+@pytest.fixture
+def store():
+    get_account_snapshot_store().clear()
+    yield get_account_snapshot_store()
+    get_account_snapshot_store().clear()
+
+
+class TestAccountSnapshotStore:
+    def test_rest_seed(self, store):
+        snapshot = store.apply_rest_account("Acc1", REST_ACCOUNT)
+        assert store.get("acc1") is snapshot
+        assert snapshot.wallet_balance == 1000.0
+        assert snapshot.available_balance == 800.0
+        assert snapshot.total_maint_margin == 5.0
+        assert list(snapshot.positions) == [("BTCUSDT", "LONG")]
+        assert snapshot.total_notional == 505.0
+
+    def test_account_update_applies_balance_and_positions(self, store):
+        store.apply_rest_account("acc1", REST_ACCOUNT)
+        changed = store.apply_account_update("acc1", {
+            "B": [{"a": "USDT", "wb": "990.0", "cw": "990.0"}],
+            "P": [
+                {"s": "BTCUSDT", "pa": "0", "ep": "0", "up": "0", "ps": "BOTH"},
+                {"s": "ETHUSDT", "pa": "-0.5", "ep": "3000", "up": "0", "ps": "BOTH"},
+            ],
+        })
+        snapshot = store.get("acc1")
+        assert changed is True
+        assert snapshot.wallet_balance == 990.0
+        assert snapshot.available_balance == 790.0  # wallet delta applied
+        assert list(snapshot.positions) == [("ETHUSDT", "SHORT")]
+        assert snapshot.positions[("ETHUSDT", "SHORT")].notional == 1500.0
+
+    def test_balance_only_update_reports_no_position_change(self, store):
+        store.apply_rest_account("acc1", REST_ACCOUNT)
+        changed = store.apply_account_update("acc1", {"B": [{"a": "USDT", "wb": "1010.0"}], "P": []})
+        assert changed is False
+        assert store.get("acc1").wallet_balance == 1010.0
+
+    def test_update_without_seed_is_ignored(self, store):
+        assert store.apply_account_update("acc1", {"B": [{"a": "USDT", "wb": "1.0"}]}) is False
+        assert store.get("acc1") is None
+
+    def test_stale_snapshot_is_not_served(self):
+        local = AccountSnapshotStore(max_age_seconds=60.0)
+        local.apply_rest_account("acc1", REST_ACCOUNT)
+        key = (None, "acc1")
+        local._snapshots[key] = replace(local._snapshots[key], synced_at=time.monotonic() - 120)
+        assert local.get("acc1") is None
+
+    def test_same_account_id_is_isolated_per_user(self, store):
+        alice, bob = uuid4(), uuid4()
+        store.apply_rest_account("default", REST_ACCOUNT, user_id=alice)
+        assert store.get("default", user_id=alice).wallet_balance == 1000.0
+        assert store.get("default", user_id=bob) is None
+        assert store.get("default") is None
+
+        store.apply_account_update("default", {"B": [{"a": "USDT", "wb": "5.0"}]}, user_id=bob)
+        assert store.get("default", user_id=alice).wallet_balance == 1000.0
+
+        store.unregister("default", user_id=bob)
+        assert store.get("default", user_id=alice) is not None
+
+
+class TestSnapshotReaders:
+    def test_wallet_balance_prefers_snapshot(self, store):
+        client = MagicMock()
+        client.futures_account_balance.return_value = 123.0
+        assert get_wallet_balance(client) == 123.0
+
+        store.register_client("acc1", client)
+        store.apply_rest_account("acc1", REST_ACCOUNT)
+        assert get_wallet_balance(client) == 1000.0
+        assert client.futures_account_balance.call_count == 1
+
+        store.unregister("acc1")
+        assert get_wallet_balance(client) == 123.0
+
+    def test_margin_status_without_rest_calls(self, store):
+        client = MagicMock()
+        store.register_client("acc1", client)
+        store.apply_rest_account("acc1", REST_ACCOUNT)
+        status = MarginManager(client).get_margin_status("acc1")
+        assert status.total_balance == 1000.0
+        assert status.available_balance == 800.0
+        assert status.margin_ratio == pytest.approx(0.2)
+        client.futures_account_balance.assert_not_called()
+        client.futures_account.assert_not_called()
+
+    def test_margin_status_ignores_other_users_snapshot(self, store):
+        user_id = uuid4()
+        store.register_client("acc1", MagicMock(), user_id=user_id)
+        store.apply_rest_account("acc1", REST_ACCOUNT, user_id=user_id)
+
+        client = MagicMock()
+        client.futures_account_balance.return_value = 50.0
+        client.futures_account.return_value = {"totalWalletBalance": "50.0", "availableBalance": "40.0"}
+        status = MarginManager(client).get_margin_status("acc1")
+        assert status.total_balance == 50.0
+        client.futures_account.assert_called_once()
+
+    def test_risk_manager_sizing_uses_snapshot(self, store):
+        client = MagicMock()
+        client.get_min_notional.return_value = 5.0
+        client.round_quantity.side_effect = lambda symbol, qty: round(qty, 3)
+        store.register_client("acc1", client)
+        store.apply_rest_account("acc1", REST_ACCOUNT)
+
+        result = RiskManager(client).size_position("BTCUSDT", risk_per_trade=0.1, price=100.0)
+        assert result.notional == pytest.approx(100.0)  # 10% of 1000 USDT
+        client.futures_account_balance.assert_not_called()
+
+
+class TestStreamManagerFeedsSnapshot:
+    @pytest.mark.asyncio
+    async def test_account_update_updates_store_and_schedules_resync(self, store):
+        user_id = uuid4()
+        manager = FuturesUserDataStreamManager(
+            account_manager=MagicMock(), on_position_update=MagicMock(), user_id=user_id
+        )
+        store.apply_rest_account("acc1", REST_ACCOUNT, user_id=user_id)
+        store.apply_rest_account("acc1", REST_ACCOUNT)
+        manager._schedule_snapshot_resync = MagicMock()
+
+        await manager._on_ws_message("acc1", "ACCOUNT_UPDATE", {
+            "a": {"B": [{"a": "USDT", "wb": "1005.0"}], "P": []},
+        })
+        assert store.get("acc1", user_id=user_id).wallet_balance == 1005.0
+        assert store.get("acc1").wallet_balance == 1000.0
+        manager._schedule_snapshot_resync.assert_not_called()
+
+        await manager._on_ws_message("acc1", "ACCOUNT_UPDATE", {
+            "a": {"P": [{"s": "BTCUSDT", "pa": "0.02", "ep": "50000", "up": "0", "ps": "BOTH"}]},
+        })
+        manager._schedule_snapshot_resync.assert_called_once_with("acc1")
@@ -0,0 +1,101 @@
+"""
+Tests for compact backtest chart payloads (downsampling and columnar format).
+"""
+import json
+import math
+from datetime import datetime, timezone
+
+from app.api.routes.backtesting import BacktestResult
+from app.services.backtest_payload import (
+    columnar_backtest_payload,
+    downsample_backtest_result,
+    downsample_klines,
+    downsample_levels,
+    lttb_indices,
+)
+
+T0 = 1700000000000
+N = 20000
+
+
+def make_result():
+    klines = []
+    for i in range(N):
+        close = 100 + 10 * math.sin(i / 50)
+        klines.append([T0 + i * 60000, close - 0.1, close + 0.5, close - 0.5, close, 1.0])
+    klines[12345][2] = 500.0  # spike that must survive downsampling
+    series = [{"time": k[0] // 1000, "value": k[4]} for k in klines]
+    levels = [
+        {"time": k[0] // 1000, "tp1": 110.0, "tp2": 112.0, "sl": 95.0, "position_side": "LONG"}
+        for k in klines[1000:3000]
+    ]
+    entry = datetime.fromtimestamp((T0 + 777 * 60000 + 30000) / 1000, tz=timezone.utc)
+    exit_ = datetime.fromtimestamp((T0 + 778 * 60000) / 1000, tz=timezone.utc)
+    return BacktestResult(
+        symbol="BTCUSDT", strategy_type="range_mean_reversion",
+        start_time=datetime.fromtimestamp(T0 / 1000, tz=timezone.utc),
+        end_time=datetime.fromtimestamp((T0 + N * 60000) / 1000, tz=timezone.utc),
+        initial_balance=1000, final_balance=1010, total_pnl=10, total_return_pct=1,
+        total_trades=1, completed_trades=1, open_trades=0, winning_trades=1, losing_trades=0,
+        win_rate=100, total_fees=0.1, avg_profit_per_trade=10, largest_win=10, largest_loss=0,
+        max_drawdown=0, max_drawdown_pct=0,
+        trades=[{"entry_time": entry, "exit_time": exit_, "net_pnl": 10.0}],
+        klines=klines,
+        indicators={"rsi": series, "ema_fast": series, "tp_sl_levels": levels, "rsi_period": 14},
+    )
+
+
+class TestDownsampling:
+    def test_lttb_keeps_endpoints_and_peaks(self):
+        xs = list(range(1000))
+        ys = [0.0] * 1000
+        ys[500] = 10.0
+        kept = lttb_indices(xs, ys, 50)
+        assert len(kept) == 50
+        assert kept[0] == 0 and kept[-1] == 999
+        assert 500 in kept
+        assert lttb_indices(xs, ys, 2000) == xs
+
+    def test_klines_keep_extremes_and_trade_candles(self):
+        result = make_result()
+        bars = downsample_klines(result.klines, 1000, keep_times_ms=[T0 + 777 * 60000 + 30000])
+        assert len(bars) <= 1002
+        assert max(b[2] for b in bars) == 500.0
+        assert min(b[3] for b in bars) == min(k[3] for k in result.klines)
+        assert sum(b[5] for b in bars) == sum(k[5] for k in result.klines)
+        assert T0 + 777 * 60000 in {b[0] for b in bars}
+
+    def test_levels_keep_run_boundaries(self):
+        levels = [{"time": t, "sl": 1.0} for t in range(5)] + [{"time": t, "sl": 2.0} for t in range(5, 8)]
+        assert [l["time"] for l in downsample_levels(levels)] == [0, 4, 5, 7]
+
+    def test_result_downsampled_without_losing_trades(self):
+        result = make_result()
+        reduced = downsample_backtest_result(result, 2000)
+        assert reduced.trades == result.trades
+        assert len(reduced.klines) <= 2003
+        assert len(reduced.indicators["rsi"]) == 2000
+        assert len(reduced.indicators["tp_sl_levels"]) == 2
+        assert reduced.indicators["rsi_period"] == 14
+        times = {b[0] for b in reduced.klines}
+        assert {T0 + 777 * 60000, T0 + 778 * 60000} <= times
+        # The original is untouched
+        assert len(result.klines) == N
+
+
+class TestColumnar:
+    def test_columnar_arrays_match_rows(self):
+        result = make_result()
+        payload = columnar_backtest_payload(result)
+        assert payload["format"] == "columnar"
+        assert payload["klines"]["high"][12345] == 500.0
+        assert payload["klines"]["time"] == [k[0] for k in result.klines]
+        assert payload["indicators"]["rsi"]["value"][10] == result.indicators["rsi"][10]["value"]
+        assert payload["indicators"]["tp_sl_levels"]["position_side"][0] == "LONG"
+        assert payload["total_trades"] == 1
+
+    def test_payload_an_order_of_magnitude_smaller(self):
+        result = make_result()
+        full = len(result.model_dump_json())
+        compact = len(json.dumps(columnar_backtest_payload(downsample_backtest_result(result, 2000))))
+        assert compact * 10 < full
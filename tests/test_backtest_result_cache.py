@@ -0,0 +1,142 @@
+"""
+Tests for content-addressed backtest result memoization.
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.api.routes import backtesting as bt
+from app.services import backtest_result_cache as result_cache
+from app.services.backtest_result_cache import (
+    BacktestResultCache,
+    backtest_cache_key,
+    get_backtest_result_cache,
+    kline_fingerprint,
+)
+from app.strategies.base import StrategySignal
+
+T0 = 1700000000000
+
+
+def kline(ts_ms, o, h, l, c, v=1.0):
+    return [ts_ms, str(o), str(h), str(l), str(c), str(v), ts_ms + 59999, "0", 0, "0", "0", "0"]
+
+
+def make_klines(n=6):
+    return [kline(T0 + i * 60000, 100 + i, 101 + i, 99 + i, 100 + i) for i in range(n)]
+
+
+def make_request(**overrides):
+    fields = dict(
+        symbol="BTCUSDT",
+        strategy_type="scalping",
+        start_time=datetime.fromtimestamp(T0 / 1000, tz=timezone.utc),
+        end_time=datetime.fromtimestamp((T0 + 300000) / 1000, tz=timezone.utc),
+        leverage=1,
+        risk_per_trade=0.01,
+        fixed_amount=100,
+        initial_balance=1000,
+        params={"ema_fast": 1, "ema_slow": 1, "kline_interval": "1m"},
+    )
+    fields.update(overrides)
+    return bt.BacktestRequest(**fields)
+
+
+class TestCacheKey:
+    def test_key_ignores_param_order(self):
+        klines = make_klines()
+        a = make_request(params={"ema_fast": 1, "ema_slow": 1})
+        b = make_request(params={"ema_slow": 1, "ema_fast": 1})
+        assert backtest_cache_key(a, "1m", klines) == backtest_cache_key(b, "1m", klines)
+
+    def test_key_changes_with_params_interval_and_data(self):
+        klines = make_klines()
+        base = backtest_cache_key(make_request(), "1m", klines)
+        assert backtest_cache_key(make_request(leverage=2), "1m", klines) != base
+        assert backtest_cache_key(make_request(), "5m", klines) != base
+
+        changed = make_klines()
+        changed[3][4] = "123.4"
+        assert kline_fingerprint(changed) != kline_fingerprint(klines)
+        assert backtest_cache_key(make_request(), "1m", changed) != base
+
+    def test_key_changes_with_simulation_code(self, monkeypatch):
+        klines = make_klines()
+        fingerprint = result_cache.simulation_fingerprint()
+        assert fingerprint == result_cache.simulation_fingerprint()
+        base = backtest_cache_key(make_request(), "1m", klines)
+
+        monkeypatch.setattr(result_cache, "simulation_fingerprint", lambda: fingerprint + "x")
+        assert backtest_cache_key(make_request(), "1m", klines) != base
+
+
+class TestTiers:
+    def test_memory_tier_evicts_least_recently_used_by_size(self):
+        result = bt.BacktestResult.model_validate(_empty_result_fields())
+        size = len(result.model_dump_json())
+        cache = BacktestResultCache(memory_max_bytes=2 * size)
+
+        cache.put("a", result)
+        cache.put("b", result)
+        assert cache.get("a", bt.BacktestResult) is not None  # "a" is now most recent
+        cache.put("c", result)
+
+        assert cache.get("b", bt.BacktestResult) is None
+        assert cache.get("a", bt.BacktestResult) is not None
+        assert cache.get("c", bt.BacktestResult) is not None
+
+    def test_hits_are_independent_copies(self):
+        cache = BacktestResultCache()
+        cache.put("k", bt.BacktestResult.model_validate(_empty_result_fields()))
+        first = cache.get("k", bt.BacktestResult)
+        first.trades.append({"mutated": True})
+        assert cache.get("k", bt.BacktestResult).trades == []
+
+    def test_disk_tier_survives_new_process_and_is_size_bounded(self, tmp_path):
+        result = bt.BacktestResult.model_validate(_empty_result_fields())
+        size = len(result.model_dump_json())
+        BacktestResultCache(disk_dir=str(tmp_path), disk_max_bytes=10 * size).put("k", result)
+
+        fresh = BacktestResultCache(disk_dir=str(tmp_path), disk_max_bytes=10 * size)
+        assert fresh.get("k", bt.BacktestResult) == result
+
+        small = BacktestResultCache(disk_dir=str(tmp_path), disk_max_bytes=2 * size)
+        for key in ("x", "y", "z"):
+            small.put(key, result)
+        assert sum(p.stat().st_size for p in tmp_path.glob("*.json")) <= 2 * size
+
+
+@pytest.mark.asyncio
+async def test_repeat_backtest_is_not_resimulated(monkeypatch):
+    calls = {"n": 0}
+
+    async def fake_eval(self):
+        calls["n"] += 1
+        return StrategySignal(action="HOLD", symbol="BTCUSDT", confidence=0.0, price=None)
+
+    monkeypatch.setattr(bt.EmaScalpingStrategy, "evaluate", fake_eval)
+    klines = make_klines()
+
+    first = await bt.run_backtest(make_request(), None, pre_fetched_klines=klines)
+    evaluations = calls["n"]
+    assert evaluations > 0
+
+    second = await bt.run_backtest(make_request(), None, pre_fetched_klines=[list(k) for k in klines])
+    assert calls["n"] == evaluations
+    assert second == first
+    assert get_backtest_result_cache().hits == 1
+
+    await bt.run_backtest(make_request(leverage=2), None, pre_fetched_klines=klines)
+    assert calls["n"] > evaluations
+
+
+def _empty_result_fields():
+    return dict(
+        symbol="BTCUSDT", strategy_type="scalping",
+        start_time=datetime.fromtimestamp(T0 / 1000, tz=timezone.utc),
+        end_time=datetime.fromtimestamp((T0 + 300000) / 1000, tz=timezone.utc),
+        initial_balance=1000, final_balance=1000, total_pnl=0, total_return_pct=0,
+        total_trades=0, completed_trades=0, open_trades=0, winning_trades=0, losing_trades=0,
+        win_rate=0, total_fees=0, avg_profit_per_trade=0, largest_win=0, largest_loss=0,
+        max_drawdown=0, max_drawdown_pct=0, trades=[],
+    )
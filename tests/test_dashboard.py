@@ -14,7 +14,7 @@ import sys
 import os
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
@@ -115,6 +115,14 @@ def mock_client_manager():
     return manager
 
 
+@pytest.fixture
+def mock_db_service():
+    """Create a mock async database service without completed trades."""
+    db_service = MagicMock()
+    db_service.async_get_user_strategies = AsyncMock(return_value=[])
+    return db_service
+
+
 @pytest.mark.skipif(
     os.environ.get('DEPLOYMENT') == 'true',
     reason="Skipped during deployment"
@@ -123,12 +131,13 @@ class TestDashboardOverview:
     """Test dashboard overview endpoint."""
     
     @pytest.mark.slow
-    def test_dashboard_overview_basic(self, client: TestClient, mock_user, mock_strategies, mock_client_manager):
+    def test_dashboard_overview_basic(self, client: TestClient, mock_user, mock_strategies, mock_client_manager, mock_db_service):
         """Test basic dashboard overview returns correct structure."""
-        from app.api.deps import get_current_user, get_strategy_runner, get_binance_client, get_client_manager
+        from app.api.deps import get_current_user_async, get_database_service_async, get_strategy_runner, get_binance_client, get_client_manager
         
         # Mock authentication and dependencies
-        app.dependency_overrides[get_current_user] = lambda: mock_user
+        app.dependency_overrides[get_current_user_async] = lambda: mock_user
+        app.dependency_overrides[get_database_service_async] = lambda: mock_db_service
         
         try:
             # Mock strategy runner
@@ -189,7 +198,7 @@ class TestDashboardOverview:
             app.dependency_overrides[get_client_manager] = lambda: mock_client_manager
             
             # get_pnl_overview is imported inside the function, patch it in the trades module
-            with patch('app.api.routes.trades.get_pnl_overview', return_value=[]):
+            with patch('app.api.routes.trades.get_pnl_overview', new_callable=AsyncMock, return_value=[]):
                 # Make request
                 response = client.get("/api/dashboard/overview/")
                 
@@ -216,11 +225,12 @@ class TestDashboardOverview:
             app.dependency_overrides.clear()
     
     @pytest.mark.slow
-    def test_dashboard_overview_with_date_filter(self, client: TestClient, mock_user, mock_strategies, mock_client_manager):
+    def test_dashboard_overview_with_date_filter(self, client: TestClient, mock_user, mock_strategies, mock_client_manager, mock_db_service):
         """Test dashboard overview with date filtering."""
-        from app.api.deps import get_current_user, get_strategy_runner, get_binance_client, get_client_manager
+        from app.api.deps import get_current_user_async, get_database_service_async, get_strategy_runner, get_binance_client, get_client_manager
         
-        app.dependency_overrides[get_current_user] = lambda: mock_user
+        app.dependency_overrides[get_current_user_async] = lambda: mock_user
+        app.dependency_overrides[get_database_service_async] = lambda: mock_db_service
         
         try:
             mock_runner = Mock(spec=StrategyRunner)
@@ -257,7 +267,7 @@ class TestDashboardOverview:
             app.dependency_overrides[get_binance_client] = lambda: mock_client
             app.dependency_overrides[get_client_manager] = lambda: mock_client_manager
             
-            with patch('app.api.routes.trades.get_pnl_overview', return_value=[]):
+            with patch('app.api.routes.trades.get_pnl_overview', new_callable=AsyncMock, return_value=[]):
                 # Request with date filter
                 start_date = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
                 end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -277,11 +287,12 @@ class TestDashboardOverview:
             app.dependency_overrides.clear()
     
     @pytest.mark.slow
-    def test_dashboard_overview_with_account_filter(self, client: TestClient, mock_user, mock_strategies, mock_client_manager):
+    def test_dashboard_overview_with_account_filter(self, client: TestClient, mock_user, mock_strategies, mock_client_manager, mock_db_service):
         """Test dashboard overview with account filtering."""
-        from app.api.deps import get_current_user, get_strategy_runner, get_binance_client, get_client_manager
+        from app.api.deps import get_current_user_async, get_database_service_async, get_strategy_runner, get_binance_client, get_client_manager
         
-        app.dependency_overrides[get_current_user] = lambda: mock_user
+        app.dependency_overrides[get_current_user_async] = lambda: mock_user
+        app.dependency_overrides[get_database_service_async] = lambda: mock_db_service
         
         try:
             # Filter strategies by account_id
@@ -318,7 +329,7 @@ class TestDashboardOverview:
             app.dependency_overrides[get_binance_client] = lambda: mock_client
             app.dependency_overrides[get_client_manager] = lambda: mock_client_manager
             
-            with patch('app.api.routes.trades.get_pnl_overview', return_value=[]):
+            with patch('app.api.routes.trades.get_pnl_overview', new_callable=AsyncMock, return_value=[]):
                 response = client.get("/api/dashboard/overview/?account_id=test_account")
                 
                 assert response.status_code == 200
@@ -328,11 +339,12 @@ class TestDashboardOverview:
             app.dependency_overrides.clear()
     
     @pytest.mark.slow
-    def test_dashboard_overview_date_only_format(self, client: TestClient, mock_user, mock_client_manager):
+    def test_dashboard_overview_date_only_format(self, client: TestClient, mock_user, mock_client_manager, mock_db_service):
         """Test that date-only format (YYYY-MM-DD) is handled correctly."""
-        from app.api.deps import get_current_user, get_strategy_runner, get_binance_client, get_client_manager
+        from app.api.deps import get_current_user_async, get_database_service_async, get_strategy_runner, get_binance_client, get_client_manager
         
-        app.dependency_overrides[get_current_user] = lambda: mock_user
+        app.dependency_overrides[get_current_user_async] = lambda: mock_user
+        app.dependency_overrides[get_database_service_async] = lambda: mock_db_service
         
         try:
             mock_runner = Mock(spec=StrategyRunner)
@@ -365,7 +377,7 @@ class TestDashboardOverview:
             app.dependency_overrides[get_binance_client] = lambda: mock_client
             app.dependency_overrides[get_client_manager] = lambda: mock_client_manager
             
-            with patch('app.api.routes.trades.get_pnl_overview', return_value=[]):
+            with patch('app.api.routes.trades.get_pnl_overview', new_callable=AsyncMock, return_value=[]):
                 # Test with date-only format (should not error)
                 response = client.get("/api/dashboard/overview/?start_date=2026-01-19&end_date=2026-01-20")
                 
@@ -375,11 +387,12 @@ class TestDashboardOverview:
             app.dependency_overrides.clear()
     
     @pytest.mark.slow
-    def test_dashboard_overview_invalid_date_format(self, client: TestClient, mock_user, mock_client_manager):
+    def test_dashboard_overview_invalid_date_format(self, client: TestClient, mock_user, mock_client_manager, mock_db_service):
         """Test that invalid date formats are handled gracefully."""
-        from app.api.deps import get_current_user, get_strategy_runner, get_binance_client, get_client_manager
+        from app.api.deps import get_current_user_async, get_database_service_async, get_strategy_runner, get_binance_client, get_client_manager
         
-        app.dependency_overrides[get_current_user] = lambda: mock_user
+        app.dependency_overrides[get_current_user_async] = lambda: mock_user
+        app.dependency_overrides[get_database_service_async] = lambda: mock_db_service
         
         try:
             mock_runner = Mock(spec=StrategyRunner)
@@ -396,7 +409,7 @@ class TestDashboardOverview:
             app.dependency_overrides[get_binance_client] = lambda: mock_client
             app.dependency_overrides[get_client_manager] = lambda: mock_client_manager
             
-            with patch('app.api.routes.trades.get_pnl_overview', return_value=[]):
+            with patch('app.api.routes.trades.get_pnl_overview', new_callable=AsyncMock, return_value=[]):
                 # Test with invalid date format (should still work, ignoring invalid dates)
                 response = client.get("/api/dashboard/overview/?start_date=invalid-date&end_date=also-invalid")
                 
@@ -406,11 +419,12 @@ class TestDashboardOverview:
             app.dependency_overrides.clear()
     
     @pytest.mark.slow
-    def test_dashboard_overview_empty_data(self, client: TestClient, mock_user, mock_client_manager):
+    def test_dashboard_overview_empty_data(self, client: TestClient, mock_user, mock_client_manager, mock_db_service):
         """Test dashboard overview with no strategies or trades."""
-        from app.api.deps import get_current_user, get_strategy_runner, get_binance_client, get_client_manager
+        from app.api.deps import get_current_user_async, get_database_service_async, get_strategy_runner, get_binance_client, get_client_manager
         
-        app.dependency_overrides[get_current_user] = lambda: mock_user
+        app.dependency_overrides[get_current_user_async] = lambda: mock_user
+        app.dependency_overrides[get_database_service_async] = lambda: mock_db_service
         
         try:
             mock_runner = Mock(spec=StrategyRunner)
@@ -427,7 +441,7 @@ class TestDashboardOverview:
             app.dependency_overrides[get_binance_client] = lambda: mock_client
             app.dependency_overrides[get_client_manager] = lambda: mock_client_manager
             
-            with patch('app.api.routes.trades.get_pnl_overview', return_value=[]):
+            with patch('app.api.routes.trades.get_pnl_overview', new_callable=AsyncMock, return_value=[]):
                 response = client.get("/api/dashboard/overview/")
                 
                 assert response.status_code == 200
@@ -446,11 +460,12 @@ class TestDashboardOverview:
             app.dependency_overrides.clear()
     
     @pytest.mark.slow
-    def test_dashboard_overview_unrealized_pnl_excluded_with_date_filter(self, client: TestClient, mock_user, mock_strategies, mock_client_manager):
+    def test_dashboard_overview_unrealized_pnl_excluded_with_date_filter(self, client: TestClient, mock_user, mock_strategies, mock_client_manager, mock_db_service):
         """Test that unrealized PnL is excluded when date filtering is active."""
-        from app.api.deps import get_current_user, get_strategy_runner, get_binance_client, get_client_manager
+        from app.api.deps import get_current_user_async, get_database_service_async, get_strategy_runner, get_binance_client, get_client_manager
         
-        app.dependency_overrides[get_current_user] = lambda: mock_user
+        app.dependency_overrides[get_current_user_async] = lambda: mock_user
+        app.dependency_overrides[get_database_service_async] = lambda: mock_db_service
         
         try:
             mock_runner = Mock(spec=StrategyRunner)
@@ -486,7 +501,7 @@ class TestDashboardOverview:
             app.dependency_overrides[get_binance_client] = lambda: mock_client
             app.dependency_overrides[get_client_manager] = lambda: mock_client_manager
             
-            with patch('app.api.routes.trades.get_pnl_overview', return_value=[]):
+            with patch('app.api.routes.trades.get_pnl_overview', new_callable=AsyncMock, return_value=[]):
                 # Request with date filter
                 start_date = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
                 end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -519,11 +534,12 @@ class TestDashboardDateFiltering:
     """Test date filtering functionality across dashboard endpoints."""
     
     @pytest.mark.slow
-    def test_date_filter_start_of_day_end_of_day(self, client: TestClient, mock_user, mock_client_manager):
+    def test_date_filter_start_of_day_end_of_day(self, client: TestClient, mock_user, mock_client_manager, mock_db_service):
         """Test that date-only format sets start to 00:00:00 and end to 23:59:59."""
-        from app.api.deps import get_current_user, get_strategy_runner, get_binance_client, get_client_manager
+        from app.api.deps import get_current_user_async, get_database_service_async, get_strategy_runner, get_binance_client, get_client_manager
         
-        app.dependency_overrides[get_current_user] = lambda: mock_user
+        app.dependency_overrides[get_current_user_async] = lambda: mock_user
+        app.dependency_overrides[get_database_service_async] = lambda: mock_db_service
         
         try:
             mock_runner = Mock(spec=StrategyRunner)
@@ -540,7 +556,7 @@ class TestDashboardDateFiltering:
             app.dependency_overrides[get_binance_client] = lambda: mock_client
             app.dependency_overrides[get_client_manager] = lambda: mock_client_manager
             
-            with patch('app.api.routes.trades.get_pnl_overview', return_value=[]):
+            with patch('app.api.routes.trades.get_pnl_overview', new_callable=AsyncMock, return_value=[]):
                 # Test date-only format
                 response = client.get("/api/dashboard/overview/?start_date=2026-01-19&end_date=2026-01-20")
                 
@@ -552,11 +568,12 @@ class TestDashboardDateFiltering:
             app.dependency_overrides.clear()
     
     @pytest.mark.slow
-    def test_date_filter_iso_format(self, client: TestClient, mock_user, mock_client_manager):
+    def test_date_filter_iso_format(self, client: TestClient, mock_user, mock_client_manager, mock_db_service):
         """Test that ISO datetime format works correctly."""
-        from app.api.deps import get_current_user, get_strategy_runner, get_binance_client, get_client_manager
+        from app.api.deps import get_current_user_async, get_database_service_async, get_strategy_runner, get_binance_client, get_client_manager
         
-        app.dependency_overrides[get_current_user] = lambda: mock_user
+        app.dependency_overrides[get_current_user_async] = lambda: mock_user
+        app.dependency_overrides[get_database_service_async] = lambda: mock_db_service
         
         try:
             mock_runner = Mock(spec=StrategyRunner)
@@ -573,7 +590,7 @@ class TestDashboardDateFiltering:
             app.dependency_overrides[get_binance_client] = lambda: mock_client
             app.dependency_overrides[get_client_manager] = lambda: mock_client_manager
             
-            with patch('app.api.routes.trades.get_pnl_overview', return_value=[]):
+            with patch('app.api.routes.trades.get_pnl_overview', new_callable=AsyncMock, return_value=[]):
                 # Test ISO format
                 start_date = "2026-01-19T10:00:00Z"
                 end_date = "2026-01-20T15:30:00Z"
@@ -591,11 +608,12 @@ class TestDashboardResponseStructure:
     """Test dashboard response structure and data validation."""
     
     @pytest.mark.slow
-    def test_dashboard_response_contains_all_required_fields(self, client: TestClient, mock_user, mock_client_manager):
+    def test_dashboard_response_contains_all_required_fields(self, client: TestClient, mock_user, mock_client_manager, mock_db_service):
         """Test that dashboard response contains all required fields."""
-        from app.api.deps import get_current_user, get_strategy_runner, get_binance_client, get_client_manager
+        from app.api.deps import get_current_user_async, get_database_service_async, get_strategy_runner, get_binance_client, get_client_manager
         
-        app.dependency_overrides[get_current_user] = lambda: mock_user
+        app.dependency_overrides[get_current_user_async] = lambda: mock_user
+        app.dependency_overrides[get_database_service_async] = lambda: mock_db_service
         
         try:
             mock_runner = Mock(spec=StrategyRunner)
@@ -612,7 +630,7 @@ class TestDashboardResponseStructure:
             app.dependency_overrides[get_binance_client] = lambda: mock_client
             app.dependency_overrides[get_client_manager] = lambda: mock_client_manager
             
-            with patch('app.api.routes.trades.get_pnl_overview', return_value=[]):
+            with patch('app.api.routes.trades.get_pnl_overview', new_callable=AsyncMock, return_value=[]):
                 response = client.get("/api/dashboard/overview/")
                 
                 assert response.status_code == 200
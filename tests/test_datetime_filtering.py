@@ -381,7 +381,7 @@ class TestStrategiesDatetimeFiltering:
     
     def test_strategies_api_accepts_datetime_params(self, client, mock_runner):
         """Test that strategies performance API accepts datetime parameters."""
-        from app.api.deps import get_db_session_dependency, get_current_user
+        from app.api.deps import get_database_service_async, get_current_user_async, get_db_session_dependency
         from unittest.mock import MagicMock
         from uuid import uuid4
         from app.models.db_models import User
@@ -395,11 +395,13 @@ class TestStrategiesDatetimeFiltering:
             is_active=True
         )
         
-        # Create a mock database session
+        # Create a mock database service, plus a mock session for get_strategy_runner
+        mock_db_service = MagicMock()
         mock_db_session = MagicMock()
         
         # Override dependencies
-        client.app.dependency_overrides[get_current_user] = lambda: mock_user
+        client.app.dependency_overrides[get_current_user_async] = lambda: mock_user
+        client.app.dependency_overrides[get_database_service_async] = lambda: mock_db_service
         client.app.dependency_overrides[get_db_session_dependency] = lambda: mock_db_session
         
         try:
@@ -424,7 +426,8 @@ class TestStrategiesDatetimeFiltering:
                 assert isinstance(data, dict)
         finally:
             # Clean up dependency overrides
-            client.app.dependency_overrides.pop(get_current_user, None)
+            client.app.dependency_overrides.pop(get_current_user_async, None)
+            client.app.dependency_overrides.pop(get_database_service_async, None)
             client.app.dependency_overrides.pop(get_db_session_dependency, None)
 
 
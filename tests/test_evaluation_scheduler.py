@@ -0,0 +1,157 @@
+"""
+Tests for EvaluationScheduler: candle fan-out, shared price/position lookups, order slots.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.evaluation_scheduler import EvaluationScheduler
+
+
+def _closed_kline(close_time: int, close: str = "100.0") -> dict:
+    return {"T": close_time, "c": close, "x": True}
+
+
+class TestCandleFanOut:
+    @pytest.mark.asyncio
+    async def test_one_candle_wakes_all_strategies_on_stream(self):
+        scheduler = EvaluationScheduler()
+        waiters = [
+            asyncio.create_task(scheduler.wait_for_candle(f"s{i}", "BTCUSDT", "1m", timeout=2.0))
+            for i in range(5)
+        ]
+        other_stream = asyncio.create_task(scheduler.wait_for_candle("eth", "ETHUSDT", "1m", timeout=0.2))
+        await asyncio.sleep(0)
+
+        scheduler.on_candle_closed("BTCUSDT", "1m", _closed_kline(1000))
+        results = await asyncio.gather(*waiters)
+
+        assert results == [True] * 5
+        assert await other_stream is False
+        snapshot = scheduler.get_snapshot("btcusdt", "1m")
+        assert snapshot.generation == 1 and snapshot.close_time == 1000
+
+    @pytest.mark.asyncio
+    async def test_candle_closed_while_busy_is_not_missed(self):
+        scheduler = EvaluationScheduler()
+        # First wait establishes the baseline and times out (no candle yet)
+        assert await scheduler.wait_for_candle("s1", "BTCUSDT", "1m", timeout=0.01) is False
+
+        # Candle closes while the strategy is evaluating (not waiting)
+        scheduler.on_candle_closed("BTCUSDT", "1m", _closed_kline(1000))
+
+        assert await scheduler.wait_for_candle("s1", "BTCUSDT", "1m", timeout=0.01) is True
+        # Same candle is not delivered twice
+        assert await scheduler.wait_for_candle("s1", "BTCUSDT", "1m", timeout=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_forget_drops_strategy(self):
+        scheduler = EvaluationScheduler()
+        await scheduler.wait_for_candle("s1", "BTCUSDT", "1m", timeout=0.01)
+        assert "s1" in scheduler._last_seen
+        scheduler.forget("s1")
+        assert "s1" not in scheduler._last_seen
+
+
+class TestSharedLookups:
+    @pytest.mark.asyncio
+    async def test_strategies_woken_by_one_candle_share_one_klines_fetch(self):
+        kline_manager = MagicMock()
+        kline_manager.get_klines = AsyncMock(side_effect=lambda symbol, interval, limit: [[1], [2]][-limit:])
+        scheduler = EvaluationScheduler(kline_manager=kline_manager)
+        scheduler.on_candle_closed("BTCUSDT", "1m", _closed_kline(1000))
+
+        views = await asyncio.gather(*[scheduler.get_klines("BTCUSDT", "1m", 2) for _ in range(5)])
+        assert views == [[[1], [2]]] * 5
+        assert views[0] is not views[1]  # Each strategy gets its own list
+        assert kline_manager.get_klines.await_count == 1
+
+        # A different window and the next candle are fetched again
+        await scheduler.get_klines("BTCUSDT", "1m", 1)
+        scheduler.on_candle_closed("BTCUSDT", "1m", _closed_kline(2000))
+        await scheduler.get_klines("BTCUSDT", "1m", 2)
+        assert kline_manager.get_klines.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_price_requests_share_one_rest_call(self):
+        scheduler = EvaluationScheduler()
+        calls = []
+
+        def get_price(symbol):
+            calls.append(symbol)
+            time.sleep(0.05)
+            return 50000.0
+
+        client = MagicMock()
+        client.get_price.side_effect = get_price
+        prices = await asyncio.gather(*[scheduler.get_price("BTCUSDT", client) for _ in range(10)])
+
+        assert prices == [50000.0] * 10
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_price_used_only_for_matching_network(self):
+        kline_manager = MagicMock()
+        kline_manager.testnet = False
+        kline_manager.get_last_price.return_value = 123.0
+        scheduler = EvaluationScheduler(kline_manager=kline_manager)
+        kline_manager.add_candle_listener.assert_called_once_with(scheduler.on_candle_closed)
+
+        mainnet_client = MagicMock(testnet=False)
+        assert await scheduler.get_price("BTCUSDT", mainnet_client) == 123.0
+        mainnet_client.get_price.assert_not_called()
+
+        testnet_client = MagicMock(testnet=True)
+        testnet_client.get_price.return_value = 99.0
+        assert await scheduler.get_price("BTCUSDT", testnet_client) == 99.0
+
+    @pytest.mark.asyncio
+    async def test_position_requests_are_shared_only_while_in_flight(self):
+        scheduler = EvaluationScheduler()
+        client = MagicMock()
+        client.get_open_position.side_effect = lambda symbol: (time.sleep(0.05), {"positionAmt": "1"})[1]
+
+        results = await asyncio.gather(*[
+            scheduler.get_open_position("acc1", "BTCUSDT", client) for _ in range(4)
+        ])
+        assert all(r == {"positionAmt": "1"} for r in results)
+        assert client.get_open_position.call_count == 1
+
+        # A later caller gets a fresh request (no TTL reuse for positions)
+        await scheduler.get_open_position("acc1", "BTCUSDT", client)
+        assert client.get_open_position.call_count == 2
+
+
+class TestOrderSlots:
+    @pytest.mark.asyncio
+    async def test_order_execution_is_bounded(self):
+        from app.services.strategy_executor import StrategyExecutor
+
+        scheduler = EvaluationScheduler(max_concurrent_orders=2)
+        executor = StrategyExecutor(
+            account_manager=MagicMock(),
+            state_manager=MagicMock(),
+            order_manager=MagicMock(),
+            client_manager=MagicMock(),
+            evaluation_scheduler=scheduler,
+        )
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        async def fake_execute_order(*args, **kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            with lock:
+                running -= 1
+
+        executor._execute_order = fake_execute_order
+        await asyncio.gather(*[executor._execute_order_bounded() for _ in range(6)])
+        assert peak == 2
@@ -364,7 +364,7 @@ class TestExitReasonTracking:
         assert completed[0].exit_reason == "TP_TRAILING", \
             f"Expected 'TP_TRAILING' from signal, got '{completed[0].exit_reason}'"
     
-    def test_exit_reason_in_full_report(self):
+    async def test_exit_reason_in_full_report(self):
         """Test that exit_reason appears correctly in full trading reports."""
         runner = make_runner()
         
@@ -414,7 +414,7 @@ class TestExitReasonTracking:
         
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=client):
-                report = get_trading_report(
+                report = await get_trading_report(
                     strategy_id=strategy_id,
                     strategy_name=None,
                     symbol=None,
@@ -265,3 +265,68 @@ class TestIndicatorIntegration:
         assert 0 <= rsi <= 100
         assert atr > 0
 
+
+
+class TestIndicatorSeriesCache:
+    """Cached per-candle indicator values match the inline calculations exactly."""
+
+    @staticmethod
+    def _klines(n=400):
+        import math
+        klines = []
+        for i in range(n):
+            close = 100 + 5 * math.sin(i / 7) + (i % 5) * 0.3
+            klines.append([i * 60000, str(close - 0.2), str(close + 1), str(close - 1), str(close), "10",
+                           i * 60000 + 59999, "0", 0, "0", "0", "0"])
+        return klines
+
+    def test_values_match_inline_functions(self):
+        from app.strategies.indicator_cache import IndicatorSeriesCache
+
+        klines = self._klines()
+        closes = [float(k[4]) for k in klines]
+        cache = IndicatorSeriesCache(klines)
+        for end in (0, 5, 13, 14, 15, 60, 105, 106, 250, 400):
+            assert cache.ema(14, end) == calculate_ema(closes[:end], 14)
+            assert cache.ema(14, end, window=105) == calculate_ema(closes[max(0, end - 105):end], 14)
+            assert cache.rsi(14, end) == calculate_rsi(closes[:end], 14)
+            assert cache.atr(14, end) == calculate_atr(klines[:end], 14)
+
+    def test_end_for_requires_a_prefix_of_the_cached_klines(self):
+        from app.strategies.indicator_cache import IndicatorSeriesCache
+
+        klines = self._klines(50)
+        cache = IndicatorSeriesCache(klines)
+        assert cache.end_for(klines[:20]) == 20
+        assert cache.end_for(klines[5:20]) is None
+        assert cache.end_for([list(k) for k in klines[:20]]) is None
+        assert cache.end_for([]) is None
+
+    @pytest.mark.asyncio
+    async def test_backtest_results_identical_with_and_without_cache(self, monkeypatch):
+        from datetime import datetime, timezone
+        from app.api.routes import backtesting as bt
+        from app.strategies.base import Strategy
+        from app.strategies.indicator_cache import IndicatorSeriesCache
+
+        monkeypatch.setattr(bt, "get_backtest_result_cache", lambda: None)
+        klines = self._klines(600)
+        request = bt.BacktestRequest(
+            symbol="BTCUSDT",
+            strategy_type="scalping",
+            start_time=datetime.fromtimestamp(0, tz=timezone.utc),
+            end_time=datetime.fromtimestamp(600 * 60, tz=timezone.utc),
+            leverage=5,
+            risk_per_trade=0.01,
+            initial_balance=1000,
+            params={"ema_fast": 5, "ema_slow": 13, "kline_interval": "1m", "enable_short": True,
+                    "use_rsi_filter": True, "use_atr_filter": True, "atr_min_pct": 0.0, "atr_max_pct": 100.0},
+        )
+        cached = await bt.run_backtest(request, None, pre_fetched_klines=klines,
+                                       indicator_cache=IndicatorSeriesCache(klines))
+
+        monkeypatch.setattr(Strategy, "_indicator_cache_end", lambda self, closed_klines: None)
+        inline = await bt.run_backtest(request.model_copy(deep=True), None, pre_fetched_klines=klines)
+
+        assert cached.total_trades > 0
+        assert cached.model_dump(exclude={"klines", "indicators"}) == inline.model_dump(exclude={"klines", "indicators"})
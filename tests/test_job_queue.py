@@ -0,0 +1,295 @@
+"""
+Tests for the Redis job queue, the job worker and the Redis-backed task manager.
+"""
+
+import asyncio
+import time
+from functools import partial
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import job_queue as job_queue_module
+from app.core.job_queue import JobQueue, is_transient_error
+from app.core.redis_codec import get_codec
+from app.core.redis_storage import RedisStorage
+from app.job_worker import JobWorker
+from app.services.walk_forward_task_manager import RedisWalkForwardTaskManager
+
+
+class FakeRedisClient:
+    """In-memory stand-in for the Redis commands the job queue uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    # Strings
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = str(value)
+        return True
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def decr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) - 1)
+        return int(self.data[key])
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+    # Hashes
+    def hset(self, key, field=None, value=None, mapping=None):
+        target = self.data.setdefault(key, {})
+        if field is not None:
+            target[field] = str(value)
+        target.update({k: str(v) for k, v in (mapping or {}).items()})
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def hmget(self, key, fields):
+        return [self.hget(key, field) for field in fields]
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hincrby(self, key, field, amount):
+        target = self.data.setdefault(key, {})
+        target[field] = str(int(target.get(field, 0)) + amount)
+        return int(target[field])
+
+    # Sets
+    def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(member)
+
+    def srem(self, key, member):
+        self.data.get(key, set()).discard(member)
+
+    def scard(self, key):
+        return len(self.data.get(key, set()))
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    # Sorted sets
+    def zadd(self, key, mapping, xx=False):
+        target = self.data.setdefault(key, {})
+        for member, score in mapping.items():
+            if not xx or member in target:
+                target[member] = score
+
+    def zrem(self, key, member):
+        return int(self.data.get(key, {}).pop(member, None) is not None)
+
+    def zcard(self, key):
+        return len(self.data.get(key, {}))
+
+    def _sorted(self, key):
+        return sorted(self.data.get(key, {}).items(), key=lambda item: item[1])
+
+    def zrange(self, key, start, end):
+        return [member for member, _ in self._sorted(key)][start:end + 1]
+
+    def zrangebyscore(self, key, low, high):
+        low = float("-inf") if low == "-inf" else low
+        return [member for member, score in self._sorted(key) if low <= score <= high]
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.calls = []
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+            def execute(self):
+                return [getattr(client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+        return Pipeline()
+
+
+class FakeBinaryRedisClient:
+    """In-memory stand-in for the bytes client behind ``get_value``/``set_value``."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+        return True
+
+    def setex(self, key, seconds, value):
+        return self.set(key, value)
+
+
+def make_queue(user_quota=1, lease_seconds=60):
+    storage = MagicMock()
+    storage.enabled = True
+    storage._client = FakeRedisClient()
+    storage._binary_client = FakeBinaryRedisClient()
+    storage.codec = get_codec("zlib")
+    # Real codec round trip for values stored next to the queue (task results)
+    storage.get_value = partial(RedisStorage.get_value, storage)
+    storage.set_value = partial(RedisStorage.set_value, storage)
+    return JobQueue(storage, user_quota=user_quota, lease_seconds=lease_seconds)
+
+
+class TestJobQueue:
+    def test_priority_then_age_and_per_user_quota(self):
+        queue = make_queue(user_quota=1)
+        first = queue.enqueue("walk_forward", "alice", {})
+        second = queue.enqueue("walk_forward", "alice", {})
+        urgent = queue.enqueue("sensitivity", "bob", {}, priority=1)
+
+        assert queue.claim("w1").id == urgent.id
+        assert queue.claim("w1").id == first.id
+        # alice is at her quota: her next job waits although the queue is not empty
+        assert queue.claim("w2") is None
+        queue.complete(queue.get(first.id))
+        assert queue.claim("w2").id == second.id
+        assert queue.get(first.id).status == "completed"
+        assert queue.active_count("alice") == 1
+
+    def test_same_job_id_is_enqueued_once_while_active(self):
+        queue = make_queue()
+        job = queue.enqueue("walk_forward", "alice", {}, job_id="task-1")
+        assert queue.enqueue("walk_forward", "alice", {}, job_id="task-1").id == job.id
+        assert queue.queued_count() == 1
+
+    def test_failed_attempt_is_retried_after_delay_until_attempts_run_out(self, monkeypatch):
+        monkeypatch.setattr(job_queue_module, "RETRY_DELAYS_SECONDS", (0,))
+        queue = make_queue()
+        queue.enqueue("walk_forward", "alice", {}, max_attempts=2)
+
+        job = queue.claim("w1")
+        assert queue.fail(job, "timeout")
+        assert queue.claim("w1") is None  # Waiting in the delayed set
+        assert queue.promote_delayed() == 1
+        job = queue.claim("w1")
+        assert job.attempts == 2
+        assert not queue.fail(job, "timeout")
+        assert queue.get(job.id).status == "failed"
+        assert queue.active_count("alice") == 0
+
+    def test_jobs_of_a_silent_worker_are_retried(self):
+        queue = make_queue(lease_seconds=60)
+        queue.enqueue("walk_forward", "alice", {}, max_attempts=1)
+        other = queue.enqueue("walk_forward", "bob", {}, max_attempts=2)
+        lost = queue.claim("dead-worker")
+        lost_retry = queue.claim("dead-worker")
+        queue._client.zadd(queue._key("running"), {lost.id: time.time() - 1, lost_retry.id: time.time() - 1})
+
+        failed = queue.requeue_stale()
+
+        assert [job.id for job in failed] == [lost.id]
+        assert queue.get(other.id).status == "queued"
+        assert queue.running_count() == 0
+
+    def test_cancel_removes_queued_job_and_flags_running_job(self):
+        queue = make_queue(user_quota=2)
+        running = queue.enqueue("walk_forward", "alice", {})
+        queued = queue.enqueue("walk_forward", "alice", {})
+        running = queue.claim("w1")
+
+        queue.cancel(queued.id)
+        queue.cancel(running.id)
+
+        assert queue.get(queued.id).status == "cancelled"
+        assert queue.claim("w1") is None
+        assert queue.is_cancelled(running.id)
+        queue.complete(running)
+        assert queue.get(running.id).status == "cancelled"
+
+    def test_transient_errors(self):
+        assert is_transient_error(ConnectionError("reset"))
+        assert is_transient_error(HTTPException(status_code=500, detail="Failed to fetch historical klines: 503"))
+        assert not is_transient_error(ValueError("invalid params"))
+
+
+@pytest.fixture
+def redis_task_manager(monkeypatch):
+    queue = make_queue(user_quota=2)
+    manager = RedisWalkForwardTaskManager(queue)
+    monkeypatch.setattr("app.job_worker.get_task_manager", lambda: manager)
+    return manager
+
+
+class TestRedisWalkForwardTaskManager:
+    @pytest.mark.asyncio
+    async def test_progress_is_shared_between_processes(self, redis_task_manager):
+        other_process = RedisWalkForwardTaskManager(redis_task_manager.job_queue)
+        task_id = await redis_task_manager.create_task(total_windows=4, user_id="alice")
+        version = other_process.progress_version(task_id)
+
+        await redis_task_manager.update_progress(task_id, current_window=2, current_phase="testing", phase_progress=0.5)
+
+        assert await other_process.wait_for_update(task_id, version, timeout=1.0) > version
+        progress = await other_process.get_progress(task_id)
+        assert (progress.current_window, progress.current_phase, progress.phase_progress) == (2, "testing", 0.5)
+        assert progress.estimated_time_remaining_seconds is not None
+
+        await redis_task_manager.complete_task(task_id, {"windows": []})
+        progress = await other_process.get_progress(task_id)
+        assert progress.status == "completed" and progress.result == {"windows": []}
+        assert [task.task_id for task in await other_process.get_user_tasks("alice")] == [task_id]
+
+    @pytest.mark.asyncio
+    async def test_cancel_reaches_the_worker(self, redis_task_manager):
+        worker_side = RedisWalkForwardTaskManager(redis_task_manager.job_queue)
+        task_id = await redis_task_manager.create_task(total_windows=1, user_id="alice")
+        redis_task_manager.job_queue.enqueue("walk_forward", "alice", {}, job_id=task_id)
+        assert not worker_side.is_cancelled(task_id)
+
+        assert await redis_task_manager.cancel_task(task_id)
+        worker_side._cancel_checks.clear()  # Skip the poll interval
+
+        assert worker_side.is_cancelled(task_id)
+        assert redis_task_manager.job_queue.get(task_id).status == "cancelled"
+
+
+class TestJobWorker:
+    @pytest.mark.asyncio
+    async def test_runs_jobs_and_records_outcomes(self, redis_task_manager, monkeypatch):
+        monkeypatch.setattr(job_queue_module, "RETRY_DELAYS_SECONDS", (0,))
+        queue = redis_task_manager.job_queue
+        calls = []
+
+        async def handler(job, client):
+            calls.append(job.payload["name"])
+            if job.payload["name"] == "flaky" and job.attempts == 1:
+                raise ConnectionError("connection reset")
+            if job.payload["name"] == "broken":
+                raise ValueError("bad parameters")
+            await redis_task_manager.complete_task(job.id, {})
+
+        task_ids = {}
+        for name in ("ok", "flaky", "broken"):
+            task_ids[name] = await redis_task_manager.create_task(total_windows=1, user_id=name)
+            queue.enqueue("walk_forward", name, {"name": name}, job_id=task_ids[name])
+
+        worker = JobWorker(queue, {"walk_forward": handler}, client=None, concurrency=2, worker_id="w1")
+        for _ in range(4):
+            await worker.poll()
+            await asyncio.gather(*worker._running.values())
+
+        assert sorted(calls) == ["broken", "flaky", "flaky", "ok"]
+        statuses = {name: (await redis_task_manager.get_progress(task_id)).status for name, task_id in task_ids.items()}
+        assert statuses == {"ok": "completed", "flaky": "completed", "broken": "error"}
+        assert queue.get(task_ids["broken"]).attempts == 1  # Not retried: the error is permanent
@@ -0,0 +1,123 @@
+"""
+Tests for local higher-timeframe candle aggregation from the 1m stream.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from app.core.kline_aggregator import KlineAggregator, bucket_open_time, merge_klines
+from app.core.websocket_kline_manager import WebSocketKlineManager
+
+MINUTE = 60_000
+# 2024-01-01 00:00 UTC, aligned to every interval up to 1d
+T0 = 1_704_067_200_000
+
+
+def _kline(open_time, o, h, l, c, v="1"):
+    return [open_time, str(o), str(h), str(l), str(c), v, open_time + MINUTE - 1, "10", 2, "0.5", "5", "0"]
+
+
+def _ws(kline, closed=True):
+    return {"e": "kline", "k": {
+        "t": kline[0], "T": kline[6], "o": kline[1], "h": kline[2], "l": kline[3], "c": kline[4],
+        "v": kline[5], "q": kline[7], "n": kline[8], "V": kline[9], "Q": kline[10], "x": closed,
+    }}
+
+
+def _seeded(interval="5m"):
+    aggregator = KlineAggregator(interval)
+    previous = merge_klines([_kline(T0 - 5 * MINUTE + i * MINUTE, 1, 2, 1, 1) for i in range(5)], T0 - 5 * MINUTE, 5 * MINUTE)
+    aggregator.seed([previous], [], now_ms=T0)
+    return aggregator
+
+
+class TestKlineAggregator:
+    def test_bucket_alignment(self):
+        assert bucket_open_time(T0 + 7 * MINUTE, 5 * MINUTE) == T0 + 5 * MINUTE
+        assert bucket_open_time(T0 + 59 * MINUTE, 60 * MINUTE) == T0
+
+    def test_closes_on_last_minute_with_binance_ohlcv(self):
+        aggregator = _seeded()
+        minutes = [
+            _kline(T0, 100, 105, 99, 104),
+            _kline(T0 + MINUTE, 104, 110, 103, 108),
+            _kline(T0 + 2 * MINUTE, 108, 109, 95, 96),
+            _kline(T0 + 3 * MINUTE, 96, 100, 96, 99),
+            _kline(T0 + 4 * MINUTE, 99, 101, 98, 100),
+        ]
+        closed = [aggregator.add_base_kline(k, is_closed=True) for k in minutes]
+
+        assert closed[:4] == [None] * 4
+        candle = closed[4]
+        assert candle[0] == T0 and candle[6] == T0 + 5 * MINUTE - 1
+        assert candle[1] == "100" and float(candle[2]) == 110 and float(candle[3]) == 95 and candle[4] == "100"
+        assert float(candle[5]) == 5 and candle[8] == 10
+
+        # Immediately after the close the last (forming) candle is flat at the close,
+        # so callers dropping the forming candle see the one that just closed
+        klines = aggregator.get_klines(limit=3)
+        assert klines[-2] == candle
+        assert klines[-1][0] == T0 + 5 * MINUTE and klines[-1][4] == "100"
+
+    def test_forming_candle_includes_forming_minute(self):
+        aggregator = _seeded()
+        aggregator.add_base_kline(_kline(T0, 100, 105, 99, 104), is_closed=True)
+        aggregator.add_base_kline(_kline(T0 + MINUTE, 104, 120, 104, 118), is_closed=False)
+        current = aggregator.get_klines(limit=2)[-1]
+        assert current[0] == T0 and float(current[2]) == 120 and current[4] == "118"
+
+    def test_gap_marks_stale(self):
+        aggregator = _seeded()
+        aggregator.add_base_kline(_kline(T0, 1, 1, 1, 1), is_closed=True)
+        aggregator.add_base_kline(_kline(T0 + 2 * MINUTE, 1, 1, 1, 1), is_closed=True)
+        assert aggregator.stale is True
+
+
+@pytest.fixture
+def manager():
+    WebSocketKlineManager._instance = None
+    m = WebSocketKlineManager(testnet=False)
+    yield m
+    WebSocketKlineManager._instance = None
+
+
+class TestManagerAggregation:
+    @pytest.mark.asyncio
+    async def test_htf_served_from_1m_stream_without_extra_socket(self, manager):
+        manager.connections["BTCUSDT_1m"] = MagicMock()
+        manager.buffers["BTCUSDT_1m"] = MagicMock()
+        manager.subscribe = MagicMock(side_effect=AssertionError("must not open a 5m stream"))
+
+        htf_history = [
+            merge_klines([_kline(T0 - (3 - i) * 5 * MINUTE + j * MINUTE, 1, 2, 1, 1) for j in range(5)],
+                         T0 - (3 - i) * 5 * MINUTE, 5 * MINUTE)
+            for i in range(3)
+        ]
+        forming = merge_klines([_kline(T0, 1, 2, 1, 1)], T0, 5 * MINUTE)
+        manager._public_client = MagicMock()
+        manager._public_client.get_klines.side_effect = [
+            htf_history + [forming],  # 5m history (last forming)
+            [_kline(T0, 1, 2, 1, 1)],  # 1m candles of the open bucket
+        ]
+
+        klines = await manager.get_klines("BTCUSDT", "5m", limit=3)
+        assert [k[0] for k in klines] == [T0 - 10 * MINUTE, T0 - 5 * MINUTE, T0]
+
+        # Stream updates: the 5m candle closes together with its last 1m candle
+        events = []
+        manager.add_candle_listener(lambda s, i, k: events.append((s, i, k["T"])))
+        for i in range(5):
+            manager._feed_aggregators("BTCUSDT", _ws(_kline(T0 + i * MINUTE, 1, 3, 1, 2)))
+        assert events == [("BTCUSDT", "5m", T0 + 5 * MINUTE - 1)]
+
+        klines = await manager.get_klines("BTCUSDT", "5m", limit=3)
+        assert klines[-2][0] == T0 and float(klines[-2][2]) == 3
+        assert manager._public_client.get_klines.call_count == 2  # no further REST calls
+
+    def test_not_aggregated_without_base_stream_or_when_disabled(self, manager):
+        assert manager._should_aggregate("BTCUSDT", "5m") is False
+        manager.connections["BTCUSDT_1m"] = MagicMock()
+        assert manager._should_aggregate("BTCUSDT", "5m") is True
+        assert manager._should_aggregate("BTCUSDT", "1d") is False
+        manager.local_aggregation = False
+        assert manager.derives_from_base("5m") is False
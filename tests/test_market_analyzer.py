@@ -506,7 +506,7 @@ class TestMarketAnalyzerEndpoint:
     def test_analyze_market_volume_ratio_none_handled(self, client):
         """Test market analysis handles None volume_ratio correctly (bug fix)."""
         # Mock volume_analysis to return None volume_ratio
-        with patch('app.api.routes.market_analyzer.calculate_volume_analysis') as mock_vol:
+        with patch('app.services.market_scanner.calculate_volume_analysis') as mock_vol:
             mock_vol.return_value = {
                 "current_volume": 1000.0,
                 "average_volume": 1000.0,
@@ -653,3 +653,76 @@ class TestMarketAnalyzerEndpoint:
         assert "trend_direction" in trend_info
         assert "structure" in trend_info
 
+
+
+class TestMarketScan:
+    """Tests for the multi-symbol scan endpoint and the batch scanner."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_scanner_cache(self):
+        from app.services.market_scanner import get_market_scanner
+        get_market_scanner().clear()
+        yield
+        get_market_scanner().clear()
+
+    def test_scan_matches_single_symbol_analysis(self, client):
+        """Each scan result matches /analyze for the same symbol; failures are reported per symbol."""
+        klines_by_symbol = {
+            "BTCUSDT": build_klines(count=200, base_price=50000.0),
+            "ETHUSDT": build_klines(count=200, base_price=3000.0, volatility=5.0, volume_variation=0.3),
+            "NEWUSDT": build_klines(count=30, base_price=1.0),
+        }
+
+        class MultiStub(StubBinanceClient):
+            def get_klines(self, symbol, interval="5m", limit=200):  # noqa: ARG002
+                return klines_by_symbol[symbol]
+
+        app.state.market_analyzer_client = MultiStub(price=50000.0)
+        response = client.get(
+            "/api/market-analyzer/scan",
+            params={"symbols": "btcusdt,ETHUSDT,NEWUSDT", "lookback_period": 150},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["requested"] == 3
+        assert [r["symbol"] for r in data["results"]] == ["BTCUSDT", "ETHUSDT"]
+        assert "Insufficient data" in data["errors"]["NEWUSDT"]
+
+        for result in data["results"]:
+            single = client.get(
+                "/api/market-analyzer/analyze",
+                params={"symbol": result["symbol"], "lookback_period": 150},
+            ).json()
+            for key in ("market_condition", "confidence", "recommendation", "range_info", "market_structure", "volume_analysis"):
+                assert result[key] == single[key]
+            for key, value in single["indicators"].items():
+                assert result["indicators"][key] == pytest.approx(value) if isinstance(value, float) else result["indicators"][key] == value
+            assert result["regime"]["regime"] in ("trending", "ranging", "unknown")
+
+    @pytest.mark.asyncio
+    async def test_scanner_caches_until_candle_close(self):
+        """Closed-candle indicators are reused until the forming candle closes."""
+        import time
+        from app.services.market_scanner import MarketScanner, ScanParams
+
+        now_ms = int(time.time() * 1000)
+        klines = build_klines(count=200)
+        # Shift so the last (forming) candle closes in the future
+        offset = now_ms + 60_000 - klines[-1][6]
+        klines = [[k[0] + offset, *k[1:6], k[6] + offset, *k[7:]] for k in klines]
+        stub = Mock()
+        stub.get_klines.return_value = klines
+
+        scanner = MarketScanner()
+        first = await scanner.scan(stub, ["BTCUSDT"], ScanParams())
+        second = await scanner.scan(stub, ["BTCUSDT"], ScanParams())
+
+        assert first.cached == 0 and second.cached == 1
+        assert stub.get_klines.call_count == 1
+        assert second.indicators["BTCUSDT"] is first.indicators["BTCUSDT"]
+        # Different parameters are a different cache entry
+        await scanner.scan(stub, ["BTCUSDT"], ScanParams(swing_period=3))
+        assert stub.get_klines.call_count == 2
+        # Once the candle has closed the entry is recomputed
+        assert scanner.get_cached("BTCUSDT", ScanParams(), now_ms=klines[-1][6] + 1) is None
@@ -0,0 +1,89 @@
+"""
+Tests for the market data bus shared between processes through Redis Streams.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.core.market_data_bus import (
+    MarketDataBusReader,
+    RedisStreamConnection,
+    SequenceTracker,
+    encode_entry,
+    kline_stream_key,
+    mark_price_stream_key,
+    parse_stream_key,
+)
+from app.core.websocket_kline_manager import WebSocketKlineManager
+
+
+def _kline_message(closed):
+    return {"e": "kline", "k": {"t": 0, "x": closed}}
+
+
+class TestStreamKeys:
+    def test_round_trip(self):
+        assert parse_stream_key(kline_stream_key("btcusdt", "1m", testnet=False)) == ("kline", "BTCUSDT", "1m", False)
+        assert parse_stream_key(mark_price_stream_key("ETHUSDT", testnet=True)) == ("mark", "ETHUSDT", None, True)
+
+    def test_rejects_other_keys(self):
+        with pytest.raises(ValueError):
+            parse_stream_key("binance_bot:lease:abc")
+
+
+class TestSequenceTracker:
+    def test_gap_on_skipped_seq_or_new_epoch(self):
+        tracker = SequenceTracker()
+        assert not tracker.advance(1, 5)  # first entry after subscribing
+        assert not tracker.advance(1, 6)
+        assert tracker.advance(1, 8)
+        assert tracker.advance(2, 1)  # publisher restarted
+        assert not tracker.advance(2, 2)
+
+
+class TestReaderDispatch:
+    @pytest.mark.asyncio
+    async def test_gap_reported_before_message(self):
+        reader = MarketDataBusReader("redis://unused")
+        calls = []
+        handler = AsyncMock(side_effect=lambda message: calls.append(("message", message["n"])))
+        on_gap = AsyncMock(side_effect=lambda: calls.append(("gap", None)))
+        key = kline_stream_key("BTCUSDT", "1m", testnet=False)
+        reader._subscribers[key] = [(handler, on_gap)]
+        reader._trackers[key] = SequenceTracker()
+
+        await reader._dispatch(key, encode_entry(1, 1, {"n": 1}))
+        await reader._dispatch(key, encode_entry(1, 2, {"n": 2}))
+        await reader._dispatch(key, encode_entry(1, 4, {"n": 4}))
+
+        assert calls == [("message", 1), ("message", 2), ("gap", None), ("message", 4)]
+
+
+class TestRedisStreamConnection:
+    @pytest.mark.asyncio
+    async def test_forwards_only_closed_candles(self):
+        on_update = AsyncMock()
+        reader = AsyncMock()
+        connection = RedisStreamConnection("BTCUSDT", "1m", testnet=False, on_kline_update=on_update, reader=reader)
+
+        await connection.connect()
+        reader.register.assert_awaited_once_with(connection.url, connection._handle_message, None)
+        await connection._handle_message(_kline_message(closed=False))
+        await connection._handle_message(_kline_message(closed=True))
+        await connection.disconnect()
+
+        on_update.assert_awaited_once_with(_kline_message(closed=True))
+        reader.unregister.assert_awaited_once_with(connection.url, connection._handle_message)
+
+
+@pytest.mark.asyncio
+async def test_gap_clears_kline_buffer_for_rest_reseed():
+    WebSocketKlineManager._instance = None
+    try:
+        manager = WebSocketKlineManager(testnet=False, use_market_data_bus=True)
+        buffer = AsyncMock()
+        manager.buffers["BTCUSDT_1m"] = buffer
+        await manager._on_stream_gap_factory("BTCUSDT_1m")()
+        buffer.clear.assert_awaited_once()
+    finally:
+        WebSocketKlineManager._instance = None
@@ -702,6 +702,115 @@ class TestStateSynchronization:
         assert result["database_state"] is None  # Database state not retrieved due to error
 
 
+class TestIdempotencyIndex:
+    """Test the bounded in-memory idempotency index used by OrderExecutor."""
+    
+    def test_evicts_oldest_when_full(self):
+        """Index should never grow beyond max_entries."""
+        from app.core.idempotency_index import IdempotencyIndex
+        index = IdempotencyIndex(max_entries=3)
+        for i in range(5):
+            index.record(f"key-{i}", i)
+        
+        assert len(index) == 3
+        assert index.lookup("key-0") is None
+        assert index.lookup("key-1") is None
+        assert index.lookup("key-4")[0] == 4
+    
+    def test_redis_backing_shared_across_indexes(self):
+        """A key recorded by one index is visible to another index sharing Redis."""
+        from app.core.idempotency_index import IdempotencyIndex
+        store = {}
+        redis_storage = MagicMock()
+        redis_storage.enabled = True
+        redis_storage.get.side_effect = lambda key: store.get(key)
+        redis_storage.set.side_effect = lambda key, value, ex=None: store.__setitem__(key, value) or True
+        
+        first = IdempotencyIndex(redis_storage=redis_storage)
+        second = IdempotencyIndex(redis_storage=redis_storage)
+        first.record("abc", 777)
+        
+        assert second.lookup("abc")[0] == 777
+        assert "abc" in second  # Redis hit is cached locally
+        assert not second.is_cold()
+    
+    def test_redis_claim_lets_only_one_worker_send(self, mock_binance_client, mock_order_response):
+        """Two workers that both miss on lookup: only the one holding the claim sends the order."""
+        from app.core.idempotency_index import IdempotencyIndex
+        store = {}
+        redis_storage = MagicMock()
+        redis_storage.enabled = True
+        redis_storage.get.side_effect = lambda key: store.get(key)
+        redis_storage.set.side_effect = lambda key, value, ex=None: store.__setitem__(key, value) or True
+        redis_storage.set_if_absent.side_effect = (
+            lambda key, value, ex: False if key in store else store.__setitem__(key, value) or True
+        )
+        redis_storage.delete.side_effect = lambda key: store.pop(key, None) is not None
+        
+        first = IdempotencyIndex(redis_storage=redis_storage)
+        second = IdempotencyIndex(redis_storage=redis_storage)
+        assert first.lookup("abc") is None and second.lookup("abc") is None
+        assert first.claim("abc")
+        assert not second.claim("abc")
+        assert second.lookup("abc") is None  # Claimed, but no order id yet
+        first.record("abc", 777)
+        assert second.lookup("abc")[0] == 777
+        
+        first.claim("failed")
+        first.release("failed")
+        assert second.claim("failed")
+        
+        # The worker losing the claim does not send
+        mock_binance_client.place_order.return_value = mock_order_response
+        executor = OrderExecutor(client=mock_binance_client, idempotency_index=IdempotencyIndex(redis_storage=redis_storage))
+        signal = StrategySignal(action="BUY", symbol="BTCUSDT", confidence=0.75, price=40000.0)
+        sizing = PositionSizingResult(quantity=0.001, notional=40.0)
+        key = executor._generate_idempotency_key(signal, sizing, False, "s1")
+        store[f"{IdempotencyIndex.REDIS_KEY_PREFIX}:{key}"] = "pending:0"
+        assert executor.execute(signal=signal, sizing=sizing, strategy_id="s1") is None
+        mock_binance_client.place_order.assert_not_called()
+    
+    def test_database_fallback_only_while_cold(self, mock_binance_client, mock_order_response):
+        """Database duplicate check runs only while the index is cold."""
+        from app.core.idempotency_index import IdempotencyIndex
+        mock_binance_client.place_order.return_value = mock_order_response
+        signal = StrategySignal(action="BUY", symbol="BTCUSDT", confidence=0.75, price=40000.0)
+        sizing = PositionSizingResult(quantity=0.001, notional=40.0)
+        
+        warm_executor = OrderExecutor(
+            client=mock_binance_client,
+            trade_service=MagicMock(),
+            user_id="test-user-uuid",
+            idempotency_index=IdempotencyIndex(warmup_seconds=0),
+        )
+        with patch.object(warm_executor, "_check_duplicate_in_database", return_value=False) as db_check:
+            warm_executor.execute(signal=signal, sizing=sizing, strategy_id="warm-strategy")
+        db_check.assert_not_called()
+        
+        cold_executor = OrderExecutor(
+            client=mock_binance_client,
+            trade_service=MagicMock(),
+            user_id="test-user-uuid",
+        )
+        with patch.object(cold_executor, "_check_duplicate_in_database", return_value=False) as db_check:
+            cold_executor.execute(signal=signal, sizing=sizing, strategy_id="cold-strategy")
+        db_check.assert_called_once()
+    
+    def test_per_request_runner_shares_base_runner_index(self, mock_binance_client):
+        """Runners built from the base runner (see get_strategy_runner) see its recent keys."""
+        base_runner = StrategyRunner(client=mock_binance_client, use_websocket=False)
+        base_runner.idempotency_index.record("abc", 777)
+        
+        request_runner = StrategyRunner(
+            client=mock_binance_client,
+            use_websocket=False,
+            idempotency_index=base_runner.idempotency_index,
+        )
+        
+        assert request_runner.idempotency_index is base_runner.idempotency_index
+        assert request_runner.idempotency_index.lookup("abc")[0] == 777
+
+
 class TestOrderExecutorDatabaseIdempotency:
     """Test database-based duplicate order checking."""
     
@@ -59,7 +59,7 @@ def sample_position_dict_strings():
 class TestPositionDataNormalization:
     """Validate that position data with string numerics is normalized to float."""
 
-    def test_get_symbol_pnl_returns_float_position_fields_when_client_returns_strings(
+    async def test_get_symbol_pnl_returns_float_position_fields_when_client_returns_strings(
         self, mock_user, sample_position_dict_strings
     ):
         """Paper/client returning string positionAmt, entryPrice, etc. must be normalized to float."""
@@ -84,7 +84,7 @@ class TestPositionDataNormalization:
         mock_db_service = MagicMock()
         mock_db_service.get_strategy.return_value = None
 
-        result = get_symbol_pnl(
+        result = await get_symbol_pnl(
             symbol,
             account_id=account_id,
             start_date=None,
@@ -115,7 +115,7 @@ class TestPositionDataNormalization:
 class TestPaperClientAcceptedInGetSymbolPnl:
     """Validate that PaperBinanceClient is not skipped for position fetch."""
 
-    def test_paper_client_fetches_position(self, mock_user):
+    async def test_paper_client_fetches_position(self, mock_user):
         """When client is PaperBinanceClient, get_symbol_pnl should fetch position (not skip)."""
         from app.api.routes.trades import get_symbol_pnl
         from app.core.paper_binance_client import PaperBinanceClient
@@ -144,7 +144,7 @@ class TestPaperClientAcceptedInGetSymbolPnl:
         mock_db_service = MagicMock()
         mock_db_service.get_strategy.return_value = None
 
-        result = get_symbol_pnl(
+        result = await get_symbol_pnl(
             symbol,
             account_id=account_id,
             start_date=None,
@@ -210,7 +210,7 @@ class TestManualCloseRejectsManualStrategyId:
 class TestGetPnlOverviewAccountIdAndMerge:
     """Validate get_pnl_overview account_id filter and multi-account merge."""
 
-    def test_get_symbol_pnl_account_id_filter_case_insensitive(self, mock_user):
+    async def test_get_symbol_pnl_account_id_filter_case_insensitive(self, mock_user):
         """get_symbol_pnl should include strategies when account_id differs only by case."""
         from app.api.routes.trades import get_symbol_pnl
         from app.models.strategy import StrategySummary, StrategyState, StrategyType, StrategyParams
@@ -251,7 +251,7 @@ class TestGetPnlOverviewAccountIdAndMerge:
         mock_db_service.get_strategy.return_value = MagicMock(id=uuid4())
         mock_db_service.db = MagicMock()
         with patch("app.api.routes.reports._get_completed_trades_from_database", return_value=[]):
-            result = get_symbol_pnl(
+            result = await get_symbol_pnl(
                     symbol,
                     account_id=account_id_param,
                     start_date=None,
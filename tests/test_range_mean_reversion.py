@@ -185,6 +185,43 @@ class TestRangeDetection:
         # The actual behavior depends on implementation
         assert isinstance(is_valid, bool)
 
+    @pytest.mark.parametrize("lookback,fast,slow", [(150, 20, 50), (30, 5, 30), (20, 25, 10)])
+    def test_rolling_range_state_matches_full_window_recompute(self, lookback, fast, slow):
+        """Rolling state advanced candle by candle matches a from-scratch computation."""
+        import random
+        from app.strategies.indicators import calculate_atr, calculate_ema
+        from app.strategies.rolling_range import RollingRangeState
+
+        rng = random.Random(lookback)
+        klines, price = [], 40000.0
+        for i in range(lookback * 4):
+            price += rng.uniform(-50, 50)
+            high, low = price + rng.uniform(0, 30), price - rng.uniform(0, 30)
+            klines.append([i * 300000, price, high, low, price + rng.uniform(-10, 10), 1.0, i * 300000 + 299999])
+
+        state = RollingRangeState(lookback, fast, slow)
+        for end in range(lookback, len(klines) + 1):
+            window = klines[end - lookback:end]
+            snapshot = state.update(window)
+            closes = [float(k[4]) for k in window]
+            assert snapshot.range_high == max(float(k[2]) for k in window)
+            assert snapshot.range_low == min(float(k[3]) for k in window)
+            assert snapshot.atr == calculate_atr(window, period=14)
+            for value, period in ((snapshot.fast_ema, fast), (snapshot.slow_ema, slow)):
+                expected = calculate_ema(closes, period)
+                assert (value is None) == (expected is None)
+                if expected is not None:
+                    assert value == pytest.approx(expected, rel=1e-12)
+
+    def test_detect_range_only_applies_new_candles(self, strategy):
+        """A new candle advances the rolling state by one bar instead of rebuilding it."""
+        klines = build_range_klines(count=200, base_price=40000.0, range_size=500.0, trend="flat")
+        strategy._detect_range(klines[:180])
+        strategy._range_state._append_bar = MagicMock(wraps=strategy._range_state._append_bar)
+
+        assert strategy._detect_range(klines[:181])[3] is True
+        assert strategy._range_state._append_bar.call_count == 1
+
 
 class TestEntrySignals:
     """Tests for entry signal generation."""
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 
 from app.models.order import OrderResponse
 from app.models.strategy import StrategySummary, StrategyState, StrategyType, StrategyParams
+from app.core.redis_codec import decode_value
 from app.core.redis_storage import RedisStorage
 
 
@@ -73,12 +74,13 @@ class TestRedisOrderResponseBinanceParameters:
         result = redis_storage.save_trades("test-strategy-1", trades)
         
         assert result is True, "Should successfully save trades with Binance parameters"
-        mock_redis_client.set.assert_called_once()
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.rpush.assert_called_once()
         
-        # Verify data was serialized correctly
-        call_args = mock_redis_client.set.call_args
-        value = call_args[0][1]
-        parsed = json.loads(value)
+        # Verify data was serialized correctly, one list item per trade
+        call_args = pipe.rpush.call_args
+        assert call_args[0][0] == "binance_bot:trades:test-strategy-1"
+        parsed = [json.loads(item) for item in call_args[0][1:]]
         
         assert len(parsed) == 1, "Should have 1 trade"
         trade_data = parsed[0]
@@ -124,7 +126,7 @@ class TestRedisOrderResponseBinanceParameters:
         }
         
         # Mock Redis to return saved data
-        mock_redis_client.get.return_value = json.dumps([order_dict])
+        mock_redis_client.lrange.return_value = [json.dumps(order_dict)]
         
         trades = redis_storage.get_trades("test-strategy-1")
         
@@ -164,7 +166,7 @@ class TestRedisOrderResponseBinanceParameters:
         assert result is True, "Should handle missing optional parameters"
         
         # Mock retrieval
-        mock_redis_client.get.return_value = json.dumps([order_dict])
+        mock_redis_client.lrange.return_value = [json.dumps(order_dict)]
         trades = redis_storage.get_trades("test-strategy-2")
         
         assert len(trades) == 1, "Should retrieve trade without optional parameters"
@@ -189,13 +191,13 @@ class TestRedisStrategyWithBinanceParameters:
         assert result is True, "Should save strategy"
         
         # Verify key format
-        call_args = mock_redis_client.set.call_args
+        call_args = mock_redis_client.pipeline.return_value.set.call_args
         key = call_args[0][0]
         assert key == "binance_bot:strategy:test-strategy-binance"
         
         # Verify data is serialized
         value = call_args[0][1]
-        parsed = json.loads(value)
+        parsed = decode_value(value)
         assert parsed["id"] == "test-strategy-binance"
         assert parsed["leverage"] == 10
     
@@ -226,7 +228,7 @@ class TestRedisStrategyWithBinanceParameters:
         new_mock_client = MagicMock()
         new_mock_client.ping.return_value = True
         # After restart, Redis should have the data
-        new_mock_client.get.return_value = json.dumps(trades)
+        new_mock_client.lrange.return_value = [json.dumps(trade) for trade in trades]
         
         redis_storage._client = new_mock_client
         
@@ -265,9 +267,8 @@ class TestRedisStrategyWithBinanceParameters:
         assert result is True, "Should serialize datetime objects"
         
         # Verify datetime was converted to ISO string
-        call_args = mock_redis_client.set.call_args
-        value = call_args[0][1]
-        parsed = json.loads(value)
+        call_args = mock_redis_client.pipeline.return_value.rpush.call_args
+        parsed = [json.loads(item) for item in call_args[0][1:]]
         
         trade_data = parsed[0]
         assert isinstance(trade_data["timestamp"], str), "Timestamp should be ISO string"
@@ -314,7 +315,7 @@ class TestRedisComplexBinanceData:
         assert result is True, "Should save multiple trades"
         
         # Mock retrieval
-        mock_redis_client.get.return_value = json.dumps(trades)
+        mock_redis_client.lrange.return_value = [json.dumps(trade) for trade in trades]
         retrieved = redis_storage.get_trades("test-multiple")
         
         assert len(retrieved) == 2, "Should retrieve all trades"
@@ -342,7 +343,7 @@ class TestRedisComplexBinanceData:
         assert result is True, "Should handle None values"
         
         # Mock retrieval
-        mock_redis_client.get.return_value = json.dumps([trade])
+        mock_redis_client.lrange.return_value = [json.dumps(trade)]
         retrieved = redis_storage.get_trades("test-none-values")
         
         assert len(retrieved) == 1, "Should retrieve trade with None values"
@@ -395,3 +396,43 @@ class TestRedisConnectionHandling:
         retrieved = storage.get_trades("test-disabled")
         assert retrieved == [], "Should return empty list when Redis is disabled"
 
+
+
+class TestRedisTradeList:
+    """Test the append-only Redis trade list."""
+    
+    def test_append_trade_pushes_one_item_and_caps_list(self, redis_storage, mock_redis_client):
+        """Test that appending a trade writes only that trade and trims the list."""
+        from app.core.redis_storage import TRADES_MAX_LEN
+        
+        result = redis_storage.append_trade("s1", {"order_id": 1, "symbol": "BTCUSDT"})
+        
+        assert result is True
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.rpush.assert_called_once_with("binance_bot:trades:s1", json.dumps({"order_id": 1, "symbol": "BTCUSDT"}))
+        pipe.ltrim.assert_called_once_with("binance_bot:trades:s1", -TRADES_MAX_LEN, -1)
+        mock_redis_client.set.assert_not_called()
+    
+    def test_get_trades_limit_reads_tail_of_list(self, redis_storage, mock_redis_client):
+        """Test that a recent-N query is a range read of the list tail."""
+        mock_redis_client.lrange.return_value = [json.dumps({"order_id": 9}), json.dumps({"order_id": 10})]
+        
+        trades = redis_storage.get_trades("s1", limit=2)
+        
+        assert [t["order_id"] for t in trades] == [9, 10]
+        mock_redis_client.lrange.assert_called_once_with("binance_bot:trades:s1", -2, -1)
+    
+    def test_legacy_json_array_is_converted_to_list(self, redis_storage, mock_redis_client):
+        """Test that a trades key written as one JSON string is converted on first read."""
+        import redis
+        
+        legacy = [{"order_id": 1}, {"order_id": 2}]
+        mock_redis_client.lrange.side_effect = redis.ResponseError("WRONGTYPE")
+        mock_redis_client.get.return_value = json.dumps(legacy)
+        
+        trades = redis_storage.get_trades("s1")
+        
+        assert trades == legacy
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.delete.assert_called_once_with("binance_bot:trades:s1")
+        pipe.rpush.assert_called_once_with("binance_bot:trades:s1", *(json.dumps(t) for t in legacy))
@@ -0,0 +1,61 @@
+"""
+Tests for the Redis value codecs and their versioned header.
+"""
+
+import json
+
+import pytest
+
+from app.core.redis_codec import (
+    MAGIC,
+    MSGPACK_ZSTD_AVAILABLE,
+    decode_value,
+    encode_value,
+    get_codec,
+)
+
+
+def _equity_curve():
+    return {
+        "symbol": "BTCUSDT",
+        "equity_curve": [{"time": 1700000000 + i * 60, "equity": 1000.0 + i * 0.5} for i in range(2000)],
+        "trades": [{"side": "BUY", "pnl": None}] * 50,
+    }
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("name", ["json", "zlib", "msgpack-zstd"])
+    def test_round_trip(self, name):
+        data = _equity_curve()
+        assert decode_value(encode_value(data, get_codec(name))) == data
+
+    def test_json_codec_writes_plain_json(self):
+        encoded = encode_value({"a": 1}, get_codec("json"))
+        assert json.loads(encoded) == {"a": 1}
+
+    def test_compressed_codecs_shrink_large_values(self):
+        data = _equity_curve()
+        plain = encode_value(data, get_codec("json"))
+        compressed = encode_value(data, get_codec("zlib"))
+        assert compressed.startswith(MAGIC)
+        assert len(compressed) * 4 < len(plain)
+
+    @pytest.mark.skipif(not MSGPACK_ZSTD_AVAILABLE, reason="msgpack/zstandard not installed")
+    def test_msgpack_zstd_header(self):
+        encoded = encode_value({"a": 1}, get_codec("msgpack-zstd"))
+        assert encoded[len(MAGIC) + 1] == 2
+
+    def test_unknown_codec_name(self):
+        with pytest.raises(ValueError):
+            get_codec("pickle")
+
+
+class TestLegacyValues:
+    def test_plain_json_bytes_and_str_decode(self):
+        assert decode_value(b'{"a": 1}') == {"a": 1}
+        assert decode_value('[1, 2]') == [1, 2]
+        assert decode_value(None) is None
+
+    def test_unsupported_version_rejected(self):
+        with pytest.raises(ValueError):
+            decode_value(MAGIC + bytes((99, 1)) + b"")
@@ -19,6 +19,7 @@ from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.dialects import registry
 
+from app.core.redis_codec import decode_value, get_codec
 from app.core.redis_storage import RedisStorage
 from app.services.strategy_service import StrategyService
 from app.services.trade_service import TradeService
@@ -146,6 +147,11 @@ def mock_redis_enabled():
     redis_storage._client.get.return_value = None  # Default: cache miss
     redis_storage._client.setex.return_value = True
     redis_storage._client.delete.return_value = 1
+    # Encoded cache values go through the same mocked client
+    redis_storage.codec = get_codec()
+    redis_storage._binary_client = redis_storage._client
+    redis_storage.get_value.side_effect = lambda key: RedisStorage.get_value(redis_storage, key)
+    redis_storage.set_value.side_effect = lambda key, data, ex=None: RedisStorage.set_value(redis_storage, key, data, ex=ex)
     return redis_storage
 
 
@@ -334,7 +340,7 @@ class TestRedisDatabaseIntegration:
         
         # Verify cached data contains correct information
         cached_json = call_args[0][2]
-        cached_data = json.loads(cached_json)
+        cached_data = decode_value(cached_json)
         assert cached_data["id"] == strategy_id
         assert cached_data["name"] == "New Strategy"
     
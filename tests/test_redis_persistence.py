@@ -1,9 +1,10 @@
 """Test cases for Redis persistence configuration and data survival."""
 import pytest
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 from pathlib import Path
 
+from app.core.redis_codec import decode_value
 from app.core.redis_storage import RedisStorage
 
 
@@ -80,16 +81,19 @@ class TestRedisStoragePersistence:
         result = redis_storage.save_strategy(strategy_id, strategy_data)
         
         assert result is True, "Should successfully save strategy"
-        mock_redis_client.set.assert_called_once()
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.set.assert_called_once()
+        pipe.sadd.assert_called_once_with("binance_bot:strategy_ids", strategy_id)
+        pipe.execute.assert_called_once()
         
         # Verify the key format
-        call_args = mock_redis_client.set.call_args
+        call_args = pipe.set.call_args
         key = call_args[0][0]
         assert key == f"binance_bot:strategy:{strategy_id}", "Key should follow expected format"
         
         # Verify data is JSON serialized
         value = call_args[0][1]
-        parsed = json.loads(value)
+        parsed = decode_value(value)
         assert parsed["id"] == strategy_id, "Data should be correctly serialized"
     
     def test_get_strategy_retrieves_persisted_data(self, redis_storage, mock_redis_client):
@@ -130,6 +134,7 @@ class TestRedisStoragePersistence:
         
         # Simulate reconnection after restart
         redis_storage._client = new_mock_client
+        redis_storage._binary_client = new_mock_client
         
         # Verify data is still accessible
         result = redis_storage.get_strategy(strategy_id)
@@ -137,32 +142,87 @@ class TestRedisStoragePersistence:
         assert result["id"] == strategy_id, "Data should be intact after restart"
     
     def test_get_all_strategies_retrieves_all_persisted(self, redis_storage, mock_redis_client):
-        """Test that get_all_strategies retrieves all persisted strategies."""
-        # Mock Redis to return multiple strategy keys
-        mock_redis_client.keys.return_value = [
-            "binance_bot:strategy:strategy-1",
-            "binance_bot:strategy:strategy-2",
-            "binance_bot:strategy:strategy-3"
+        """Test that get_all_strategies reads the strategy index with one MGET."""
+        mock_redis_client.exists.return_value = True
+        mock_redis_client.smembers.return_value = {"strategy-1", "strategy-2", "strategy-3"}
+        mock_redis_client.mget.return_value = [
+            json.dumps({"id": f"strategy-{i}", "name": f"Strategy {i}"}) for i in (1, 2, 3)
         ]
         
-        # Mock data for each strategy
-        def mock_get(key):
-            if "strategy-1" in key:
-                return json.dumps({"id": "strategy-1", "name": "Strategy 1"})
-            elif "strategy-2" in key:
-                return json.dumps({"id": "strategy-2", "name": "Strategy 2"})
-            elif "strategy-3" in key:
-                return json.dumps({"id": "strategy-3", "name": "Strategy 3"})
-            return None
-        
-        mock_redis_client.get.side_effect = mock_get
-        
         result = redis_storage.get_all_strategies()
         
         assert len(result) == 3, "Should retrieve all strategies"
         assert "strategy-1" in result, "Should include strategy-1"
         assert "strategy-2" in result, "Should include strategy-2"
         assert "strategy-3" in result, "Should include strategy-3"
+        mock_redis_client.mget.assert_called_once_with([
+            "binance_bot:strategy:strategy-1",
+            "binance_bot:strategy:strategy-2",
+            "binance_bot:strategy:strategy-3",
+        ])
+        mock_redis_client.keys.assert_not_called()
+        mock_redis_client.get.assert_not_called()
+    
+    def test_get_all_strategies_builds_index_with_scan_once(self, redis_storage, mock_redis_client):
+        """Test that data saved before the index existed is indexed with SCAN, never KEYS."""
+        mock_redis_client.exists.return_value = False
+        mock_redis_client.scan_iter.return_value = iter(["binance_bot:strategy:old-1"])
+        mock_redis_client.smembers.return_value = {"old-1"}
+        mock_redis_client.mget.return_value = [json.dumps({"id": "old-1"})]
+        
+        result = redis_storage.get_all_strategies()
+        
+        assert result == {"old-1": {"id": "old-1"}}
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.sadd.assert_called_once_with("binance_bot:strategy_ids", "old-1")
+        pipe.set.assert_called_once_with("binance_bot:strategy_ids:ready", "1")
+        mock_redis_client.keys.assert_not_called()
+    
+    def test_get_all_strategies_prunes_missing_ids(self, redis_storage, mock_redis_client):
+        """Test that ids whose strategy key is gone are dropped from the index."""
+        mock_redis_client.exists.return_value = True
+        mock_redis_client.smembers.return_value = {"alive", "gone"}
+        mock_redis_client.mget.return_value = [json.dumps({"id": "alive"}), None]
+        
+        result = redis_storage.get_all_strategies()
+        
+        assert list(result) == ["alive"]
+        mock_redis_client.srem.assert_called_once_with("binance_bot:strategy_ids", "gone")
+    
+    def test_delete_strategy_removes_from_index(self, redis_storage, mock_redis_client):
+        """Test that deleting a strategy also removes it from the index."""
+        assert redis_storage.delete_strategy("strategy-1") is True
+        
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.delete.assert_any_call("binance_bot:strategy:strategy-1")
+        pipe.srem.assert_called_once_with("binance_bot:strategy_ids", "strategy-1")
+    
+    def test_get_trades_many_uses_one_pipeline(self, redis_storage, mock_redis_client):
+        """Test that trades of many strategies are read in one round trip."""
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.return_value = [[json.dumps({"id": "t1"})], []]
+        
+        result = redis_storage.get_trades_many(["s1", "s2"])
+        
+        assert result == {"s1": [{"id": "t1"}]}
+        assert [c.args[0] for c in pipe.lrange.call_args_list] == ["binance_bot:trades:s1", "binance_bot:trades:s2"]
+        pipe.execute.assert_called_once_with(raise_on_error=False)
+    
+    @pytest.mark.asyncio
+    async def test_async_get_all_strategies_uses_pooled_client(self, redis_storage, mock_redis_client):
+        """Test that the async variant reads the index and MGETs on the asyncio client."""
+        async_client = AsyncMock()
+        async_client.exists.return_value = 1
+        async_client.smembers.return_value = {"strategy-1"}
+        async_client.mget.return_value = [json.dumps({"id": "strategy-1"})]
+        redis_storage._async_client = async_client
+        redis_storage._async_binary_client = async_client
+        
+        result = await redis_storage.async_get_all_strategies()
+        
+        assert result == {"strategy-1": {"id": "strategy-1"}}
+        async_client.mget.assert_awaited_once_with(["binance_bot:strategy:strategy-1"])
+        mock_redis_client.mget.assert_not_called()
 
 
 @pytest.mark.slow
@@ -199,12 +259,13 @@ class TestRedisPersistenceIntegration:
             assert result is True, "Should handle complex data types"
             
             # Verify serialization was called
-            mock_redis_client.set.assert_called_once()
-            call_args = mock_redis_client.set.call_args
+            pipe = mock_redis_client.pipeline.return_value
+            pipe.set.assert_called_once()
+            call_args = pipe.set.call_args
             value = call_args[0][1]
             
             # Should be valid JSON
-            parsed = json.loads(value)
+            parsed = decode_value(value)
             assert parsed["id"] == "test-123", "Complex data should be serialized correctly"
 
 
@@ -0,0 +1,133 @@
+"""
+Tests for the report response cache and its invalidation from committed writes.
+"""
+
+import inspect
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.models.db_models import CompletedTrade, Strategy, Trade
+from app.services import report_cache
+from app.services.report_cache import (
+    ReportCache,
+    _changed_report_users,
+    _ends_in_past,
+    _invalidate_report_users,
+    cached_report,
+)
+
+
+class TestReportCache:
+    def test_hit_until_user_invalidated(self):
+        cache = ReportCache()
+        user_id = uuid4()
+        params = {"account_id": "main", "start_date": None}
+
+        value, generation = cache.get(user_id, "pnl_overview", params)
+        assert value is None
+        cache.put(user_id, "pnl_overview", params, ["report"], generation, live=False)
+        assert cache.get(user_id, "pnl_overview", params)[0] == ["report"]
+
+        cache.invalidate_user(uuid4())  # another user
+        assert cache.get(user_id, "pnl_overview", params)[0] == ["report"]
+
+        cache.invalidate_user(user_id)
+        assert cache.get(user_id, "pnl_overview", params)[0] is None
+
+    def test_response_computed_across_a_write_is_stale(self):
+        cache = ReportCache()
+        user_id = uuid4()
+        _, generation = cache.get(user_id, "trading_report", {})
+        cache.invalidate_user(user_id)  # trade committed while the report was computed
+        cache.put(user_id, "trading_report", {}, "old", generation, live=False)
+        assert cache.get(user_id, "trading_report", {})[0] is None
+
+    def test_live_responses_use_live_ttl(self):
+        cache = ReportCache(ttl_seconds=300, live_ttl_seconds=0)
+        user_id = uuid4()
+        cache.put(user_id, "dashboard_overview", {}, "live", 0, live=True)
+        cache.put(user_id, "dashboard_overview", {"end_date": "2020-01-01"}, "past", 0, live=False)
+        assert cache.get(user_id, "dashboard_overview", {})[0] is None
+        assert cache.get(user_id, "dashboard_overview", {"end_date": "2020-01-01"})[0] == "past"
+
+    def test_lru_bound(self):
+        cache = ReportCache(max_entries=2)
+        user_id = uuid4()
+        for i in range(3):
+            cache.put(user_id, "e", {"i": i}, i, 0, live=False)
+        assert len(cache) == 2
+        assert cache.get(user_id, "e", {"i": 0})[0] is None
+
+    def test_ends_in_past(self):
+        assert _ends_in_past("2020-01-01")
+        assert _ends_in_past("2020-01-01T10:00:00Z")
+        assert not _ends_in_past(None)
+        assert not _ends_in_past("2999-01-01")
+
+
+class TestCachedReportDecorator:
+    def test_calls_with_user_are_cached_per_filters(self):
+        calls = []
+
+        @cached_report("test_report", ("account_id", "end_date"))
+        def report(account_id=None, end_date=None, current_user=None):
+            calls.append(account_id)
+            return {"account": account_id}
+
+        user = SimpleNamespace(id=uuid4())
+        assert report(account_id="a", current_user=user) == {"account": "a"}
+        assert report(account_id="a", current_user=user) == {"account": "a"}
+        assert report(account_id="b", current_user=user) == {"account": "b"}
+        assert calls == ["a", "b"]
+
+        report_cache._report_cache.invalidate_user(user.id)
+        report(account_id="a", current_user=user)
+        assert calls == ["a", "b", "a"]
+
+    async def test_async_routes_are_cached(self):
+        calls = []
+
+        @cached_report("test_report", ("end_date",))
+        async def report(end_date=None, current_user=None):
+            calls.append(end_date)
+            return {"end": end_date}
+
+        user = SimpleNamespace(id=uuid4())
+        assert await report(end_date="2020-01-01", current_user=user) == {"end": "2020-01-01"}
+        assert await report(end_date="2020-01-01", current_user=user) == {"end": "2020-01-01"}
+        assert calls == ["2020-01-01"]
+        assert inspect.iscoroutinefunction(report)
+
+    def test_calls_without_user_bypass_cache(self):
+        calls = []
+
+        @cached_report("test_report", ("end_date",))
+        def report(end_date=None, current_user=None):
+            calls.append(end_date)
+            return "report"
+
+        report()
+        report()
+        assert calls == [None, None]
+
+
+class TestInvalidationFromWrites:
+    def test_trades_completed_trades_and_strategy_status_changes(self):
+        trade_user, completed_user, strategy_user = uuid4(), uuid4(), uuid4()
+        strategy = Strategy(user_id=strategy_user)
+        strategy.status = "running"
+        session = SimpleNamespace(
+            new=[Trade(user_id=trade_user)],
+            dirty=[CompletedTrade(user_id=completed_user), strategy],
+            deleted=[],
+        )
+        assert _changed_report_users(session) == {trade_user, completed_user, strategy_user}
+
+    def test_commit_invalidates_collected_users(self):
+        cache = report_cache._report_cache
+        user_id = uuid4()
+        cache.put(user_id, "pnl_overview", {}, "report", cache.get(user_id, "pnl_overview", {})[1], live=False)
+
+        _invalidate_report_users(SimpleNamespace(info={"report_cache_users": {user_id}}))
+
+        assert cache.get(user_id, "pnl_overview", {})[0] is None
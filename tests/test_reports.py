@@ -213,7 +213,7 @@ class TestTradeMatching:
 class TestReportGeneration:
     """Test report generation API."""
     
-    def test_report_generation_basic(self):
+    async def test_report_generation_basic(self):
         """Test basic report generation."""
         runner = make_runner()
         
@@ -263,7 +263,7 @@ class TestReportGeneration:
         # Call report generation function
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=client):
-                report = get_trading_report(
+                report = await get_trading_report(
                     strategy_id=None,
                     strategy_name=None,
                     symbol=None,
@@ -284,7 +284,7 @@ class TestReportGeneration:
         assert strategy_report.wins == 1, "Should have 1 win"
         assert strategy_report.losses == 0, "Should have 0 losses"
     
-    def test_report_filtering_by_strategy_id(self):
+    async def test_report_filtering_by_strategy_id(self):
         """Test report filtering by strategy ID."""
         runner = make_runner()
         
@@ -315,7 +315,7 @@ class TestReportGeneration:
         # Filter by strategy1_id
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=client):
-                report = get_trading_report(
+                report = await get_trading_report(
                     strategy_id=strategy1_id,
                     strategy_name=None,
                     symbol=None,
@@ -328,7 +328,7 @@ class TestReportGeneration:
         assert len(report.strategies) == 1, "Should filter to 1 strategy"
         assert report.strategies[0].strategy_id == strategy1_id, "Should match filtered strategy ID"
     
-    def test_report_filtering_by_symbol(self):
+    async def test_report_filtering_by_symbol(self):
         """Test report filtering by symbol."""
         runner = make_runner()
         
@@ -357,7 +357,7 @@ class TestReportGeneration:
         # Filter by BTCUSDT
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=client):
-                report = get_trading_report(
+                report = await get_trading_report(
                     strategy_id=None,
                     strategy_name=None,
                     symbol="BTCUSDT",
@@ -370,7 +370,7 @@ class TestReportGeneration:
         assert len(report.strategies) == 1, "Should filter to 1 strategy"
         assert report.strategies[0].symbol == "BTCUSDT", "Should match filtered symbol"
     
-    def test_report_filtering_by_date(self):
+    async def test_report_filtering_by_date(self):
         """Test report filtering by date range."""
         runner = make_runner()
         
@@ -418,7 +418,7 @@ class TestReportGeneration:
         
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=client):
-                report = get_trading_report(
+                report = await get_trading_report(
                     strategy_id=None,
                     strategy_name=None,
                     symbol=None,
@@ -481,7 +481,7 @@ class TestStrategyReportModel:
 class TestBinanceParametersInReports:
     """Test that Binance trade parameters are included in reports."""
     
-    def test_report_includes_initial_margin_and_margin_type(self):
+    async def test_report_includes_initial_margin_and_margin_type(self):
         """Test that reports include initial margin and margin type from Binance."""
         runner = make_runner()
         
@@ -542,7 +542,7 @@ class TestBinanceParametersInReports:
         
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=client):
-                report = get_trading_report(
+                report = await get_trading_report(
                     strategy_id=strategy_id,
                     strategy_name=None,
                     symbol=None,
@@ -567,7 +567,7 @@ class TestBinanceParametersInReports:
         assert trade.entry_time == entry_time, "Should use actual entry time from Binance"
         assert trade.exit_time == exit_time, "Should use actual exit time from Binance"
     
-    def test_report_includes_actual_commission_from_binance(self):
+    async def test_report_includes_actual_commission_from_binance(self):
         """Test that reports use actual commission from Binance orders."""
         runner = make_runner()
         
@@ -620,7 +620,7 @@ class TestBinanceParametersInReports:
         
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=client):
-                report = get_trading_report(
+                report = await get_trading_report(
                     strategy_id=strategy_id,
                     strategy_name=None,
                     symbol=None,
@@ -640,7 +640,7 @@ class TestBinanceParametersInReports:
         assert abs(trade.fee_paid - expected_fee) < 0.001, \
             f"Fee should use actual Binance commission values. Expected ~{expected_fee}, got {trade.fee_paid}"
     
-    def test_strategy_report_includes_symbol(self):
+    async def test_strategy_report_includes_symbol(self):
         """Test that StrategyReport includes symbol field."""
         runner = make_runner()
         
@@ -667,7 +667,7 @@ class TestBinanceParametersInReports:
         
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=client):
-                report = get_trading_report(
+                report = await get_trading_report(
                     strategy_id=strategy_id,
                     strategy_name=None,
                     symbol=None,
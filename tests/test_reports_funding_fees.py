@@ -132,7 +132,7 @@ class TestFundingFeeFetching:
 class TestFundingFeeMatching:
     """Test matching funding fees to trades."""
     
-    def test_funding_fee_matched_to_trade(self, mock_binance_client):
+    async def test_funding_fee_matched_to_trade(self, mock_binance_client):
         """Test that funding fees are correctly matched to trades based on entry/exit times."""
         runner = make_runner()
         
@@ -207,9 +207,9 @@ class TestFundingFeeMatching:
         # Generate report
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=mock_binance_client):
-                with patch('app.api.routes.reports.get_current_user', return_value=None):
-                    with patch('app.api.routes.reports.get_database_service', return_value=None):
-                        report = get_trading_report(
+                with patch('app.api.routes.reports.get_current_user_async', return_value=None):
+                    with patch('app.api.routes.reports.get_database_service_async', return_value=None):
+                        report = await get_trading_report(
                             strategy_id=strategy_id,
                             strategy_name=None,
                             symbol=None,
@@ -247,7 +247,7 @@ class TestFundingFeeMatching:
         # The second funding fee (0.3) should definitely be included
         assert trade.funding_fee >= 0.3
     
-    def test_funding_fee_outside_trade_period(self, mock_binance_client):
+    async def test_funding_fee_outside_trade_period(self, mock_binance_client):
         """Test that funding fees outside trade period are not matched."""
         runner = make_runner()
         
@@ -327,9 +327,9 @@ class TestFundingFeeMatching:
         # Generate report
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=mock_binance_client):
-                with patch('app.api.routes.reports.get_current_user', return_value=None):
-                    with patch('app.api.routes.reports.get_database_service', return_value=None):
-                        report = get_trading_report(
+                with patch('app.api.routes.reports.get_current_user_async', return_value=None):
+                    with patch('app.api.routes.reports.get_database_service_async', return_value=None):
+                        report = await get_trading_report(
                             strategy_id=strategy_id,
                             strategy_name=None,
                             symbol=None,
@@ -353,7 +353,7 @@ class TestFundingFeeMatching:
         assert abs(trade.funding_fee - 0.3) < 0.01
         assert abs(strategy_report.total_funding_fee - 0.3) < 0.01
     
-    def test_funding_fee_received_not_counted(self, mock_binance_client):
+    async def test_funding_fee_received_not_counted(self, mock_binance_client):
         """Test that positive funding fees (received) are not counted as fees paid."""
         runner = make_runner()
         
@@ -426,9 +426,9 @@ class TestFundingFeeMatching:
         # Generate report
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=mock_binance_client):
-                with patch('app.api.routes.reports.get_current_user', return_value=None):
-                    with patch('app.api.routes.reports.get_database_service', return_value=None):
-                        report = get_trading_report(
+                with patch('app.api.routes.reports.get_current_user_async', return_value=None):
+                    with patch('app.api.routes.reports.get_database_service_async', return_value=None):
+                        report = await get_trading_report(
                             strategy_id=strategy_id,
                             strategy_name=None,
                             symbol=None,
@@ -456,7 +456,7 @@ class TestFundingFeeMatching:
 class TestFundingFeeTotals:
     """Test calculation of total fees and total funding fees."""
     
-    def test_total_fee_and_funding_fee_calculation(self, mock_binance_client):
+    async def test_total_fee_and_funding_fee_calculation(self, mock_binance_client):
         """Test that total fees and total funding fees are calculated correctly."""
         runner = make_runner()
         
@@ -555,9 +555,9 @@ class TestFundingFeeTotals:
         # Generate report
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=mock_binance_client):
-                with patch('app.api.routes.reports.get_current_user', return_value=None):
-                    with patch('app.api.routes.reports.get_database_service', return_value=None):
-                        report = get_trading_report(
+                with patch('app.api.routes.reports.get_current_user_async', return_value=None):
+                    with patch('app.api.routes.reports.get_database_service_async', return_value=None):
+                        report = await get_trading_report(
                             strategy_id=strategy_id,
                             strategy_name=None,
                             symbol=None,
@@ -593,7 +593,7 @@ class TestFundingFeeTotals:
         assert (abs(trade1_funding - 0.5) < 0.01 and abs(trade2_funding - 0.3) < 0.01) or \
                (abs(trade1_funding - 0.3) < 0.01 and abs(trade2_funding - 0.5) < 0.01)
     
-    def test_no_funding_fees_returns_zero(self, mock_binance_client):
+    async def test_no_funding_fees_returns_zero(self, mock_binance_client):
         """Test that when no funding fees are found, totals are zero."""
         runner = make_runner()
         
@@ -649,9 +649,9 @@ class TestFundingFeeTotals:
         # Generate report
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=mock_binance_client):
-                with patch('app.api.routes.reports.get_current_user', return_value=None):
-                    with patch('app.api.routes.reports.get_database_service', return_value=None):
-                        report = get_trading_report(
+                with patch('app.api.routes.reports.get_current_user_async', return_value=None):
+                    with patch('app.api.routes.reports.get_database_service_async', return_value=None):
+                        report = await get_trading_report(
                             strategy_id=strategy_id,
                             strategy_name=None,
                             symbol=None,
@@ -676,7 +676,7 @@ class TestFundingFeeTotals:
 class TestFundingFeeErrorHandling:
     """Test error handling in funding fee functionality."""
     
-    def test_funding_fee_api_error_handled_gracefully(self, mock_binance_client):
+    async def test_funding_fee_api_error_handled_gracefully(self, mock_binance_client):
         """Test that API errors when fetching funding fees don't break report generation."""
         runner = make_runner()
         
@@ -735,10 +735,10 @@ class TestFundingFeeErrorHandling:
         # Report generation should not fail
         with patch('app.api.routes.reports.get_strategy_runner', return_value=runner):
             with patch('app.api.routes.reports.get_binance_client', return_value=mock_binance_client):
-                with patch('app.api.routes.reports.get_current_user', return_value=None):
-                    with patch('app.api.routes.reports.get_database_service', return_value=None):
+                with patch('app.api.routes.reports.get_current_user_async', return_value=None):
+                    with patch('app.api.routes.reports.get_database_service_async', return_value=None):
                         # Should not raise exception
-                        report = get_trading_report(
+                        report = await get_trading_report(
                             strategy_id=strategy_id,
                             strategy_name=None,
                             symbol=None,
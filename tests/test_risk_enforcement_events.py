@@ -9,7 +9,7 @@ Tests verify that:
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone, timedelta
 from uuid import uuid4
 
@@ -47,6 +47,11 @@ def mock_risk_config():
     return config
 
 
+async def _run_inline(fn, *args, **kwargs):
+    """Stand-in for asyncio.to_thread that calls fn on the event loop."""
+    return fn(*args, **kwargs)
+
+
 @pytest.mark.asyncio
 async def test_daily_loss_breach_creates_enforcement_event(mock_user, mock_account, mock_risk_config):
     """Test that daily loss limit breach creates an enforcement event."""
@@ -57,19 +62,19 @@ async def test_daily_loss_breach_creates_enforcement_event(mock_user, mock_accou
     # Setup mocks
     mock_db = MagicMock()
     mock_db_service = MagicMock(spec=DatabaseService)
-    mock_db_service.get_account_by_id.return_value = mock_account
-    mock_db_service.get_enforcement_events.return_value = ([], 0)  # No recent events
-    mock_db_service.create_system_event.return_value = MagicMock(spec=SystemEvent)
+    mock_db_service.async_get_account_by_id = AsyncMock(return_value=mock_account)
+    mock_db_service.async_get_enforcement_events = AsyncMock(return_value=([], 0))  # No recent events
+    mock_db_service.async_create_system_event = AsyncMock(return_value=MagicMock(spec=SystemEvent))
     
     mock_risk_service = MagicMock(spec=RiskManagementService)
-    mock_risk_service.get_risk_config.return_value = mock_risk_config
+    mock_risk_service.async_get_risk_config = AsyncMock(return_value=mock_risk_config)
     
     mock_trade_service = MagicMock(spec=TradeService)
     mock_account_service = MagicMock()
     mock_account_config = MagicMock()
     mock_account_config.api_key = "test_key"
     mock_account_config.api_secret = "test_secret"
-    mock_account_service.get_account.return_value = mock_account_config
+    mock_account_service.async_get_account = AsyncMock(return_value=mock_account_config)
     
     mock_client_manager = MagicMock()
     mock_client = MagicMock()
@@ -77,8 +82,7 @@ async def test_daily_loss_breach_creates_enforcement_event(mock_user, mock_accou
     mock_client_manager.get_client.return_value = mock_client
     mock_client_manager.add_client = MagicMock()
     
-    # Mock database queries
-    # Need to mock Strategy query for the code to find strategies
+    # The account's strategies come from DatabaseService
     from app.models.db_models import Strategy
     mock_strategy = MagicMock(spec=Strategy)
     mock_strategy.id = uuid4()
@@ -86,33 +90,11 @@ async def test_daily_loss_breach_creates_enforcement_event(mock_user, mock_accou
     mock_strategy.name = "Test Strategy"
     mock_strategy.symbol = "BTCUSDT"
     mock_strategy.leverage = 5
-    
-    # Setup query chain for Strategy query
-    mock_strategy_query = MagicMock()
-    mock_strategy_query.filter.return_value.all.return_value = [mock_strategy]
-    mock_strategy_query.filter.return_value.first.return_value = mock_strategy
-    
-    # Setup query chain for Account query
-    mock_account_query = MagicMock()
-    mock_account_query.filter.return_value.first.return_value = mock_account
-    
-    # Setup query chain for Trade query (empty - no raw trades)
-    mock_trade_query = MagicMock()
-    mock_trade_query.filter.return_value.all.return_value = []
-    
-    # Make mock_db.query return different queries based on what's being queried
-    def query_side_effect(model):
-        if model == Strategy:
-            return mock_strategy_query
-        elif hasattr(model, '__name__') and 'Account' in model.__name__:
-            return mock_account_query
-        else:
-            return mock_trade_query
-    
-    mock_db.query.side_effect = query_side_effect
+    mock_strategy.account_id = mock_account.id
+    mock_db_service.async_get_user_strategies = AsyncMock(return_value=[mock_strategy])
     
     # Create a mock completed trade object that will pass the date filter
-    # The code now uses _get_completed_trades_from_database which returns TradeReport objects
+    # The code uses _async_get_completed_trades_for_strategies which returns TradeReport objects
     from app.models.report import TradeReport
     mock_completed_trade = TradeReport(
         trade_id="test-trade",
@@ -132,18 +114,14 @@ async def test_daily_loss_breach_creates_enforcement_event(mock_user, mock_accou
         exit_reason="SL"
     )
     
-    # Mock get_strategy_by_uuid to return the mock strategy
-    mock_db_service.get_strategy_by_uuid.return_value = mock_strategy
-    
     with patch('app.api.routes.risk_metrics.DatabaseService', return_value=mock_db_service), \
          patch('app.api.routes.risk_metrics.RiskManagementService', return_value=mock_risk_service), \
          patch('app.api.routes.risk_metrics.TradeService', return_value=mock_trade_service), \
-         patch('app.api.routes.risk_metrics.get_account_service', return_value=mock_account_service), \
          patch('app.api.routes.risk_metrics.get_client_manager', return_value=mock_client_manager), \
-         patch('app.api.routes.reports._get_completed_trades_from_database', return_value=[mock_completed_trade]), \
+         patch('app.api.routes.reports._async_get_completed_trades_for_strategies', new=AsyncMock(return_value=[mock_completed_trade])), \
          patch('app.risk.utils.get_pnl_from_completed_trade', return_value=-600.0), \
          patch('app.risk.utils.get_timestamp_from_completed_trade', return_value=datetime.now(timezone.utc)), \
-         patch('asyncio.to_thread', side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs)):
+         patch('app.api.routes.risk_metrics.asyncio.to_thread', new=_run_inline):
         
         # Call endpoint with daily loss breach (-600 < -500)
         result = await get_realtime_risk_status(
@@ -158,9 +136,9 @@ async def test_daily_loss_breach_creates_enforcement_event(mock_user, mock_accou
         assert result.risk_status == "breach", f"Expected breach but got {result.risk_status}. Daily loss: {result.loss_limits.get('daily_loss_usdt')}"
         
         # Verify enforcement event was created
-        assert mock_db_service.create_system_event.called, "Enforcement event should be created for daily loss breach"
+        assert mock_db_service.async_create_system_event.called, "Enforcement event should be created for daily loss breach"
         
-        call_args = mock_db_service.create_system_event.call_args
+        call_args = mock_db_service.async_create_system_event.call_args
         assert call_args.kwargs['event_type'] == "DAILY_LOSS_LIMIT_BREACH"
         assert call_args.kwargs['event_level'] == "ERROR"
         assert "Daily loss limit exceeded" in call_args.kwargs['message']
@@ -190,26 +168,26 @@ async def test_duplicate_event_prevention(mock_user, mock_account, mock_risk_con
     
     mock_db = MagicMock()
     mock_db_service = MagicMock(spec=DatabaseService)
-    mock_db_service.get_account_by_id.return_value = mock_account
-    mock_db_service.get_enforcement_events.return_value = ([recent_event], 1)  # Recent event exists
-    mock_db_service.create_system_event.return_value = MagicMock(spec=SystemEvent)
+    mock_db_service.async_get_account_by_id = AsyncMock(return_value=mock_account)
+    mock_db_service.async_get_enforcement_events = AsyncMock(return_value=([recent_event], 1))  # Recent event exists
+    mock_db_service.async_create_system_event = AsyncMock(return_value=MagicMock(spec=SystemEvent))
     
     mock_risk_service = MagicMock(spec=RiskManagementService)
-    mock_risk_service.get_risk_config.return_value = mock_risk_config
+    mock_risk_service.async_get_risk_config = AsyncMock(return_value=mock_risk_config)
     
     mock_trade_service = MagicMock(spec=TradeService)
     mock_account_service = MagicMock()
     mock_account_config = MagicMock()
     mock_account_config.api_key = "test_key"
     mock_account_config.api_secret = "test_secret"
-    mock_account_service.get_account.return_value = mock_account_config
+    mock_account_service.async_get_account = AsyncMock(return_value=mock_account_config)
     
     mock_client_manager = MagicMock()
     mock_client = MagicMock()
     mock_client.futures_account_balance.return_value = 10000.0
     mock_client_manager.get_client.return_value = mock_client
     
-    # Mock Strategy query
+    # The account's strategies come from DatabaseService
     from app.models.db_models import Strategy
     mock_strategy = MagicMock(spec=Strategy)
     mock_strategy.id = uuid4()
@@ -217,25 +195,8 @@ async def test_duplicate_event_prevention(mock_user, mock_account, mock_risk_con
     mock_strategy.name = "Test Strategy"
     mock_strategy.symbol = "BTCUSDT"
     mock_strategy.leverage = 5
-    
-    mock_strategy_query = MagicMock()
-    mock_strategy_query.filter.return_value.all.return_value = [mock_strategy]
-    
-    mock_account_query = MagicMock()
-    mock_account_query.filter.return_value.first.return_value = mock_account
-    
-    mock_trade_query = MagicMock()
-    mock_trade_query.filter.return_value.all.return_value = []
-    
-    def query_side_effect(model):
-        if model == Strategy:
-            return mock_strategy_query
-        elif hasattr(model, '__name__') and 'Account' in model.__name__:
-            return mock_account_query
-        else:
-            return mock_trade_query
-    
-    mock_db.query.side_effect = query_side_effect
+    mock_strategy.account_id = mock_account.id
+    mock_db_service.async_get_user_strategies = AsyncMock(return_value=[mock_strategy])
     
     # Create a mock completed trade with loss
     from app.models.report import TradeReport
@@ -257,17 +218,14 @@ async def test_duplicate_event_prevention(mock_user, mock_account, mock_risk_con
         exit_reason="SL"
     )
     
-    mock_db_service.get_strategy_by_uuid.return_value = mock_strategy
-    
     with patch('app.api.routes.risk_metrics.DatabaseService', return_value=mock_db_service), \
          patch('app.api.routes.risk_metrics.RiskManagementService', return_value=mock_risk_service), \
          patch('app.api.routes.risk_metrics.TradeService', return_value=mock_trade_service), \
-         patch('app.api.routes.risk_metrics.get_account_service', return_value=mock_account_service), \
          patch('app.api.routes.risk_metrics.get_client_manager', return_value=mock_client_manager), \
-         patch('app.api.routes.reports._get_completed_trades_from_database', return_value=[mock_completed_trade]), \
+         patch('app.api.routes.reports._async_get_completed_trades_for_strategies', new=AsyncMock(return_value=[mock_completed_trade])), \
          patch('app.risk.utils.get_pnl_from_completed_trade', return_value=-600.0), \
          patch('app.risk.utils.get_timestamp_from_completed_trade', return_value=datetime.now(timezone.utc)), \
-         patch('asyncio.to_thread', side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs)):
+         patch('app.api.routes.risk_metrics.asyncio.to_thread', new=_run_inline):
         
         result = await get_realtime_risk_status(
             account_id="test-account",
@@ -281,7 +239,7 @@ async def test_duplicate_event_prevention(mock_user, mock_account, mock_risk_con
         assert result.risk_status == "breach"
         
         # Verify NO new event was created (duplicate prevention)
-        assert not mock_db_service.create_system_event.called, "Duplicate event should not be created when recent event exists"
+        assert not mock_db_service.async_create_system_event.called, "Duplicate event should not be created when recent event exists"
 
 
 @pytest.mark.asyncio
@@ -293,36 +251,34 @@ async def test_no_breach_no_event_created(mock_user, mock_account, mock_risk_con
     
     mock_db = MagicMock()
     mock_db_service = MagicMock(spec=DatabaseService)
-    mock_db_service.get_account_by_id.return_value = mock_account
-    mock_db_service.get_enforcement_events.return_value = ([], 0)
+    mock_db_service.async_get_account_by_id = AsyncMock(return_value=mock_account)
+    mock_db_service.async_get_enforcement_events = AsyncMock(return_value=([], 0))
     
     mock_risk_service = MagicMock(spec=RiskManagementService)
-    mock_risk_service.get_risk_config.return_value = mock_risk_config
+    mock_risk_service.async_get_risk_config = AsyncMock(return_value=mock_risk_config)
     
     mock_trade_service = MagicMock(spec=TradeService)
     mock_account_service = MagicMock()
     mock_account_config = MagicMock()
     mock_account_config.api_key = "test_key"
     mock_account_config.api_secret = "test_secret"
-    mock_account_service.get_account.return_value = mock_account_config
+    mock_account_service.async_get_account = AsyncMock(return_value=mock_account_config)
     
     mock_client_manager = MagicMock()
     mock_client = MagicMock()
     mock_client.futures_account_balance.return_value = 10000.0
     mock_client_manager.get_client.return_value = mock_client
     
-    mock_db.query.return_value.filter.return_value.all.return_value = []
-    mock_db.query.return_value.filter.return_value.first.return_value = mock_account
+    mock_db_service.async_get_user_strategies = AsyncMock(return_value=[])
     
     with patch('app.api.routes.risk_metrics.DatabaseService', return_value=mock_db_service), \
          patch('app.api.routes.risk_metrics.RiskManagementService', return_value=mock_risk_service), \
          patch('app.api.routes.risk_metrics.TradeService', return_value=mock_trade_service), \
-         patch('app.api.routes.risk_metrics.get_account_service', return_value=mock_account_service), \
          patch('app.api.routes.risk_metrics.get_client_manager', return_value=mock_client_manager), \
-         patch('app.api.routes.reports._match_trades_to_completed_positions', return_value=[]), \
+         patch('app.api.routes.reports._async_get_completed_trades_for_strategies', new=AsyncMock(return_value=[])), \
          patch('app.risk.utils.get_pnl_from_completed_trade', return_value=-100.0), \
          patch('app.risk.utils.get_timestamp_from_completed_trade', return_value=datetime.now(timezone.utc)), \
-         patch('asyncio.to_thread', side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs)):
+         patch('app.api.routes.risk_metrics.asyncio.to_thread', new=_run_inline):
         
         result = await get_realtime_risk_status(
             account_id="test-account",
@@ -336,4 +292,4 @@ async def test_no_breach_no_event_created(mock_user, mock_account, mock_risk_con
         assert result.risk_status in ("normal", "warning")
         
         # Verify NO event was created
-        assert not mock_db_service.create_system_event.called, "No event should be created when no breach occurs"
+        assert not mock_db_service.async_create_system_event.called, "No event should be created when no breach occurs"
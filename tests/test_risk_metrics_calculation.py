@@ -166,103 +166,76 @@ def sample_trades(mock_user):
     return [buy1, sell1, buy2, sell2]
 
 
+def _convert_trade(db_trade):
+    """Convert DBTrade mock to OrderResponse (stands in for TradeService._db_trade_to_order_response)."""
+    return OrderResponse(
+        symbol=db_trade.symbol,
+        order_id=db_trade.order_id,
+        status=db_trade.status,
+        side=db_trade.side,
+        price=float(db_trade.price),
+        avg_price=float(db_trade.avg_price) if db_trade.avg_price else None,
+        executed_qty=float(db_trade.executed_qty),
+        timestamp=db_trade.timestamp,
+        commission=float(db_trade.commission) if db_trade.commission else None,
+        commission_asset=db_trade.commission_asset,
+        leverage=db_trade.leverage,
+        position_side=db_trade.position_side,
+        update_time=db_trade.update_time,
+        time_in_force=db_trade.time_in_force,
+        order_type=db_trade.order_type,
+        notional_value=float(db_trade.notional_value) if db_trade.notional_value else None,
+        cummulative_quote_qty=float(db_trade.cummulative_quote_qty) if db_trade.cummulative_quote_qty else None,
+        initial_margin=float(db_trade.initial_margin) if db_trade.initial_margin else None,
+        margin_type=db_trade.margin_type,
+    )
+
+
+def _mock_account_lookup():
+    """Account service and client manager returning a client with a 10000 USDT balance."""
+    mock_account_service = MagicMock()
+    mock_account_service.async_get_account = AsyncMock(return_value=MagicMock())
+    
+    mock_client_manager = MagicMock()
+    mock_client = MagicMock()
+    mock_client.futures_account_balance.return_value = 10000.0
+    mock_client_manager.get_client.return_value = mock_client
+    return mock_account_service, mock_client_manager
+
+
 @pytest.mark.asyncio
 async def test_portfolio_metrics_uses_trade_matching(mock_user, mock_strategy, mock_account, sample_trades):
     """Test that portfolio metrics uses trade matching to calculate win rate correctly."""
     from app.api.routes.risk_metrics import get_portfolio_risk_metrics
     from app.services.trade_service import TradeService
     from app.services.database_service import DatabaseService
-    from app.models.db_models import Trade as DBTrade, Account, Strategy
     
-    # Mock database session with proper query chain
-    mock_db = MagicMock()
+    # Strategy belongs to the requested account; trades belong to the strategy
+    mock_strategy.account_id = mock_account.id
+    for trade in sample_trades:
+        trade.strategy_id = mock_strategy.id
     
-    # Mock Account query: db.query(Account).filter(...).first()
-    mock_account_query = MagicMock()
-    mock_account_query.filter.return_value.first.return_value = mock_account
-    mock_db.query.return_value = mock_account_query
-    
-    # Mock Strategy query: db.query(Strategy).filter(...).all()
-    def query_side_effect(model):
-        """Handle different model queries."""
-        if model == Account:
-            mock_account_query = MagicMock()
-            mock_account_query.filter.return_value.first.return_value = mock_account
-            return mock_account_query
-        elif model == Strategy:
-            mock_strategy_query = MagicMock()
-            mock_strategy_query.filter.return_value.all.return_value = [mock_strategy]
-            return mock_strategy_query
-        elif model == DBTrade:
-            mock_trade_query = MagicMock()
-            # Return sample_trades (which are Trade/DBTrade objects)
-            mock_trade_query.filter.return_value.all.return_value = sample_trades
-            return mock_trade_query
-        else:
-            return MagicMock()
-    
-    mock_db.query.side_effect = query_side_effect
+    # Async session: the fallback DBTrade select returns the sample trades
+    mock_db = MagicMock()
+    trade_result = MagicMock()
+    trade_result.scalars.return_value.all.return_value = sample_trades
+    mock_db.execute = AsyncMock(return_value=trade_result)
     
     # Mock trade service (needed for _db_trade_to_order_response conversion)
     mock_trade_service = MagicMock(spec=TradeService)
-    # Mock the conversion method to return OrderResponse objects
-    from app.models.order import OrderResponse
-    def convert_trade(db_trade):
-        """Convert DBTrade mock to OrderResponse."""
-        return OrderResponse(
-            symbol=db_trade.symbol,
-            order_id=db_trade.order_id,
-            status=db_trade.status,
-            side=db_trade.side,
-            price=float(db_trade.price),
-            avg_price=float(db_trade.avg_price) if db_trade.avg_price else None,
-            executed_qty=float(db_trade.executed_qty),
-            timestamp=db_trade.timestamp,
-            commission=float(db_trade.commission) if db_trade.commission else None,
-            commission_asset=db_trade.commission_asset,
-            leverage=db_trade.leverage,
-            position_side=db_trade.position_side,
-            update_time=db_trade.update_time,
-            time_in_force=db_trade.time_in_force,
-            order_type=db_trade.order_type,
-            notional_value=float(db_trade.notional_value) if db_trade.notional_value else None,
-            cummulative_quote_qty=float(db_trade.cummulative_quote_qty) if db_trade.cummulative_quote_qty else None,
-            initial_margin=float(db_trade.initial_margin) if db_trade.initial_margin else None,
-            margin_type=db_trade.margin_type,
-        )
-    mock_trade_service._db_trade_to_order_response = convert_trade
+    mock_trade_service._db_trade_to_order_response = _convert_trade
     
-    # Mock database service
+    # Mock database service (async methods)
     mock_db_service = MagicMock(spec=DatabaseService)
-    mock_db_service.get_strategy.return_value = mock_strategy
-    # Mock get_strategy_by_uuid to return strategy with proper string attributes
-    def get_strategy_by_uuid_side_effect(uuid):
-        """Return strategy with proper attributes."""
-        strategy = MagicMock()
-        strategy.id = uuid
-        strategy.strategy_id = "test-strategy-123"  # String, not MagicMock
-        strategy.name = "Test Strategy"  # String, not MagicMock
-        strategy.symbol = "BTCUSDT"  # String, not MagicMock
-        strategy.leverage = 5
-        return strategy
-    mock_db_service.get_strategy_by_uuid.side_effect = get_strategy_by_uuid_side_effect
-    
-    # Mock account service and client manager
-    mock_account_service = MagicMock()
-    mock_account_service.get_account.return_value = MagicMock()
+    mock_db_service.async_get_user_strategies = AsyncMock(return_value=[mock_strategy])
+    mock_db_service.async_get_account_by_id = AsyncMock(return_value=mock_account)
     
-    mock_client_manager = MagicMock()
-    mock_client = MagicMock()
-    mock_client.futures_account_balance.return_value = 10000.0
-    mock_client_manager.get_client.return_value = mock_client
-    mock_client_manager.add_client = MagicMock()
-    
-    # Mock request
-    mock_request = MagicMock()
+    mock_account_service, mock_client_manager = _mock_account_lookup()
     
     with patch('app.api.routes.risk_metrics.TradeService', return_value=mock_trade_service), \
          patch('app.api.routes.risk_metrics.DatabaseService', return_value=mock_db_service), \
-         patch('app.api.routes.risk_metrics.get_account_service', return_value=mock_account_service), \
+         patch('app.api.routes.reports._async_get_completed_trades_for_strategies', new=AsyncMock(return_value=[])), \
+         patch('app.api.routes.risk_metrics.get_account_service_async', new=AsyncMock(return_value=mock_account_service)), \
          patch('app.api.routes.risk_metrics.get_client_manager', return_value=mock_client_manager), \
          patch('app.api.routes.risk_metrics.asyncio.to_thread', new_callable=AsyncMock) as mock_to_thread:
         
@@ -270,7 +243,7 @@ async def test_portfolio_metrics_uses_trade_matching(mock_user, mock_strategy, m
         
         # Call the endpoint
         result = await get_portfolio_risk_metrics(
-            request=mock_request,
+            request=MagicMock(),
             account_id="test-account-123",
             lookback_days=90,
             current_user=mock_user,
@@ -295,6 +268,49 @@ async def test_portfolio_metrics_uses_trade_matching(mock_user, mock_strategy, m
         # Should have 1 winning trade and 1 losing trade
         assert metrics["winning_trades"] == 1, f"Expected 1 winning trade, got {metrics['winning_trades']}"
         assert metrics["losing_trades"] == 1, f"Expected 1 losing trade, got {metrics['losing_trades']}"
+        
+        # Balance came from the account's client
+        assert metrics["current_balance"] == 10000.0
+        mock_account_service.async_get_account.assert_awaited_once_with(mock_user.id, "test-account-123")
+
+
+@pytest.mark.asyncio
+async def test_portfolio_metrics_prefers_completed_trades(mock_user, mock_strategy, mock_account):
+    """Pre-computed completed trades are loaded for all strategies at once; raw trades are not queried."""
+    from app.api.routes.risk_metrics import get_portfolio_risk_metrics
+    from app.services.database_service import DatabaseService
+    
+    mock_strategy.account_id = mock_account.id
+    other_account_strategy = MagicMock()
+    other_account_strategy.account_id = uuid4()
+    
+    mock_db = MagicMock()
+    mock_db.execute = AsyncMock()
+    
+    mock_db_service = MagicMock(spec=DatabaseService)
+    mock_db_service.async_get_user_strategies = AsyncMock(return_value=[mock_strategy, other_account_strategy])
+    mock_db_service.async_get_account_by_id = AsyncMock(return_value=mock_account)
+    
+    completed = [MagicMock(pnl_usd=50.0, exit_time=datetime.now(timezone.utc))]
+    load_completed = AsyncMock(return_value=completed)
+    mock_account_service, mock_client_manager = _mock_account_lookup()
+    
+    with patch('app.api.routes.risk_metrics.DatabaseService', return_value=mock_db_service), \
+         patch('app.api.routes.reports._async_get_completed_trades_for_strategies', new=load_completed), \
+         patch('app.api.routes.risk_metrics.get_account_service_async', new=AsyncMock(return_value=mock_account_service)), \
+         patch('app.api.routes.risk_metrics.get_client_manager', return_value=mock_client_manager), \
+         patch('app.api.routes.risk_metrics.asyncio.to_thread', new=AsyncMock(return_value=10000.0)):
+        result = await get_portfolio_risk_metrics(
+            request=MagicMock(),
+            account_id="test-account-123",
+            lookback_days=90,
+            current_user=mock_user,
+            db=mock_db
+        )
+    
+    assert result["metrics"]["total_trades"] == 1
+    assert load_completed.await_args.kwargs["strategies"] == [mock_strategy]
+    mock_db.execute.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -304,31 +320,30 @@ async def test_strategy_metrics_uses_trade_matching(mock_user, mock_strategy, sa
     from app.services.trade_service import TradeService
     from app.services.database_service import DatabaseService
     
-    # Mock database session
+    # Mock async database session
     mock_db = MagicMock()
     
     # Mock trade service
     mock_trade_service = MagicMock(spec=TradeService)
-    mock_trade_service.get_strategy_trades.return_value = sample_trades
+    mock_trade_service._db_trade_to_order_response = _convert_trade
     
-    # Mock database service
+    # Mock database service (strategy comes with its account loaded)
+    mock_strategy.account.account_id = "test-account-123"
     mock_db_service = MagicMock(spec=DatabaseService)
-    mock_db_service.get_strategy.return_value = mock_strategy
-    
-    # Mock account
-    mock_account = MagicMock()
-    mock_account.account_id = "test-account-123"
-    mock_db.query.return_value.filter.return_value.first.return_value = mock_account
+    mock_db_service.async_get_strategy = AsyncMock(return_value=mock_strategy)
+    mock_db_service.async_get_user_trades = AsyncMock(return_value=sample_trades)
     
-    # Mock request
-    mock_request = MagicMock()
+    mock_account_service, mock_client_manager = _mock_account_lookup()
     
     with patch('app.api.routes.risk_metrics.TradeService', return_value=mock_trade_service), \
-         patch('app.api.routes.risk_metrics.DatabaseService', return_value=mock_db_service):
+         patch('app.api.routes.risk_metrics.DatabaseService', return_value=mock_db_service), \
+         patch('app.api.routes.risk_metrics.get_account_service_async', new=AsyncMock(return_value=mock_account_service)), \
+         patch('app.api.routes.risk_metrics.get_client_manager', return_value=mock_client_manager), \
+         patch('app.api.routes.risk_metrics.asyncio.to_thread', new=AsyncMock(return_value=10000.0)):
         
         # Call the endpoint
         result = await get_strategy_risk_metrics(
-            request=mock_request,
+            request=MagicMock(),
             strategy_id="test-strategy-123",
             lookback_days=90,
             current_user=mock_user,
@@ -349,6 +364,8 @@ async def test_strategy_metrics_uses_trade_matching(mock_user, mock_strategy, sa
         # Should have 1 winning trade and 1 losing trade
         assert metrics["winning_trades"] == 1, f"Expected 1 winning trade, got {metrics['winning_trades']}"
         assert metrics["losing_trades"] == 1, f"Expected 1 losing trade, got {metrics['losing_trades']}"
+        
+        mock_db_service.async_get_user_trades.assert_awaited_once_with(mock_user.id, mock_strategy.id, limit=10000)
 
 
 def test_trade_matching_logic():
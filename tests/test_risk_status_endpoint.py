@@ -9,7 +9,7 @@ Tests verify that:
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -45,6 +45,7 @@ def mock_strategy_running(mock_user, mock_account):
     strategy.strategy_id = "test-strategy-123"
     strategy.user_id = mock_user.id
     strategy.account_id = mock_account.id
+    strategy.account = mock_account
     strategy.status = "running"
     strategy.name = "Test Strategy"
     strategy.symbol = "BTCUSDT"
@@ -59,6 +60,7 @@ def mock_strategy_paused_by_risk(mock_user, mock_account):
     strategy.strategy_id = "test-strategy-paused"
     strategy.user_id = mock_user.id
     strategy.account_id = mock_account.id
+    strategy.account = mock_account
     strategy.status = "stopped_by_risk"  # Updated from "paused_by_risk" to "stopped_by_risk"
     strategy.name = "Paused Strategy"
     strategy.symbol = "ETHUSDT"
@@ -90,13 +92,12 @@ async def test_risk_status_endpoint_running_strategy(mock_user, mock_strategy_ru
         
         # Setup mocks
         mock_db_service = MagicMock()
-        mock_db_service.get_strategy.return_value = mock_strategy_running
-        mock_db_service.get_account_by_uuid.return_value = mock_account
-        mock_db_service.get_enforcement_events.return_value = ([], 0)
+        mock_db_service.async_get_strategy = AsyncMock(return_value=mock_strategy_running)
+        mock_db_service.async_get_enforcement_events = AsyncMock(return_value=([], 0))
         MockDBService.return_value = mock_db_service
         
         mock_risk_service = MagicMock()
-        mock_risk_service.get_risk_config.return_value = mock_risk_config
+        mock_risk_service.async_get_risk_config = AsyncMock(return_value=mock_risk_config)
         MockRiskService.return_value = mock_risk_service
         
         # Mock database session
@@ -133,13 +134,12 @@ async def test_risk_status_endpoint_paused_strategy(mock_user, mock_strategy_pau
         
         # Setup mocks
         mock_db_service = MagicMock()
-        mock_db_service.get_strategy.return_value = mock_strategy_paused_by_risk
-        mock_db_service.get_account_by_uuid.return_value = mock_account
-        mock_db_service.get_enforcement_events.return_value = ([], 0)
+        mock_db_service.async_get_strategy = AsyncMock(return_value=mock_strategy_paused_by_risk)
+        mock_db_service.async_get_enforcement_events = AsyncMock(return_value=([], 0))
         MockDBService.return_value = mock_db_service
         
         mock_risk_service = MagicMock()
-        mock_risk_service.get_risk_config.return_value = mock_risk_config
+        mock_risk_service.async_get_risk_config = AsyncMock(return_value=mock_risk_config)
         MockRiskService.return_value = mock_risk_service
         
         # Mock database session
@@ -172,7 +172,7 @@ async def test_risk_status_endpoint_strategy_not_found(mock_user):
     with patch('app.api.routes.risk_metrics.DatabaseService') as MockDBService:
         # Setup mocks
         mock_db_service = MagicMock()
-        mock_db_service.get_strategy.return_value = None  # Strategy not found
+        mock_db_service.async_get_strategy = AsyncMock(return_value=None)  # Strategy not found
         MockDBService.return_value = mock_db_service
         
         # Mock database session
@@ -201,13 +201,12 @@ async def test_risk_status_endpoint_no_risk_config(mock_user, mock_strategy_runn
         
         # Setup mocks
         mock_db_service = MagicMock()
-        mock_db_service.get_strategy.return_value = mock_strategy_running
-        mock_db_service.get_account_by_uuid.return_value = mock_account
-        mock_db_service.get_enforcement_events.return_value = ([], 0)
+        mock_db_service.async_get_strategy = AsyncMock(return_value=mock_strategy_running)
+        mock_db_service.async_get_enforcement_events = AsyncMock(return_value=([], 0))
         MockDBService.return_value = mock_db_service
         
         mock_risk_service = MagicMock()
-        mock_risk_service.get_risk_config.return_value = None  # No risk config
+        mock_risk_service.async_get_risk_config = AsyncMock(return_value=None)  # No risk config
         MockRiskService.return_value = mock_risk_service
         
         # Mock database session
@@ -246,13 +245,12 @@ async def test_risk_status_endpoint_with_enforcement_event(mock_user, mock_strat
         
         # Setup mocks
         mock_db_service = MagicMock()
-        mock_db_service.get_strategy.return_value = mock_strategy_running
-        mock_db_service.get_account_by_uuid.return_value = mock_account
-        mock_db_service.get_enforcement_events.return_value = ([mock_event], 1)
+        mock_db_service.async_get_strategy = AsyncMock(return_value=mock_strategy_running)
+        mock_db_service.async_get_enforcement_events = AsyncMock(return_value=([mock_event], 1))
         MockDBService.return_value = mock_db_service
         
         mock_risk_service = MagicMock()
-        mock_risk_service.get_risk_config.return_value = mock_risk_config
+        mock_risk_service.async_get_risk_config = AsyncMock(return_value=mock_risk_config)
         MockRiskService.return_value = mock_risk_service
         
         # Mock database session
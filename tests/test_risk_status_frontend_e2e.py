@@ -58,26 +58,19 @@ class TestFrontendRiskStatusE2E:
         
         # Mock database service
         with patch('app.api.routes.risk_metrics.DatabaseService') as MockDBService, \
-             patch('app.api.routes.risk_metrics.RiskManagementService') as MockRiskService, \
-             patch('app.api.routes.risk_metrics.TradeService') as MockTradeService:
+             patch('app.api.routes.risk_metrics.RiskManagementService') as MockRiskService:
             
             # Setup database service mocks
             mock_db_service = MagicMock()
-            mock_db_service.get_strategy.return_value = mock_strategy
-            mock_db_service.get_account_by_uuid.return_value = mock_account
-            mock_db_service.get_enforcement_events.return_value = ([], 0)  # No enforcement events
+            mock_db_service.async_get_strategy = AsyncMock(return_value=mock_strategy)
+            mock_db_service.async_get_enforcement_events = AsyncMock(return_value=([], 0))  # No enforcement events
             MockDBService.return_value = mock_db_service
             
             # Setup risk service mocks
             mock_risk_service = MagicMock()
-            mock_risk_service.get_risk_config.return_value = mock_risk_config
+            mock_risk_service.async_get_risk_config = AsyncMock(return_value=mock_risk_config)
             MockRiskService.return_value = mock_risk_service
             
-            # Setup trade service mocks - NO TRADES
-            mock_trade_service = MagicMock()
-            mock_trade_service.get_trades_by_account.return_value = []  # Empty list = no trades
-            MockTradeService.return_value = mock_trade_service
-            
             # Call the API endpoint (simulating backend)
             strategy_id = str(mock_strategy.id)
             api_response = await get_strategy_risk_status(
@@ -85,7 +85,7 @@ def make_strategy_summary(
 class TestLONGPositionDisplay:
     """Test LONG position display on strategies page."""
     
-    def test_long_position_displayed_correctly(self):
+    async def test_long_position_displayed_correctly(self):
         """Test that LONG position is displayed with correct data."""
         runner = make_runner()
         
@@ -117,7 +117,7 @@ class TestLONGPositionDisplay:
         runner.client_manager.get_account_config = MagicMock(return_value=None)
         
         # Get performance data
-        result = get_strategy_performance(
+        result = await get_strategy_performance(
             strategy_name=None,
             symbol=None,
             status=None,
@@ -138,7 +138,7 @@ class TestLONGPositionDisplay:
         assert strategy_perf.current_price == 51000.0
         assert strategy_perf.total_unrealized_pnl == 10.0
     
-    def test_long_position_with_profit(self):
+    async def test_long_position_with_profit(self):
         """Test LONG position with profit displays correctly."""
         runner = make_runner()
         
@@ -165,7 +165,7 @@ class TestLONGPositionDisplay:
         ))
         runner.client_manager.get_account_config = MagicMock(return_value=None)
         
-        result = get_strategy_performance(
+        result = await get_strategy_performance(
             strategy_name=None,
             symbol=None,
             status=None,
@@ -181,7 +181,7 @@ class TestLONGPositionDisplay:
         assert strategy_perf.total_unrealized_pnl == 200.0
         assert strategy_perf.total_pnl == 200.0  # Only unrealized PnL
     
-    def test_long_position_with_loss(self):
+    async def test_long_position_with_loss(self):
         """Test LONG position with loss displays correctly."""
         runner = make_runner()
         
@@ -208,7 +208,7 @@ class TestLONGPositionDisplay:
         ))
         runner.client_manager.get_account_config = MagicMock(return_value=None)
         
-        result = get_strategy_performance(
+        result = await get_strategy_performance(
             strategy_name=None,
             symbol=None,
             status=None,
@@ -228,7 +228,7 @@ class TestLONGPositionDisplay:
 class TestSHORTPositionDisplay:
     """Test SHORT position display on strategies page."""
     
-    def test_short_position_displayed_correctly(self):
+    async def test_short_position_displayed_correctly(self):
         """Test that SHORT position is displayed with correct data."""
         runner = make_runner()
         
@@ -256,7 +256,7 @@ class TestSHORTPositionDisplay:
         ))
         runner.client_manager.get_account_config = MagicMock(return_value=None)
         
-        result = get_strategy_performance(
+        result = await get_strategy_performance(
             strategy_name=None,
             symbol=None,
             status=None,
@@ -277,7 +277,7 @@ class TestSHORTPositionDisplay:
         assert strategy_perf.current_price == 49000.0
         assert strategy_perf.total_unrealized_pnl == 10.0
     
-    def test_short_position_with_profit(self):
+    async def test_short_position_with_profit(self):
         """Test SHORT position with profit (price went down) displays correctly."""
         runner = make_runner()
         
@@ -304,7 +304,7 @@ class TestSHORTPositionDisplay:
         ))
         runner.client_manager.get_account_config = MagicMock(return_value=None)
         
-        result = get_strategy_performance(
+        result = await get_strategy_performance(
             strategy_name=None,
             symbol=None,
             status=None,
@@ -319,7 +319,7 @@ class TestSHORTPositionDisplay:
         assert strategy_perf.position_side == "SHORT"
         assert strategy_perf.total_unrealized_pnl == 200.0
     
-    def test_short_position_with_loss(self):
+    async def test_short_position_with_loss(self):
         """Test SHORT position with loss (price went up) displays correctly."""
         runner = make_runner()
         
@@ -346,7 +346,7 @@ class TestSHORTPositionDisplay:
         ))
         runner.client_manager.get_account_config = MagicMock(return_value=None)
         
-        result = get_strategy_performance(
+        result = await get_strategy_performance(
             strategy_name=None,
             symbol=None,
             status=None,
@@ -365,7 +365,7 @@ class TestSHORTPositionDisplay:
 class TestNoPositionDisplay:
     """Test display when no position exists."""
     
-    def test_no_position_displayed_correctly(self):
+    async def test_no_position_displayed_correctly(self):
         """Test that 'No open position' is displayed when position_size is 0 or None."""
         runner = make_runner()
         
@@ -393,7 +393,7 @@ class TestNoPositionDisplay:
         ))
         runner.client_manager.get_account_config = MagicMock(return_value=None)
         
-        result = get_strategy_performance(
+        result = await get_strategy_performance(
             strategy_name=None,
             symbol=None,
             status=None,
@@ -410,7 +410,7 @@ class TestNoPositionDisplay:
         assert strategy_perf.entry_price is None
         assert strategy_perf.total_unrealized_pnl == 0.0
     
-    def test_no_position_when_position_size_none(self):
+    async def test_no_position_when_position_size_none(self):
         """Test that no position is displayed when position_size is None."""
         runner = make_runner()
         
@@ -437,7 +437,7 @@ class TestNoPositionDisplay:
         ))
         runner.client_manager.get_account_config = MagicMock(return_value=None)
         
-        result = get_strategy_performance(
+        result = await get_strategy_performance(
             strategy_name=None,
             symbol=None,
             status=None,
@@ -629,7 +629,7 @@ class TestPositionClose:
 class TestPositionDisplayEdgeCases:
     """Test edge cases for position display."""
     
-    def test_position_side_set_but_position_size_zero(self):
+    async def test_position_side_set_but_position_size_zero(self):
         """Test edge case: position_side is set but position_size is 0."""
         runner = make_runner()
         
@@ -657,7 +657,7 @@ class TestPositionDisplayEdgeCases:
         ))
         runner.client_manager.get_account_config = MagicMock(return_value=None)
         
-        result = get_strategy_performance(
+        result = await get_strategy_performance(
             strategy_name=None,
             symbol=None,
             status=None,
@@ -673,7 +673,7 @@ class TestPositionDisplayEdgeCases:
         # Frontend should check both position_side AND position_size !== 0
         assert strategy_perf.position_size == 0
     
-    def test_multiple_strategies_with_different_positions(self):
+    async def test_multiple_strategies_with_different_positions(self):
         """Test multiple strategies with different position states."""
         runner = make_runner()
         
@@ -729,7 +729,7 @@ class TestPositionDisplayEdgeCases:
         runner.calculate_strategy_stats = MagicMock(return_value=mock_stats)
         runner.client_manager.get_account_config = MagicMock(return_value=None)
         
-        result = get_strategy_performance(
+        result = await get_strategy_performance(
             strategy_name=None,
             symbol=None,
             status=None,
@@ -0,0 +1,195 @@
+"""
+Tests for strategy leases shared by several worker processes.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.exceptions import StrategyAlreadyRunningError, StrategyOwnedByOtherWorkerError
+from app.core.strategy_leases import _RELEASE_SCRIPT, _RENEW_SCRIPT, StrategyLeaseManager
+
+
+class FakeRedisClient:
+    """In-memory stand-in for the few Redis commands leases use (with key expiry)."""
+
+    def __init__(self):
+        self.values = {}
+        self.expires = {}
+
+    def _alive(self, key):
+        if key in self.expires and self.expires[key] <= time.monotonic():
+            self.values.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.values
+
+    def expire_now(self, key):
+        self.expires[key] = time.monotonic()
+
+    def get(self, key):
+        return self.values.get(key) if self._alive(key) else None
+
+    def mget(self, keys):
+        return [self.get(key) for key in keys]
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and self._alive(key):
+            return None
+        self.values[key] = value
+        if px is not None:
+            self.expires[key] = time.monotonic() + px / 1000
+        return True
+
+    def eval(self, script, numkeys, key, owner, *args):
+        if self.get(key) != owner:
+            return 0
+        if script == _RENEW_SCRIPT:
+            self.expires[key] = time.monotonic() + int(args[0]) / 1000
+            return 1
+        if script == _RELEASE_SCRIPT:
+            self.values.pop(key, None)
+            self.expires.pop(key, None)
+            return 1
+        raise AssertionError("unknown script")
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.calls = []
+
+            def eval(self, *args):
+                self.calls.append(args)
+
+            def execute(self):
+                return [client.eval(*args) for args in self.calls]
+
+        return Pipeline()
+
+
+def make_storage(client):
+    storage = MagicMock()
+    storage.enabled = True
+    storage._client = client
+    return storage
+
+
+@pytest.fixture
+def workers():
+    storage = make_storage(FakeRedisClient())
+    return (
+        StrategyLeaseManager(storage, worker_id="worker-a", ttl_seconds=30),
+        StrategyLeaseManager(storage, worker_id="worker-b", ttl_seconds=30),
+    )
+
+
+class TestStrategyLeaseManager:
+    def test_one_worker_holds_a_strategy(self, workers):
+        a, b = workers
+        assert a.acquire("s1")
+        assert a.acquire("s1")  # re-acquiring extends its own lease
+        assert not b.acquire("s1")
+        assert b.held_by_other_worker("s1")
+        assert not a.held_by_other_worker("s1")
+        assert a.owners(["s1", "s2"]) == {"s1": "worker-a", "s2": None}
+
+    def test_takeover_after_expiry_and_lost_lease_reported(self, workers):
+        a, b = workers
+        a.acquire("s1")
+        a.acquire("s2")
+        a.redis._client.expire_now("binance_bot:lease:s1")
+        assert b.acquire("s1")
+        assert a.renew(["s1", "s2"]) == ["s1"]
+        assert a.owned == {"s2"}
+
+    def test_expired_lease_nobody_took_is_reclaimed(self, workers):
+        a, _ = workers
+        a.acquire("s1")
+        a.redis._client.expire_now("binance_bot:lease:s1")
+        assert a.renew(["s1"]) == []
+        assert a.owners(["s1"]) == {"s1": "worker-a"}
+
+    def test_release_never_drops_another_workers_lease(self, workers):
+        a, b = workers
+        a.acquire("s1")
+        b.release("s1")
+        assert a.owners(["s1"]) == {"s1": "worker-a"}
+        a.release("s1")
+        assert b.acquire("s1")
+
+    def test_redis_errors_do_not_grant_or_revoke(self, workers):
+        a, _ = workers
+        a.acquire("s1")
+        broken = MagicMock()
+        broken.set.side_effect = ConnectionError("down")
+        broken.pipeline.side_effect = ConnectionError("down")
+        a.redis._client = broken
+        assert not a.acquire("s2")
+        assert a.renew(["s1"]) == []
+
+    def test_without_redis_every_lease_is_granted(self):
+        manager = StrategyLeaseManager(None, worker_id="solo")
+        assert manager.acquire("s1")
+        assert manager.renew(["s1"]) == []
+        assert not manager.held_by_other_worker("s1")
+
+    def test_owned_by_other_worker_is_already_running(self):
+        exc = StrategyOwnedByOtherWorkerError("s1", owner="worker-b")
+        assert isinstance(exc, StrategyAlreadyRunningError)
+        assert exc.details == {"strategy_id": "s1", "owner": "worker-b"}
+
+
+class TestRunnerLeaseMaintenance:
+    @pytest.fixture
+    def runner(self, workers):
+        from app.services.strategy_runner import StrategyRunner
+
+        runner = StrategyRunner(client=MagicMock(), redis_storage=None, use_websocket=False)
+        runner.lease_manager = workers[0]
+        return runner
+
+    @pytest.mark.asyncio
+    async def test_start_refused_while_another_worker_holds_lease(self, runner, workers):
+        from app.models.strategy import StrategyParams, StrategyState, StrategySummary, StrategyType
+        from datetime import datetime, timezone
+
+        runner._strategies["s1"] = StrategySummary(
+            id="s1", name="S1", symbol="BTCUSDT", strategy_type=StrategyType.scalping,
+            leverage=5, risk_per_trade=0.01, status=StrategyState.stopped, account_id="default",
+            params=StrategyParams(), created_at=datetime.now(timezone.utc), last_signal=None,
+        )
+        workers[1].acquire("s1")
+        with pytest.raises(StrategyOwnedByOtherWorkerError):
+            await runner.start("s1")
+        assert "s1" not in runner._tasks
+
+    @pytest.mark.asyncio
+    async def test_lost_and_remotely_stopped_strategies_are_abandoned(self, runner, workers):
+        a, b = workers
+        for sid in ("lost", "stopped", "kept"):
+            a.acquire(sid)
+            runner._tasks[sid] = asyncio.create_task(asyncio.sleep(60))
+        a.acquire("dead")
+        a.redis._client.expire_now("binance_bot:lease:lost")
+        b.acquire("lost")
+
+        with patch(
+            "app.services.strategy_takeover.stopped_by_other_worker",
+            AsyncMock(return_value=["stopped"]),
+        ), patch(
+            "app.services.strategy_takeover.take_over_orphaned_strategies",
+            AsyncMock(return_value=[]),
+        ) as takeover:
+            await runner._maintain_leases()
+
+        try:
+            assert set(runner._tasks) == {"kept"}
+            assert a.owned == {"kept"}
+            assert a.owners(["lost", "stopped", "dead"]) == {"lost": "worker-b", "stopped": None, "dead": None}
+            takeover.assert_awaited_once_with(runner)
+        finally:
+            for task in runner._tasks.values():
+                task.cancel()
@@ -572,6 +572,113 @@ class TestPortfolioRiskManagerStrategyConfig:
         assert effective.max_daily_loss_usdt == 100.0  # More restrictive (strategy: 100.0 < account: 500.0)
 
 
+    def test_effective_config_is_reused_until_inputs_change(
+        self,
+        portfolio_risk_manager: PortfolioRiskManager,
+        mock_strategy_config: StrategyRiskConfigResponse
+    ):
+        """Merged config is built once per (account config, strategy config) pair."""
+        first = portfolio_risk_manager.get_effective_risk_config(strategy_config=mock_strategy_config)
+        second = portfolio_risk_manager.get_effective_risk_config(strategy_config=mock_strategy_config)
+        assert second is first
+        
+        # In-place change of the strategy config must produce a new merged config
+        mock_strategy_config.max_daily_loss_usdt = 50.0
+        third = portfolio_risk_manager.get_effective_risk_config(strategy_config=mock_strategy_config)
+        assert third is not first
+        assert third.max_daily_loss_usdt == 50.0
+
+
+class TestRiskConfigCache:
+    """Test the process-wide risk config cache used by the pre-trade risk path."""
+    
+    def test_strategy_context_invalidation(self):
+        """Cached strategy context is dropped on invalidate_strategy."""
+        from app.risk.risk_config_cache import RiskConfigCache, StrategyRiskContext
+        cache = RiskConfigCache()
+        user_id = uuid4()
+        context = StrategyRiskContext(strategy_uuid=uuid4(), strategy_config=None)
+        
+        assert cache.get_strategy_context(user_id, "strategy-1") is None
+        cache.set_strategy_context(user_id, "strategy-1", context)
+        assert cache.get_strategy_context(user_id, "strategy-1") is context
+        
+        cache.invalidate_strategy(user_id, "strategy-1")
+        assert cache.get_strategy_context(user_id, "strategy-1") is None
+    
+    def test_account_config_caches_missing_config(self):
+        """A cached 'no config' is a hit; account ids are normalized."""
+        from app.risk.risk_config_cache import RiskConfigCache
+        cache = RiskConfigCache()
+        user_id = uuid4()
+        
+        assert cache.get_account_config(user_id, "Main") == (False, None)
+        cache.set_account_config(user_id, "Main", None)
+        assert cache.get_account_config(user_id, " main ") == (True, None)
+        
+        cache.invalidate_account(user_id)
+        assert cache.get_account_config(user_id, "main") == (False, None)
+    
+    def test_invalidation_reaches_other_processes_through_redis(self):
+        """An edit handled by one worker makes the entries cached by another worker stale."""
+        from app.risk.risk_config_cache import RiskConfigCache, StrategyRiskContext
+        generations = {}
+        redis_storage = MagicMock()
+        redis_storage.enabled = True
+        redis_storage.get.side_effect = lambda key: generations.get(key)
+        redis_storage._client.incr.side_effect = lambda key: generations.__setitem__(key, generations.get(key, 0) + 1)
+        api_worker = RiskConfigCache(redis=redis_storage)
+        trading_worker = RiskConfigCache(redis=redis_storage)
+        user_id = uuid4()
+        context = StrategyRiskContext(strategy_uuid=uuid4(), strategy_config=None)
+        
+        trading_worker.set_strategy_context(user_id, "strategy-1", context)
+        trading_worker.set_account_config(user_id, "main", None)
+        assert trading_worker.get_strategy_context(user_id, "strategy-1") is context
+        
+        api_worker.invalidate_strategy(user_id, "strategy-1")
+        assert trading_worker.get_strategy_context(user_id, "strategy-1") is None
+        assert trading_worker.get_account_config(user_id, "main") == (False, None)
+        
+        # A config loaded before the invalidation is stored as already stale
+        generation = trading_worker.generation(user_id)
+        api_worker.invalidate_account(user_id, "main")
+        trading_worker.set_account_config(user_id, "main", None, generation=generation)
+        assert trading_worker.get_account_config(user_id, "main") == (False, None)
+    
+    @pytest.mark.asyncio
+    async def test_order_manager_skips_config_queries_when_cached(self):
+        """Second lookup for the same strategy does not query strategy or risk config."""
+        from app.risk.risk_config_cache import get_risk_config_cache
+        user_id = uuid4()
+        db_strategy = MagicMock()
+        db_strategy.id = uuid4()
+        
+        order_manager = StrategyOrderManager(account_manager=MagicMock(), user_id=user_id)
+        db_service = MagicMock()
+        db_service._is_async = False
+        db_service.get_strategy = MagicMock(return_value=db_strategy)
+        db_service.get_strategy_risk_config = MagicMock(return_value=None)
+        order_manager.db_service = db_service
+        summary = MagicMock()
+        summary.id = "cached-strategy"
+        
+        try:
+            for _ in range(3):
+                strategy_uuid, strategy_config = await order_manager._load_strategy_risk_context(summary)
+                assert strategy_uuid == db_strategy.id
+                assert strategy_config is None
+            assert db_service.get_strategy.call_count == 1
+            assert db_service.get_strategy_risk_config.call_count == 1
+            
+            # Invalidation (as done by the config endpoints) forces a reload
+            get_risk_config_cache().invalidate_strategy(user_id, "cached-strategy")
+            await order_manager._load_strategy_risk_context(summary)
+            assert db_service.get_strategy.call_count == 2
+        finally:
+            get_risk_config_cache().invalidate_strategy(user_id, "cached-strategy")
+
+
 class TestStrategyOrderManagerIntegration:
     """Test StrategyOrderManager loading and using strategy risk config."""
     
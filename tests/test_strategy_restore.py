@@ -0,0 +1,152 @@
+"""
+Tests for restoring running strategies after a restart.
+
+Restoration starts strategies with bounded concurrency, warms klines once per
+symbol/interval and checks task liveness in a single pass.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from app.core.binance_client_manager import BinanceClientManager
+from app.core.config import BinanceAccountConfig, get_settings
+from app.models.strategy import StrategyParams, StrategyState, StrategySummary, StrategyType
+from app.services.strategy_runner import RESTORE_KLINE_WARMUP_LIMIT, StrategyRunner
+
+
+class DummyRedis:
+    enabled = False
+
+
+class FakeKlineManager:
+    def __init__(self):
+        self.subscription_counts = {}
+        self.prefetched = []
+
+    def derives_from_base(self, interval):
+        return interval != "1m"  # HTF bias candles aggregated from the 1m stream
+
+    async def subscribe(self, symbol, interval):
+        key = (symbol, interval)
+        self.subscription_counts[key] = self.subscription_counts.get(key, 0) + 1
+
+    async def unsubscribe(self, symbol, interval):
+        self.subscription_counts[(symbol, interval)] -= 1
+
+    async def prefetch_klines(self, symbol, interval, limit):
+        await asyncio.sleep(0.05)
+        self.prefetched.append((symbol, interval, limit))
+        return limit
+
+
+def make_summary(i, symbol):
+    return StrategySummary(
+        id=f"strategy-{i}",
+        name=f"Strategy {i}",
+        symbol=symbol,
+        strategy_type=StrategyType.scalping,
+        leverage=5,
+        risk_per_trade=0.02,
+        status=StrategyState.running,
+        account_id="default",
+        params=StrategyParams(),
+        created_at=datetime.now(timezone.utc),
+        last_signal=None,
+    )
+
+
+@pytest.fixture
+def runner():
+    manager = BinanceClientManager(get_settings())
+    manager._clients = {"default": MagicMock()}
+    manager._accounts = {
+        "default": BinanceAccountConfig(account_id="default", api_key="k", api_secret="s", testnet=True)
+    }
+    runner = StrategyRunner(
+        client_manager=manager,
+        max_concurrent=20,
+        redis_storage=DummyRedis(),
+        use_websocket=False,
+    )
+    summaries = [make_summary(i, "BTCUSDT" if i % 2 else "ETHUSDT") for i in range(12)]
+    strategy_service = MagicMock()
+    strategy_service.list_strategies.return_value = summaries
+    runner.strategy_service = strategy_service
+    runner.user_id = UUID("00000000-0000-0000-0000-000000000001")
+    runner.state_manager._strategies = runner._strategies
+    runner.state_manager.strategy_service = strategy_service
+    runner.state_manager.user_id = runner.user_id
+    runner.state_manager.update_strategy_in_db = MagicMock()
+    runner.kline_manager = FakeKlineManager()
+    return runner
+
+
+@pytest.mark.asyncio
+async def test_restore_is_bounded_parallel_with_shared_warmup(runner):
+    runner.restore_concurrency = 4
+    active = 0
+    peak = 0
+    subscribed_at_start = []
+
+    async def fake_start(strategy_id):
+        nonlocal active, peak
+        summary = runner._strategies[strategy_id]
+        subscribed_at_start.append(runner.kline_manager.subscription_counts[(summary.symbol, "1m")])
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.2)  # stream subscription / REST calls of a real start
+        active -= 1
+        runner._tasks[strategy_id] = asyncio.create_task(asyncio.sleep(60))
+        return summary
+
+    runner.start = fake_start
+    started = time.monotonic()
+    try:
+        restored = await runner.restore_running_strategies()
+    finally:
+        for task in runner._tasks.values():
+            task.cancel()
+    elapsed = time.monotonic() - started
+
+    assert sorted(restored) == sorted(f"strategy-{i}" for i in range(12))
+    assert peak == 4
+    # 3 waves of 0.2s plus one 0.5s liveness pass, not 12 * (0.2s + 0.5s)
+    assert elapsed < 2.0
+    # One warmup per (symbol, interval), held while strategies start, released afterwards
+    assert sorted(runner.kline_manager.prefetched) == [
+        ("BTCUSDT", "1m", RESTORE_KLINE_WARMUP_LIMIT),
+        ("ETHUSDT", "1m", RESTORE_KLINE_WARMUP_LIMIT),
+    ]
+    assert all(count == 1 for count in subscribed_at_start)
+    assert set(runner.kline_manager.subscription_counts.values()) == {0}
+
+
+@pytest.mark.asyncio
+async def test_restore_marks_dead_tasks_and_respects_max_concurrent(runner):
+    runner.max_concurrent = 5
+
+    async def fake_start(strategy_id):
+        if strategy_id == "strategy-1":
+            raise RuntimeError("exchange unavailable")
+        coro = asyncio.sleep(0) if strategy_id == "strategy-2" else asyncio.sleep(60)
+        runner._tasks[strategy_id] = asyncio.create_task(coro)
+        return runner._strategies[strategy_id]
+
+    runner.start = fake_start
+    try:
+        restored = await runner.restore_running_strategies()
+    finally:
+        for task in runner._tasks.values():
+            task.cancel()
+
+    assert sorted(restored) == ["strategy-0", "strategy-3", "strategy-4"]
+    assert "strategy-2" not in runner._tasks
+    assert runner._strategies["strategy-1"].status == StrategyState.error
+    assert runner._strategies["strategy-2"].status == StrategyState.error
+    # Strategies beyond the free slots are left running in the DB for the next restore
+    assert runner._strategies["strategy-7"].status == StrategyState.running
@@ -230,3 +230,66 @@ def test_scalping_strategy_wires_structure_filter_and_passes_bullish_fixture():
     klines_fail = _bullish_klines_with_close(50.0)
     closes_fail = [float(k[4]) for k in klines_fail]
     assert s._passes_entry_filters("LONG", klines_fail, closes_fail, int(klines_fail[-1][6])) is False
+
+
+def _brute_force_pivots(highs, lows, left, right):
+    """Reference O(n*k) scan with the original strict-comparison semantics."""
+    sh, sl = [], []
+    for i in range(left, len(highs) - right):
+        if highs[i] > max(highs[i - left : i]) and highs[i] > max(highs[i + 1 : i + right + 1]):
+            sh.append((i, highs[i]))
+        if lows[i] < min(lows[i - left : i]) and lows[i] < min(lows[i + 1 : i + right + 1]):
+            sl.append((i, lows[i]))
+    return sh, sl
+
+
+def _random_klines(n: int, seed: int) -> list[list]:
+    import random
+
+    rng = random.Random(seed)
+    highs, lows = [], []
+    for _ in range(n):
+        # Coarse prices so equal highs/lows (ties) occur often
+        mid = rng.randint(90, 110)
+        highs.append(float(mid + rng.randint(0, 3)))
+        lows.append(float(mid - rng.randint(0, 3)))
+    return _series_from_hl(highs, lows)
+
+
+@pytest.mark.parametrize("left,right", [(1, 1), (2, 2), (3, 1), (1, 4), (8, 8)])
+def test_find_swing_highs_lows_matches_brute_force(left, right):
+    klines = _random_klines(300, seed=left * 10 + right)
+    highs = [float(k[2]) for k in klines]
+    lows = [float(k[3]) for k in klines]
+    assert _find_swing_highs_lows(klines, left, right) == _brute_force_pivots(highs, lows, left, right)
+
+
+@pytest.mark.parametrize("left,right", [(2, 2), (3, 1), (5, 5)])
+def test_swing_pivot_tracker_matches_full_scan_on_sliding_window(left, right):
+    from app.strategies.swing_pivots import SwingPivotTracker
+
+    klines = _random_klines(400, seed=7)
+    tracker = SwingPivotTracker(left, right)
+    window = 120
+    for end in range(window, len(klines) + 1):
+        closed = klines[end - window : end]
+        assert tracker.update(closed) == _find_swing_highs_lows(closed, left, right)
+    # Same open times with different prices (e.g. another symbol) rebuild instead of reusing state
+    shifted = [[k[0], k[1], k[2] + 1000 * (i % 2), k[3], k[4]] + k[5:] for i, k in enumerate(klines[-window:])]
+    assert tracker.update(shifted) == _find_swing_highs_lows(shifted, left, right)
+
+
+@pytest.mark.parametrize("left,right", [(2, 2), (3, 1), (5, 5)])
+def test_swing_pivot_tracker_matches_full_scan_on_varying_window(left, right):
+    import random
+
+    from app.strategies.swing_pivots import SwingPivotTracker
+
+    klines = _random_klines(400, seed=11)
+    tracker = SwingPivotTracker(left, right)
+    rng = random.Random(left * 10 + right)
+    for end in range(150, len(klines) + 1):
+        # Window shrinks and grows between calls (e.g. a different kline limit)
+        window = rng.choice([30, 60, 90, 120, 150])
+        closed = klines[end - window : end]
+        assert tracker.update(closed) == _find_swing_highs_lows(closed, left, right)
@@ -0,0 +1,137 @@
+"""
+Tests for cursor pagination of the trade listings.
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+def _completed_trade(strategy_uuid, exit_time):
+    return SimpleNamespace(
+        id=uuid4(),
+        strategy_id=strategy_uuid,
+        symbol="BTCUSDT",
+        side="LONG",
+        entry_order_id=1,
+        exit_order_id=2,
+        entry_price=40000.0,
+        exit_price=41000.0,
+        quantity=0.1,
+        entry_time=exit_time - timedelta(hours=1),
+        exit_time=exit_time,
+        fee_paid=1.0,
+        leverage=5,
+        initial_margin=None,
+        margin_type="ISOLATED",
+        notional_value=None,
+    )
+
+
+def _strategy():
+    return SimpleNamespace(
+        id=uuid4(),
+        strategy_id="strategy-1",
+        name="Strategy 1",
+        symbol="BTCUSDT",
+        account=SimpleNamespace(account_id="default", paper_trading=False),
+    )
+
+
+def _db_returning(rows):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+class TestCursor:
+    def test_round_trip(self):
+        timestamp = datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc)
+        row_id = uuid4()
+        cursor = encode_cursor(timestamp, row_id)
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (timestamp, row_id)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(datetime.now(timezone.utc), uuid4())[:-4]])
+    def test_malformed_cursor_rejected(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestCompletedTradesPage:
+    @pytest.mark.asyncio
+    async def test_full_page_returns_cursor_of_last_row(self):
+        from app.api.routes.trades import _get_completed_trades_page
+
+        strategy = _strategy()
+        now = datetime.now(timezone.utc)
+        rows = [_completed_trade(strategy.id, now - timedelta(minutes=i)) for i in range(3)]
+
+        trades, next_cursor = await _get_completed_trades_page(_db_returning(rows), uuid4(), [strategy], limit=2)
+
+        # limit + 1 rows read: two completed trades returned, exit order first
+        assert [t.side for t in trades] == ["SELL", "BUY", "SELL", "BUY"]
+        assert trades[0].timestamp == rows[0].exit_time
+        assert decode_cursor(next_cursor) == (rows[1].exit_time, rows[1].id)
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self):
+        from app.api.routes.trades import _get_completed_trades_page
+
+        strategy = _strategy()
+        rows = [_completed_trade(strategy.id, datetime.now(timezone.utc))]
+
+        trades, next_cursor = await _get_completed_trades_page(_db_returning(rows), uuid4(), [strategy], limit=2)
+
+        assert len(trades) == 2
+        assert next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_no_strategies_skips_query(self):
+        from app.api.routes.trades import _get_completed_trades_page
+
+        db = _db_returning([])
+        assert await _get_completed_trades_page(db, uuid4(), [], limit=10) == ([], None)
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_raises(self):
+        from app.api.routes.trades import _get_completed_trades_page
+
+        with pytest.raises(ValueError):
+            await _get_completed_trades_page(_db_returning([]), uuid4(), [_strategy()], limit=10, cursor="bogus")
+
+
+class TestTradeListEndpoint:
+    def test_malformed_cursor_returns_400(self):
+        from fastapi.testclient import TestClient
+
+        from app.api.deps import (
+            get_current_user_async,
+            get_database_service_async,
+            get_strategy_runner,
+        )
+        from app.main import app
+
+        db_service = MagicMock()
+        db_service.async_get_user_strategies = AsyncMock(return_value=[_strategy()])
+        db_service.db = _db_returning([])
+
+        app.dependency_overrides[get_current_user_async] = lambda: SimpleNamespace(id=uuid4())
+        app.dependency_overrides[get_strategy_runner] = lambda: MagicMock()
+        app.dependency_overrides[get_database_service_async] = lambda: db_service
+        try:
+            response = TestClient(app).get("/api/trades/list", params={"limit": 10, "cursor": "bogus"})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 400
+        assert "Invalid cursor" in response.json()["detail"]
+        db_service.db.execute.assert_not_awaited()
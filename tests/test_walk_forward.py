@@ -1027,6 +1027,62 @@ class TestDataLeakagePrevention:
         assert "not supported" in str(exc_info.value.detail).lower()
 
 
+class TestParallelWindows:
+    """Windows optimized/trained in worker processes give the same analysis as sequential runs."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_windows_match_sequential(self, monkeypatch):
+        from types import SimpleNamespace
+        from app.services import walk_forward
+
+        start_time = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        end_time = datetime(2024, 1, 10, 0, 0, 0, tzinfo=timezone.utc)
+        all_klines = build_klines(count=9 * 96, start_time=start_time, volatility=300.0, interval_minutes=15)
+
+        request = WalkForwardRequest(
+            symbol="BTCUSDT",
+            strategy_type="scalping",
+            start_time=start_time,
+            end_time=end_time,
+            training_period_days=7,
+            test_period_days=1,
+            step_size_days=1,
+            window_type="rolling",
+            params={"kline_interval": "15m", "ema_fast": 3, "ema_slow": 8},
+            optimize_params={"ema_fast": [3, 5]},
+        )
+
+        async def fetch(*args, **kwargs):
+            return all_klines
+
+        monkeypatch.setattr(walk_forward, "_fetch_historical_klines", fetch)
+        sequential = await run_walk_forward_analysis(request.model_copy(deep=True), None)
+
+        monkeypatch.setattr(walk_forward, "get_settings", lambda: SimpleNamespace(walk_forward_window_workers=2))
+        monkeypatch.setattr(walk_forward, "_submit_windows", _counting(walk_forward._submit_windows))
+        try:
+            parallel = await run_walk_forward_analysis(request.model_copy(deep=True), None)
+        finally:
+            walk_forward.shutdown_window_pool()
+
+        assert walk_forward._submit_windows.calls == 1
+        assert parallel.total_windows == sequential.total_windows == 2
+        for par, seq in zip(parallel.windows, sequential.windows):
+            assert par.window_number == seq.window_number
+            assert par.optimized_params == seq.optimized_params
+            assert par.training_result.model_dump() == seq.training_result.model_dump()
+            assert par.test_result.final_balance == seq.test_result.final_balance
+        assert parallel.total_return_pct == sequential.total_return_pct
+
+
+def _counting(func):
+    def wrapper(*args, **kwargs):
+        wrapper.calls += 1
+        return func(*args, **kwargs)
+    wrapper.calls = 0
+    return wrapper
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
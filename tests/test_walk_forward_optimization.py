@@ -26,6 +26,7 @@ from app.api.routes.backtesting import (
     _slice_klines_by_time_range
 )
 from app.core.my_binance_client import BinanceClient
+from app.utils.kline_series import KlineSeries, KlineView
 
 
 # ============================================================================
@@ -224,6 +225,27 @@ class TestKlineSlicing:
         assert sliced[0] == klines[0], "First kline should match"
         assert sliced[-1] == klines[-1], "Last kline should match"
 
+    def test_series_slices_match_linear_filter(self):
+        """Indexed slices select exactly the klines of a full scan, as views over the same list."""
+        start_time = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        klines = build_klines(count=600, start_time=start_time, interval_minutes=1)
+        series = KlineSeries(klines)
+
+        for start_offset, end_offset in [(0, 600), (90, 210), (90.5, 210.25), (-30, 10), (599, 700), (300, 200)]:
+            slice_start = start_time + timedelta(minutes=start_offset)
+            slice_end = start_time + timedelta(minutes=end_offset)
+            start_ts = int(slice_start.timestamp() * 1000)
+            end_ts = int(slice_end.timestamp() * 1000)
+            expected = [k for k in klines if int(k[0]) >= start_ts and int(k[6]) <= end_ts]
+
+            assert _slice_klines_by_time_range(klines, slice_start, slice_end) == expected
+            view = _slice_klines_by_time_range(series, slice_start, slice_end)
+            assert isinstance(view, KlineView)
+            assert list(view) == expected
+            if expected:
+                assert view[0] is expected[0] and view[-1] is expected[-1]
+                assert view[:-1] == expected[:-1]
+
 
 # ============================================================================
 # Test Pre-Fetched Klines in run_backtest
@@ -17,7 +17,9 @@ from typing import Optional
 from app.services.walk_forward import (
     WalkForwardRequest,
     grid_search_optimization,
-    generate_param_combinations
+    generate_param_combinations,
+    plan_successive_halving,
+    successive_halving_optimization
 )
 from app.api.routes.backtesting import BacktestResult
 from app.core.my_binance_client import BinanceClient
@@ -821,6 +823,90 @@ class TestOptimizationIntegration:
         print(f"   - Memory management: [OK] Only best result kept, not all {len(backtest_calls)} results")
 
 
+class TestSuccessiveHalving:
+    """Successive halving finds the grid search optimum with fewer full-window backtests."""
+    
+    @staticmethod
+    def _request(**overrides):
+        return WalkForwardRequest(
+            symbol="BTCUSDT",
+            strategy_type="scalping",
+            start_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_time=datetime(2024, 1, 10, tzinfo=timezone.utc),
+            params={"kline_interval": "1m", "take_profit_pct": 0.04, "stop_loss_pct": 0.02},
+            optimize_params={
+                "take_profit_pct": [0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09],
+                "stop_loss_pct": [0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09],
+            },
+            optimization_metric="total_return",
+            optimization_method="successive_halving",
+            **overrides
+        )
+    
+    @staticmethod
+    def _scorer(calls, drawdown=lambda p: 5.0):
+        """Return peaks at take_profit_pct=0.06, stop_loss_pct=0.03 on any slice."""
+        async def scored_backtest(req, client, pre_fetched_klines=None, **kwargs):
+            calls.append(len(pre_fetched_klines))
+            tp, sl = req.params["take_profit_pct"], req.params["stop_loss_pct"]
+            ret = 20.0 - 100 * abs(tp - 0.06) - 200 * abs(sl - 0.03)
+            return create_mock_backtest_result(
+                final_balance=req.initial_balance * (1 + ret / 100),
+                max_drawdown_pct=drawdown(req.params)
+            )
+        return scored_backtest
+    
+    @pytest.mark.asyncio
+    async def test_matches_grid_search_with_smaller_budget(self):
+        request = self._request()
+        klines = build_klines(3000, start_time=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        start, end = request.start_time, request.end_time
+        
+        grid_calls, sh_calls = [], []
+        grid_budget, sh_budget = {}, {}
+        with patch('app.services.walk_forward.run_backtest', side_effect=self._scorer(grid_calls)):
+            grid_best, _ = await grid_search_optimization(
+                request, start, end, None, "total_return", pre_fetched_klines=klines, budget=grid_budget
+            )
+        with patch('app.services.walk_forward.run_backtest', side_effect=self._scorer(sh_calls)):
+            sh_best, sh_results = await successive_halving_optimization(
+                request, start, end, None, "total_return", pre_fetched_klines=klines, budget=sh_budget
+            )
+        
+        assert sh_best == grid_best == {"take_profit_pct": 0.06, "stop_loss_pct": 0.03}
+        assert grid_budget["backtests"] == 81
+        # 81 combinations on 1/9 of the data, 27 on 1/3, 9 on the full window
+        assert [r["candidates"] for r in sh_budget["rungs"]] == [81, 27, 9]
+        assert sh_budget["backtests"] == len(sh_calls) == 117
+        assert sh_budget["full_window_equivalents"] == pytest.approx(27.0)
+        assert sum(1 for n in sh_calls if n == len(klines)) == 9
+        assert sh_results[0]["rung"] == 3 and sh_results[0]["data_fraction"] == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_final_rung_applies_request_guardrails(self):
+        request = self._request(max_drawdown_cap=30.0)
+        klines = build_klines(3000, start_time=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        
+        # The best-returning combination breaches the drawdown cap
+        def drawdown(params):
+            return 45.0 if (params["take_profit_pct"], params["stop_loss_pct"]) == (0.06, 0.03) else 5.0
+        
+        calls = []
+        with patch('app.services.walk_forward.run_backtest', side_effect=self._scorer(calls, drawdown)):
+            best, results = await successive_halving_optimization(
+                request, request.start_time, request.end_time, None, "total_return", pre_fetched_klines=klines
+            )
+        
+        assert best != {"take_profit_pct": 0.06, "stop_loss_pct": 0.03}
+        assert all("Max drawdown" in r["failure_reason"] for r in results if r["status"] == "failed")
+    
+    def test_plan_drops_rungs_below_min_candles(self):
+        assert plan_successive_halving(81, 100000) == [1 / 27, 1 / 9, 1 / 3, 1.0]
+        assert plan_successive_halving(81, 3000) == [1 / 9, 1 / 3, 1.0]
+        assert plan_successive_halving(81, 200) == [1.0]
+        assert plan_successive_halving(1, 100000) == [1.0]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
 
@@ -298,6 +298,37 @@ class TestWalkForwardTaskManager:
         
         # Should be cancelled (non-async check)
         assert task_manager.is_cancelled(task_id) is True
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_update_wakes_on_change(self, task_manager, test_user):
+        """Subscribers are woken by progress changes instead of polling."""
+        task_id = await task_manager.create_task(total_windows=5, user_id=str(test_user.id))
+        version = task_manager.progress_version(task_id)
+        
+        waiter = asyncio.create_task(task_manager.wait_for_update(task_id, version, timeout=5.0))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        
+        await task_manager.update_progress(task_id, current_window=1)
+        new_version = await asyncio.wait_for(waiter, timeout=1.0)
+        assert new_version > version
+        
+        # A change made before waiting is not missed
+        await task_manager.complete_task(task_id)
+        assert await task_manager.wait_for_update(task_id, new_version, timeout=5.0) > new_version
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_update_times_out_and_wakes_on_cleanup(self, task_manager, test_user):
+        """Waiting returns the same version on timeout; cleanup wakes waiters."""
+        task_id = await task_manager.create_task(total_windows=5, user_id=str(test_user.id))
+        version = task_manager.progress_version(task_id)
+        assert await task_manager.wait_for_update(task_id, version, timeout=0.01) == version
+        
+        waiter = asyncio.create_task(task_manager.wait_for_update(task_id, version, timeout=5.0))
+        await asyncio.sleep(0)
+        await task_manager.cleanup_task(task_id)
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert await task_manager.get_progress(task_id) is None
 
 
 # ============================================================================